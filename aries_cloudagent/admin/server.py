@@ -35,6 +35,7 @@ from ..storage.error import StorageNotFoundError
 from ..transport.outbound.message import OutboundMessage
 from ..transport.outbound.status import OutboundSendStatus
 from ..transport.queue.basic import BasicMessageQueue
+from ..utils import json_codec
 from ..utils.stats import Collector
 from ..utils.task_queue import TaskQueue
 from ..version import __version__
@@ -671,7 +672,7 @@ class AdminServer(BaseAdminServer):
                 config["admin.webhook_urls"][index],
             )
 
-        return web.json_response({"config": config})
+        return web.json_response({"config": config}, dumps=json_codec.dumps)
 
     @docs(tags=["server"], summary="Fetch the server status")
     @response_schema(AdminStatusSchema(), 200, description="")
@@ -692,7 +693,7 @@ class AdminServer(BaseAdminServer):
             status["timing"] = collector.results
         if self.conductor_stats:
             status["conductor"] = await self.conductor_stats()
-        return web.json_response(status)
+        return web.json_response(status, dumps=json_codec.dumps)
 
     @docs(tags=["server"], summary="Reset statistics")
     @response_schema(AdminResetSchema(), 200, description="")
@@ -858,7 +859,7 @@ class AdminServer(BaseAdminServer):
                             }
                         if not closed:
                             if msg:
-                                await ws.send_json(msg)
+                                await ws.send_json(msg, dumps=json_codec.dumps)
                             send = loop.create_task(queue.dequeue(timeout=5.0))
 
                 except asyncio.CancelledError:
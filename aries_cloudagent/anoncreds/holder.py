@@ -23,6 +23,7 @@ from ..askar.profile_anon import AskarAnoncredsProfile
 from ..core.error import BaseError
 from ..core.profile import Profile
 from ..ledger.base import BaseLedger
+from ..revocation.state_cache import RevocationStateCache, RevocationStateEntry
 from ..wallet.error import WalletNotFoundError
 from .models.anoncreds_cred_def import CredDef
 
@@ -568,6 +569,10 @@ class AnonCredsHolder:
     ) -> str:
         """Create current revocation state for a received credential.
 
+        States are kept in the revocation state cache, when one is configured,
+        and a state kept for the same credential is updated rather than created
+        anew.
+
         Args:
             cred_rev_id: credential revocation id in revocation registry
             rev_reg_def: revocation registry definition
@@ -579,15 +584,34 @@ class AnonCredsHolder:
 
         """
 
+        cache = self.profile.inject_or(RevocationStateCache)
+        rev_reg_id = rev_list.get("revRegDefId")
+        timestamp = rev_list.get("timestamp")
+        cacheable = bool(cache is not None and rev_reg_id and timestamp is not None)
+        previous = None
+        if cacheable:
+            entry = cache.get(rev_reg_id, cred_rev_id, timestamp)
+            if entry and entry.source == rev_list:
+                return entry.state
+            previous = cache.nearest(rev_reg_id, cred_rev_id, timestamp)
+
+        args = [rev_reg_def, rev_list, int(cred_rev_id), tails_file_path]
+        if previous:
+            args += [previous.state, previous.source]
         try:
-            rev_state = await asyncio.get_event_loop().run_in_executor(
-                None,
-                CredentialRevocationState.create,
-                rev_reg_def,
-                rev_list,
-                int(cred_rev_id),
-                tails_file_path,
-            )
+            if cache is not None:
+                rev_state = await cache.run(CredentialRevocationState.create, *args)
+            else:
+                rev_state = await asyncio.get_event_loop().run_in_executor(
+                    None, CredentialRevocationState.create, *args
+                )
         except AnoncredsError as err:
             raise AnonCredsHolderError("Error creating revocation state") from err
-        return rev_state.to_json()
+        rev_state_json = rev_state.to_json()
+        if cacheable:
+            cache.put(
+                rev_reg_id,
+                cred_rev_id,
+                RevocationStateEntry(timestamp, rev_state_json, rev_list),
+            )
+        return rev_state_json
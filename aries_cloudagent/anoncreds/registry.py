@@ -1,9 +1,10 @@
 """AnonCreds Registry."""
 import logging
-from typing import List, Optional, Sequence
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 
 from ..core.profile import Profile
+from ..utils.task_queue import gather_keyed
 from .models.anoncreds_cred_def import (
     CredDef,
     CredDefResult,
@@ -32,6 +33,9 @@ LOGGER = logging.getLogger(__name__)
 class AnonCredsRegistry:
     """AnonCredsRegistry."""
 
+    # Maximum number of concurrent lookups made by a batched read
+    BATCH_READ_LIMIT = 8
+
     def __init__(self, registries: Optional[List[BaseAnonCredsHandler]] = None):
         """Create DID Resolver."""
         self.resolvers = []
@@ -78,6 +82,16 @@ class AnonCredsRegistry:
         resolver = await self._resolver_for_identifier(schema_id)
         return await resolver.get_schema(profile, schema_id)
 
+    async def get_schemas(
+        self, profile: Profile, schema_ids: Iterable[str]
+    ) -> Dict[str, GetSchemaResult]:
+        """Get many schemas from the registry concurrently."""
+        return await gather_keyed(
+            lambda schema_id: self.get_schema(profile, schema_id),
+            schema_ids,
+            self.BATCH_READ_LIMIT,
+        )
+
     async def register_schema(
         self,
         profile: Profile,
@@ -98,6 +112,16 @@ class AnonCredsRegistry:
             credential_definition_id,
         )
 
+    async def get_credential_definitions(
+        self, profile: Profile, credential_definition_ids: Iterable[str]
+    ) -> Dict[str, GetCredDefResult]:
+        """Get many credential definitions from the registry concurrently."""
+        return await gather_keyed(
+            lambda cred_def_id: self.get_credential_definition(profile, cred_def_id),
+            credential_definition_ids,
+            self.BATCH_READ_LIMIT,
+        )
+
     async def register_credential_definition(
         self,
         profile: Profile,
@@ -125,6 +149,18 @@ class AnonCredsRegistry:
             profile, revocation_registry_id
         )
 
+    async def get_revocation_registry_definitions(
+        self, profile: Profile, revocation_registry_ids: Iterable[str]
+    ) -> Dict[str, GetRevRegDefResult]:
+        """Get many revocation registry definitions from the registry concurrently."""
+        return await gather_keyed(
+            lambda rev_reg_id: self.get_revocation_registry_definition(
+                profile, rev_reg_id
+            ),
+            revocation_registry_ids,
+            self.BATCH_READ_LIMIT,
+        )
+
     async def register_revocation_registry_definition(
         self,
         profile: Profile,
@@ -146,6 +182,16 @@ class AnonCredsRegistry:
         resolver = await self._resolver_for_identifier(rev_reg_def_id)
         return await resolver.get_revocation_list(profile, rev_reg_def_id, timestamp)
 
+    async def get_revocation_lists(
+        self, profile: Profile, requests: Iterable[Tuple[str, int]]
+    ) -> Dict[Tuple[str, int], GetRevListResult]:
+        """Get many revocation lists, by rev reg def id and timestamp, concurrently."""
+        return await gather_keyed(
+            lambda request: self.get_revocation_list(profile, *request),
+            requests,
+            self.BATCH_READ_LIMIT,
+        )
+
     async def register_revocation_list(
         self,
         profile: Profile,
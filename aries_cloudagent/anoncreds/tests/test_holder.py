@@ -6,3 +6,101 @@ Unit tests for the anoncreds holder:
 
 See tests under aries_cloudagent/indy/sdk/tests
 """
+
+import json
+import tempfile
+from unittest import IsolatedAsyncioTestCase
+
+import pytest
+from anoncreds import (
+    CredentialDefinition,
+    RevocationRegistryDefinition,
+    RevocationStatusList,
+    Schema,
+)
+
+from ...askar.profile_anon import AskarAnonProfileManager
+from ...config.injection_context import InjectionContext
+from ...revocation.state_cache import RevocationStateCache
+from ...tests import mock
+from .. import holder as test_module
+
+ISSUER_ID = "did:web:example.org"
+SCHEMA_ID = f"{ISSUER_ID}/schema"
+CRED_DEF_ID = f"{ISSUER_ID}/cred-def"
+REV_REG_DEF_ID = f"{ISSUER_ID}/rev-reg-def"
+
+
+@pytest.mark.askar
+class TestAnonCredsHolderRevocationState(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.profile = await AskarAnonProfileManager().provision(
+            InjectionContext(enforce_typing=False),
+            {
+                "name": ":memory:",
+                "key": await AskarAnonProfileManager.generate_store_key(),
+                "key_derivation_method": "RAW",
+            },
+        )
+        self.cache = RevocationStateCache(10, workers=1)
+        self.profile.context.injector.bind_instance(RevocationStateCache, self.cache)
+        self.holder = test_module.AnonCredsHolder(self.profile)
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        schema = Schema.create("resident", "1.0", ISSUER_ID, ["name"])
+        cred_def, _, _ = CredentialDefinition.create(
+            SCHEMA_ID, schema, ISSUER_ID, "default", "CL", support_revocation=True
+        )
+        rev_reg_def, _ = RevocationRegistryDefinition.create(
+            CRED_DEF_ID,
+            cred_def,
+            ISSUER_ID,
+            "0",
+            "CL_ACCUM",
+            10,
+            tails_dir_path=self.tmp_dir.name,
+        )
+        self.rev_reg_def = rev_reg_def
+        self.tails_path = rev_reg_def.tails_location
+        self.rev_list = RevocationStatusList.create(
+            REV_REG_DEF_ID, rev_reg_def, ISSUER_ID, 10, True
+        )
+
+    async def asyncTearDown(self):
+        self.cache.pool.shutdown()
+        self.tmp_dir.cleanup()
+
+    async def test_create_revocation_state_cached(self):
+        rev_reg_def = json.loads(self.rev_reg_def.to_json())
+        rev_list = json.loads(self.rev_list.to_json())
+        updated_list = json.loads(
+            self.rev_list.update(20, None, [3], self.rev_reg_def).to_json()
+        )
+        create = test_module.CredentialRevocationState.create
+
+        with mock.patch.object(
+            test_module.CredentialRevocationState, "create", side_effect=create
+        ) as mock_create:
+            state = await self.holder.create_revocation_state(
+                "1", rev_reg_def, rev_list, self.tails_path
+            )
+            assert len(self.cache) == 1
+            assert (
+                await self.holder.create_revocation_state(
+                    "1", rev_reg_def, rev_list, self.tails_path
+                )
+                == state
+            )
+            mock_create.assert_called_once_with(
+                rev_reg_def, rev_list, 1, self.tails_path
+            )
+
+            mock_create.reset_mock()
+            updated = await self.holder.create_revocation_state(
+                "1", rev_reg_def, updated_list, self.tails_path
+            )
+            mock_create.assert_called_once_with(
+                rev_reg_def, updated_list, 1, self.tails_path, state, rev_list
+            )
+        assert len(self.cache) == 2
+        assert json.loads(updated)["timestamp"] == 20
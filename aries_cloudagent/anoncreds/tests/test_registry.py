@@ -0,0 +1,41 @@
+import pytest
+
+from ...core.in_memory import InMemoryProfile
+from ...tests import mock
+from ..base import BaseAnonCredsResolver
+from ..registry import AnonCredsRegistry
+
+
+@pytest.fixture
+def resolver():
+    resolver = mock.MagicMock(BaseAnonCredsResolver)
+    resolver.supports = mock.CoroutineMock(return_value=True)
+    resolver.get_schema = mock.CoroutineMock(
+        side_effect=lambda profile, schema_id: f"schema {schema_id}"
+    )
+    resolver.get_revocation_list = mock.CoroutineMock(
+        side_effect=lambda profile, rev_reg_id, timestamp: (rev_reg_id, timestamp)
+    )
+    yield resolver
+
+
+@pytest.mark.asyncio
+async def test_get_schemas(resolver):
+    profile = InMemoryProfile.test_profile()
+    registry = AnonCredsRegistry([resolver])
+    assert await registry.get_schemas(profile, ["a", "b", "a"]) == {
+        "a": "schema a",
+        "b": "schema b",
+    }
+    assert resolver.get_schema.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_revocation_lists(resolver):
+    profile = InMemoryProfile.test_profile()
+    registry = AnonCredsRegistry([resolver])
+    requests = [("rr1", 1), ("rr1", 2), ("rr1", 1)]
+    assert await registry.get_revocation_lists(profile, requests) == {
+        ("rr1", 1): ("rr1", 1),
+        ("rr1", 2): ("rr1", 2),
+    }
@@ -126,13 +126,14 @@ class AnonCredsVerifier:
 
         # timestamp for irrevocable credential
         cred_defs: List[GetCredDefResult] = []
+        anoncreds_registry = profile.inject(AnonCredsRegistry)
+        cred_def_results = await anoncreds_registry.get_credential_definitions(
+            profile, [ident["cred_def_id"] for ident in pres["identifiers"]]
+        )
         for index, ident in enumerate(pres["identifiers"]):
             LOGGER.debug(f">>> got (index, ident): ({index},{ident})")
             cred_def_id = ident["cred_def_id"]
-            anoncreds_registry = profile.inject(AnonCredsRegistry)
-            cred_def_result = await anoncreds_registry.get_credential_definition(
-                profile, cred_def_id
-            )
+            cred_def_result = cred_def_results[cred_def_id]
             cred_defs.append(cred_def_result)
             if ident.get("timestamp"):
                 if not cred_def_result.credential_definition.value.revocation:
@@ -378,56 +379,47 @@ class AnonCredsVerifier:
         identifiers: list,
     ) -> Tuple[dict, dict, dict, dict]:
         """Return schemas, cred_defs, rev_reg_defs, rev_lists."""
-        schema_ids = []
-        cred_def_ids = []
-
-        schemas = {}
-        cred_defs = {}
-        rev_reg_defs = {}
+        anoncreds_registry = self.profile.inject(AnonCredsRegistry)
+        revocable = [ident for ident in identifiers if ident.get("rev_reg_id")]
+
+        schemas = {
+            schema_id: result.schema.serialize()
+            for schema_id, result in (
+                await anoncreds_registry.get_schemas(
+                    self.profile, [ident["schema_id"] for ident in identifiers]
+                )
+            ).items()
+        }
+        cred_defs = {
+            cred_def_id: result.credential_definition.serialize()
+            for cred_def_id, result in (
+                await anoncreds_registry.get_credential_definitions(
+                    self.profile, [ident["cred_def_id"] for ident in identifiers]
+                )
+            ).items()
+        }
+        rev_reg_defs = {
+            rev_reg_id: result.revocation_registry.serialize()
+            for rev_reg_id, result in (
+                await anoncreds_registry.get_revocation_registry_definitions(
+                    self.profile, [ident["rev_reg_id"] for ident in revocable]
+                )
+            ).items()
+        }
         rev_lists = {}
-
-        for identifier in identifiers:
-            schema_ids.append(identifier["schema_id"])
-            cred_def_ids.append(identifier["cred_def_id"])
-
-            anoncreds_registry = self.profile.inject(AnonCredsRegistry)
-            # Build schemas for anoncreds
-            if identifier["schema_id"] not in schemas:
-                schemas[identifier["schema_id"]] = (
-                    await anoncreds_registry.get_schema(
-                        self.profile, identifier["schema_id"]
-                    )
-                ).schema.serialize()
-            if identifier["cred_def_id"] not in cred_defs:
-                cred_defs[identifier["cred_def_id"]] = (
-                    await anoncreds_registry.get_credential_definition(
-                        self.profile, identifier["cred_def_id"]
-                    )
-                ).credential_definition.serialize()
-
-            if identifier.get("rev_reg_id"):
-                if identifier["rev_reg_id"] not in rev_reg_defs:
-                    rev_reg_defs[identifier["rev_reg_id"]] = (
-                        await anoncreds_registry.get_revocation_registry_definition(
-                            self.profile, identifier["rev_reg_id"]
-                        )
-                    ).revocation_registry.serialize()
-
-                if identifier.get("timestamp"):
-                    rev_lists.setdefault(identifier["rev_reg_id"], {})
-
-                    if (
-                        identifier["timestamp"]
-                        not in rev_lists[identifier["rev_reg_id"]]
-                    ):
-                        result = await anoncreds_registry.get_revocation_list(
-                            self.profile,
-                            identifier["rev_reg_id"],
-                            identifier["timestamp"],
-                        )
-                        rev_lists[identifier["rev_reg_id"]][
-                            identifier["timestamp"]
-                        ] = result.revocation_list.serialize()
+        for (rev_reg_id, timestamp), result in (
+            await anoncreds_registry.get_revocation_lists(
+                self.profile,
+                [
+                    (ident["rev_reg_id"], ident["timestamp"])
+                    for ident in revocable
+                    if ident.get("timestamp")
+                ],
+            )
+        ).items():
+            rev_lists.setdefault(rev_reg_id, {})[
+                timestamp
+            ] = result.revocation_list.serialize()
         return (
             schemas,
             cred_defs,
@@ -1,7 +1,7 @@
 """DIDComm v1 envelope handling via Askar backend."""
 
 from collections import OrderedDict
-from typing import Optional, Sequence, Tuple
+from typing import Awaitable, Callable, Optional, Sequence, Tuple
 
 from aries_askar import (
     crypto_box,
@@ -15,6 +15,7 @@ from marshmallow import ValidationError
 from ...utils.jwe import b64url, JweEnvelope, JweRecipient
 from ...wallet.base import WalletError
 from ...wallet.crypto import extract_pack_recipients
+from ...wallet.crypto_pool import CryptoWorkerPool, run_crypto
 from ...wallet.util import b58_to_bytes, bytes_to_b58
 
 
@@ -73,8 +74,18 @@ def pack_message(
     return wrapper.to_json().encode("utf-8")
 
 
-async def unpack_message(session: Session, enc_message: bytes) -> Tuple[str, str, str]:
-    """Decode a message using the DIDComm v1 'unpack' algorithm."""
+async def unpack_message(
+    session: Session,
+    enc_message: bytes,
+    worker_pool: Optional[CryptoWorkerPool] = None,
+    fetch_key: Callable[[str], Awaitable[Optional[Key]]] = None,
+) -> Tuple[str, str, str]:
+    """Decode a message using the DIDComm v1 'unpack' algorithm.
+
+    The key agreement and decryption run on the worker pool if one is given,
+    and otherwise on the default executor. Recipient keys are looked up with
+    `fetch_key` if given, and otherwise fetched from the session.
+    """
     try:
         wrapper = JweEnvelope.from_json(enc_message)
     except ValidationError:
@@ -87,19 +98,38 @@ async def unpack_message(session: Session, enc_message: bytes) -> Tuple[str, str
 
     recips = extract_pack_recipients(wrapper.recipients)
 
-    payload_key, sender_vk = None, None
     for recip_vk in recips:
-        recip_key_entry = await session.fetch_key(recip_vk)
-        if recip_key_entry:
-            payload_key, sender_vk = _extract_payload_key(
-                recips[recip_vk], recip_key_entry.key
-            )
+        if fetch_key:
+            recip_key = await fetch_key(recip_vk)
+        else:
+            recip_key_entry = await session.fetch_key(recip_vk)
+            recip_key = recip_key_entry and recip_key_entry.key
+        if recip_key:
             break
-
-    if not payload_key:
+    else:
         raise WalletError(
             "No corresponding recipient key found in {}".format(tuple(recips))
         )
+
+    message, sender_vk = await run_crypto(
+        worker_pool,
+        _decrypt_message,
+        wrapper,
+        recips[recip_vk],
+        recip_key,
+        is_authcrypt,
+    )
+    return message, recip_vk, sender_vk
+
+
+def _decrypt_message(
+    wrapper: JweEnvelope, sender_cek: dict, recip_secret: Key, is_authcrypt: bool
+) -> Tuple[bytes, str]:
+    """Decrypt the payload of a packed message for a recipient.
+
+    Returns: A tuple of the message and sender verkey
+    """
+    payload_key, sender_vk = _extract_payload_key(sender_cek, recip_secret)
     if not sender_vk and is_authcrypt:
         raise WalletError("Sender public key not provided for Authcrypt message")
 
@@ -110,7 +140,7 @@ async def unpack_message(session: Session, enc_message: bytes) -> Tuple[str, str
         tag=wrapper.tag,
         aad=wrapper.protected_bytes,
     )
-    return message, recip_vk, sender_vk
+    return message, sender_vk
 
 
 def _extract_payload_key(sender_cek: dict, recip_secret: Key) -> Tuple[bytes, str]:
@@ -0,0 +1,137 @@
+"""Cache of Askar key handles for frequently used local keys."""
+
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from aries_askar import Key
+
+from ..core.profile import Profile, ProfileSession
+from ..utils.stats import Collector
+
+
+class AskarKeyCache:
+    """LRU cache of key handles, shared by the Askar profiles of an agent.
+
+    Entries are scoped by profile, so that a key is only returned to sessions
+    of the wallet which holds it. The cache drops evicted and invalidated
+    handles at once, and Askar zeroizes the key material when the last handle
+    to a key is freed.
+
+    Every invalidation increments `generation`. A fetch started before an
+    invalidation cannot restore an entry which was invalidated while the
+    fetch was in progress.
+    """
+
+    def __init__(self, capacity: int, collector: Collector = None):
+        """Initialize an `AskarKeyCache` instance.
+
+        Args:
+            capacity: The maximum number of key handles to retain
+            collector: An optional stats collector for the hit ratio
+        """
+
+        self._cache: "OrderedDict[Tuple[str, str], Key]" = OrderedDict()
+        self.capacity = capacity
+        self.collector = collector
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def scope_for(profile: Profile) -> str:
+        """Get the cache scope for the keys of a profile."""
+
+        return "{}:{}".format(profile.name, getattr(profile, "profile_id", None) or "")
+
+    @property
+    def hit_ratio(self) -> float:
+        """Accessor for the fraction of lookups answered from the cache."""
+
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get(self, scope: str, verkey: str) -> Optional[Key]:
+        """Get a cached key handle.
+
+        Args:
+            scope: The profile scope of the key
+            verkey: The verkey of the key
+        """
+
+        key = self._cache.get((scope, verkey))
+        if key is not None:
+            self._cache.move_to_end((scope, verkey))
+            self.hits += 1
+        else:
+            self.misses += 1
+        if self.collector:
+            self.collector.log("AskarKeyCache:hit", 0.0 if key is None else 1.0)
+        return key
+
+    def put(self, scope: str, verkey: str, key: Key, generation: int = None):
+        """Add a key handle to the cache.
+
+        Args:
+            scope: The profile scope of the key
+            verkey: The verkey of the key
+            key: The key handle
+            generation: The generation observed when the fetch started
+        """
+
+        if generation is not None and generation != self.generation:
+            return
+        self._cache[(scope, verkey)] = key
+        self._cache.move_to_end((scope, verkey))
+        while len(self._cache) > self.capacity:
+            self._cache.popitem(last=False)
+
+    async def fetch(self, session: ProfileSession, verkey: str) -> Optional[Key]:
+        """Fetch a key handle from the cache, or from the store on a miss.
+
+        Args:
+            session: An active Askar profile session
+            verkey: The verkey of the key
+        """
+
+        scope = self.scope_for(session.profile)
+        key = self.get(scope, verkey)
+        if key is None:
+            generation = self.generation
+            entry = await session.handle.fetch_key(verkey)
+            if entry:
+                key = entry.key
+                self.put(scope, verkey, key, generation)
+        return key
+
+    def remove(self, scope: str, verkey: str):
+        """Remove a key handle from the cache.
+
+        Args:
+            scope: The profile scope of the key
+            verkey: The verkey of the key
+        """
+
+        self.generation += 1
+        self._cache.pop((scope, verkey), None)
+
+    def remove_scope(self, scope: str):
+        """Remove all key handles for a profile from the cache.
+
+        Args:
+            scope: The profile scope to remove
+        """
+
+        self.generation += 1
+        for cache_key in [key for key in self._cache if key[0] == scope]:
+            del self._cache[cache_key]
+
+    def clear(self):
+        """Remove all entries from the cache."""
+
+        self.generation += 1
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        """Get the number of cached key handles."""
+
+        return len(self._cache)
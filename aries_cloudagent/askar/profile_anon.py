@@ -26,6 +26,7 @@ from ..utils.multi_ledger import get_write_ledger_config_for_profile
 from ..wallet.base import BaseWallet
 from ..wallet.crypto import validate_seed
 
+from .key_cache import AskarKeyCache
 from .store import AskarStoreConfig, AskarOpenStore
 
 LOGGER = logging.getLogger(__name__)
@@ -66,6 +67,7 @@ class AskarAnoncredsProfile(Profile):
         """Remove the profile."""
         if self.profile_id:
             await self.store.remove_profile(self.profile_id)
+        self.clear_key_cache()
 
     def init_ledger_pool(self):
         """Initialize the ledger pool."""
@@ -88,6 +90,7 @@ class AskarAnoncredsProfile(Profile):
                 genesis_transactions=genesis_transactions,
                 read_only=read_only,
                 socks_proxy=socks_proxy,
+                persistent_cache=bool(self.settings.get("ledger.persistent_cache")),
             )
 
     def bind_providers(self):
@@ -142,6 +145,12 @@ class AskarAnoncredsProfile(Profile):
                         ),
                         read_only=write_ledger_config.get("read_only"),
                         socks_proxy=write_ledger_config.get("socks_proxy"),
+                        persistent_cache=bool(
+                            write_ledger_config.get(
+                                "persistent_cache",
+                                self.settings.get("ledger.persistent_cache"),
+                            )
+                        ),
                     ),
                     ref(self),
                 ),
@@ -178,9 +187,16 @@ class AskarAnoncredsProfile(Profile):
         """
         return AskarAnoncredsProfileSession(self, True, context=context)
 
+    def clear_key_cache(self):
+        """Release any cached key handles for the profile."""
+        key_cache = self.inject_or(AskarKeyCache)
+        if key_cache is not None:
+            key_cache.remove_scope(key_cache.scope_for(self))
+
     async def close(self):
         """Close the profile instance."""
         if self.opened:
+            self.clear_key_cache()
             await self.opened.close()
             self.opened = None
 
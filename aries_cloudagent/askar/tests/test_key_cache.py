@@ -0,0 +1,104 @@
+import pytest
+
+from aries_askar import Key, KeyAlg
+
+from ...config.injection_context import InjectionContext
+from ...utils.stats import Collector
+from ...wallet.base import BaseWallet
+from ...wallet.did_method import SOV, DIDMethods
+from ...wallet.key_type import ED25519, KeyTypes
+from ..key_cache import AskarKeyCache
+from ..profile import AskarProfileManager
+
+
+@pytest.fixture()
+async def profile():
+    context = InjectionContext()
+    context.injector.bind_instance(AskarKeyCache, AskarKeyCache(10))
+    context.injector.bind_instance(DIDMethods, DIDMethods())
+    context.injector.bind_instance(KeyTypes, KeyTypes())
+    profile = await AskarProfileManager().provision(
+        context,
+        {
+            "name": ":memory:",
+            "key": await AskarProfileManager.generate_store_key(),
+            "key_derivation_method": "RAW",
+        },
+    )
+    yield profile
+    await profile.close()
+
+
+def test_lru_eviction():
+    cache = AskarKeyCache(2)
+    keys = [Key.generate(KeyAlg.ED25519) for _ in range(3)]
+    cache.put("scope", "a", keys[0])
+    cache.put("scope", "b", keys[1])
+    assert cache.get("scope", "a") is keys[0]
+    cache.put("scope", "c", keys[2])
+    assert len(cache) == 2
+    assert cache.get("scope", "b") is None
+    assert cache.get("other", "a") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert cache.hit_ratio == 1 / 3
+
+
+def test_invalidation():
+    cache = AskarKeyCache(10, collector=Collector())
+    key = Key.generate(KeyAlg.ED25519)
+    cache.put("one", "a", key)
+    cache.put("two", "a", key)
+
+    generation = cache.generation
+    cache.remove("one", "a")
+    assert cache.get("one", "a") is None
+    # a fetch started before the invalidation does not restore the entry
+    cache.put("one", "a", key, generation)
+    assert cache.get("one", "a") is None
+
+    cache.remove_scope("two")
+    assert not len(cache)
+    cache.put("two", "a", key)
+    cache.clear()
+    assert not len(cache)
+    assert "AskarKeyCache:hit" in cache.collector.results["avg"]
+
+
+@pytest.mark.asyncio
+async def test_wallet_uses_cache(profile):
+    cache = profile.inject(AskarKeyCache)
+    async with profile.session() as session:
+        wallet = session.inject(BaseWallet)
+        sender = await wallet.create_signing_key(ED25519)
+        recip = await wallet.create_signing_key(ED25519)
+
+        await wallet.sign_message(b"one", sender.verkey)
+        await wallet.sign_message(b"two", sender.verkey)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        packed = await wallet.pack_message("hello", [recip.verkey], sender.verkey)
+        assert await wallet.unpack_message(packed) == (
+            "hello",
+            sender.verkey,
+            recip.verkey,
+        )
+        packed = await wallet.pack_message("again", [recip.verkey], sender.verkey)
+        await wallet.unpack_message(packed)
+        assert (cache.hits, cache.misses) == (4, 2)
+
+    await profile.close()
+    assert not len(cache)
+
+
+@pytest.mark.asyncio
+async def test_rotation_invalidates(profile):
+    cache = profile.inject(AskarKeyCache)
+    async with profile.session() as session:
+        wallet = session.inject(BaseWallet)
+        info = await wallet.create_local_did(method=SOV, key_type=ED25519)
+        await wallet.sign_message(b"msg", info.verkey)
+        assert len(cache) == 1
+
+        await wallet.rotate_did_keypair_start(info.did)
+        await wallet.rotate_did_keypair_apply(info.did)
+        assert not len(cache)
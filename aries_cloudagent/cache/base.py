@@ -2,7 +2,7 @@
 
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Sequence, Text, Union
+from typing import Any, Mapping, Optional, Sequence, Text, Union
 
 from ..core.error import BaseError
 
@@ -43,6 +43,29 @@ class BaseCache(ABC):
 
         """
 
+    async def mget(self, keys: Sequence[Text]) -> Sequence[Any]:
+        """Get several items from the cache.
+
+        Args:
+            keys: the keys to retrieve items for
+
+        Returns:
+            A list of the records found, with `None` for missing keys
+
+        """
+        return [await self.get(key) for key in keys]
+
+    async def mset(self, values: Mapping[Text, Any], ttl: Optional[int] = None):
+        """Add several items to the cache with an optional ttl.
+
+        Args:
+            values: a mapping of keys to the values to store in the cache
+            ttl: number of second that the records should persist
+
+        """
+        for key, value in values.items():
+            await self.set(key, value, ttl)
+
     @abstractmethod
     async def clear(self, key: Text):
         """Remove an item from the cache, if present.
@@ -1,29 +1,108 @@
 """Basic in-memory cache implementation."""
 
+import heapq
+import sys
 import time
-from typing import Any, Sequence, Text, Union
+
+from collections import OrderedDict
+from typing import Any, Mapping, Sequence, Text, Union
 
 from .base import BaseCache
 
 
+def _estimate_size(value: Any) -> int:
+    """Estimate the memory footprint of a cached value in bytes."""
+    size = sys.getsizeof(value)
+    if isinstance(value, Mapping):
+        size += sum(
+            _estimate_size(key) + _estimate_size(val) for key, val in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_estimate_size(item) for item in value)
+    return size
+
+
 class InMemoryCache(BaseCache):
-    """Basic in-memory cache class."""
+    """Basic in-memory cache class.
+
+    Entries are kept in least-recently-used order and expiry times are tracked
+    in a heap, so that lookups and updates run in amortized constant time. When
+    `max_entries` or `max_bytes` is set, the least recently used entries are
+    evicted once the bound is exceeded.
+    """
 
-    def __init__(self):
-        """Initialize a `InMemoryCache` instance."""
+    def __init__(self, max_entries: int = None, max_bytes: int = None):
+        """Initialize a `InMemoryCache` instance.
+
+        Args:
+            max_entries: the maximum number of keys to retain, if any
+            max_bytes: the maximum estimated size of cached values, if any
+
+        """
         super().__init__()
         # looks like { "key": { "expires": <epoch timestamp>, "value": <val> } }
-        self._cache = {}
+        self._cache = OrderedDict()
+        # heap of (expires, key) tuples, possibly containing stale entries
+        self._expiry_heap = []
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the cache counters."""
+        return {
+            "entries": len(self._cache),
+            "bytes": self._size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def _remove_entry(self, key: Text) -> dict:
+        """Remove an entry from the cache, updating the size total."""
+        entry = self._cache.pop(key, None)
+        if entry:
+            self._size -= entry.get("size", 0)
+        return entry
 
     def _remove_expired_cache_items(self):
         """Remove all expired items from cache."""
-        for key, val in self._cache.copy().items():  # iterate copy, del from original
-            cache_item_expiry = val["expires"]
-            if cache_item_expiry is None:
-                continue
-            now = time.perf_counter()
-            if now >= cache_item_expiry:
-                del self._cache[key]
+        heap = self._expiry_heap
+        now = time.perf_counter()
+        while heap and heap[0][0] <= now:
+            expires, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # skip heap records left behind by an updated or removed entry
+            if entry and entry["expires"] == expires:
+                self._remove_entry(key)
+                self.expirations += 1
+        if len(heap) > 2 * len(self._cache) + 64:
+            self._compact_expiry_heap()
+
+    def _compact_expiry_heap(self):
+        """Rebuild the expiry heap, dropping stale records."""
+        self._expiry_heap = [
+            (entry["expires"], key)
+            for key, entry in self._cache.items()
+            if entry["expires"] is not None
+        ]
+        heapq.heapify(self._expiry_heap)
+
+    def _evict_excess(self):
+        """Evict least recently used items until the cache is within bounds."""
+        while self._cache and (
+            (self._max_entries and len(self._cache) > self._max_entries)
+            or (self._max_bytes and self._size > self._max_bytes)
+        ):
+            key = next(iter(self._cache))
+            self._remove_entry(key)
+            self.evictions += 1
 
     async def get(self, key: Text):
         """Get an item from the cache.
@@ -36,7 +115,13 @@ class InMemoryCache(BaseCache):
 
         """
         self._remove_expired_cache_items()
-        return self._cache.get(key)["value"] if self._cache.get(key) else None
+        entry = self._cache.get(key)
+        if not entry:
+            self.misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return entry["value"]
 
     async def set(self, keys: Union[Text, Sequence[Text]], value: Any, ttl: int = None):
         """Add an item to the cache with an optional ttl.
@@ -51,8 +136,14 @@ class InMemoryCache(BaseCache):
         """
         self._remove_expired_cache_items()
         expires_ts = time.perf_counter() + ttl if ttl else None
+        size = _estimate_size(value) if self._max_bytes else 0
         for key in [keys] if isinstance(keys, Text) else keys:
-            self._cache[key] = {"expires": expires_ts, "value": value}
+            self._remove_entry(key)
+            self._cache[key] = {"expires": expires_ts, "value": value, "size": size}
+            self._size += size
+            if expires_ts is not None:
+                heapq.heappush(self._expiry_heap, (expires_ts, key))
+        self._evict_excess()
 
     async def clear(self, key: Text):
         """Remove an item from the cache, if present.
@@ -61,10 +152,11 @@ class InMemoryCache(BaseCache):
             key: the key to remove
 
         """
-        if key in self._cache:
-            del self._cache[key]
+        self._remove_entry(key)
 
     async def flush(self):
         """Remove all items from the cache."""
 
-        self._cache = {}
+        self._cache = OrderedDict()
+        self._expiry_heap = []
+        self._size = 0
@@ -0,0 +1,273 @@
+"""Redis-backed cache implementation shared between agent instances.
+
+The cache uses the redis package, which is not installed with the agent. Install
+it with `pip install redis` to use this cache.
+"""
+
+import asyncio
+import json
+import logging
+
+from typing import Any, Callable, Mapping, Sequence, Text, Tuple, Union
+from uuid import uuid4
+
+from .base import BaseCache, CacheError, CacheKeyLock
+
+LOGGER = logging.getLogger(__name__)
+
+# delete a lock entry only if it still holds the token of the instance releasing it
+RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class RedisCache(BaseCache):
+    """Cache class storing values in a Redis server.
+
+    Values are shared by every agent instance connected to the same server, and
+    key locks are extended with a lock entry in the server so that expensive
+    lookups are only performed by one instance at a time.
+    """
+
+    def __init__(
+        self,
+        client,
+        *,
+        prefix: str = "acapy:cache:",
+        lock_timeout: float = 10.0,
+        lock_ttl: float = None,
+        lock_poll_interval: float = 0.05,
+        serializer: Callable[[Any], Union[bytes, str]] = None,
+        deserializer: Callable[[Union[bytes, str]], Any] = None,
+    ):
+        """Initialize a `RedisCache` instance.
+
+        Args:
+            client: an asyncio Redis client, such as `redis.asyncio.Redis`
+            prefix: the prefix applied to every key stored by this cache
+            lock_timeout: the maximum number of seconds to wait on a lock held
+                by another instance before computing the value locally
+            lock_ttl: the number of seconds after which a lock entry expires if
+                it is not released, which must be longer than `lock_timeout`.
+                Defaults to three times `lock_timeout`
+            lock_poll_interval: the delay in seconds between checks for a
+                value produced by the holder of a lock
+            serializer: callable encoding cached values, defaults to JSON
+            deserializer: callable decoding cached values, defaults to JSON
+
+        """
+        super().__init__()
+        if lock_ttl is None:
+            lock_ttl = lock_timeout * 3
+        if lock_ttl <= lock_timeout:
+            raise ValueError("lock_ttl must be longer than lock_timeout")
+        self._client = client
+        self._prefix = prefix
+        self.lock_timeout = lock_timeout
+        self.lock_ttl = lock_ttl
+        self.lock_poll_interval = lock_poll_interval
+        self._serialize = serializer or json.dumps
+        self._deserialize = deserializer or json.loads
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "RedisCache":
+        """Create a `RedisCache` instance connected to a Redis URL."""
+        try:
+            from redis.asyncio import Redis
+        except ImportError as err:
+            raise CacheError(
+                "The redis package is required for RedisCache, "
+                "install it with 'pip install redis'"
+            ) from err
+
+        return cls(Redis.from_url(url), **kwargs)
+
+    def value_key(self, key: Text) -> str:
+        """Get the server key holding the value for a cache key."""
+        return f"{self._prefix}v:{key}"
+
+    def lock_key(self, key: Text) -> str:
+        """Get the server key holding the lock for a cache key."""
+        return f"{self._prefix}l:{key}"
+
+    def _decode(self, raw: Union[bytes, str, None]) -> Any:
+        """Decode a value returned by the server."""
+        return None if raw is None else self._deserialize(raw)
+
+    @staticmethod
+    def _ttl_millis(ttl: float = None) -> int:
+        """Convert a ttl in seconds to milliseconds, as accepted by the server."""
+        return max(int(ttl * 1000), 1) if ttl else None
+
+    async def get(self, key: Text):
+        """Get an item from the cache.
+
+        Args:
+            key: the key to retrieve an item for
+
+        Returns:
+            The record found or `None`
+
+        """
+        return self._decode(await self._client.get(self.value_key(key)))
+
+    async def get_entry(self, key: Text) -> Tuple[bool, Any]:
+        """Get an item from the cache, distinguishing a missing item.
+
+        Args:
+            key: the key to retrieve an item for
+
+        Returns:
+            Whether the item was found, and the item
+
+        """
+        raw = await self._client.get(self.value_key(key))
+        return (raw is not None, self._decode(raw))
+
+    async def mget(self, keys: Sequence[Text]) -> Sequence[Any]:
+        """Get several items from the cache in a single request.
+
+        Args:
+            keys: the keys to retrieve items for
+
+        Returns:
+            A list of the records found, with `None` for missing keys
+
+        """
+        if not keys:
+            return []
+        found = await self._client.mget([self.value_key(key) for key in keys])
+        return [self._decode(raw) for raw in found]
+
+    async def set(self, keys: Union[Text, Sequence[Text]], value: Any, ttl: int = None):
+        """Add an item to the cache with an optional ttl.
+
+        Overwrites existing cache entries.
+
+        Args:
+            keys: the key or keys for which to set an item
+            value: the value to store in the cache
+            ttl: number of seconds that the record should persist
+
+        """
+        keys = [keys] if isinstance(keys, Text) else keys
+        await self.mset(dict.fromkeys(keys, value), ttl)
+
+    async def mset(self, values: Mapping[Text, Any], ttl: int = None):
+        """Add several items to the cache in a single request.
+
+        Args:
+            values: a mapping of keys to the values to store in the cache
+            ttl: number of seconds that the records should persist
+
+        """
+        if not values:
+            return
+        ttl_ms = self._ttl_millis(ttl)
+        async with self._client.pipeline(transaction=False) as pipe:
+            for key, value in values.items():
+                pipe.set(self.value_key(key), self._serialize(value), px=ttl_ms)
+            await pipe.execute()
+
+    async def clear(self, key: Text):
+        """Remove an item from the cache, if present.
+
+        Args:
+            key: the key to remove
+
+        """
+        await self._client.delete(self.value_key(key))
+
+    async def flush(self):
+        """Remove all items from the cache."""
+        batch = []
+        async for server_key in self._client.scan_iter(match=self.value_key("*")):
+            batch.append(server_key)
+            if len(batch) >= 500:
+                await self._client.delete(*batch)
+                batch = []
+        if batch:
+            await self._client.delete(*batch)
+
+    def acquire(self, key: Text):
+        """Acquire a lock on a given cache key."""
+        result = RedisCacheKeyLock(self, key)
+        first = self._key_locks.setdefault(key, result)
+        if first is not result:
+            result.parent = first
+        return result
+
+    async def acquire_shared(self, key: Text) -> str:
+        """Attempt to take the lock entry for a cache key in the server.
+
+        Returns:
+            The lock token if the lock was taken, otherwise `None`
+
+        """
+        token = uuid4().hex
+        acquired = await self._client.set(
+            self.lock_key(key),
+            token,
+            nx=True,
+            px=self._ttl_millis(self.lock_ttl),
+        )
+        return token if acquired else None
+
+    async def release_shared(self, key: Text, token: str):
+        """Release the lock entry for a cache key, if still held by this token."""
+        await self._client.eval(RELEASE_SCRIPT, 1, self.lock_key(key), token)
+
+    def __repr__(self) -> str:
+        """Human readable representation of this instance."""
+        return "<{} prefix={}>".format(self.__class__.__name__, self._prefix)
+
+
+class RedisCacheKeyLock(CacheKeyLock):
+    """A lock on a cache key shared between agent instances.
+
+    After the in-process checks of `CacheKeyLock`, a lock entry is taken in the
+    server. If another instance already holds it, the value it produces is
+    awaited until `lock_timeout` expires.
+    """
+
+    def __init__(self, cache: RedisCache, key: Text):
+        """Initialize the key lock."""
+        super().__init__(cache, key)
+        self._token: str = None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await super().__aenter__()
+        if self.done:
+            return self
+
+        cache: RedisCache = self.cache
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + cache.lock_timeout
+        while True:
+            self._token = await cache.acquire_shared(self.key)
+            if self._token:
+                break
+            if loop.time() >= deadline:
+                LOGGER.warning(
+                    "Timed out waiting on shared cache lock for key: %s", self.key
+                )
+                break
+            await asyncio.sleep(cache.lock_poll_interval)
+            found, value = await cache.get_entry(self.key)
+            if found:
+                self._future.set_result(value)
+                break
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit, releasing the shared lock."""
+        try:
+            if self._token:
+                await self.cache.release_shared(self.key, self._token)
+                self._token = None
+        finally:
+            await super().__aexit__(exc_type, exc_val, exc_tb)
@@ -166,3 +166,65 @@ class TestBasicCache:
     @pytest.mark.asyncio
     async def test_repr(self, cache):
         assert isinstance(repr(cache), str)
+
+
+class TestBoundedCache:
+    @pytest.mark.asyncio
+    async def test_max_entries_evicts_lru(self):
+        cache = InMemoryCache(max_entries=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        assert await cache.get("a") == 1  # "b" is now least recently used
+        await cache.set("c", 3)
+        assert await cache.get("b") is None
+        assert await cache.get("a") == 1
+        assert await cache.get("c") == 3
+        assert cache.evictions == 1
+        assert len(cache._cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_max_bytes_evicts_lru(self):
+        cache = InMemoryCache(max_bytes=1024)
+        await cache.set("a", "x" * 400)
+        await cache.set("b", "x" * 400)
+        await cache.set("c", "x" * 400)
+        assert await cache.get("a") is None
+        assert await cache.get("c") is not None
+        assert cache._size <= 1024
+        await cache.clear("b")
+        await cache.clear("c")
+        assert cache._size == 0
+
+    @pytest.mark.asyncio
+    async def test_overwrite_resets_expiry(self):
+        cache = InMemoryCache()
+        await cache.set("key", "old", 0.05)
+        await cache.set("key", "new")
+        await sleep(0.05)
+        assert await cache.get("key") == "new"
+        assert cache.expirations == 0
+
+    @pytest.mark.asyncio
+    async def test_expiry_heap_compacted(self):
+        cache = InMemoryCache()
+        for _ in range(200):
+            await cache.set("key", "value", 60)
+        assert len(cache._expiry_heap) <= 2 * len(cache._cache) + 65
+
+    @pytest.mark.asyncio
+    async def test_stats(self):
+        cache = InMemoryCache(max_entries=1)
+        await cache.set("a", 1)
+        await cache.get("a")
+        await cache.get("b")
+        await cache.set("b", 2, 0.01)
+        await sleep(0.02)
+        await cache.get("b")
+        assert cache.stats == {
+            "entries": 0,
+            "bytes": 0,
+            "hits": 1,
+            "misses": 2,
+            "evictions": 1,
+            "expirations": 1,
+        }
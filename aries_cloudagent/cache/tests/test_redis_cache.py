@@ -0,0 +1,221 @@
+import asyncio
+import fnmatch
+import time
+
+from unittest import mock
+
+import pytest
+
+from ..base import CacheError
+from ..redis import RELEASE_SCRIPT, RedisCache
+
+
+class FakeRedis:
+    """Minimal in-process stand-in for an asyncio Redis client."""
+
+    def __init__(self):
+        self.data = {}
+        self.calls = []
+
+    def _live(self, key):
+        value, expires = self.data.get(key, (None, None))
+        if expires is not None and time.monotonic() >= expires:
+            del self.data[key]
+            return None
+        return value
+
+    @staticmethod
+    def _encode(value):
+        return value.encode() if isinstance(value, str) else value
+
+    async def get(self, key):
+        self.calls.append("get")
+        return self._live(key)
+
+    async def mget(self, keys):
+        self.calls.append("mget")
+        return [self._live(key) for key in keys]
+
+    async def set(self, key, value, px=None, nx=False):
+        self.calls.append("set")
+        if nx and self._live(key) is not None:
+            return None
+        expires = time.monotonic() + px / 1000 if px else None
+        self.data[key] = (self._encode(value), expires)
+        return True
+
+    async def delete(self, *keys):
+        self.calls.append("delete")
+        for key in keys:
+            self.data.pop(key, None)
+
+    async def eval(self, script, numkeys, *args):
+        self.calls.append("eval")
+        assert script == RELEASE_SCRIPT and numkeys == 1
+        key, token = args
+        if self._live(key) == self._encode(token):
+            del self.data[key]
+            return 1
+        return 0
+
+    async def scan_iter(self, match=None):
+        for key in list(self.data):
+            if match is None or fnmatch.fnmatch(key, match):
+                yield key
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client: FakeRedis):
+        self.client = client
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    def set(self, key, value, px=None):
+        self.commands.append((key, value, px))
+
+    async def execute(self):
+        self.client.calls.append("execute")
+        for key, value, px in self.commands:
+            expires = time.monotonic() + px / 1000 if px else None
+            self.client.data[key] = (self.client._encode(value), expires)
+        self.commands = []
+
+
+@pytest.fixture()
+def server():
+    return FakeRedis()
+
+
+@pytest.fixture()
+async def cache(server):
+    cache = RedisCache(server, lock_timeout=1.0, lock_poll_interval=0.01)
+    await cache.set("valid key", "value")
+    return cache
+
+
+class TestRedisCache:
+    async def test_get_none(self, cache):
+        assert await cache.get("doesn't exist") is None
+
+    async def test_get_valid(self, cache):
+        assert await cache.get("valid key") == "value"
+
+    async def test_set_dict(self, cache, server):
+        await cache.set("key", {"dictkey": "dval"})
+        assert await cache.get("key") == {"dictkey": "dval"}
+        assert cache.value_key("key") in server.data
+
+    async def test_set_multi(self, cache):
+        await cache.set([f"key{i}" for i in range(4)], {"dictkey": "dval"})
+        for i in range(4):
+            assert await cache.get(f"key{i}") == {"dictkey": "dval"}
+
+    async def test_set_expires(self, cache):
+        await cache.set("key", "value", 0.05)
+        assert await cache.get("key") == "value"
+        await asyncio.sleep(0.06)
+        assert await cache.get("key") is None
+
+    async def test_mget_mset_batched(self, cache, server):
+        server.calls.clear()
+        await cache.mset({"a": 1, "b": 2})
+        assert await cache.mget(["a", "missing", "b"]) == [1, None, 2]
+        assert server.calls == ["execute", "mget"]
+        assert await cache.mget([]) == []
+
+    async def test_clear_flush(self, cache, server):
+        await cache.set("key", "value")
+        await cache.clear("key")
+        assert await cache.get("key") is None
+        server.data["other"] = (b"1", None)
+        await cache.flush()
+        assert await cache.get("valid key") is None
+        assert "other" in server.data
+
+    async def test_acquire_sets_value(self, cache, server):
+        async with cache.acquire("lookup") as entry:
+            assert not entry.done
+            assert cache.lock_key("lookup") in server.data
+            await entry.set_result("result")
+        assert cache.lock_key("lookup") not in server.data
+        assert await cache.get("lookup") == "result"
+        assert "lookup" not in cache._key_locks
+
+    async def test_acquire_cached(self, cache):
+        async with cache.acquire("valid key") as entry:
+            assert entry.done
+            assert entry.result == "value"
+
+    async def test_single_flight_between_instances(self, server):
+        first = RedisCache(server, lock_timeout=1.0, lock_poll_interval=0.01)
+        second = RedisCache(server, lock_timeout=1.0, lock_poll_interval=0.01)
+        produced = []
+
+        async def lookup(cache: RedisCache):
+            async with cache.acquire("did") as entry:
+                if entry.done:
+                    return entry.result
+                await asyncio.sleep(0.05)
+                produced.append(cache)
+                await entry.set_result("doc")
+                return "doc"
+
+        results = await asyncio.gather(lookup(first), lookup(second))
+        assert results == ["doc", "doc"]
+        assert len(produced) == 1
+
+    async def test_single_flight_falsy_value(self, server):
+        first = RedisCache(server, lock_timeout=1.0, lock_poll_interval=0.01)
+        second = RedisCache(server, lock_timeout=1.0, lock_poll_interval=0.01)
+        produced = []
+
+        async def lookup(cache: RedisCache):
+            async with cache.acquire("count") as entry:
+                if entry.done:
+                    return entry.result
+                await asyncio.sleep(0.05)
+                produced.append(cache)
+                await entry.set_result(0)
+                return 0
+
+        assert await asyncio.gather(lookup(first), lookup(second)) == [0, 0]
+        assert len(produced) == 1
+
+    async def test_release_other_token(self, cache, server):
+        await server.set(cache.lock_key("key"), "other", nx=True, px=60000)
+        await cache.release_shared("key", "mine")
+        assert await server.get(cache.lock_key("key")) == b"other"
+        await cache.release_shared("key", "other")
+        assert await server.get(cache.lock_key("key")) is None
+
+    async def test_lock_ttl(self, server):
+        cache = RedisCache(server, lock_timeout=1.0)
+        assert cache.lock_ttl == 3.0
+        async with cache.acquire("lookup"):
+            _, expires = server.data[cache.lock_key("lookup")]
+            assert expires - time.monotonic() > cache.lock_timeout
+        with pytest.raises(ValueError):
+            RedisCache(server, lock_timeout=1.0, lock_ttl=1.0)
+
+    async def test_lock_timeout(self, cache, server):
+        cache.lock_timeout = 0.02
+        await server.set(cache.lock_key("stuck"), "other", nx=True, px=60000)
+        async with cache.acquire("stuck") as entry:
+            assert not entry.done
+        assert await server.get(cache.lock_key("stuck")) == b"other"
+
+    async def test_from_url_missing_package(self):
+        with mock.patch.dict("sys.modules", {"redis.asyncio": None}):
+            with pytest.raises(CacheError):
+                RedisCache.from_url("redis://localhost:6379/0")
+
+    async def test_repr(self, cache):
+        assert "acapy:cache:" in repr(cache)
@@ -558,6 +558,18 @@ class GeneralGroup(ArgumentGroup):
             ),
         )
 
+        parser.add_argument(
+            "--lazy-load-plugins",
+            action="store_true",
+            env_var="ACAPY_LAZY_LOAD_PLUGINS",
+            help=(
+                "Avoid importing the admin routes modules of plugins at startup. "
+                "Event handlers are subscribed from the source of routes modules, "
+                "which are imported when the first event arrives, or when the "
+                "admin server is set up. Default: false."
+            ),
+        )
+
         parser.add_argument(
             "--plugin-config",
             dest="plugin_config",
@@ -658,6 +670,84 @@ class GeneralGroup(ArgumentGroup):
             env_var="ACAPY_UNIVERSAL_RESOLVER_BEARER_TOKEN",
             help="Bearer token if universal resolver instance requires authentication.",
         ),
+        parser.add_argument(
+            "--cache-max-entries",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_CACHE_MAX_ENTRIES",
+            help=(
+                "Set the maximum number of entries held by the shared in-memory "
+                "cache. Least recently used entries are evicted beyond this limit. "
+                "Default: unbounded."
+            ),
+        )
+        parser.add_argument(
+            "--cache-max-bytes",
+            type=ByteSize(min=1024),
+            metavar="<cache-size>",
+            env_var="ACAPY_CACHE_MAX_BYTES",
+            help=(
+                "Set the maximum estimated size in bytes of values held by the "
+                "shared in-memory cache. Least recently used entries are evicted "
+                "beyond this limit. Default: unbounded."
+            ),
+        )
+        parser.add_argument(
+            "--cache-redis-url",
+            type=str,
+            metavar="<redis-url>",
+            env_var="ACAPY_CACHE_REDIS_URL",
+            help=(
+                "Store the shared cache in the Redis server at this URL, in "
+                "'redis://[[username]:[password]@]host:port/db' format, so that it "
+                "is shared between agent instances. Requires 'pip install redis'."
+            ),
+        )
+        parser.add_argument(
+            "--cache-redis-prefix",
+            type=str,
+            metavar="<prefix>",
+            env_var="ACAPY_CACHE_REDIS_PREFIX",
+            help=(
+                "Prefix applied to keys stored in the Redis cache server. Agents "
+                "sharing one server should use distinct prefixes. "
+                "Default: 'acapy:cache:'."
+            ),
+        )
+        parser.add_argument(
+            "--event-notify-mode",
+            type=str,
+            choices=("sequential", "concurrent", "background"),
+            metavar="<mode>",
+            env_var="ACAPY_EVENT_NOTIFY_MODE",
+            help=(
+                "Set how event subscribers are notified: 'sequential' awaits "
+                "each subscriber in turn, 'concurrent' awaits matching subscribers "
+                "together and 'background' hands events to a bounded queue "
+                "processed by worker tasks. Default: 'sequential'."
+            ),
+        )
+        parser.add_argument(
+            "--event-subscriber-timeout",
+            type=float,
+            metavar="<seconds>",
+            env_var="ACAPY_EVENT_SUBSCRIBER_TIMEOUT",
+            help=(
+                "Cancel an event subscriber that does not complete within this "
+                "many seconds. Default: no timeout."
+            ),
+        )
+        parser.add_argument(
+            "--event-queue-size",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_EVENT_QUEUE_SIZE",
+            help=(
+                "Set the maximum number of events waiting for delivery in the "
+                "'background' notify mode. Emitters wait while the queue is full. "
+                "Default: 1000."
+            ),
+        )
 
     def get_settings(self, args: Namespace) -> dict:
         """Extract general settings."""
@@ -668,6 +758,9 @@ class GeneralGroup(ArgumentGroup):
         if args.blocked_plugins:
             settings["blocked_plugins"] = args.blocked_plugins
 
+        if args.lazy_load_plugins:
+            settings["lazy_load_plugins"] = True
+
         if args.plugin_config:
             with open(args.plugin_config, "r") as stream:
                 settings[PLUGIN_CONFIG_KEY] = yaml.safe_load(stream)
@@ -718,6 +811,32 @@ class GeneralGroup(ArgumentGroup):
         if args.universal_resolver_bearer_token:
             settings["resolver.universal.token"] = args.universal_resolver_bearer_token
 
+        if args.cache_max_entries:
+            settings["cache.max_entries"] = args.cache_max_entries
+
+        if args.cache_max_bytes:
+            settings["cache.max_bytes"] = args.cache_max_bytes
+
+        if args.cache_redis_prefix and not args.cache_redis_url:
+            raise ArgsParseError(
+                "--cache-redis-prefix cannot be used without --cache-redis-url"
+            )
+
+        if args.cache_redis_url:
+            settings["cache.redis.url"] = args.cache_redis_url
+
+        if args.cache_redis_prefix:
+            settings["cache.redis.prefix"] = args.cache_redis_prefix
+
+        if args.event_notify_mode:
+            settings["event_bus.notify_mode"] = args.event_notify_mode
+
+        if args.event_subscriber_timeout:
+            settings["event_bus.subscriber_timeout"] = args.event_subscriber_timeout
+
+        if args.event_queue_size:
+            settings["event_bus.queue_size"] = args.event_queue_size
+
         return settings
 
 
@@ -775,6 +894,28 @@ class RevocationGroup(ArgumentGroup):
                 "for anoncreds credentials. Values are 'accept' or 'reject'."
             ),
         )
+        parser.add_argument(
+            "--revocation-state-cache-size",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_REVOCATION_STATE_CACHE_SIZE",
+            help=(
+                "Keep up to <count> revocation states created for presentations, "
+                "and update a kept state when the same credential is presented "
+                "again rather than creating the state from the tails file. "
+                "Default: no cache."
+            ),
+        )
+        parser.add_argument(
+            "--revocation-state-workers",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_REVOCATION_STATE_WORKERS",
+            help=(
+                "Number of threads creating and updating revocation states when "
+                "the revocation state cache is enabled. Default: 2."
+            ),
+        )
 
     def get_settings(self, args: Namespace) -> dict:
         """Extract revocation settings."""
@@ -794,6 +935,10 @@ class RevocationGroup(ArgumentGroup):
             settings[
                 "revocation.anoncreds_legacy_support"
             ] = args.anoncreds_legacy_revocation
+        if args.revocation_state_cache_size:
+            settings["revocation.state_cache_size"] = args.revocation_state_cache_size
+        if args.revocation_state_workers:
+            settings["revocation.state_workers"] = args.revocation_state_workers
         return settings
 
 
@@ -866,6 +1011,18 @@ class LedgerGroup(ArgumentGroup):
             env_var="ACAPY_LEDGER_KEEP_ALIVE",
             help="Specifies how many seconds to keep the ledger open. Default: 5",
         )
+        parser.add_argument(
+            "--ledger-persistent-cache",
+            action="store_true",
+            env_var="ACAPY_LEDGER_PERSISTENT_CACHE",
+            help=(
+                "Keep schemas and credential definitions read from an indy-vdr "
+                "ledger in a cache on disk, so that they are not fetched again "
+                "after a restart. These objects cannot change once written. The "
+                "cache is kept beside the pool configuration, separately for each "
+                "set of genesis transactions. Default: false."
+            ),
+        )
         parser.add_argument(
             "--ledger-socks-proxy",
             type=str,
@@ -963,6 +1120,8 @@ class LedgerGroup(ArgumentGroup):
                 settings["ledger.pool_name"] = args.ledger_pool_name
             if args.ledger_keepalive:
                 settings["ledger.keepalive"] = args.ledger_keepalive
+            if args.ledger_persistent_cache:
+                settings["ledger.persistent_cache"] = True
             if args.ledger_socks_proxy:
                 settings["ledger.socks_proxy"] = args.ledger_socks_proxy
             if args.accept_taa:
@@ -1159,6 +1318,16 @@ class ProtocolGroup(ArgumentGroup):
                 "Forced to `true` as the old MIME type must never be used."
             ),
         )
+        parser.add_argument(
+            "--preload-message-types",
+            action="store_true",
+            env_var="ACAPY_PRELOAD_MESSAGE_TYPES",
+            help=(
+                "Load the classes of all registered message types at startup, "
+                "rather than when the first message of each type is received. "
+                "Default: false."
+            ),
+        )
         parser.add_argument(
             "--exch-use-unencrypted-tags",
             action="store_true",
@@ -1231,6 +1400,8 @@ class ProtocolGroup(ArgumentGroup):
         # Even if the args are not set, the config setting is True.
         settings["emit_new_didcomm_prefix"] = True
         settings["emit_new_didcomm_mime_type"] = True
+        if args.preload_message_types:
+            settings["preload_message_types"] = True
         if args.exch_use_unencrypted_tags:
             settings["exch_use_unencrypted_tags"] = True
             environ["EXCH_UNENCRYPTED_TAGS"] = "True"
@@ -1353,6 +1524,165 @@ class TransportGroup(ArgumentGroup):
                 "accumulated messages in message queue. Default value is 4."
             ),
         )
+        parser.add_argument(
+            "--outbound-http-pool-limit",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_OUTBOUND_HTTP_POOL_LIMIT",
+            help=(
+                "Set the maximum number of simultaneous outbound HTTP "
+                "connections. Default: 200."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-http-pool-limit-per-host",
+            type=BoundedInt(min=0),
+            metavar="<count>",
+            env_var="ACAPY_OUTBOUND_HTTP_POOL_LIMIT_PER_HOST",
+            help=(
+                "Set the maximum number of simultaneous outbound HTTP connections "
+                "to a single host, or 0 for no limit. Further requests to the host "
+                "wait for a free connection. Default: 50."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-http-dns-cache-ttl",
+            type=BoundedInt(min=0),
+            metavar="<seconds>",
+            env_var="ACAPY_OUTBOUND_HTTP_DNS_CACHE_TTL",
+            help=(
+                "Set the number of seconds resolved host addresses are cached for "
+                "outbound HTTP connections, or 0 to disable caching. Default: 10."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-http-keepalive-timeout",
+            type=float,
+            metavar="<seconds>",
+            env_var="ACAPY_OUTBOUND_HTTP_KEEPALIVE_TIMEOUT",
+            help=(
+                "Set the number of seconds idle outbound HTTP connections are kept "
+                "open for reuse. Default: 15."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-retry-backoff",
+            type=float,
+            metavar="<seconds>",
+            env_var="ACAPY_OUTBOUND_RETRY_BACKOFF",
+            help=(
+                "Set the delay in seconds before the first retry of a failed "
+                "outbound delivery. The delay doubles for each further retry, "
+                "up to --outbound-retry-max-delay. Default: 10."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-retry-max-delay",
+            type=float,
+            metavar="<seconds>",
+            env_var="ACAPY_OUTBOUND_RETRY_MAX_DELAY",
+            help="Set the maximum delay between outbound retries. Default: 600.",
+        )
+        parser.add_argument(
+            "--outbound-retry-jitter",
+            type=float,
+            metavar="<fraction>",
+            env_var="ACAPY_OUTBOUND_RETRY_JITTER",
+            help=(
+                "Set the maximum fraction, between 0 and 1, removed at random from "
+                "each outbound retry delay. Default: 0.5."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-breaker-threshold",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_OUTBOUND_BREAKER_THRESHOLD",
+            help=(
+                "Set the number of consecutive delivery failures to an endpoint "
+                "after which deliveries to that endpoint are held for a time. "
+                "Default: 5."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-breaker-reset",
+            type=float,
+            metavar="<seconds>",
+            env_var="ACAPY_OUTBOUND_BREAKER_RESET",
+            help=(
+                "Set the number of seconds deliveries to a failing endpoint are "
+                "held before a trial delivery is made. Default: 30."
+            ),
+        )
+        parser.add_argument(
+            "--persistent-outbound-queue",
+            nargs="?",
+            const="DEFAULT",
+            metavar="<path>",
+            env_var="ACAPY_PERSISTENT_OUTBOUND_QUEUE",
+            help=(
+                "Write encoded outbound messages to a log in the given directory "
+                "until they are delivered, so that undelivered messages are "
+                "retried after a restart. Without a path, the log is kept in the "
+                "agent storage directory. Default: messages are kept in memory only."
+            ),
+        )
+        parser.add_argument(
+            "--outbound-queue-max-buffered",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_OUTBOUND_QUEUE_MAX_BUFFERED",
+            help=(
+                "Set the maximum number of outbound messages held in memory when "
+                "--persistent-outbound-queue is enabled. Further messages are kept "
+                "in the log until there is room. Default: no limit."
+            ),
+        )
+        parser.add_argument(
+            "--crypto-workers",
+            type=BoundedInt(min=0),
+            metavar="<count>",
+            env_var="ACAPY_CRYPTO_WORKERS",
+            help=(
+                "Set the number of worker threads used to pack and unpack DIDComm "
+                "envelopes off the event loop, in batches. Default: 0, this work "
+                "runs on the default executor."
+            ),
+        )
+        parser.add_argument(
+            "--crypto-batch-size",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_CRYPTO_BATCH_SIZE",
+            help=(
+                "Set the maximum number of queued envelopes handed to a crypto "
+                "worker at once. Default: 8."
+            ),
+        )
+        parser.add_argument(
+            "--crypto-max-pending",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_CRYPTO_MAX_PENDING",
+            help=(
+                "Set the maximum number of envelopes queued or being processed by "
+                "the crypto workers. Further messages wait until there is room. "
+                "Default: 1000."
+            ),
+        )
+        parser.add_argument(
+            "--inbound-connection-index-size",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_INBOUND_CONNECTION_INDEX_SIZE",
+            help=(
+                "Keep an in-memory index of up to <count> active connections by "
+                "the verkeys of their messages, so that the connection for an "
+                "inbound message is found without querying storage. Connections "
+                "updated by another agent instance sharing the wallet are not "
+                "refreshed in the index. Default: no index."
+            ),
+        )
         parser.add_argument(
             "--ws-heartbeat-interval",
             default=3,
@@ -1397,6 +1727,57 @@ class TransportGroup(ArgumentGroup):
             settings["transport.max_message_size"] = args.max_message_size
         if args.max_outbound_retry:
             settings["transport.max_outbound_retry"] = args.max_outbound_retry
+        if args.outbound_http_pool_limit:
+            settings["transport.http.pool_limit"] = args.outbound_http_pool_limit
+        if args.outbound_http_pool_limit_per_host is not None:
+            settings[
+                "transport.http.pool_limit_per_host"
+            ] = args.outbound_http_pool_limit_per_host
+        if args.outbound_http_dns_cache_ttl is not None:
+            settings["transport.http.dns_cache_ttl"] = args.outbound_http_dns_cache_ttl
+        if args.outbound_http_keepalive_timeout is not None:
+            settings[
+                "transport.http.keepalive_timeout"
+            ] = args.outbound_http_keepalive_timeout
+        if args.outbound_retry_backoff is not None:
+            settings["transport.outbound_retry.base"] = args.outbound_retry_backoff
+        if args.outbound_retry_max_delay is not None:
+            settings["transport.outbound_retry.max_delay"] = (
+                args.outbound_retry_max_delay
+            )
+        if args.outbound_retry_jitter is not None:
+            if not 0 <= args.outbound_retry_jitter <= 1:
+                raise ArgsParseError(
+                    "Parameter --outbound-retry-jitter must be between 0 and 1"
+                )
+            settings["transport.outbound_retry.jitter"] = args.outbound_retry_jitter
+        if args.outbound_breaker_threshold:
+            settings[
+                "transport.outbound_breaker.threshold"
+            ] = args.outbound_breaker_threshold
+        if args.outbound_breaker_reset is not None:
+            settings["transport.outbound_breaker.reset"] = args.outbound_breaker_reset
+        if args.persistent_outbound_queue:
+            settings["transport.outbound_queue.path"] = args.persistent_outbound_queue
+        if args.outbound_queue_max_buffered:
+            if not args.persistent_outbound_queue:
+                raise ArgsParseError(
+                    "Parameter --outbound-queue-max-buffered requires "
+                    "--persistent-outbound-queue"
+                )
+            settings[
+                "transport.outbound_queue.max_buffered"
+            ] = args.outbound_queue_max_buffered
+        if args.crypto_workers is not None:
+            settings["transport.crypto.workers"] = args.crypto_workers
+        if args.crypto_batch_size:
+            settings["transport.crypto.batch_size"] = args.crypto_batch_size
+        if args.crypto_max_pending:
+            settings["transport.crypto.max_pending"] = args.crypto_max_pending
+        if args.inbound_connection_index_size:
+            settings[
+                "transport.inbound_connection_index_size"
+            ] = args.inbound_connection_index_size
         if args.ws_heartbeat_interval:
             settings["transport.ws.heartbeat_interval"] = args.ws_heartbeat_interval
         if args.ws_timeout_interval:
@@ -1618,6 +1999,18 @@ class WalletGroup(ArgumentGroup):
                 " is expected."
             ),
         )
+        parser.add_argument(
+            "--wallet-key-cache-size",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_WALLET_KEY_CACHE_SIZE",
+            help=(
+                "Keep up to <count> recently used private key handles in memory, "
+                "so that signing, packing and unpacking messages does not read "
+                "the key from storage each time. Applies to askar wallets. "
+                "Default: keys are not cached."
+            ),
+        )
         parser.add_argument(
             "--wallet-storage-creds",
             type=str,
@@ -1675,6 +2068,8 @@ class WalletGroup(ArgumentGroup):
             settings["wallet.type"] = args.wallet_type
         if args.wallet_key_derivation_method:
             settings["wallet.key_derivation_method"] = args.wallet_key_derivation_method
+        if args.wallet_key_cache_size:
+            settings["wallet.key_cache_size"] = args.wallet_key_cache_size
         if args.wallet_storage_config:
             settings["wallet.storage_config"] = args.wallet_storage_config
         if args.wallet_storage_creds:
@@ -1745,8 +2140,8 @@ class MultitenantGroup(ArgumentGroup):
                 "Specify multitenancy configuration in key=value pairs. "
                 'For example: "wallet_type=askar-profile wallet_name=askar-profile-name" '
                 "Possible values: wallet_name, wallet_key, cache_size, "
-                'key_derivation_method. "wallet_name" is only used when '
-                '"wallet_type" is "askar-profile"'
+                'key_cache_size, key_derivation_method. "wallet_name" is only '
+                'used when "wallet_type" is "askar-profile"'
             ),
         )
         parser.add_argument(
@@ -1800,6 +2195,11 @@ class MultitenantGroup(ArgumentGroup):
                             "cache_size"
                         )
 
+                    if multitenancy_config.get("key_cache_size"):
+                        settings[
+                            "multitenant.key_cache_size"
+                        ] = multitenancy_config.get("key_cache_size")
+
                     if multitenancy_config.get("key_derivation_method"):
                         settings[
                             "multitenant.key_derivation_method"
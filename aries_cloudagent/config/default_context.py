@@ -3,6 +3,7 @@
 from ..anoncreds.registry import AnonCredsRegistry
 from ..cache.base import BaseCache
 from ..cache.in_memory import InMemoryCache
+from ..connections.inbound_index import InboundConnectionIndex
 from ..core.event_bus import EventBus
 from ..core.goal_code_registry import GoalCodeRegistry
 from ..core.plugin_registry import PluginRegistry
@@ -14,10 +15,12 @@ from ..protocols.didcomm_prefix import DIDCommPrefix
 from ..protocols.introduction.v0_1.base_service import BaseIntroductionService
 from ..protocols.introduction.v0_1.demo_service import DemoIntroductionService
 from ..resolver.did_resolver import DIDResolver
+from ..revocation.state_cache import RevocationStateCache
 from ..tails.base import BaseTailsServer
 from ..transport.wire_format import BaseWireFormat
 from ..utils.dependencies import is_indy_sdk_module_installed
 from ..utils.stats import Collector
+from ..wallet.crypto_pool import CryptoWorkerPool
 from ..wallet.default_verification_key_strategy import (
     DefaultVerificationKeyStrategy,
     BaseVerificationKeyStrategy,
@@ -42,8 +45,21 @@ class DefaultContextBuilder(ContextBuilder):
             collector = Collector(log_path=timing_log)
             context.injector.bind_instance(Collector, collector)
 
-        # Shared in-memory cache
-        context.injector.bind_instance(BaseCache, InMemoryCache())
+        # Shared cache, held in memory unless a Redis server is configured
+        redis_url = context.settings.get("cache.redis.url")
+        if redis_url:
+            from ..cache.redis import RedisCache
+
+            cache = RedisCache.from_url(
+                redis_url,
+                prefix=context.settings.get("cache.redis.prefix", "acapy:cache:"),
+            )
+        else:
+            cache = InMemoryCache(
+                max_entries=context.settings.get("cache.max_entries"),
+                max_bytes=context.settings.get("cache.max_bytes"),
+            )
+        context.injector.bind_instance(BaseCache, cache)
 
         # Global protocol registry
         context.injector.bind_instance(ProtocolRegistry, ProtocolRegistry())
@@ -52,7 +68,58 @@ class DefaultContextBuilder(ContextBuilder):
         context.injector.bind_instance(GoalCodeRegistry, GoalCodeRegistry())
 
         # Global event bus
-        context.injector.bind_instance(EventBus, EventBus())
+        context.injector.bind_instance(
+            EventBus,
+            EventBus(
+                context.settings.get("event_bus.notify_mode", EventBus.MODE_SEQUENTIAL),
+                subscriber_timeout=context.settings.get("event_bus.subscriber_timeout"),
+                queue_size=context.settings.get("event_bus.queue_size", 1000),
+                collector=context.inject_or(Collector),
+            ),
+        )
+
+        # Opt-in worker threads for DIDComm envelope encryption
+        crypto_workers = context.settings.get("transport.crypto.workers")
+        if crypto_workers:
+            context.injector.bind_instance(
+                CryptoWorkerPool,
+                CryptoWorkerPool(
+                    crypto_workers,
+                    batch_size=context.settings.get("transport.crypto.batch_size", 8),
+                    max_pending=context.settings.get(
+                        "transport.crypto.max_pending", 1000
+                    ),
+                    collector=context.inject_or(Collector),
+                ),
+            )
+
+        # Opt-in cache of askar key handles
+        key_cache_size = context.settings.get("wallet.key_cache_size")
+        if key_cache_size:
+            from ..askar.key_cache import AskarKeyCache
+
+            context.injector.bind_instance(
+                AskarKeyCache,
+                AskarKeyCache(key_cache_size, collector=context.inject_or(Collector)),
+            )
+
+        # Opt-in index of connections for inbound messages
+        index_size = context.settings.get("transport.inbound_connection_index_size")
+        if index_size:
+            context.injector.bind_instance(
+                InboundConnectionIndex, InboundConnectionIndex(index_size)
+            )
+
+        # Opt-in cache of holder revocation states
+        state_cache_size = context.settings.get("revocation.state_cache_size")
+        if state_cache_size:
+            context.injector.bind_instance(
+                RevocationStateCache,
+                RevocationStateCache(
+                    state_cache_size,
+                    workers=context.settings.get("revocation.state_workers", 2),
+                ),
+            )
 
         # Global did resolver
         context.injector.bind_instance(DIDResolver, DIDResolver([]))
@@ -127,7 +194,8 @@ class DefaultContextBuilder(ContextBuilder):
         """Set up plugin registry and load plugins."""
 
         plugin_registry = PluginRegistry(
-            blocklist=self.settings.get("blocked_plugins", [])
+            blocklist=self.settings.get("blocked_plugins", []),
+            lazy=bool(self.settings.get("lazy_load_plugins")),
         )
         wallet_type = self.settings.get("wallet.type")
         context.injector.bind_instance(PluginRegistry, plugin_registry)
@@ -171,3 +239,6 @@ class DefaultContextBuilder(ContextBuilder):
 
         # Register message protocols
         await plugin_registry.init_context(context)
+
+        if self.settings.get("preload_message_types"):
+            context.inject(ProtocolRegistry).preload_message_classes()
@@ -633,3 +633,281 @@ class TestArgParse(IsolatedAsyncioTestCase):
         )
         with self.assertRaises(argparse.ArgsParseError):
             group.get_settings(result)
+
+    def test_cache_bounds(self):
+        """Test shared cache bound flags."""
+        parser = argparse.create_argument_parser()
+        group = argparse.GeneralGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(["-e", "test"])
+        settings = group.get_settings(result)
+        assert "cache.max_entries" not in settings
+        assert "cache.max_bytes" not in settings
+
+        result = parser.parse_args(
+            ["-e", "test", "--cache-max-entries", "1000", "--cache-max-bytes", "64M"]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("cache.max_entries") == 1000
+        assert settings.get("cache.max_bytes") == 64 << 20
+
+        result = parser.parse_args(
+            [
+                "-e",
+                "test",
+                "--cache-redis-url",
+                "redis://localhost:6379/0",
+                "--cache-redis-prefix",
+                "agent:",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("cache.redis.url") == "redis://localhost:6379/0"
+        assert settings.get("cache.redis.prefix") == "agent:"
+
+        result = parser.parse_args(["-e", "test", "--cache-redis-prefix", "agent:"])
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
+
+    def test_persistent_outbound_queue(self):
+        """Test persistent outbound queue flags."""
+        parser = argparse.create_argument_parser()
+        group = argparse.TransportGroup()
+        group.add_arguments(parser)
+        base_args = ["-it", "http", "0.0.0.0", "80", "-ot", "http"]
+
+        result = parser.parse_args(base_args)
+        settings = group.get_settings(result)
+        assert "transport.outbound_queue.path" not in settings
+
+        result = parser.parse_args(base_args + ["--persistent-outbound-queue"])
+        settings = group.get_settings(result)
+        assert settings.get("transport.outbound_queue.path") == "DEFAULT"
+
+        result = parser.parse_args(
+            base_args
+            + [
+                "--persistent-outbound-queue",
+                "/var/acapy/outbound",
+                "--outbound-queue-max-buffered",
+                "1000",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("transport.outbound_queue.path") == "/var/acapy/outbound"
+        assert settings.get("transport.outbound_queue.max_buffered") == 1000
+
+        result = parser.parse_args(
+            base_args + ["--outbound-queue-max-buffered", "1000"]
+        )
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
+
+    def test_outbound_retry(self):
+        """Test outbound retry and circuit breaker flags."""
+        parser = argparse.create_argument_parser()
+        group = argparse.TransportGroup()
+        group.add_arguments(parser)
+        base_args = ["-it", "http", "0.0.0.0", "80", "-ot", "http"]
+
+        result = parser.parse_args(base_args)
+        settings = group.get_settings(result)
+        assert "transport.outbound_retry.base" not in settings
+        assert "transport.outbound_breaker.threshold" not in settings
+
+        result = parser.parse_args(
+            base_args
+            + [
+                "--outbound-retry-backoff",
+                "2.5",
+                "--outbound-retry-max-delay",
+                "120",
+                "--outbound-retry-jitter",
+                "0",
+                "--outbound-breaker-threshold",
+                "3",
+                "--outbound-breaker-reset",
+                "15",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("transport.outbound_retry.base") == 2.5
+        assert settings.get("transport.outbound_retry.max_delay") == 120
+        assert settings.get("transport.outbound_retry.jitter") == 0
+        assert settings.get("transport.outbound_breaker.threshold") == 3
+        assert settings.get("transport.outbound_breaker.reset") == 15
+
+        result = parser.parse_args(base_args + ["--outbound-retry-jitter", "1.5"])
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
+
+    def test_outbound_http_pool(self):
+        """Test outbound HTTP connection pool flags."""
+        parser = argparse.create_argument_parser()
+        group = argparse.TransportGroup()
+        group.add_arguments(parser)
+        base_args = ["-it", "http", "0.0.0.0", "80", "-ot", "http"]
+
+        result = parser.parse_args(base_args)
+        settings = group.get_settings(result)
+        assert not any(key.startswith("transport.http.") for key in settings)
+
+        result = parser.parse_args(
+            base_args
+            + [
+                "--outbound-http-pool-limit",
+                "500",
+                "--outbound-http-pool-limit-per-host",
+                "0",
+                "--outbound-http-dns-cache-ttl",
+                "300",
+                "--outbound-http-keepalive-timeout",
+                "60",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("transport.http.pool_limit") == 500
+        assert settings.get("transport.http.pool_limit_per_host") == 0
+        assert settings.get("transport.http.dns_cache_ttl") == 300
+        assert settings.get("transport.http.keepalive_timeout") == 60
+
+    def test_crypto_workers(self):
+        """Test crypto worker pool flags."""
+        parser = argparse.create_argument_parser()
+        group = argparse.TransportGroup()
+        group.add_arguments(parser)
+        base_args = ["-it", "http", "0.0.0.0", "80", "-ot", "http"]
+
+        result = parser.parse_args(base_args)
+        settings = group.get_settings(result)
+        assert not any(key.startswith("transport.crypto.") for key in settings)
+
+        result = parser.parse_args(
+            base_args
+            + [
+                "--crypto-workers",
+                "0",
+                "--crypto-batch-size",
+                "16",
+                "--crypto-max-pending",
+                "200",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("transport.crypto.workers") == 0
+        assert settings.get("transport.crypto.batch_size") == 16
+        assert settings.get("transport.crypto.max_pending") == 200
+
+    def test_preload_message_types(self):
+        """Test message class preload flag."""
+        parser = argparse.create_argument_parser()
+        group = argparse.ProtocolGroup()
+        group.add_arguments(parser)
+        argparse.TransportGroup().add_arguments(parser)
+        base_args = ["-it", "http", "0.0.0.0", "80", "-ot", "http"]
+
+        result = parser.parse_args(base_args)
+        settings = group.get_settings(result)
+        assert "preload_message_types" not in settings
+
+        result = parser.parse_args(base_args + ["--preload-message-types"])
+        settings = group.get_settings(result)
+        assert settings.get("preload_message_types") is True
+
+    def test_inbound_connection_index_size(self):
+        """Test inbound connection index flag."""
+        parser = argparse.create_argument_parser()
+        group = argparse.TransportGroup()
+        group.add_arguments(parser)
+        base_args = ["-it", "http", "0.0.0.0", "80", "-ot", "http"]
+
+        result = parser.parse_args(base_args)
+        settings = group.get_settings(result)
+        assert "transport.inbound_connection_index_size" not in settings
+
+        result = parser.parse_args(
+            base_args + ["--inbound-connection-index-size", "500"]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("transport.inbound_connection_index_size") == 500
+
+        with self.assertRaises(SystemExit):
+            parser.parse_args(base_args + ["--inbound-connection-index-size", "0"])
+
+    def test_wallet_key_cache_size(self):
+        """Test wallet key cache flag."""
+        parser = argparse.create_argument_parser()
+        group = argparse.WalletGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args([])
+        settings = group.get_settings(result)
+        assert "wallet.key_cache_size" not in settings
+
+        result = parser.parse_args(["--wallet-key-cache-size", "64"])
+        settings = group.get_settings(result)
+        assert settings.get("wallet.key_cache_size") == 64
+
+        with self.assertRaises(SystemExit):
+            parser.parse_args(["--wallet-key-cache-size", "0"])
+
+    def test_revocation_state_cache(self):
+        """Test revocation state cache flags."""
+        parser = argparse.create_argument_parser()
+        group = argparse.RevocationGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args([])
+        settings = group.get_settings(result)
+        assert "revocation.state_cache_size" not in settings
+        assert "revocation.state_workers" not in settings
+
+        result = parser.parse_args(
+            [
+                "--revocation-state-cache-size",
+                "200",
+                "--revocation-state-workers",
+                "4",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("revocation.state_cache_size") == 200
+        assert settings.get("revocation.state_workers") == 4
+
+        with self.assertRaises(SystemExit):
+            parser.parse_args(["--revocation-state-cache-size", "0"])
+
+    def test_ledger_persistent_cache(self):
+        """Test persistent ledger cache flag."""
+        parser = argparse.create_argument_parser()
+        group = argparse.LedgerGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(["--genesis-url", "http://localhost:9000/genesis"])
+        settings = group.get_settings(result)
+        assert "ledger.persistent_cache" not in settings
+
+        result = parser.parse_args(
+            [
+                "--genesis-url",
+                "http://localhost:9000/genesis",
+                "--ledger-persistent-cache",
+            ]
+        )
+        settings = group.get_settings(result)
+        assert settings.get("ledger.persistent_cache") is True
+
+    def test_lazy_load_plugins(self):
+        """Test lazy plugin loading flag."""
+        parser = argparse.create_argument_parser()
+        group = argparse.GeneralGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(["--endpoint", "localhost"])
+        settings = group.get_settings(result)
+        assert "lazy_load_plugins" not in settings
+
+        result = parser.parse_args(["--endpoint", "localhost", "--lazy-load-plugins"])
+        settings = group.get_settings(result)
+        assert settings.get("lazy_load_plugins") is True
@@ -2,10 +2,15 @@ from tempfile import NamedTemporaryFile
 
 from unittest import IsolatedAsyncioTestCase
 
+from ...askar.key_cache import AskarKeyCache
 from ...cache.base import BaseCache
+from ...core.event_bus import EventBus
+from ...core.plugin_registry import PluginRegistry
 from ...core.profile import ProfileManager
 from ...core.protocol_registry import ProtocolRegistry
+from ...revocation.state_cache import RevocationStateCache
 from ...transport.wire_format import BaseWireFormat
+from ...wallet.crypto_pool import CryptoWorkerPool
 
 from ..default_context import DefaultContextBuilder
 from ..injection_context import InjectionContext
@@ -36,3 +41,69 @@ class TestDefaultContext(IsolatedAsyncioTestCase):
         )
         result = await builder.build_context()
         assert isinstance(result, InjectionContext)
+
+    async def test_build_context_crypto_workers(self):
+        """Test context init with the opt-in crypto worker pool."""
+
+        for workers in (None, 0):
+            settings = {"transport.crypto.workers": workers}
+            builder = DefaultContextBuilder(settings=settings)
+            result = await builder.build_context()
+            assert result.inject_or(CryptoWorkerPool) is None
+
+        builder = DefaultContextBuilder(settings={"transport.crypto.workers": 2})
+        result = await builder.build_context()
+        assert result.inject(CryptoWorkerPool).workers == 2
+
+    async def test_build_context_key_cache(self):
+        """Test context init with the askar key cache enabled."""
+
+        builder = DefaultContextBuilder()
+        result = await builder.build_context()
+        assert result.inject_or(AskarKeyCache) is None
+
+        builder = DefaultContextBuilder(settings={"wallet.key_cache_size": 32})
+        result = await builder.build_context()
+        assert result.inject(AskarKeyCache).capacity == 32
+
+    async def test_build_context_revocation_state_cache(self):
+        """Test context init with the revocation state cache enabled."""
+
+        builder = DefaultContextBuilder()
+        result = await builder.build_context()
+        assert result.inject_or(RevocationStateCache) is None
+
+        builder = DefaultContextBuilder(
+            settings={
+                "revocation.state_cache_size": 50,
+                "revocation.state_workers": 3,
+            }
+        )
+        result = await builder.build_context()
+        cache = result.inject(RevocationStateCache)
+        assert cache.capacity == 50
+        assert cache.pool.workers == 3
+
+    async def test_build_context_preload_message_types(self):
+        """Test context init with message classes preloaded."""
+
+        builder = DefaultContextBuilder()
+        result = await builder.build_context()
+        assert not result.inject(ProtocolRegistry)._resolved
+
+        builder = DefaultContextBuilder(settings={"preload_message_types": True})
+        result = await builder.build_context()
+        assert (
+            "https://didcomm.org/trust_ping/1.0/ping"
+            in result.inject(ProtocolRegistry)._resolved
+        )
+
+    async def test_build_context_lazy_load_plugins(self):
+        """Test context init with plugins loaded lazily."""
+
+        builder = DefaultContextBuilder(settings={"lazy_load_plugins": True})
+        result = await builder.build_context()
+        registry = result.inject(PluginRegistry)
+        assert registry._lazy
+        assert "aries_cloudagent.wallet" in registry.plugin_names
+        assert result.inject(EventBus).topic_patterns_to_subscribers
@@ -49,6 +49,7 @@ from ..wallet.did_method import SOV
 from ..wallet.error import WalletNotFoundError
 from ..wallet.key_type import ED25519
 from ..wallet.util import b64_to_bytes, bytes_to_b58
+from .inbound_index import InboundConnectionEntry, InboundConnectionIndex
 from .models.conn_record import ConnRecord
 from .models.connection_target import ConnectionTarget
 from .models.diddoc import DIDDoc, PublicKey, PublicKeyType, Service
@@ -710,6 +711,10 @@ class BaseConnectionManager:
         resolved = False
 
         if receipt.sender_verkey and receipt.recipient_verkey:
+            index = self._profile.inject_or(InboundConnectionIndex)
+            if index is not None:
+                return await self._find_indexed_inbound_connection(index, receipt)
+
             cache_key = (
                 f"connection_by_verkey::{receipt.sender_verkey}"
                 f"::{receipt.recipient_verkey}"
@@ -742,6 +747,109 @@ class BaseConnectionManager:
             connection = await self.resolve_inbound_connection(receipt)
         return connection
 
+    async def _find_indexed_inbound_connection(
+        self, index: InboundConnectionIndex, receipt: MessageReceipt
+    ) -> Optional[ConnRecord]:
+        """Find the connection for a receipt in the index, or add it on a miss."""
+
+        scope = index.scope_for(self._profile)
+        entry = index.get(scope, receipt.sender_verkey, receipt.recipient_verkey)
+        if entry is not None:
+            receipt.sender_did = entry.sender_did
+            receipt.recipient_did = entry.recipient_did
+            receipt.recipient_did_public = entry.recipient_did_public
+            return ConnRecord.from_storage(entry.connection_id, json.loads(entry.record))
+
+        generation = index.generation
+        connection = await self.resolve_inbound_connection(receipt)
+        # connections still being established are not indexed
+        if (
+            connection
+            and ConnRecord.State.get(connection.state) is ConnRecord.State.COMPLETED
+        ):
+            index.put(
+                scope,
+                receipt.sender_verkey,
+                receipt.recipient_verkey,
+                InboundConnectionEntry(
+                    connection.connection_id,
+                    receipt.sender_did,
+                    receipt.recipient_did,
+                    bool(receipt.recipient_did_public),
+                    json.dumps(connection.value),
+                ),
+                generation,
+            )
+        return connection
+
+    async def warm_inbound_connection_index(self) -> int:
+        """Add the most recently updated active connections to the index.
+
+        Entries already in the index are kept, and connections saved or deleted
+        while the connections are read are skipped.
+
+        Returns:
+            The number of index entries added
+
+        """
+        index = self._profile.inject_or(InboundConnectionIndex)
+        if index is None:
+            return 0
+
+        scope = index.scope_for(self._profile)
+        generation = index.generation
+        async with self._profile.session() as session:
+            records = await ConnRecord.query(session)
+            wallet = session.inject(BaseWallet)
+            my_dids = {info.did: info for info in await wallet.get_local_dids()}
+            storage = session.inject(BaseStorage)
+            their_keys = {}
+            for key_record in await storage.find_all_records(
+                self.RECORD_TYPE_DID_KEY
+            ):
+                their_keys.setdefault(key_record.tags["did"], []).append(
+                    key_record.tags["key"]
+                )
+
+        active = sorted(
+            (
+                record
+                for record in records
+                if ConnRecord.State.get(record.state) is ConnRecord.State.COMPLETED
+                and record.my_did in my_dids
+                and record.their_did in their_keys
+            ),
+            key=lambda record: record.updated_at or "",
+            reverse=True,
+        )
+        changed = index.changed_since(generation)
+        if changed is None:
+            return 0
+        added = 0
+        for record in active:
+            if (scope, record.connection_id) in changed:
+                continue
+            my_info = my_dids[record.my_did]
+            value = json.dumps(record.value)
+            for their_key in their_keys[record.their_did]:
+                if added >= index.capacity:
+                    return added
+                if index.get(scope, their_key, my_info.verkey) is None:
+                    index.put(
+                        scope,
+                        their_key,
+                        my_info.verkey,
+                        InboundConnectionEntry(
+                            record.connection_id,
+                            record.their_did,
+                            record.my_did,
+                            my_info.metadata.get("posted") is True,
+                            value,
+                        ),
+                    )
+                    added += 1
+        return added
+
     async def resolve_inbound_connection(
         self, receipt: MessageReceipt
     ) -> Optional[ConnRecord]:
@@ -0,0 +1,191 @@
+"""Index of connections by the verkeys of inbound messages."""
+
+import json
+
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, Deque, Dict, NamedTuple, Optional, Set, Tuple
+
+from ..core.profile import Profile
+
+if TYPE_CHECKING:
+    from .models.conn_record import ConnRecord
+
+
+class InboundConnectionEntry(NamedTuple):
+    """The connection and DIDs found for a sender and recipient verkey."""
+
+    connection_id: str
+    sender_did: Optional[str]
+    recipient_did: Optional[str]
+    recipient_did_public: bool
+    record: str
+
+
+class InboundConnectionIndex:
+    """LRU index of connections by sender and recipient verkey.
+
+    Entries hold the stored value of the connection record, so that the
+    connection for an inbound message is found without querying storage.
+    Connection records update or remove the entries for their connection when
+    they are saved or deleted.
+
+    Entries are scoped by profile, so that a connection is only returned to
+    the wallet which holds it. Every invalidation increments `generation`. An
+    entry resolved before an invalidation, or before any connection record is
+    saved, cannot be added afterwards. The connections invalidated since a
+    recent generation are retained, so that a long scan of connections only
+    needs to skip those.
+    """
+
+    def __init__(self, capacity: int):
+        """Initialize an `InboundConnectionIndex` instance.
+
+        Args:
+            capacity: The maximum number of entries to retain
+        """
+
+        self._entries: "OrderedDict[Tuple[str, str, str], InboundConnectionEntry]" = (
+            OrderedDict()
+        )
+        self._by_connection: Dict[Tuple[str, str], Set[Tuple[str, str, str]]] = {}
+        self._changes: Deque[Optional[Tuple[str, str]]] = deque(maxlen=capacity)
+        self.capacity = capacity
+        self.generation = 0
+
+    @staticmethod
+    def scope_for(profile: Profile) -> str:
+        """Get the index scope for the connections of a profile."""
+
+        return "{}:{}".format(profile.name, getattr(profile, "profile_id", None) or "")
+
+    def get(
+        self, scope: str, sender_verkey: str, recipient_verkey: str
+    ) -> Optional[InboundConnectionEntry]:
+        """Get the entry for a sender and recipient verkey.
+
+        Args:
+            scope: The profile scope of the connection
+            sender_verkey: The verkey of the message sender
+            recipient_verkey: The verkey the message was sent to
+        """
+
+        key = (scope, sender_verkey, recipient_verkey)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(
+        self,
+        scope: str,
+        sender_verkey: str,
+        recipient_verkey: str,
+        entry: InboundConnectionEntry,
+        generation: int = None,
+    ):
+        """Add an entry to the index.
+
+        Args:
+            scope: The profile scope of the connection
+            sender_verkey: The verkey of the message sender
+            recipient_verkey: The verkey the message was sent to
+            entry: The connection and DIDs found for these verkeys
+            generation: The generation observed when resolution started
+        """
+
+        if generation is not None and generation != self.generation:
+            return
+        key = (scope, sender_verkey, recipient_verkey)
+        self._discard(key)
+        self._entries[key] = entry
+        self._by_connection.setdefault((scope, entry.connection_id), set()).add(key)
+        while len(self._entries) > self.capacity:
+            self._discard(next(iter(self._entries)))
+
+    def update(self, scope: str, record: "ConnRecord"):
+        """Update the entries for a connection after its record is saved.
+
+        Entries are removed instead if the DIDs of the connection changed.
+
+        Args:
+            scope: The profile scope of the connection
+            record: The saved connection record
+        """
+
+        # an entry resolved before the save may hold the previous record
+        self._invalidate((scope, record.connection_id))
+        keys = self._by_connection.get((scope, record.connection_id))
+        if not keys:
+            return
+        value = json.dumps(record.value)
+        for key in list(keys):
+            entry = self._entries[key]
+            if (
+                entry.recipient_did == record.my_did
+                and entry.sender_did == record.their_did
+            ):
+                self._entries[key] = entry._replace(record=value)
+            else:
+                self._discard(key)
+
+    def remove_connection(self, scope: str, connection_id: str):
+        """Remove the entries for a connection.
+
+        Args:
+            scope: The profile scope of the connection
+            connection_id: The connection identifier
+        """
+
+        self._invalidate((scope, connection_id))
+        for key in list(self._by_connection.get((scope, connection_id), ())):
+            self._discard(key)
+
+    def clear(self):
+        """Remove all entries from the index."""
+
+        self._invalidate(None)
+        self._entries.clear()
+        self._by_connection.clear()
+
+    def changed_since(self, generation: int) -> Optional[Set[Tuple[str, str]]]:
+        """Get the connections invalidated since a generation.
+
+        Args:
+            generation: The generation observed before the changes
+
+        Returns:
+            The profile scope and identifier of each invalidated connection, or
+            `None` if the index was cleared or the changes are no longer known
+
+        """
+
+        count = self.generation - generation
+        if count > len(self._changes):
+            return None
+        changed = set(list(self._changes)[len(self._changes) - count :])
+        if None in changed:
+            return None
+        return changed
+
+    def _invalidate(self, conn_key: Optional[Tuple[str, str]]):
+        """Start a new generation, recording the connection invalidated."""
+
+        self.generation += 1
+        self._changes.append(conn_key)
+
+    def _discard(self, key: Tuple[str, str, str]):
+        """Remove an entry, if present."""
+
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            conn_key = (key[0], entry.connection_id)
+            keys = self._by_connection.get(conn_key)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_connection[conn_key]
+
+    def __len__(self) -> int:
+        """Get the number of entries in the index."""
+
+        return len(self._entries)
@@ -33,6 +33,7 @@ from ...protocols.out_of_band.v1_0.messages.invitation import (
 from ...storage.base import BaseStorage
 from ...storage.error import StorageNotFoundError
 from ...storage.record import StorageRecord
+from ..inbound_index import InboundConnectionIndex
 
 
 class ConnRecord(BaseRecord):
@@ -513,6 +514,10 @@ class ConnRecord(BaseRecord):
         cache_key = f"connection_target::{self.connection_id}"
         await self.clear_cached_key(session, cache_key)
 
+        index = session.inject_or(InboundConnectionIndex)
+        if index is not None:
+            index.update(index.scope_for(session.profile), self)
+
     async def delete_record(self, session: ProfileSession):
         """Perform connection record deletion actions.
 
@@ -522,6 +527,12 @@ class ConnRecord(BaseRecord):
         """
         await super().delete_record(session)
 
+        index = session.inject_or(InboundConnectionIndex)
+        if index is not None and self.connection_id:
+            index.remove_connection(
+                index.scope_for(session.profile), self.connection_id
+            )
+
         storage = session.inject(BaseStorage)
         # Delete metadata
         if self.connection_id:
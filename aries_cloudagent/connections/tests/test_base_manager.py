@@ -50,6 +50,7 @@ from ...wallet.in_memory import InMemoryWallet
 from ...wallet.key_type import ED25519
 from ...wallet.util import b58_to_bytes, bytes_to_b64
 from ..base_manager import BaseConnectionManager
+from ..inbound_index import InboundConnectionIndex
 
 
 class TestBaseConnectionManager(IsolatedAsyncioTestCase):
@@ -1167,6 +1168,107 @@ class TestBaseConnectionManager(IsolatedAsyncioTestCase):
             conn_rec = await self.manager.find_inbound_connection(receipt)
             assert conn_rec
 
+    async def test_find_inbound_connection_index(self):
+        index = InboundConnectionIndex(10)
+        self.context.injector.bind_instance(InboundConnectionIndex, index)
+        my_info, _their, conn_rec = await self.manager.create_static_connection(
+            my_seed=self.test_seed,
+            their_did=self.test_target_did,
+            their_verkey=self.test_target_verkey,
+            their_endpoint=self.test_endpoint,
+        )
+        receipt = MessageReceipt(
+            sender_verkey=self.test_target_verkey,
+            recipient_verkey=my_info.verkey,
+        )
+
+        # First pass: resolved and added to the index
+        conn = await self.manager.find_inbound_connection(receipt)
+        assert conn.connection_id == conn_rec.connection_id
+        assert len(index) == 1
+
+        # Second pass: found in the index
+        receipt = MessageReceipt(
+            sender_verkey=self.test_target_verkey,
+            recipient_verkey=my_info.verkey,
+        )
+        with mock.patch.object(
+            BaseConnectionManager, "resolve_inbound_connection", mock.CoroutineMock()
+        ) as mock_conn_mgr_resolve_conn:
+            conn = await self.manager.find_inbound_connection(receipt)
+            mock_conn_mgr_resolve_conn.assert_not_called()
+        assert conn.serialize() == conn_rec.serialize()
+        assert receipt.sender_did == self.test_target_did
+        assert receipt.recipient_did == my_info.did
+
+        # Saving the record updates the entry, deleting it removes the entry
+        async with self.profile.session() as session:
+            conn.alias = "updated"
+            await conn.save(session)
+            assert (await self.manager.find_inbound_connection(receipt)).alias == (
+                "updated"
+            )
+            await conn.delete_record(session)
+        assert len(index) == 0
+
+    async def test_find_inbound_connection_index_not_completed(self):
+        index = InboundConnectionIndex(10)
+        self.context.injector.bind_instance(InboundConnectionIndex, index)
+        receipt = MessageReceipt(
+            sender_verkey=self.test_verkey,
+            recipient_verkey=self.test_target_verkey,
+        )
+        with mock.patch.object(
+            BaseConnectionManager, "resolve_inbound_connection", mock.CoroutineMock()
+        ) as mock_conn_mgr_resolve_conn:
+            mock_conn_mgr_resolve_conn.return_value = ConnRecord(
+                connection_id="dummy", state=ConnRecord.State.REQUEST
+            )
+            assert await self.manager.find_inbound_connection(receipt)
+            mock_conn_mgr_resolve_conn.return_value = None
+            assert not await self.manager.find_inbound_connection(receipt)
+        assert len(index) == 0
+
+    async def test_warm_inbound_connection_index(self):
+        assert await self.manager.warm_inbound_connection_index() == 0
+
+        index = InboundConnectionIndex(10)
+        self.context.injector.bind_instance(InboundConnectionIndex, index)
+        my_info, _their, conn_rec = await self.manager.create_static_connection(
+            my_seed=self.test_seed,
+            their_did=self.test_target_did,
+            their_verkey=self.test_target_verkey,
+            their_endpoint=self.test_endpoint,
+        )
+        assert await self.manager.warm_inbound_connection_index() == 1
+        assert await self.manager.warm_inbound_connection_index() == 0
+
+        # connections saved while reading are skipped, not the others
+        query = ConnRecord.query
+        for saved, added in ((ConnRecord(), 1), (conn_rec, 0)):
+            index.clear()
+
+            async def query_and_save(session, *args, **kwargs):
+                await saved.save(session)
+                return await query(session, *args, **kwargs)
+
+            with mock.patch.object(ConnRecord, "query", query_and_save):
+                assert await self.manager.warm_inbound_connection_index() == added
+        index.clear()
+        assert await self.manager.warm_inbound_connection_index() == 1
+
+        receipt = MessageReceipt(
+            sender_verkey=self.test_target_verkey,
+            recipient_verkey=my_info.verkey,
+        )
+        with mock.patch.object(
+            BaseConnectionManager, "resolve_inbound_connection", mock.CoroutineMock()
+        ) as mock_conn_mgr_resolve_conn:
+            conn = await self.manager.find_inbound_connection(receipt)
+            mock_conn_mgr_resolve_conn.assert_not_called()
+        assert conn.connection_id == conn_rec.connection_id
+        assert receipt.sender_did == self.test_target_did
+
     async def test_resolve_inbound_connection(self):
         receipt = MessageReceipt(
             sender_verkey=self.test_verkey,
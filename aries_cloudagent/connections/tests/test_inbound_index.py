@@ -0,0 +1,87 @@
+import json
+
+from ..inbound_index import InboundConnectionEntry, InboundConnectionIndex
+from ..models.conn_record import ConnRecord
+
+SCOPE = "test:"
+
+
+def entry(connection_id: str, record: ConnRecord = None) -> InboundConnectionEntry:
+    return InboundConnectionEntry(
+        connection_id=connection_id,
+        sender_did="their-did",
+        recipient_did="my-did",
+        recipient_did_public=False,
+        record=json.dumps(record.value if record else {}),
+    )
+
+
+def test_put_get_evicts_least_recent():
+    index = InboundConnectionIndex(2)
+    index.put(SCOPE, "s1", "r", entry("c1"))
+    index.put(SCOPE, "s2", "r", entry("c2"))
+    assert index.get(SCOPE, "s1", "r").connection_id == "c1"
+    index.put(SCOPE, "s3", "r", entry("c3"))
+    assert len(index) == 2
+    assert index.get(SCOPE, "s2", "r") is None
+    assert index.get(SCOPE, "s1", "r")
+    assert index.get(SCOPE, "s3", "r")
+    assert index.get("other:", "s1", "r") is None
+
+
+def test_put_stale_generation():
+    index = InboundConnectionIndex(2)
+    generation = index.generation
+    index.remove_connection(SCOPE, "c1")
+    index.put(SCOPE, "s1", "r", entry("c1"), generation)
+    assert index.get(SCOPE, "s1", "r") is None
+    index.put(SCOPE, "s1", "r", entry("c1"), index.generation)
+    assert index.get(SCOPE, "s1", "r")
+
+
+def test_update():
+    index = InboundConnectionIndex(2)
+    record = ConnRecord(
+        connection_id="c1",
+        my_did="my-did",
+        their_did="their-did",
+        state=ConnRecord.State.COMPLETED,
+    )
+    index.put(SCOPE, "s1", "r", entry("c1", record))
+
+    record.alias = "updated"
+    index.update(SCOPE, record)
+    assert json.loads(index.get(SCOPE, "s1", "r").record)["alias"] == "updated"
+
+    record.their_did = "rotated-did"
+    index.update(SCOPE, record)
+    assert index.get(SCOPE, "s1", "r") is None
+    assert not index._by_connection
+
+
+def test_remove_connection_clear():
+    index = InboundConnectionIndex(4)
+    index.put(SCOPE, "s1", "r1", entry("c1"))
+    index.put(SCOPE, "s1", "r2", entry("c1"))
+    index.put(SCOPE, "s2", "r1", entry("c2"))
+    index.remove_connection(SCOPE, "c1")
+    assert len(index) == 1
+    assert index.get(SCOPE, "s2", "r1")
+    index.clear()
+    assert len(index) == 0
+
+
+def test_changed_since():
+    index = InboundConnectionIndex(2)
+    generation = index.generation
+    assert index.changed_since(generation) == set()
+    index.remove_connection(SCOPE, "c1")
+    index.remove_connection("other:", "c1")
+    assert index.changed_since(generation) == {(SCOPE, "c1"), ("other:", "c1")}
+    assert index.changed_since(generation + 1) == {("other:", "c1")}
+
+    index.remove_connection(SCOPE, "c2")
+    assert index.changed_since(generation) is None
+    generation = index.generation
+    index.clear()
+    assert index.changed_since(generation) is None
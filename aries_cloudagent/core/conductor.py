@@ -27,11 +27,13 @@ from ..config.ledger import (
 from ..config.logging import LoggingConfigurator
 from ..config.provider import ClassProvider
 from ..config.wallet import wallet_config
+from ..connections.inbound_index import InboundConnectionIndex
 from ..commands.upgrade import (
     get_upgrade_version_list,
     add_version_record,
     upgrade,
 )
+from ..core.event_bus import EventBus
 from ..core.profile import Profile
 from ..indy.verifier import IndyVerifier
 from ..ledger.base import BaseLedger
@@ -73,6 +75,7 @@ from ..utils.stats import Collector
 from ..utils.task_queue import CompletedTask, TaskQueue
 from ..vc.ld_proofs.document_loader import DocumentLoader
 from ..version import RECORD_TYPE_ACAPY_VERSION, __version__
+from ..wallet.crypto_pool import CryptoWorkerPool
 from ..wallet.did_info import DIDInfo
 from .dispatcher import Dispatcher
 from .oob_processor import OobMessageProcessor
@@ -379,6 +382,13 @@ class Conductor:
         elif not (from_version_storage and from_version_storage == agent_version):
             await add_version_record(profile=self.root_profile, version=agent_version)
 
+        # Load recently active connections into the inbound connection index
+        if context.inject_or(InboundConnectionIndex):
+            self.dispatcher.run_task(
+                ConnectionManager(self.root_profile).warm_inbound_connection_index(),
+                ident="InboundConnectionIndex:warm",
+            )
+
         # Create a static connection for use by the test-suite
         if context.settings.get("debug.test_suite_endpoint"):
             mgr = ConnectionManager(self.root_profile)
@@ -524,9 +534,16 @@ class Conductor:
     async def stop(self, timeout=1.0):
         """Stop the agent."""
         # notify protcols that we are shutting down
+        event_bus = None
         if self.root_profile:
             await self.root_profile.notify(SHUTDOWN_EVENT_TOPIC, {})
 
+            # deliver any events still queued for background subscribers while
+            # the profiles and transports are open
+            event_bus = self.root_profile.inject_or(EventBus)
+            if event_bus:
+                await event_bus.shutdown(timeout)
+
         shutdown = TaskQueue()
         if self.dispatcher:
             shutdown.run(self.dispatcher.complete())
@@ -548,6 +565,15 @@ class Conductor:
 
         await shutdown.complete(timeout)
 
+        if event_bus:
+            # stop any workers started by events emitted while stopping
+            await event_bus.shutdown(timeout)
+
+        if self.root_profile:
+            crypto_pool = self.root_profile.inject_or(CryptoWorkerPool)
+            if crypto_pool:
+                crypto_pool.shutdown()
+
     def inbound_message_router(
         self,
         profile: Profile,
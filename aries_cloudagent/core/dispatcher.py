@@ -7,7 +7,7 @@ lifecycle hook callbacks storing state for message threads, etc.
 import asyncio
 import logging
 import os
-from typing import Callable, Coroutine, Optional, Tuple, Union
+from typing import Callable, Coroutine, Mapping, Optional, Tuple, Union
 import warnings
 import weakref
 
@@ -46,6 +46,25 @@ class Dispatcher:
     to other agents.
     """
 
+    LANE_PRIORITY = "priority"
+    LANE_DEFAULT = TaskQueue.DEFAULT_LANE
+    LANE_BULK = "bulk"
+
+    # relative share of handler slots given to each lane when the queue is busy
+    LANE_WEIGHTS = {LANE_PRIORITY: 4, LANE_DEFAULT: 2, LANE_BULK: 1}
+
+    # lanes by message family, other families use the default lane; problem
+    # reports of every family use the priority lane
+    MESSAGE_FAMILY_LANES = {
+        "coordinate-mediation": LANE_PRIORITY,
+        "discover-features": LANE_PRIORITY,
+        "notification": LANE_PRIORITY,
+        "routing": LANE_PRIORITY,
+        "trust_ping": LANE_PRIORITY,
+        "issue-credential": LANE_BULK,
+        "present-proof": LANE_BULK,
+    }
+
     def __init__(self, profile: Profile):
         """Initialize an instance of Dispatcher."""
         self.collector: Collector = None
@@ -58,14 +77,33 @@ class Dispatcher:
         self.collector = self.profile.inject_or(Collector)
         max_active = int(os.getenv("DISPATCHER_MAX_ACTIVE", 50))
         self.task_queue = TaskQueue(
-            max_active=max_active, timed=bool(self.collector), trace_fn=self.log_task
+            max_active=max_active,
+            timed=bool(self.collector),
+            trace_fn=self.log_task,
+            lane_weights=self.LANE_WEIGHTS,
+            group_limits={
+                "connection": int(os.getenv("DISPATCHER_MAX_ACTIVE_PER_CONNECTION", 0)),
+                "tenant": int(os.getenv("DISPATCHER_MAX_ACTIVE_PER_TENANT", 0)),
+            },
         )
 
     def put_task(
-        self, coro: Coroutine, complete: Callable = None, ident: str = None
+        self,
+        coro: Coroutine,
+        complete: Callable = None,
+        ident: str = None,
+        *,
+        lane: str = None,
+        groups: Mapping[str, str] = None,
     ) -> PendingTask:
         """Run a task in the task queue, potentially blocking other handlers."""
-        return self.task_queue.put(coro, complete, ident)
+        pending = self.task_queue.put(coro, complete, ident, lane=lane, groups=groups)
+        if self.collector:
+            self.collector.log(
+                f"Dispatcher:depth:{pending.lane}",
+                self.task_queue.lane_depth(pending.lane),
+            )
+        return pending
 
     def run_task(
         self, coro: Coroutine, complete: Callable = None, ident: str = None
@@ -83,9 +121,10 @@ class Dispatcher:
         if self.collector:
             timing = task.timing
             if "queued" in timing:
-                self.collector.log(
-                    "Dispatcher:queued", timing["unqueued"] - timing["queued"]
-                )
+                waited = timing["unqueued"] - timing["queued"]
+                self.collector.log("Dispatcher:queued", waited)
+                if task.lane:
+                    self.collector.log(f"Dispatcher:queued:{task.lane}", waited)
             if task.ident:
                 self.collector.log(task.ident, timing["ended"] - timing["started"])
 
@@ -108,11 +147,27 @@ class Dispatcher:
             A pending task instance resolving to the handler task
 
         """
+        connection_key = (
+            inbound_message.connection_id or inbound_message.receipt.sender_verkey
+        )
         return self.put_task(
             self.handle_message(profile, inbound_message, send_outbound),
             complete,
+            lane=self.message_lane(inbound_message.payload),
+            groups={"connection": connection_key, "tenant": profile.name},
         )
 
+    def message_lane(self, payload: dict) -> str:
+        """Determine the task queue lane for an inbound message payload."""
+        message_type = isinstance(payload, dict) and payload.get("@type")
+        if not isinstance(message_type, str):
+            return self.LANE_DEFAULT
+        if "/problem-report" in message_type:
+            return self.LANE_PRIORITY
+        parts = message_type.rsplit("/", 3)
+        family = parts[-3] if len(parts) == 4 else None
+        return self.MESSAGE_FAMILY_LANES.get(family, self.LANE_DEFAULT)
+
     async def handle_message(
         self,
         profile: Profile,
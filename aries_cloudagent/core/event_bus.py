@@ -1,8 +1,10 @@
 """A simple event bus."""
 
 import asyncio
+from collections import OrderedDict
 from contextlib import contextmanager
 import logging
+import time
 from typing import (
     Any,
     Awaitable,
@@ -17,9 +19,9 @@ from typing import (
     TYPE_CHECKING,
     Tuple,
 )
-from functools import partial
 
 if TYPE_CHECKING:  # To avoid circular import error
+    from ..utils.stats import Collector
     from .profile import Profile
 
 LOGGER = logging.getLogger(__name__)
@@ -80,11 +82,69 @@ class EventWithMetadata(Event):
 
 
 class EventBus:
-    """A simple event bus implementation."""
+    """A simple event bus implementation.
 
-    def __init__(self):
-        """Initialize Event Bus."""
+    By default subscribers are awaited one after another within `notify`. In
+    the `concurrent` notify mode matching subscribers are awaited together, and
+    in the `background` mode deliveries are placed on a bounded queue handled
+    by worker tasks, so that `notify` only waits when the queue is full.
+    """
+
+    MODE_SEQUENTIAL = "sequential"
+    MODE_CONCURRENT = "concurrent"
+    MODE_BACKGROUND = "background"
+    NOTIFY_MODES = (MODE_SEQUENTIAL, MODE_CONCURRENT, MODE_BACKGROUND)
+
+    MATCH_CACHE_SIZE = 1024
+
+    def __init__(
+        self,
+        notify_mode: str = MODE_SEQUENTIAL,
+        *,
+        subscriber_timeout: float = None,
+        queue_size: int = 1000,
+        workers: int = 8,
+        collector: "Collector" = None,
+    ):
+        """Initialize Event Bus.
+
+        Args:
+            notify_mode: one of `sequential`, `concurrent` or `background`
+            subscriber_timeout: maximum seconds to wait on a single subscriber
+            queue_size: maximum number of deliveries pending in background mode
+            workers: number of worker tasks processing deliveries in background mode
+            collector: stats collector for subscriber timing
+
+        """
+        if notify_mode not in self.NOTIFY_MODES:
+            raise ValueError(f"Unsupported event notify mode: {notify_mode}")
         self.topic_patterns_to_subscribers: Dict[Pattern, List[Callable]] = {}
+        self.notify_mode = notify_mode
+        self.subscriber_timeout = subscriber_timeout
+        self.queue_size = queue_size
+        self.workers = workers
+        self.collector = collector
+        self._match_cache: "OrderedDict[str, List[Tuple[Pattern, Match[str]]]]" = (
+            OrderedDict()
+        )
+        self._queue: asyncio.Queue = None
+        self._worker_tasks: List[asyncio.Task] = []
+
+    def _match_topic(self, topic: str) -> List[Tuple[Pattern, Match[str]]]:
+        """Find the subscribed patterns matching a topic, using the match cache."""
+        matches = self._match_cache.get(topic)
+        if matches is None:
+            matches = []
+            for pattern in self.topic_patterns_to_subscribers:
+                match = pattern.match(topic)
+                if match:
+                    matches.append((pattern, match))
+            self._match_cache[topic] = matches
+            if len(self._match_cache) > self.MATCH_CACHE_SIZE:
+                self._match_cache.popitem(last=False)
+        else:
+            self._match_cache.move_to_end(topic)
+        return matches
 
     async def notify(self, profile: "Profile", event: Event):
         """Notify subscribers of event.
@@ -94,33 +154,99 @@ class EventBus:
             event (Event): event to emit
 
         """
-        # TODO don't block notifier until subscribers have all been called?
-        # TODO trigger each processor but don't await?
-        # TODO log errors but otherwise ignore?
-
         LOGGER.debug("Notifying subscribers: %s", event)
 
-        partials = []
-        for pattern, subscribers in self.topic_patterns_to_subscribers.items():
-            match = pattern.match(event.topic)
-
-            if not match:
-                continue
-
+        deliveries = []
+        for pattern, match in self._match_topic(event.topic):
+            subscribers = self.topic_patterns_to_subscribers.get(pattern, ())
             for subscriber in subscribers:
-                partials.append(
-                    partial(
+                deliveries.append(
+                    (
                         subscriber,
-                        profile,
                         event.with_metadata(EventMetadata(pattern, match)),
                     )
                 )
 
-        for processor in partials:
+        if self.notify_mode == self.MODE_CONCURRENT and len(deliveries) > 1:
+            await asyncio.gather(
+                *(
+                    self._deliver(subscriber, profile, annotated)
+                    for subscriber, annotated in deliveries
+                )
+            )
+        elif self.notify_mode == self.MODE_BACKGROUND:
+            if deliveries and not self._worker_tasks:
+                self._start_workers()
+            for subscriber, annotated in deliveries:
+                # waits when the queue is full, applying back-pressure to emitters
+                await self._queue.put((subscriber, profile, annotated))
+        else:
+            for subscriber, annotated in deliveries:
+                await self._deliver(subscriber, profile, annotated)
+
+    async def _deliver(self, subscriber: Callable, profile: "Profile", event: Event):
+        """Deliver an event to a single subscriber, isolating any failure."""
+        name = getattr(subscriber, "__qualname__", None) or repr(subscriber)
+        start = time.perf_counter()
+        outcome = None
+        try:
+            if self.subscriber_timeout:
+                await asyncio.wait_for(
+                    subscriber(profile, event), self.subscriber_timeout
+                )
+            else:
+                await subscriber(profile, event)
+        except asyncio.TimeoutError:
+            outcome = "timeout"
+            LOGGER.warning(
+                "Timed out processing event %s in subscriber %s", event.topic, name
+            )
+        except Exception:
+            outcome = "error"
+            LOGGER.exception("Error occurred while processing event")
+        if self.collector:
+            duration = time.perf_counter() - start
+            self.collector.log(f"EventBus.subscriber:{name}", duration, start)
+            if outcome:
+                self.collector.log(f"EventBus.subscriber:{name}:{outcome}", duration)
+
+    def _start_workers(self):
+        """Start the worker tasks processing queued deliveries."""
+        self._queue = asyncio.Queue(self.queue_size)
+        self._worker_tasks = [
+            asyncio.get_event_loop().create_task(self._worker())
+            for _ in range(self.workers)
+        ]
+
+    async def _worker(self):
+        """Process queued deliveries until cancelled."""
+        while True:
+            subscriber, profile, event = await self._queue.get()
             try:
-                await processor()
-            except Exception:
-                LOGGER.exception("Error occurred while processing event")
+                await self._deliver(subscriber, profile, event)
+            finally:
+                self._queue.task_done()
+
+    @property
+    def queue_depth(self) -> int:
+        """Accessor for the number of deliveries waiting in background mode."""
+        return self._queue.qsize() if self._queue else 0
+
+    async def shutdown(self, timeout: float = None):
+        """Wait for queued deliveries to complete and stop the worker tasks."""
+        if not self._worker_tasks:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            LOGGER.warning(
+                "Discarding %d undelivered events on shutdown", self.queue_depth
+            )
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        self._queue = None
 
     def subscribe(self, pattern: Pattern, processor: Callable):
         """Subscribe to an event.
@@ -133,6 +259,7 @@ class EventBus:
         LOGGER.debug("Subscribed: topic %s, processor %s", pattern, processor)
         if pattern not in self.topic_patterns_to_subscribers:
             self.topic_patterns_to_subscribers[pattern] = []
+            self._match_cache.clear()
         self.topic_patterns_to_subscribers[pattern].append(processor)
 
     def unsubscribe(self, pattern: Pattern, processor: Callable):
@@ -154,6 +281,7 @@ class EventBus:
             del self.topic_patterns_to_subscribers[pattern][index]
             if not self.topic_patterns_to_subscribers[pattern]:
                 del self.topic_patterns_to_subscribers[pattern]
+                self._match_cache.clear()
             LOGGER.debug("Unsubscribed: topic %s, processor %s", pattern, processor)
 
     @contextmanager
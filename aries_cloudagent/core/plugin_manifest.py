@@ -0,0 +1,197 @@
+"""Read what plugin modules provide from their source, without importing them."""
+
+import ast
+import sys
+from importlib.util import find_spec, resolve_name
+from typing import Any, FrozenSet, Optional, Pattern, Sequence, Tuple
+
+from ..utils.classloader import ClassLoader, ModuleLoadError
+
+
+def find_module(module_name: str):
+    """Find the spec of a module without importing it.
+
+    Returns:
+        The module spec, or `None` if the module does not exist
+
+    """
+    try:
+        return find_spec(module_name)
+    except (ImportError, ValueError):
+        return None
+
+
+def _parse_module(module_name: str) -> Optional[ast.Module]:
+    """Parse the source of a module, if it can be found."""
+    spec = find_module(module_name)
+    if not spec or not spec.loader or not hasattr(spec.loader, "get_source"):
+        return None
+    try:
+        source = spec.loader.get_source(module_name)
+        return ast.parse(source) if source else None
+    except (ImportError, SyntaxError, ValueError):
+        return None
+
+
+def _bound_names(statements: Sequence[ast.stmt]) -> Optional[set]:
+    """Collect the names bound by module-level statements.
+
+    Returns `None` if the names cannot be determined, as for a star import.
+    """
+    names = set()
+    for node in statements:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.add(node.name)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                if alias.name == "*":
+                    return None
+                names.add(alias.asname or alias.name.split(".")[0])
+        elif isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                names.update(
+                    name.id for name in ast.walk(target) if isinstance(name, ast.Name)
+                )
+        elif isinstance(node, (ast.If, ast.Try, ast.With)):
+            blocks = [node.body, getattr(node, "orelse", [])]
+            blocks += [getattr(node, "finalbody", [])]
+            blocks += [handler.body for handler in getattr(node, "handlers", [])]
+            for block in blocks:
+                block_names = _bound_names(block)
+                if block_names is None:
+                    return None
+                names.update(block_names)
+    return names
+
+
+def module_manifest(module_name: str) -> Optional[FrozenSet[str]]:
+    """Get the names a module defines.
+
+    Modules which are not yet imported are read from their source.
+
+    Returns:
+        The names bound at the top level of the module, or `None` if the module
+        does not exist or its names cannot be determined from its source
+
+    """
+    module = sys.modules.get(module_name)
+    if module:
+        return frozenset(vars(module))
+    tree = _parse_module(module_name)
+    names = _bound_names(tree.body) if tree else None
+    return frozenset(names) if names is not None else None
+
+
+def _imported_value(module_name: str, name: Optional[str]) -> Any:
+    """Import a module, or a name from a module, as an import statement would."""
+    module = ClassLoader.load_module(module_name)
+    if not module or not name:
+        return module
+    if not hasattr(module, name):
+        return ClassLoader.load_module(f"{module_name}.{name}")
+    return getattr(module, name)
+
+
+def event_manifest(module_name: str) -> Optional[Sequence[Tuple[Pattern, str]]]:
+    """Get the event subscriptions made by the `register_events` function of a module.
+
+    The module is read from its source. Only a `register_events` function which
+    subscribes functions of the module to patterns built from imported names is
+    supported. The modules those names are imported from are loaded to build
+    the patterns.
+
+    Returns:
+        The pattern and handler function name of each subscription, or `None` if
+        the module does not exist or the subscriptions cannot be determined
+
+    """
+    tree = _parse_module(module_name)
+    if not tree:
+        return None
+
+    package = module_name.rsplit(".", 1)[0]
+    imports = {}
+    functions = set()
+    register_events = None
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom):
+            source = resolve_name("." * node.level + (node.module or ""), package)
+            for alias in node.names:
+                imports[alias.asname or alias.name] = (source, alias.name)
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if not alias.asname and "." not in alias.name:
+                    imports[alias.name] = (alias.name, None)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            functions.add(node.name)
+            if node.name == "register_events":
+                register_events = node
+    if not isinstance(register_events, ast.FunctionDef):
+        return None
+    if len(register_events.args.args) != 1:
+        return None
+    event_bus = register_events.args.args[0].arg
+
+    body = register_events.body
+    if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant):
+        body = body[1:]
+    subscriptions = []
+    for statement in body:
+        call = statement.value if isinstance(statement, ast.Expr) else None
+        if not (
+            isinstance(call, ast.Call)
+            and isinstance(call.func, ast.Attribute)
+            and call.func.attr == "subscribe"
+            and isinstance(call.func.value, ast.Name)
+            and call.func.value.id == event_bus
+            and len(call.args) == 2
+            and not call.keywords
+            and isinstance(call.args[1], ast.Name)
+            and call.args[1].id in functions
+        ):
+            return None
+        expression = call.args[0]
+        names = {node.id for node in ast.walk(expression) if isinstance(node, ast.Name)}
+        if not names.issubset(imports):
+            return None
+        try:
+            namespace = {name: _imported_value(*imports[name]) for name in names}
+        except ModuleLoadError:
+            return None
+        if any(value is None for value in namespace.values()):
+            return None
+        code = compile(ast.Expression(expression), module_name, "eval")
+        pattern = eval(code, {"__builtins__": {}}, namespace)
+        if not isinstance(pattern, Pattern):
+            return None
+        subscriptions.append((pattern, call.args[1].id))
+    return subscriptions
+
+
+class LazyEventProcessor:
+    """Event processor which imports its module when the first event arrives."""
+
+    def __init__(self, module_name: str, name: str):
+        """Initialize a `LazyEventProcessor` instance.
+
+        Args:
+            module_name: The module defining the processor
+            name: The name of the processor function in the module
+        """
+        self.module_name = module_name
+        self.__qualname__ = name
+        self._processor = None
+
+    async def __call__(self, profile, event):
+        """Import the processor, if necessary, and pass it the event."""
+        if not self._processor:
+            module = ClassLoader.load_module(self.module_name)
+            self._processor = getattr(module, self.__qualname__)
+        await self._processor(profile, event)
+
+    def __repr__(self) -> str:
+        """Return a string representation for this class."""
+        return "<{}({}.{})>".format(
+            self.__class__.__name__, self.module_name, self.__qualname__
+        )
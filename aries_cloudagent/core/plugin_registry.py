@@ -1,6 +1,7 @@
 """Handle registration of plugin modules for extending functionality."""
 
 import logging
+import sys
 from collections import OrderedDict
 from types import ModuleType
 from typing import Sequence, Iterable
@@ -10,6 +11,12 @@ from ..core.event_bus import EventBus
 from ..utils.classloader import ClassLoader, ModuleLoadError
 
 from .error import ProtocolDefinitionValidationError
+from .plugin_manifest import (
+    LazyEventProcessor,
+    event_manifest,
+    find_module,
+    module_manifest,
+)
 from .protocol_registry import ProtocolRegistry
 from .goal_code_registry import GoalCodeRegistry
 
@@ -19,10 +26,19 @@ LOGGER = logging.getLogger(__name__)
 class PluginRegistry:
     """Plugin registry for indexing application plugins."""
 
-    def __init__(self, blocklist: Iterable[str] = []):
-        """Initialize a `PluginRegistry` instance."""
+    def __init__(self, blocklist: Iterable[str] = [], lazy: bool = False):
+        """Initialize a `PluginRegistry` instance.
+
+        Args:
+            blocklist: Plugin modules which must not be loaded
+            lazy: Whether to avoid importing the routes modules of plugins until
+                they are needed. Plugins are validated from the modules they
+                contain, and event handlers are subscribed from the source of
+                routes modules, which are imported when the first event arrives.
+        """
         self._plugins = OrderedDict()
         self._blocklist = set(blocklist)
+        self._lazy = lazy
 
     @property
     def plugin_names(self) -> Sequence[str]:
@@ -146,8 +162,12 @@ class PluginRegistry:
             # Make an exception for non-protocol modules
             # that contain admin routes and for old-style protocol
             # modules without version support
-            routes = ClassLoader.load_module("routes", module_name)
-            message_types = ClassLoader.load_module("message_types", module_name)
+            if self._lazy:
+                routes = find_module(f"{module_name}.routes")
+                message_types = find_module(f"{module_name}.message_types")
+            else:
+                routes = ClassLoader.load_module("routes", module_name)
+                message_types = ClassLoader.load_module("message_types", module_name)
             if routes or message_types:
                 self._plugins[module_name] = mod
                 return mod
@@ -292,6 +312,30 @@ class PluginRegistry:
                 if mod and hasattr(mod, "register"):
                     await mod.register(app)
 
+    def _register_lazy_events(self, event_bus: EventBus, module_name: str) -> bool:
+        """Subscribe the event handlers of a routes module without importing it.
+
+        Returns:
+            Whether the events of the module are registered, or it has none.
+            False if plugins are not loaded lazily, or if the module must be
+            imported to register its events
+
+        """
+        if not self._lazy or module_name in sys.modules:
+            return False
+        manifest = module_manifest(module_name)
+        if manifest is None:
+            return False
+        if "register_events" not in manifest:
+            return True
+        subscriptions = event_manifest(module_name)
+        if subscriptions is None:
+            return False
+        for pattern, name in subscriptions:
+            event_bus.subscribe(pattern, LazyEventProcessor(module_name, name))
+        LOGGER.debug("Registered events of %s without importing it", module_name)
+        return True
+
     def register_protocol_events(self, context: InjectionContext):
         """Call route register_events methods on the current context."""
         event_bus = context.inject_or(EventBus)
@@ -303,10 +347,11 @@ class PluginRegistry:
             if definition:
                 # Load plugin routes that are in a versioned package.
                 for plugin_version in definition.versions:
+                    routes_name = f"{plugin.__name__}.{plugin_version['path']}.routes"
+                    if self._register_lazy_events(event_bus, routes_name):
+                        continue
                     try:
-                        mod = ClassLoader.load_module(
-                            f"{plugin.__name__}.{plugin_version['path']}.routes"
-                        )
+                        mod = ClassLoader.load_module(routes_name)
                     except ModuleLoadError as e:
                         LOGGER.error("Error loading admin routes: %s", e)
                         continue
@@ -314,8 +359,11 @@ class PluginRegistry:
                         mod.register_events(event_bus)
             else:
                 # Load plugin routes that aren't in a versioned package.
+                routes_name = f"{plugin.__name__}.routes"
+                if self._register_lazy_events(event_bus, routes_name):
+                    continue
                 try:
-                    mod = ClassLoader.load_module(f"{plugin.__name__}.routes")
+                    mod = ClassLoader.load_module(routes_name)
                 except ModuleLoadError as e:
                     LOGGER.error("Error loading admin routes: %s", e)
                     continue
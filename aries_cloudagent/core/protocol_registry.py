@@ -3,10 +3,10 @@
 import logging
 import re
 
-from typing import Mapping, Sequence
+from typing import Dict, Mapping, Optional, Sequence, Tuple, Union
 
 from ..config.injection_context import InjectionContext
-from ..utils.classloader import ClassLoader
+from ..utils.classloader import ClassLoader, ClassNotFoundError, ModuleLoadError
 
 from .error import ProtocolMinorVersionNotSupported, ProtocolDefinitionValidationError
 
@@ -21,6 +21,12 @@ class ProtocolRegistry:
         self._controllers = {}
         self._typemap = {}
         self._versionmap = {}
+        # message classes by registered message type, filled on first use
+        self._resolved: Dict[str, type] = {}
+        # message classes by module path
+        self._loaded: Dict[str, type] = {}
+        # version routes by protocol name, message name and major version
+        self._routes: Dict[Tuple[str, str, int], dict] = {}
 
     @property
     def protocols(self) -> Sequence[str]:
@@ -139,12 +145,20 @@ class ProtocolRegistry:
         if version_definition["major_version"] not in self._versionmap:
             self._versionmap[version_definition["major_version"]] = []
 
-        self._versionmap[version_definition["major_version"]].append(
-            {
-                "parsed_type_string": parsed_type_string,
-                "version_definition": version_definition,
-                "message_module": module_path,
-            }
+        route = {
+            "parsed_type_string": parsed_type_string,
+            "version_definition": version_definition,
+            "message_module": module_path,
+        }
+        self._versionmap[version_definition["major_version"]].append(route)
+        # the first route registered for a message takes precedence
+        self._routes.setdefault(
+            (
+                parsed_type_string["protocol_name"],
+                parsed_type_string["message_name"],
+                parsed_type_string["major_version"],
+            ),
+            route,
         )
 
     def register_message_types(self, *typesets, version_definition=None):
@@ -156,6 +170,9 @@ class ProtocolRegistry:
 
         """
 
+        # registered types may replace types already resolved
+        self._resolved.clear()
+
         # Maintain support for versionless protocol modules
         updated_typesets = None
         minor_versions_supported = self._message_type_check_for_minor_verssion(
@@ -190,7 +207,17 @@ class ProtocolRegistry:
         for controlset in controller_sets:
             self._controllers.update(controlset)
 
-    def resolve_message_class(self, message_type: str) -> type:
+    def _load_message_class(self, message_cls: Union[str, type]) -> type:
+        """Load a message class from its module path, if not already loaded."""
+        if not isinstance(message_cls, str):
+            return message_cls
+        loaded = self._loaded.get(message_cls)
+        if not loaded:
+            loaded = ClassLoader.load_class(message_cls)
+            self._loaded[message_cls] = loaded
+        return loaded
+
+    def resolve_message_class(self, message_type: str) -> Optional[type]:
         """Resolve a message_type to a message class.
 
         Given a message type identifier, this method
@@ -204,47 +231,64 @@ class ProtocolRegistry:
 
         """
 
+        msg_cls = self._resolved.get(message_type)
+        if msg_cls:
+            return msg_cls
+
         # Try and retrieve from direct mapping
         msg_cls = self._typemap.get(message_type)
-        if isinstance(msg_cls, str):
-            return ClassLoader.load_class(msg_cls)
-
-        # Support registered modules (not path as string)
-        elif msg_cls:
+        if msg_cls:
+            msg_cls = self._load_message_class(msg_cls)
+            self._resolved[message_type] = msg_cls
             return msg_cls
 
-        # Try and route via min/maj version matching
-        if not msg_cls:
-            parsed_type_string = self.parse_type_string(message_type)
-            major_version = parsed_type_string["major_version"]
-
-            version_supported_protos = self._versionmap.get(major_version)
-            if not version_supported_protos:
-                return None
-
-            for proto in version_supported_protos:
-                if (
-                    proto["parsed_type_string"]["protocol_name"]
-                    == parsed_type_string["protocol_name"]
-                    and proto["parsed_type_string"]["message_name"]
-                    == parsed_type_string["message_name"]
-                ):
-                    if (
-                        parsed_type_string["minor_version"]
-                        < proto["version_definition"]["minimum_minor_version"]
-                    ):
-                        raise ProtocolMinorVersionNotSupported(
-                            "Minimum supported minor version is "
-                            + f"{proto['version_definition']['minimum_minor_version']}."
-                            + f" Received {parsed_type_string['minor_version']}."
-                        )
-
-                    if isinstance(proto["message_module"], str):
-                        return ClassLoader.load_class(msg_cls)
-                    elif proto["message_module"]:
-                        return proto["message_module"]
-
-        return None
+        # Try and route via min/maj version matching. Routed types are not
+        # added to the resolved classes, as any minor version may be received.
+        parsed_type_string = self.parse_type_string(message_type)
+        route = self._routes.get(
+            (
+                parsed_type_string["protocol_name"],
+                parsed_type_string["message_name"],
+                parsed_type_string["major_version"],
+            )
+        )
+        if not route:
+            return None
+
+        min_minor_version = route["version_definition"]["minimum_minor_version"]
+        if parsed_type_string["minor_version"] < min_minor_version:
+            raise ProtocolMinorVersionNotSupported(
+                f"Minimum supported minor version is {min_minor_version}."
+                + f" Received {parsed_type_string['minor_version']}."
+            )
+
+        return (
+            self._load_message_class(route["message_module"])
+            if route["message_module"]
+            else None
+        )
+
+    def preload_message_classes(self) -> int:
+        """Load the classes of all registered message types.
+
+        Message classes are otherwise loaded when the first message of each type
+        is received. Classes which cannot be loaded are skipped with a warning.
+
+        Returns:
+            The number of message types resolved
+
+        """
+        resolved = 0
+        for message_type in tuple(self._typemap):
+            try:
+                self.resolve_message_class(message_type)
+            except (ClassNotFoundError, ModuleLoadError) as err:
+                LOGGER.warning(
+                    "Error loading message class for %s: %s", message_type, err
+                )
+            else:
+                resolved += 1
+        return resolved
 
     async def prepare_disclosed(
         self, context: InjectionContext, protocols: Sequence[str]
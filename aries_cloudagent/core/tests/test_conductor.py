@@ -1,3 +1,5 @@
+import asyncio
+import re
 from io import StringIO
 
 from aries_cloudagent.tests import mock
@@ -1288,6 +1290,42 @@ class TestConductor(IsolatedAsyncioTestCase, Config, TestDIDs):
             multitenant_mgr._profiles.profiles["test2"].close.assert_called_once_with()
 
 
+    async def test_shutdown_delivers_background_events(self):
+        builder: ContextBuilder = StubContextBuilder(self.test_settings)
+        conductor = test_module.Conductor(builder)
+
+        with mock.patch.object(
+            test_module, "InboundTransportManager", autospec=True
+        ) as mock_inbound_mgr, mock.patch.object(
+            test_module, "OutboundTransportManager", autospec=True
+        ) as mock_outbound_mgr, mock.patch.object(
+            test_module, "LoggingConfigurator", autospec=True
+        ) as mock_logger:
+            mock_outbound_mgr.return_value.registered_transports = {
+                "test": mock.MagicMock(schemes=["http"])
+            }
+            await conductor.setup()
+
+        event_bus = EventBus(EventBus.MODE_BACKGROUND)
+        conductor.root_profile.context.injector.bind_instance(EventBus, event_bus)
+        closed = []
+        delivered = []
+
+        async def processor(profile, event):
+            await asyncio.sleep(0.01)
+            delivered.append(bool(closed))
+
+        async def close():
+            closed.append(True)
+
+        event_bus.subscribe(re.compile("^test$"), processor)
+        await conductor.root_profile.notify("test", {})
+        with mock.patch.object(conductor.root_profile, "close", close):
+            await conductor.stop()
+        assert delivered == [False]
+        assert closed
+
+
 def get_invite_store_mock(
     invite_string: str, invite_already_used: bool = False
 ) -> mock.MagicMock:
@@ -407,6 +407,67 @@ class TestDispatcher(IsolatedAsyncioTestCase):
         )
         dispatcher.log_task(mock_task)
 
+    async def test_dispatch_log_lane(self):
+        profile = make_profile()
+        dispatcher = test_module.Dispatcher(profile)
+        await dispatcher.setup()
+
+        mock_task = mock.MagicMock(
+            exc_info=None,
+            ident="abc",
+            lane="priority",
+            timing={
+                "queued": 10,
+                "unqueued": 12,
+                "started": 12,
+                "ended": 13,
+            },
+        )
+        dispatcher.log_task(mock_task)
+        results = dispatcher.collector.extract(
+            ["Dispatcher:queued", "Dispatcher:queued:priority"]
+        )
+        assert results["total"] == {
+            "Dispatcher:queued": 2,
+            "Dispatcher:queued:priority": 2,
+        }
+
+    async def test_message_lane(self):
+        profile = make_profile()
+        dispatcher = test_module.Dispatcher(profile)
+        for message_type, lane in (
+            ("https://didcomm.org/trust_ping/1.0/ping", "priority"),
+            ("did:sov:BzCbsNYhMrjHiqZDTUASHg;spec/routing/1.0/forward", "priority"),
+            ("https://didcomm.org/issue-credential/2.0/offer-credential", "bulk"),
+            ("https://didcomm.org/present-proof/1.0/problem-report", "priority"),
+            ("https://didcomm.org/issue-credential/2.0/problem-report", "priority"),
+            ("https://didcomm.org/basicmessage/1.0/message", "default"),
+            ("not-a-type", "default"),
+            (None, "default"),
+        ):
+            assert dispatcher.message_lane({"@type": message_type}) == lane
+        assert dispatcher.message_lane("not a dict") == "default"
+
+    async def test_queue_message_lane_and_groups(self):
+        profile = make_profile()
+        dispatcher = test_module.Dispatcher(profile)
+        await dispatcher.setup()
+        inbound = InboundMessage(
+            {"@type": "https://didcomm.org/trust_ping/1.0/ping"},
+            MessageReceipt(sender_verkey="sender-verkey"),
+        )
+        with mock.patch.object(
+            dispatcher, "handle_message", mock.CoroutineMock()
+        ), mock.patch.object(
+            dispatcher.task_queue, "put", mock.MagicMock()
+        ) as mock_put:
+            dispatcher.queue_message(profile, inbound, None)
+        assert mock_put.call_args.kwargs["lane"] == "priority"
+        assert mock_put.call_args.kwargs["groups"] == {
+            "connection": "sender-verkey",
+            "tenant": profile.name,
+        }
+
     async def test_create_send_outbound(self):
         profile = make_profile()
         context = RequestContext(
@@ -1,11 +1,13 @@
 """Test Event Bus."""
 
+import asyncio
 import pytest
 import re
 
 from unittest import mock
 
 from .. import event_bus as test_module
+from ...utils.stats import Collector
 from ..event_bus import EventBus, Event
 
 # pylint: disable=redefined-outer-name
@@ -205,3 +207,95 @@ async def test_wait_for_event_condition(event_bus: EventBus, profile, event):
         await event_bus.notify(profile, event)
         assert returned_event.done()
         assert await returned_event == event
+
+
+def test_invalid_notify_mode():
+    with pytest.raises(ValueError):
+        EventBus("unknown")
+
+
+@pytest.mark.asyncio
+async def test_match_cache(event_bus: EventBus, profile, event, processor):
+    """Test topic matches are cached and invalidated on subscription changes."""
+    pattern = mock.MagicMock(match=mock.MagicMock(wraps=re.compile(".*").match))
+    event_bus.subscribe(pattern, processor)
+    await event_bus.notify(profile, event)
+    await event_bus.notify(profile, event)
+    pattern.match.assert_called_once_with(event.topic)
+    assert processor.event.metadata.pattern is pattern
+    assert list(event_bus._match_cache) == [event.topic]
+
+    other = MockProcessor()
+    event_bus.subscribe(re.compile("any"), other)
+    assert not event_bus._match_cache
+    await event_bus.notify(profile, event)
+    assert other.event == event
+
+    event_bus.unsubscribe(re.compile("any"), other)
+    assert not event_bus._match_cache
+
+
+@pytest.mark.asyncio
+async def test_match_cache_bounded(event_bus: EventBus, profile, processor):
+    event_bus.subscribe(re.compile(".*"), processor)
+    event_bus.MATCH_CACHE_SIZE = 2
+    for topic in ("one", "two", "three"):
+        await event_bus.notify(profile, Event(topic))
+    assert list(event_bus._match_cache) == ["two", "three"]
+
+
+@pytest.mark.asyncio
+async def test_notify_concurrent(profile, event):
+    """Test a slow subscriber does not delay the others in concurrent mode."""
+    event_bus = EventBus(EventBus.MODE_CONCURRENT, subscriber_timeout=0.05)
+    started = asyncio.Event()
+    processor = MockProcessor()
+
+    async def _slow(profile, event):
+        started.set()
+        await asyncio.sleep(1)
+
+    async def _after_slow(profile, event):
+        assert started.is_set()
+        await processor(profile, event)
+
+    event_bus.subscribe(re.compile(".*"), _slow)
+    event_bus.subscribe(re.compile(".*"), _after_slow)
+    with mock.patch.object(test_module.LOGGER, "warning") as mock_log_warn:
+        await asyncio.wait_for(event_bus.notify(profile, event), 0.5)
+    mock_log_warn.assert_called_once()
+    assert processor.event == event
+
+
+@pytest.mark.asyncio
+async def test_notify_background(profile, event):
+    """Test events are delivered by worker tasks in background mode."""
+    collector = Collector()
+    event_bus = EventBus(
+        EventBus.MODE_BACKGROUND, queue_size=1, workers=1, collector=collector
+    )
+    release = asyncio.Event()
+    received = []
+
+    async def _blocking(profile, event):
+        await release.wait()
+        received.append(event)
+
+    event_bus.subscribe(re.compile(".*"), _blocking)
+    await event_bus.notify(profile, event)
+    await asyncio.sleep(0)
+    # the worker holds the first event and the second fills the queue
+    await event_bus.notify(profile, event)
+    assert event_bus.queue_depth == 1
+    blocked = asyncio.ensure_future(event_bus.notify(profile, event))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    release.set()
+    await asyncio.wait_for(blocked, 1)
+    await event_bus.shutdown(1)
+    assert received == [event, event, event]
+    assert event_bus.queue_depth == 0
+    assert collector.results["count"] == {
+        "EventBus.subscriber:test_notify_background.<locals>._blocking": 3
+    }
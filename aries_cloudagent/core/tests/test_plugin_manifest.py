@@ -0,0 +1,139 @@
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import IsolatedAsyncioTestCase
+
+from ..plugin_manifest import (
+    LazyEventProcessor,
+    event_manifest,
+    find_module,
+    module_manifest,
+)
+
+UTIL = '''
+import re
+
+EVENT_PREFIX = "acapy::TEST::"
+EVENT_PATTERN = re.compile(f"^{EVENT_PREFIX}(.*)?$")
+'''
+
+ROUTES = '''
+"""Plugin routes."""
+
+import re
+
+from .util import EVENT_PATTERN, EVENT_PREFIX
+
+EVENTS = []
+
+try:
+    from .missing import MISSING
+except ImportError:
+    MISSING = None
+
+
+async def register(app):
+    """Register routes."""
+
+
+def register_events(event_bus):
+    """Register events."""
+    event_bus.subscribe(EVENT_PATTERN, on_event)
+    event_bus.subscribe(re.compile(f"^{EVENT_PREFIX}other$"), on_other_event)
+
+
+async def on_event(profile, event):
+    EVENTS.append((profile, event))
+
+
+async def on_other_event(profile, event):
+    pass
+'''
+
+
+class TestPluginManifest(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.package = f"manifest_plugin_{id(self)}"
+        path = Path(self.tmp_dir.name, self.package)
+        path.mkdir()
+        path.joinpath("__init__.py").write_text("")
+        path.joinpath("util.py").write_text(UTIL)
+        path.joinpath("routes.py").write_text(ROUTES)
+        self.path = path
+        sys.path.insert(0, self.tmp_dir.name)
+
+    def tearDown(self):
+        sys.path.remove(self.tmp_dir.name)
+        for name in list(sys.modules):
+            if name.startswith(self.package):
+                del sys.modules[name]
+        self.tmp_dir.cleanup()
+
+    def test_find_module(self):
+        assert find_module(f"{self.package}.routes")
+        assert not find_module(f"{self.package}.missing")
+        assert not find_module(f"{self.package}_missing.routes")
+        assert f"{self.package}.routes" not in sys.modules
+
+    def test_module_manifest(self):
+        manifest = module_manifest(f"{self.package}.routes")
+        assert {
+            "re",
+            "EVENT_PATTERN",
+            "EVENT_PREFIX",
+            "EVENTS",
+            "MISSING",
+            "register",
+            "register_events",
+            "on_event",
+        }.issubset(manifest)
+        assert "post_process_routes" not in manifest
+        assert f"{self.package}.routes" not in sys.modules
+
+    def test_module_manifest_imported(self):
+        __import__(f"{self.package}.routes")
+        assert "on_other_event" in module_manifest(f"{self.package}.routes")
+
+    def test_module_manifest_undetermined(self):
+        self.path.joinpath("star.py").write_text("from .util import *\n")
+        assert module_manifest(f"{self.package}.star") is None
+        assert module_manifest(f"{self.package}.missing") is None
+
+    def test_event_manifest(self):
+        subscriptions = event_manifest(f"{self.package}.routes")
+        assert [(pattern.pattern, name) for pattern, name in subscriptions] == [
+            ("^acapy::TEST::(.*)?$", "on_event"),
+            ("^acapy::TEST::other$", "on_other_event"),
+        ]
+        assert f"{self.package}.util" in sys.modules
+        assert f"{self.package}.routes" not in sys.modules
+
+    def test_event_manifest_unsupported(self):
+        self.path.joinpath("no_events.py").write_text("def register(app):\n    pass\n")
+        self.path.joinpath("local.py").write_text(
+            "import re\n"
+            "PATTERN = re.compile('^x$')\n"
+            "def register_events(event_bus):\n"
+            "    event_bus.subscribe(PATTERN, on_event)\n"
+            "async def on_event(profile, event):\n"
+            "    pass\n"
+        )
+        self.path.joinpath("other.py").write_text(
+            "from .util import EVENT_PATTERN\n"
+            "def register_events(event_bus):\n"
+            "    setup = object()\n"
+            "    event_bus.subscribe(EVENT_PATTERN, setup.on_event)\n"
+        )
+        for module in ("no_events", "local", "other", "missing"):
+            assert event_manifest(f"{self.package}.{module}") is None
+
+    async def test_lazy_event_processor(self):
+        processor = LazyEventProcessor(f"{self.package}.routes", "on_event")
+        assert processor.__qualname__ == "on_event"
+        assert f"{self.package}.routes" not in sys.modules
+
+        await processor("profile", "event")
+        routes = sys.modules[f"{self.package}.routes"]
+        assert routes.EVENTS == [("profile", "event")]
+        assert "on_event" in repr(processor)
@@ -1,10 +1,14 @@
 import pytest
+import sys
 
 from aries_cloudagent.tests import mock
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import call
 
 from ...config.injection_context import InjectionContext
+from ...core.event_bus import Event, EventBus
 from ...utils.classloader import ClassLoader, ModuleLoadError
 
 from ..plugin_registry import PluginRegistry
@@ -12,6 +16,7 @@ from ..protocol_registry import ProtocolRegistry
 from ..goal_code_registry import GoalCodeRegistry
 
 from ..error import ProtocolDefinitionValidationError
+from ..plugin_manifest import LazyEventProcessor
 
 
 class TestPluginRegistry(IsolatedAsyncioTestCase):
@@ -602,3 +607,80 @@ class TestPluginRegistry(IsolatedAsyncioTestCase):
 
     def test_repr(self):
         assert isinstance(repr(self.registry), str)
+
+
+class TestPluginRegistryLazy(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.package = f"lazy_plugin_{id(self)}"
+        path = Path(self.tmp_dir.name, self.package)
+        for plugin in ("events", "plain", "unsupported"):
+            path.joinpath(plugin).mkdir(parents=True)
+            path.joinpath(plugin, "__init__.py").write_text("")
+        path.joinpath("__init__.py").write_text("")
+        path.joinpath("util.py").write_text(
+            "import re\nEVENT_PATTERN = re.compile('^acapy::TEST::.*$')\n"
+        )
+        path.joinpath("events", "routes.py").write_text(
+            "from ..util import EVENT_PATTERN\n"
+            "EVENTS = []\n"
+            "def register_events(event_bus):\n"
+            "    event_bus.subscribe(EVENT_PATTERN, on_event)\n"
+            "async def on_event(profile, event):\n"
+            "    EVENTS.append(event.topic)\n"
+        )
+        path.joinpath("plain", "routes.py").write_text(
+            "async def register(app):\n    pass\n"
+        )
+        path.joinpath("unsupported", "routes.py").write_text(
+            "REGISTERED = []\n"
+            "def register_events(event_bus):\n"
+            "    REGISTERED.append(event_bus)\n"
+        )
+        sys.path.insert(0, self.tmp_dir.name)
+
+        self.registry = PluginRegistry(lazy=True)
+        self.event_bus = EventBus()
+        self.context = InjectionContext(enforce_typing=False)
+        self.context.injector.bind_instance(EventBus, self.event_bus)
+
+    def tearDown(self):
+        sys.path.remove(self.tmp_dir.name)
+        for name in list(sys.modules):
+            if name.startswith(self.package):
+                del sys.modules[name]
+        self.tmp_dir.cleanup()
+
+    def routes_imported(self, plugin: str) -> bool:
+        return f"{self.package}.{plugin}.routes" in sys.modules
+
+    async def test_register_plugin(self):
+        for plugin in ("events", "plain", "unsupported"):
+            assert self.registry.register_plugin(f"{self.package}.{plugin}")
+            assert not self.routes_imported(plugin)
+        assert not self.registry.register_plugin(f"{self.package}.missing")
+        assert not self.registry.register_plugin(self.package)
+
+    async def test_register_protocol_events(self):
+        for plugin in ("events", "plain", "unsupported"):
+            self.registry.register_plugin(f"{self.package}.{plugin}")
+        self.registry.register_protocol_events(self.context)
+
+        assert not self.routes_imported("events")
+        assert not self.routes_imported("plain")
+        unsupported = sys.modules[f"{self.package}.unsupported.routes"]
+        assert unsupported.REGISTERED == [self.event_bus]
+
+        ((processor,),) = self.event_bus.topic_patterns_to_subscribers.values()
+        assert isinstance(processor, LazyEventProcessor)
+        await self.event_bus.notify(mock.MagicMock(), Event("acapy::TEST::topic"))
+        events = sys.modules[f"{self.package}.events.routes"]
+        assert events.EVENTS == ["acapy::TEST::topic"]
+
+    async def test_register_protocol_events_imported(self):
+        self.registry.register_plugin(f"{self.package}.events")
+        __import__(f"{self.package}.events.routes")
+        self.registry.register_protocol_events(self.context)
+
+        ((processor,),) = self.event_bus.topic_patterns_to_subscribers.values()
+        assert not isinstance(processor, LazyEventProcessor)
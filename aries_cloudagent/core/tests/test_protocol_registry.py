@@ -2,7 +2,9 @@ from aries_cloudagent.tests import mock
 from unittest import IsolatedAsyncioTestCase
 
 from ...config.injection_context import InjectionContext
-from ...utils.classloader import ClassLoader
+from ...utils.classloader import ClassLoader, ClassNotFoundError
+
+from ..error import ProtocolMinorVersionNotSupported
 
 from ..protocol_registry import ProtocolRegistry
 
@@ -296,5 +298,65 @@ class TestProtocolRegistry(IsolatedAsyncioTestCase):
             result = self.registry.resolve_message_class("proto/1.2/bbb")
             assert result is None
 
+    def test_resolve_message_class_memoized(self):
+        self.registry.register_message_types(
+            {self.test_message_type: self.test_message_handler}
+        )
+        mock_class = mock.MagicMock()
+        with mock.patch.object(
+            ClassLoader, "load_class", mock.MagicMock()
+        ) as load_class:
+            load_class.return_value = mock_class
+            for _ in range(3):
+                result = self.registry.resolve_message_class(self.test_message_type)
+                assert result == mock_class
+            load_class.assert_called_once_with(self.test_message_handler)
+
+            # registering types again replaces resolved classes
+            replacement = mock.MagicMock()
+            self.registry.register_message_types(
+                {self.test_message_type: replacement}
+            )
+            result = self.registry.resolve_message_class(self.test_message_type)
+            assert result is replacement
+
+    def test_resolve_message_class_version_route(self):
+        self.registry.register_message_types(
+            {"proto/1.2/aaa": self.test_message_handler},
+            version_definition={
+                "major_version": 1,
+                "minimum_minor_version": 1,
+                "current_minor_version": 2,
+                "path": "v1_2",
+            },
+        )
+        mock_class = mock.MagicMock()
+        with mock.patch.object(
+            ClassLoader, "load_class", mock.MagicMock()
+        ) as load_class:
+            load_class.return_value = mock_class
+            assert self.registry.resolve_message_class("proto/1.2/aaa") == mock_class
+            assert self.registry.resolve_message_class("proto/1.5/aaa") == mock_class
+            assert self.registry.resolve_message_class("proto/1.6/aaa") == mock_class
+            load_class.assert_called_once_with(self.test_message_handler)
+            assert "proto/1.5/aaa" not in self.registry._resolved
+
+            assert self.registry.resolve_message_class("proto/2.0/aaa") is None
+            with self.assertRaises(ProtocolMinorVersionNotSupported):
+                self.registry.resolve_message_class("proto/1.0/aaa")
+
+    def test_preload_message_classes(self):
+        self.registry.register_message_types(
+            {"proto/1.0/aaa": "module.Aaa", "proto/1.0/bbb": "module.Bbb"}
+        )
+        mock_class = mock.MagicMock()
+        with mock.patch.object(
+            ClassLoader, "load_class", mock.MagicMock()
+        ) as load_class:
+            load_class.side_effect = [mock_class, ClassNotFoundError()]
+            assert self.registry.preload_message_classes() == 1
+            assert self.registry.resolve_message_class("proto/1.0/aaa") == mock_class
+            assert load_class.call_count == 2
+
     def test_repr(self):
         assert isinstance(repr(self.registry), str)
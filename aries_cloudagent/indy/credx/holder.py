@@ -21,6 +21,7 @@ from indy_credx import (
 
 from ...askar.profile import AskarProfile
 from ...ledger.base import BaseLedger
+from ...revocation.state_cache import RevocationStateCache, RevocationStateEntry
 from ...wallet.error import WalletNotFoundError
 
 from ..holder import IndyHolder, IndyHolderError
@@ -48,6 +49,56 @@ def _normalize_attr_name(name: str) -> str:
     return name.replace(" ", "")
 
 
+def _is_accumulated_delta(rev_reg_delta: dict) -> bool:
+    """Check whether a registry delta covers the registry from its creation."""
+    value = rev_reg_delta.get("value") or {}
+    return "accum" in value and not (value.get("prev_accum") or value.get("prevAccum"))
+
+
+def _delta_between(rev_reg_def: dict, old_delta: dict, new_delta: dict) -> dict:
+    """Get the changes between two registry deltas covering the whole registry.
+
+    Indexes which became active are listed as issued, and indexes which became
+    inactive are listed as revoked, so that a revocation state created from the
+    old delta can be updated to the new one.
+    """
+    old = old_delta["value"]
+    new = new_delta["value"]
+    old_revoked = set(old.get("revoked") or ())
+    new_revoked = set(new.get("revoked") or ())
+    if rev_reg_def["value"].get("issuanceType") == "ISSUANCE_BY_DEFAULT":
+        # all indexes are active unless revoked
+        issued = old_revoked - new_revoked
+        revoked = new_revoked - old_revoked
+    else:
+        old_active = set(old.get("issued") or ()) - old_revoked
+        new_active = set(new.get("issued") or ()) - new_revoked
+        issued = new_active - old_active
+        revoked = old_active - new_active
+    return {
+        "ver": "1.0",
+        "value": {
+            "accum": new["accum"],
+            "issued": sorted(issued),
+            "revoked": sorted(revoked),
+        },
+    }
+
+
+def _update_revocation_state(
+    rev_state: str,
+    rev_reg_def: dict,
+    rev_reg_delta: dict,
+    cred_rev_id: int,
+    timestamp: int,
+    tails_file_path: str,
+) -> CredentialRevocationState:
+    """Update a revocation state with the changes in a registry delta."""
+    state = CredentialRevocationState.load(rev_state)
+    state.update(rev_reg_def, rev_reg_delta, cred_rev_id, timestamp, tails_file_path)
+    return state
+
+
 class IndyCredxHolder(IndyHolder):
     """Indy-credx holder class."""
 
@@ -539,6 +590,11 @@ class IndyCredxHolder(IndyHolder):
     ) -> str:
         """Create current revocation state for a received credential.
 
+        States are kept in the revocation state cache, when one is configured,
+        and a state kept for the same credential is updated rather than created
+        anew. Deltas which do not cover the registry from its creation are not
+        cached.
+
         Args:
             cred_rev_id: credential revocation id in revocation registry
             rev_reg_def: revocation registry definition
@@ -550,16 +606,55 @@ class IndyCredxHolder(IndyHolder):
 
         """
 
+        cache = self._profile.inject_or(RevocationStateCache)
+        rev_reg_id = rev_reg_def.get("id")
+        cacheable = bool(
+            cache is not None and rev_reg_id and _is_accumulated_delta(rev_reg_delta)
+        )
+        previous = None
+        if cacheable:
+            entry = cache.get(rev_reg_id, cred_rev_id, timestamp)
+            if entry and entry.source == rev_reg_delta:
+                return entry.state
+            previous = cache.nearest(rev_reg_id, cred_rev_id, timestamp)
+
         try:
-            rev_state = await asyncio.get_event_loop().run_in_executor(
-                None,
-                CredentialRevocationState.create,
-                rev_reg_def,
-                rev_reg_delta,
-                int(cred_rev_id),
-                timestamp,
-                tails_file_path,
-            )
+            if previous:
+                rev_state = await cache.run(
+                    _update_revocation_state,
+                    previous.state,
+                    rev_reg_def,
+                    _delta_between(rev_reg_def, previous.source, rev_reg_delta),
+                    int(cred_rev_id),
+                    timestamp,
+                    tails_file_path,
+                )
+            elif cache is not None:
+                rev_state = await cache.run(
+                    CredentialRevocationState.create,
+                    rev_reg_def,
+                    rev_reg_delta,
+                    int(cred_rev_id),
+                    timestamp,
+                    tails_file_path,
+                )
+            else:
+                rev_state = await asyncio.get_event_loop().run_in_executor(
+                    None,
+                    CredentialRevocationState.create,
+                    rev_reg_def,
+                    rev_reg_delta,
+                    int(cred_rev_id),
+                    timestamp,
+                    tails_file_path,
+                )
         except CredxError as err:
             raise IndyHolderError("Error creating revocation state") from err
-        return rev_state.to_json()
+        rev_state_json = rev_state.to_json()
+        if cacheable:
+            cache.put(
+                rev_reg_id,
+                cred_rev_id,
+                RevocationStateEntry(timestamp, rev_state_json, rev_reg_delta),
+            )
+        return rev_state_json
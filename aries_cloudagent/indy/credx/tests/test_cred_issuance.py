@@ -11,6 +11,7 @@ from ....ledger.base import BaseLedger
 from ....ledger.multiple_ledger.ledger_requests_executor import (
     IndyLedgerRequestsExecutor,
 )
+from ....revocation.state_cache import RevocationStateCache
 
 from .. import issuer, holder, verifier
 
@@ -55,6 +56,12 @@ class TestIndyCredxIssuance(IsolatedAsyncioTestCase):
                 )
             ),
         )
+        mock_ledger.get_credential_definitions = mock.CoroutineMock(
+            side_effect=lambda ids: {
+                cred_def_id: mock_ledger.get_credential_definition.return_value
+                for cred_def_id in ids
+            }
+        )
         mock_ledger.__aenter__ = mock.CoroutineMock(return_value=mock_ledger)
         self.ledger = mock_ledger
 
@@ -338,3 +345,130 @@ class TestIndyCredxIssuance(IsolatedAsyncioTestCase):
         )
 
         await self.holder.delete_credential(cred_id)
+
+    async def test_revocation_state_cache(self):
+        (s_id, schema_json) = await self.issuer.create_schema(
+            TEST_DID,
+            SCHEMA_NAME,
+            SCHEMA_VERSION,
+            ["name", "moniker"],
+        )
+        schema = json.loads(schema_json)
+        schema["seqNo"] = SCHEMA_TXN
+        (cd_id, cred_def_json) = await self.issuer.create_and_store_credential_definition(
+            TEST_DID, schema, support_revocation=True
+        )
+        cred_def = json.loads(cred_def_json)
+        self.ledger.get_credential_definition.return_value = cred_def
+
+        cache = RevocationStateCache(10, workers=1)
+        self.holder_profile.context.injector.bind_instance(RevocationStateCache, cache)
+
+        with tempfile.TemporaryDirectory() as tmp_path:
+            (
+                reg_id,
+                reg_def_json,
+                reg_entry_json,
+            ) = await self.issuer.create_and_store_revocation_registry(
+                TEST_DID, cd_id, "CL_ACCUM", "0", 10, tmp_path
+            )
+            reg_def = json.loads(reg_def_json)
+            reg_entry = json.loads(reg_entry_json)
+            tails_path = reg_def["value"]["tailsLocation"]
+
+            cred_offer = json.loads(await self.issuer.create_credential_offer(cd_id))
+            (
+                cred_req_json,
+                cred_req_meta_json,
+            ) = await self.holder.create_credential_request(
+                cred_offer, cred_def, TEST_DID
+            )
+            cred_json, cred_rev_id = await self.issuer.create_credential(
+                schema,
+                cred_offer,
+                json.loads(cred_req_json),
+                {"name": "NAME", "moniker": "MONIKER"},
+                revoc_reg_id=reg_id,
+                tails_file_path=tails_path,
+            )
+            assert cred_rev_id == "1"
+            cred_id = await self.holder.store_credential(
+                cred_def,
+                json.loads(cred_json),
+                json.loads(cred_req_meta_json),
+                rev_reg_def=reg_def,
+            )
+            await self.issuer.create_credential(
+                schema,
+                cred_offer,
+                json.loads(cred_req_json),
+                {"name": "OTHER", "moniker": "OTHER"},
+                revoc_reg_id=reg_id,
+                tails_file_path=tails_path,
+            )
+
+            state_1 = await self.holder.create_revocation_state(
+                cred_rev_id, reg_def, reg_entry, 1, tails_path
+            )
+            assert len(cache) == 1
+            with mock.patch.object(cache, "run") as mock_run:
+                assert (
+                    await self.holder.create_revocation_state(
+                        cred_rev_id, reg_def, reg_entry, 1, tails_path
+                    )
+                    == state_1
+                )
+                mock_run.assert_not_called()
+
+            (rev_delta_json, skipped_ids) = await self.issuer.revoke_credentials(
+                cd_id, reg_id, tails_path, ("2",)
+            )
+            assert not skipped_ids
+            rev_delta = json.loads(rev_delta_json)
+            reg_entry_2 = json.loads(
+                await self.issuer.merge_revocation_registry_deltas(
+                    reg_entry, rev_delta
+                )
+            )
+
+            with mock.patch.object(
+                holder.CredentialRevocationState,
+                "create",
+                side_effect=holder.CredentialRevocationState.create,
+            ) as mock_create:
+                state_2 = await self.holder.create_revocation_state(
+                    cred_rev_id, reg_def, reg_entry_2, 2, tails_path
+                )
+                mock_create.assert_not_called()
+            assert len(cache) == 2
+
+            # deltas which do not cover the whole registry are not cached
+            await self.holder.create_revocation_state(
+                cred_rev_id, reg_def, rev_delta, 3, tails_path
+            )
+            assert len(cache) == 2
+
+        pres_req = {**PRES_REQ_REV, "non_revoked": {"to": 2}}
+        pres_json = await self.holder.create_presentation(
+            pres_req,
+            {
+                "requested_attributes": {
+                    CRED_REFT: {"cred_id": cred_id, "revealed": True, "timestamp": 2}
+                }
+            },
+            {s_id: schema},
+            {cd_id: cred_def},
+            rev_states={reg_id: {2: json.loads(state_2)}},
+        )
+        reg_def["txnTime"] = 2
+        (verified, _) = await self.verifier.verify_presentation(
+            pres_req,
+            json.loads(pres_json),
+            {s_id: schema},
+            {cd_id: cred_def},
+            {reg_id: reg_def},
+            {reg_id: {2: reg_entry_2}},
+        )
+        assert verified
+
+        cache.pool.shutdown()
@@ -5,7 +5,7 @@ import logging
 from abc import ABC, ABCMeta, abstractmethod
 from enum import Enum
 from time import time
-from typing import Mapping, Tuple
+from typing import Dict, Mapping, Sequence, Tuple
 
 from ..core.profile import Profile
 from ..ledger.multiple_ledger.ledger_requests_executor import (
@@ -105,6 +105,40 @@ class IndyVerifier(ABC, metaclass=ABCMeta):
             )
         return msgs
 
+    async def get_credential_definitions(
+        self, profile: Profile, cred_def_ids: Sequence[str]
+    ) -> Dict[str, dict]:
+        """Fetch credential definitions, in one batch per ledger.
+
+        Args:
+            profile: relevant profile
+            cred_def_ids: the cred def ids to fetch, which may repeat
+
+        Returns:
+            The credential definitions by id
+
+        """
+        multitenant_mgr = profile.inject_or(BaseMultitenantManager)
+        if multitenant_mgr:
+            ledger_exec_inst = IndyLedgerRequestsExecutor(profile)
+        else:
+            ledger_exec_inst = profile.inject(IndyLedgerRequestsExecutor)
+        ledger_cred_def_ids = {}
+        for cred_def_id in dict.fromkeys(cred_def_ids):
+            ledger = (
+                await ledger_exec_inst.get_ledger_for_identifier(
+                    cred_def_id,
+                    txn_record_type=GET_CRED_DEF,
+                )
+            )[1]
+            ledger_cred_def_ids.setdefault(ledger, []).append(cred_def_id)
+
+        cred_defs = {}
+        for ledger, ids in ledger_cred_def_ids.items():
+            async with ledger:
+                cred_defs.update(await ledger.get_credential_definitions(ids))
+        return cred_defs
+
     async def check_timestamps(
         self,
         profile: Profile,
@@ -129,22 +163,13 @@ class IndyVerifier(ABC, metaclass=ABCMeta):
         LOGGER.debug(f">>> got non-revoc intervals: {non_revoc_intervals}")
         # timestamp for irrevocable credential
         cred_defs = []
+        cred_defs_by_id = await self.get_credential_definitions(
+            profile, [ident["cred_def_id"] for ident in pres["identifiers"]]
+        )
         for index, ident in enumerate(pres["identifiers"]):
             LOGGER.debug(f">>> got (index, ident): ({index},{ident})")
             cred_def_id = ident["cred_def_id"]
-            multitenant_mgr = profile.inject_or(BaseMultitenantManager)
-            if multitenant_mgr:
-                ledger_exec_inst = IndyLedgerRequestsExecutor(profile)
-            else:
-                ledger_exec_inst = profile.inject(IndyLedgerRequestsExecutor)
-            ledger = (
-                await ledger_exec_inst.get_ledger_for_identifier(
-                    cred_def_id,
-                    txn_record_type=GET_CRED_DEF,
-                )
-            )[1]
-            async with ledger:
-                cred_def = await ledger.get_credential_definition(cred_def_id)
+            cred_def = cred_defs_by_id[cred_def_id]
             cred_defs.append(cred_def)
             if ident.get("timestamp"):
                 if not cred_def["value"].get("revocation"):
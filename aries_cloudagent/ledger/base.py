@@ -7,11 +7,12 @@ import re
 from abc import ABC, abstractmethod, ABCMeta
 from enum import Enum
 from hashlib import sha256
-from typing import List, Sequence, Tuple, Union
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
 
 from ..indy.issuer import DEFAULT_CRED_DEF_TAG, IndyIssuer, IndyIssuerError
 from ..messaging.valid import IndyDID
 from ..utils import sentinel
+from ..utils.task_queue import gather_keyed
 from ..wallet.did_info import DIDInfo
 
 from .error import (
@@ -29,6 +30,9 @@ LOGGER = logging.getLogger(__name__)
 class BaseLedger(ABC, metaclass=ABCMeta):
     """Base class for ledger."""
 
+    # Maximum number of concurrent requests made by a batched read
+    BATCH_READ_LIMIT = 8
+
     BACKEND_NAME: str = None
 
     async def __aenter__(self) -> "BaseLedger":
@@ -562,6 +566,86 @@ class BaseLedger(ABC, metaclass=ABCMeta):
     ) -> Tuple[dict, int]:
         """Get revocation registry entry by revocation registry ID and timestamp."""
 
+    async def get_schemas(self, schema_ids: Iterable[str]) -> Dict[str, dict]:
+        """Get many schemas, fetching those not cached from the ledger concurrently.
+
+        Args:
+            schema_ids: The schema ids (or stringified sequence numbers) to retrieve
+
+        Returns:
+            The schemas by id
+
+        """
+        return await gather_keyed(self.get_schema, schema_ids, self.BATCH_READ_LIMIT)
+
+    async def get_credential_definitions(
+        self, credential_definition_ids: Iterable[str]
+    ) -> Dict[str, dict]:
+        """Get many credential definitions, fetching those not cached concurrently.
+
+        Args:
+            credential_definition_ids: The cred def ids of the cred defs to retrieve
+
+        Returns:
+            The credential definitions by id
+
+        """
+        return await gather_keyed(
+            self.get_credential_definition,
+            credential_definition_ids,
+            self.BATCH_READ_LIMIT,
+        )
+
+    async def get_revoc_reg_defs(self, revoc_reg_ids: Iterable[str]) -> Dict[str, dict]:
+        """Look up many revocation registry definitions concurrently.
+
+        Args:
+            revoc_reg_ids: The revocation registry ids to retrieve
+
+        Returns:
+            The revocation registry definitions by id
+
+        """
+        return await gather_keyed(
+            self.get_revoc_reg_def, revoc_reg_ids, self.BATCH_READ_LIMIT
+        )
+
+    async def get_revoc_reg_deltas(
+        self, requests: Iterable[Tuple[str, int, int]]
+    ) -> Dict[Tuple[str, int, int], Tuple[dict, int]]:
+        """Look up many revocation registry deltas concurrently.
+
+        Args:
+            requests: Tuples of revocation registry id, from and to timestamps
+
+        Returns:
+            The delta and delta timestamp by request
+
+        """
+        return await gather_keyed(
+            lambda request: self.get_revoc_reg_delta(*request),
+            requests,
+            self.BATCH_READ_LIMIT,
+        )
+
+    async def get_revoc_reg_entries(
+        self, requests: Iterable[Tuple[str, int]]
+    ) -> Dict[Tuple[str, int], Tuple[dict, int]]:
+        """Get many revocation registry entries concurrently.
+
+        Args:
+            requests: Tuples of revocation registry id and timestamp
+
+        Returns:
+            The entry and entry timestamp by request
+
+        """
+        return await gather_keyed(
+            lambda request: self.get_revoc_reg_entry(*request),
+            requests,
+            self.BATCH_READ_LIMIT,
+        )
+
     async def check_existing_schema_anoncreds(
         self,
         schema_id: str,
@@ -28,6 +28,7 @@ from ..wallet.did_posture import DIDPosture
 
 from .base import BaseLedger, Role
 from .endpoint_type import EndpointType
+from .object_cache import LedgerObjectCache
 from .error import (
     BadLedgerRequestError,
     ClosedPoolError,
@@ -78,6 +79,7 @@ class IndyVdrLedgerPool:
         genesis_transactions: str = None,
         read_only: bool = False,
         socks_proxy: str = None,
+        persistent_cache: bool = False,
     ):
         """Initialize an IndyLedger instance.
 
@@ -89,6 +91,7 @@ class IndyVdrLedgerPool:
             genesis_transactions: The ledger genesis transaction as a string
             read_only: Prevent any ledger write operations
             socks_proxy: Specifies socks proxy for ZMQ to connect to ledger pool
+            persistent_cache: Keep schemas and credential definitions on disk
         """
         self.ref_count = 0
         self.ref_lock = asyncio.Lock()
@@ -105,6 +108,8 @@ class IndyVdrLedgerPool:
         self.taa_cache: str = None
         self.read_only: bool = read_only
         self.socks_proxy: str = socks_proxy
+        self.persistent_cache = persistent_cache
+        self.object_cache_inst: LedgerObjectCache = None
 
     @property
     def cfg_path(self) -> Path:
@@ -120,6 +125,15 @@ class IndyVdrLedgerPool:
             self.genesis_hash_cache = _hash_txns(self.genesis_txns)
         return self.genesis_hash_cache
 
+    @property
+    def object_cache(self) -> Optional[LedgerObjectCache]:
+        """Get the persistent cache of immutable ledger objects, if enabled."""
+        if self.persistent_cache and self.object_cache_inst is None:
+            self.object_cache_inst = LedgerObjectCache(
+                self.cfg_path.joinpath(self.name, f"objects-{self.genesis_hash}")
+            )
+        return self.object_cache_inst
+
     @property
     def genesis_txns(self) -> str:
         """Get the configured genesis transactions."""
@@ -189,6 +203,8 @@ class IndyVdrLedgerPool:
             cached = False
 
         self.handle = await open_pool(transactions=txns, socks_proxy=self.socks_proxy)
+        if self.object_cache is not None:
+            self.object_cache.warm()
         upd_txns = _normalize_txns(await self.handle.get_transactions())
         if not cached or upd_txns != txns:
             try:
@@ -400,15 +416,25 @@ class IndyVdrLedger(BaseLedger):
             schema_id: The schema id (or stringified sequence number) to retrieve
 
         """
+        object_cache = self.pool.object_cache
+        if object_cache is not None:
+            result = object_cache.get("schema", schema_id)
+            if result:
+                return result
+
         if self.pool.cache:
             result = await self.pool.cache.get(f"schema::{schema_id}")
             if result:
                 return result
 
         if schema_id.isdigit():
-            return await self.fetch_schema_by_seq_no(int(schema_id))
+            result = await self.fetch_schema_by_seq_no(int(schema_id))
         else:
-            return await self.fetch_schema_by_id(schema_id)
+            result = await self.fetch_schema_by_id(schema_id)
+        if result and object_cache is not None:
+            object_cache.set("schema", result["id"], result)
+            object_cache.set("schema", str(result["seqNo"]), result)
+        return result
 
     async def fetch_schema_by_id(self, schema_id: str) -> dict:
         """Get schema from ledger.
@@ -516,6 +542,12 @@ class IndyVdrLedger(BaseLedger):
             credential_definition_id: The schema id of the schema to fetch cred def for
 
         """
+        object_cache = self.pool.object_cache
+        if object_cache is not None:
+            result = object_cache.get("credential_definition", credential_definition_id)
+            if result:
+                return result
+
         if self.pool.cache:
             cache_key = f"credential_definition::{credential_definition_id}"
             async with self.pool.cache.acquire(cache_key) as entry:
@@ -527,9 +559,12 @@ class IndyVdrLedger(BaseLedger):
                     )
                     if result:
                         await entry.set_result(result, self.pool.cache_duration)
-                return result
+        else:
+            result = await self.fetch_credential_definition(credential_definition_id)
 
-        return await self.fetch_credential_definition(credential_definition_id)
+        if result and object_cache is not None:
+            object_cache.set("credential_definition", credential_definition_id, result)
+        return result
 
     async def fetch_credential_definition(self, credential_definition_id: str) -> dict:
         """Get a credential definition from the ledger by id.
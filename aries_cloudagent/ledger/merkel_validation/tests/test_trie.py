@@ -1,5 +1,7 @@
 from unittest import IsolatedAsyncioTestCase
 
+from rlp import decode as rlp_decode
+
 from ..domain_txn_handler import (
     prepare_for_state_read,
     get_proof_nodes,
@@ -42,6 +44,27 @@ class TestSubTrie(IsolatedAsyncioTestCase):
             expected_value="test", proof_nodes="test"
         )
 
+    async def test_verify_spv_proof_cached(self):
+        SubTrie._serialized_proof_values.cache_clear()
+        for _ in range(2):
+            assert await SubTrie.verify_spv_proof(
+                proof_nodes=get_proof_nodes(GET_NYM_REPLY),
+                expected_value=prepare_for_state_read(GET_NYM_REPLY),
+            )
+        info = SubTrie._serialized_proof_values.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    async def test_verify_spv_proof_decoded(self):
+        proof_nodes = rlp_decode(get_proof_nodes(GET_NYM_REPLY))
+        expected_value = prepare_for_state_read(GET_NYM_REPLY)
+        assert await SubTrie.verify_spv_proof(
+            expected_value, proof_nodes, serialized=False
+        )
+        # nodes after one which cannot be read are not considered
+        assert not await SubTrie.verify_spv_proof(
+            expected_value, [[b"", b"x"]] + proof_nodes, serialized=False
+        )
+
 
 class TestMPTStateProofValidation(IsolatedAsyncioTestCase):
     async def test_validate_get_nym(self):
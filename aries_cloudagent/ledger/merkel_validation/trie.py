@@ -4,6 +4,9 @@ import json
 from collections import (
     OrderedDict,
 )
+from functools import lru_cache
+from typing import Sequence
+
 from rlp import (
     encode as rlp_encode,
     decode as rlp_decode,
@@ -23,6 +26,8 @@ from .constants import (
     BLANK_NODE,
 )
 
+PROOF_CACHE_SIZE = 256
+
 
 class SubTrie:
     """Utility class for SubTrie and State Proof validation."""
@@ -57,31 +62,55 @@ class SubTrie:
             return NODE_TYPE_BRANCH
 
     @staticmethod
-    async def verify_spv_proof(expected_value, proof_nodes, serialized=True):
-        """Verify State Proof."""
+    def _node_values(proof_nodes: Sequence) -> tuple:
+        """Extract the values held by decoded proof nodes.
+
+        Nodes are read in order, up to the first one which cannot be read.
+        """
+        values = []
         try:
-            if serialized:
-                proof_nodes = rlp_decode(proof_nodes)
-            new_trie = await SubTrie.get_new_trie_with_proof_nodes(proof_nodes)
-            expected_value = json.loads(expected_value)
-            for encoded_node in list(new_trie._subtrie.values()):
+            for node in proof_nodes:
+                node_type = SubTrie._get_node_type(node)
+                if node_type == NODE_TYPE_BRANCH:
+                    encoded_value = node[-1]
+                elif node_type == NODE_TYPE_LEAF:
+                    encoded_value = node[1]
+                else:
+                    continue
                 try:
-                    decoded_node = rlp_decode(encoded_node)
-                    # branch node
-                    if SubTrie._get_node_type(decoded_node) == NODE_TYPE_BRANCH:
-                        if (
-                            json.loads(rlp_decode(decoded_node[-1])[0].decode("utf-8"))
-                        ) == expected_value:
-                            return True
-                    # leaf or extension node
-                    if SubTrie._get_node_type(decoded_node) == NODE_TYPE_LEAF:
-                        if (
-                            json.loads(rlp_decode(decoded_node[1])[0].decode("utf-8"))
-                        ) == expected_value:
-                            return True
+                    value = rlp_decode(encoded_value)[0]
                 except DecodingError:
                     continue
-            return False
+                values.append(json.loads(value.decode("utf-8")))
+        except Exception:
+            pass
+        return tuple(values)
+
+    @staticmethod
+    @lru_cache(maxsize=PROOF_CACHE_SIZE)
+    def _serialized_proof_values(proof_nodes: bytes) -> tuple:
+        """Extract the values held by serialized proof nodes, caching the result.
+
+        Reads of the same ledger state return identical proofs, so the
+        decoded values are kept for the most recently verified proofs.
+        """
+        try:
+            return SubTrie._node_values(rlp_decode(proof_nodes))
+        except Exception:
+            return ()
+
+    @staticmethod
+    async def verify_spv_proof(expected_value, proof_nodes, serialized=True):
+        """Verify State Proof."""
+        try:
+            expected_value = json.loads(expected_value)
+            if serialized and isinstance(proof_nodes, bytes):
+                values = SubTrie._serialized_proof_values(proof_nodes)
+            else:
+                if serialized:
+                    proof_nodes = rlp_decode(proof_nodes)
+                values = SubTrie._node_values(proof_nodes)
+            return expected_value in values
         except Exception:
             return False
 
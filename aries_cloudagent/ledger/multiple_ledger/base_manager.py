@@ -1,8 +1,11 @@
 """Manager for multiple ledger."""
 
+import asyncio
+
 from abc import ABC, abstractmethod
 from typing import Optional, Tuple, Mapping, List
 
+from ...cache.base import BaseCache
 from ...core.error import BaseError
 from ...core.profile import Profile
 from ...ledger.base import BaseLedger
@@ -17,6 +20,11 @@ class MultipleLedgerManagerError(BaseError):
 class BaseMultipleLedgerManager(ABC):
     """Base class for handling multiple ledger support."""
 
+    # Cache value recording that a DID was found on none of the ledgers
+    DID_NOT_FOUND = "::not_found"
+    # Time in sec to remember that a DID was not found
+    NOT_FOUND_CACHE_TTL = 30
+
     def __init__(self, profile: Profile):
         """Initialize Multiple Ledger Manager."""
 
@@ -50,11 +58,94 @@ class BaseMultipleLedgerManager(ABC):
     async def get_ledger_inst_by_id(self, ledger_id: str) -> Optional[BaseLedger]:
         """Return ledger instance by identifier."""
 
-    @abstractmethod
     async def lookup_did_in_configured_ledgers(
-        self, did: str, cache_did: bool
+        self, did: str, cache_did: bool = True
     ) -> Tuple[str, BaseLedger]:
-        """Lookup given DID in configured ledgers in parallel."""
+        """Lookup given DID in configured ledgers in parallel.
+
+        All configured ledgers are queried at once. A self-certified DID on a
+        production ledger is preferred, then one on a non-production ledger,
+        then a DID which is not self-certified, in the same order. Ledgers are
+        ranked by their configured order within each group. Outstanding
+        queries are cancelled as soon as none of them could supply a better
+        answer than the one already found.
+
+        Args:
+            did: The DID to look up
+            cache_did: Whether to cache the result, including a negative one
+
+        Returns:
+            A tuple of the ledger identifier and ledger instance
+
+        Raises:
+            MultipleLedgerManagerError: If the DID is not found on any ledger
+
+        """
+        self.cache = self.profile.inject_or(BaseCache)
+        cache_key = f"did_ledger_id_resolver::{did}"
+        cached_ledger_id = (
+            await self.cache.get(cache_key) if cache_did and self.cache else None
+        )
+        if cached_ledger_id == self.DID_NOT_FOUND:
+            raise self._did_not_found_error(did)
+        elif cached_ledger_id:
+            if cached_ledger_id in self.production_ledgers:
+                return (cached_ledger_id, self.production_ledgers.get(cached_ledger_id))
+            elif cached_ledger_id in self.non_production_ledgers:
+                return (
+                    cached_ledger_id,
+                    self.non_production_ledgers.get(cached_ledger_id),
+                )
+            else:
+                raise MultipleLedgerManagerError(
+                    f"cached ledger_id {cached_ledger_id} not found in either "
+                    "production_ledgers or non_production_ledgers"
+                )
+
+        # best possible rank of a response from each ledger, lower is better
+        ranks = {}
+        for index, ledger_id in enumerate(self.production_ledgers):
+            ranks.setdefault(ledger_id, (0, index))
+        for index, ledger_id in enumerate(self.non_production_ledgers):
+            ranks.setdefault(ledger_id, (1, index))
+
+        async def lookup(ledger_id: str):
+            return ledger_id, await self._get_ledger_by_did(ledger_id, did)
+
+        tasks = [asyncio.ensure_future(lookup(ledger_id)) for ledger_id in ranks]
+        pending = set(ranks)
+        found = None
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                ledger_id, result = await next_done
+                pending.discard(ledger_id)
+                if result:
+                    group, index = ranks[ledger_id]
+                    rank = (group, index) if result[2] else (group + 2, index)
+                    if not found or rank < found[0]:
+                        found = (rank, (result[0], result[1]))
+                if found and all(ranks[ledger_id] > found[0] for ledger_id in pending):
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        if not found:
+            if cache_did and self.cache:
+                await self.cache.set(
+                    cache_key, self.DID_NOT_FOUND, self.NOT_FOUND_CACHE_TTL
+                )
+            raise self._did_not_found_error(did)
+        if cache_did and self.cache:
+            await self.cache.set(cache_key, found[1][0], self.cache_ttl)
+        return found[1]
+
+    def _did_not_found_error(self, did: str) -> MultipleLedgerManagerError:
+        return MultipleLedgerManagerError(
+            f"DID {did} not found in any of the ledgers total: "
+            f"(production: {len(self.production_ledgers)}, "
+            f"non_production: {len(self.non_production_ledgers)})"
+        )
 
     def extract_did_from_identifier(self, identifier: str) -> str:
         """Return did from record identifier (REV_REG_ID, CRED_DEF_ID, SCHEMA_ID)."""
@@ -1,13 +1,11 @@
 """Multiple IndySdkLedger Manager."""
 import asyncio
-import concurrent.futures
 import logging
 import json
 
 from collections import OrderedDict
 from typing import Optional, Tuple, Mapping, List
 
-from ...cache.base import BaseCache
 from ...core.profile import Profile
 from ...ledger.base import BaseLedger
 from ...ledger.error import LedgerError
@@ -51,7 +49,6 @@ class MultiIndyLedgerManager(BaseMultipleLedgerManager):
         self.non_production_ledgers = non_production_ledgers
         self.writable_ledgers = writable_ledgers
         self.endorser_map = endorser_map
-        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=5)
         self.cache_ttl = cache_ttl
 
     async def get_write_ledgers(self) -> List[str]:
@@ -152,120 +149,3 @@ class MultiIndyLedgerManager(BaseMultipleLedgerManager):
                 f"for Did {did} and ledger {ledger_id}, {err}"
             )
             return None
-
-    async def lookup_did_in_configured_ledgers(
-        self, did: str, cache_did: bool = True
-    ) -> Tuple[str, IndySdkLedger]:
-        """Lookup given DID in configured ledgers in parallel."""
-        self.cache = self.profile.inject_or(BaseCache)
-        cache_key = f"did_ledger_id_resolver::{did}"
-        if bool(cache_did and self.cache and await self.cache.get(cache_key)):
-            cached_ledger_id = await self.cache.get(cache_key)
-            if cached_ledger_id in self.production_ledgers:
-                return (cached_ledger_id, self.production_ledgers.get(cached_ledger_id))
-            elif cached_ledger_id in self.non_production_ledgers:
-                return (
-                    cached_ledger_id,
-                    self.non_production_ledgers.get(cached_ledger_id),
-                )
-            else:
-                raise MultipleLedgerManagerError(
-                    f"cached ledger_id {cached_ledger_id} not found in either "
-                    "production_ledgers or non_production_ledgers"
-                )
-        applicable_prod_ledgers = {"self_certified": {}, "non_self_certified": {}}
-        applicable_non_prod_ledgers = {"self_certified": {}, "non_self_certified": {}}
-        ledger_ids = list(self.production_ledgers.keys()) + list(
-            self.non_production_ledgers.keys()
-        )
-        coro_futures = {
-            self.executor.submit(self._get_ledger_by_did, ledger_id, did): ledger_id
-            for ledger_id in ledger_ids
-        }
-        for coro_future in concurrent.futures.as_completed(coro_futures):
-            result = await coro_future.result()
-            if result:
-                applicable_ledger_id = result[0]
-                applicable_ledger_inst = result[1]
-                is_self_certified = result[2]
-                if applicable_ledger_id in self.production_ledgers:
-                    insert_key = list(self.production_ledgers).index(
-                        applicable_ledger_id
-                    )
-                    if is_self_certified:
-                        applicable_prod_ledgers["self_certified"][insert_key] = (
-                            applicable_ledger_id,
-                            applicable_ledger_inst,
-                        )
-                    else:
-                        applicable_prod_ledgers["non_self_certified"][insert_key] = (
-                            applicable_ledger_id,
-                            applicable_ledger_inst,
-                        )
-                else:
-                    insert_key = list(self.non_production_ledgers).index(
-                        applicable_ledger_id
-                    )
-                    if is_self_certified:
-                        applicable_non_prod_ledgers["self_certified"][insert_key] = (
-                            applicable_ledger_id,
-                            applicable_ledger_inst,
-                        )
-                    else:
-                        applicable_non_prod_ledgers["non_self_certified"][
-                            insert_key
-                        ] = (applicable_ledger_id, applicable_ledger_inst)
-        applicable_prod_ledgers["self_certified"] = OrderedDict(
-            sorted(applicable_prod_ledgers.get("self_certified").items())
-        )
-        applicable_prod_ledgers["non_self_certified"] = OrderedDict(
-            sorted(applicable_prod_ledgers.get("non_self_certified").items())
-        )
-        applicable_non_prod_ledgers["self_certified"] = OrderedDict(
-            sorted(applicable_non_prod_ledgers.get("self_certified").items())
-        )
-        applicable_non_prod_ledgers["non_self_certified"] = OrderedDict(
-            sorted(applicable_non_prod_ledgers.get("non_self_certified").items())
-        )
-        if len(applicable_prod_ledgers.get("self_certified")) > 0:
-            successful_ledger_inst = list(
-                applicable_prod_ledgers.get("self_certified").values()
-            )[0]
-            if cache_did and self.cache:
-                await self.cache.set(
-                    cache_key, successful_ledger_inst[0], self.cache_ttl
-                )
-            return successful_ledger_inst
-        elif len(applicable_non_prod_ledgers.get("self_certified")) > 0:
-            successful_ledger_inst = list(
-                applicable_non_prod_ledgers.get("self_certified").values()
-            )[0]
-            if cache_did and self.cache:
-                await self.cache.set(
-                    cache_key, successful_ledger_inst[0], self.cache_ttl
-                )
-            return successful_ledger_inst
-        elif len(applicable_prod_ledgers.get("non_self_certified")) > 0:
-            successful_ledger_inst = list(
-                applicable_prod_ledgers.get("non_self_certified").values()
-            )[0]
-            if cache_did and self.cache:
-                await self.cache.set(
-                    cache_key, successful_ledger_inst[0], self.cache_ttl
-                )
-            return successful_ledger_inst
-        elif len(applicable_non_prod_ledgers.get("non_self_certified")) > 0:
-            successful_ledger_inst = list(
-                applicable_non_prod_ledgers.get("non_self_certified").values()
-            )[0]
-            if cache_did and self.cache:
-                await self.cache.set(
-                    cache_key, successful_ledger_inst[0], self.cache_ttl
-                )
-            return successful_ledger_inst
-        else:
-            raise MultipleLedgerManagerError(
-                f"DID {did} not found in any of the ledgers total: "
-                f"(production: {len(self.production_ledgers)}, "
-                f"non_production: {len(self.non_production_ledgers)})"
-            )
@@ -126,6 +126,12 @@ class MultiIndyLedgerManagerProvider(BaseProvider):
                         keepalive = config.get("keepalive")
                         read_only = config.get("read_only")
                         socks_proxy = config.get("socks_proxy")
+                        persistent_cache = bool(
+                            config.get(
+                                "persistent_cache",
+                                settings.get("ledger.persistent_cache"),
+                            )
+                        )
                         genesis_transactions = config.get("genesis_transactions")
                         cache = injector.inject_or(BaseCache)
                         ledger_id = config.get("id")
@@ -141,6 +147,7 @@ class MultiIndyLedgerManagerProvider(BaseProvider):
                             genesis_transactions=genesis_transactions,
                             read_only=read_only,
                             socks_proxy=socks_proxy,
+                            persistent_cache=persistent_cache,
                         )
                         ledger_instance = ledger_class(
                             pool=ledger_pool,
@@ -533,3 +533,78 @@ class TestMultiIndyVDRLedgerManager(IsolatedAsyncioTestCase):
 
     async def test_get_non_production_ledgers(self):
         assert len(await self.manager.get_nonprod_ledgers()) == 2
+
+    async def test_lookup_did_in_configured_ledgers_concurrent(self):
+        delays = {
+            "test_prod_1": 0.2,
+            "test_prod_2": 0.01,
+            "test_non_prod_1": 0.01,
+            "test_non_prod_2": 5,
+        }
+        cancelled = []
+
+        async def get_ledger_by_did(ledger_id, did):
+            try:
+                await asyncio.sleep(delays[ledger_id])
+            except asyncio.CancelledError:
+                cancelled.append(ledger_id)
+                raise
+            if ledger_id == "test_prod_2":
+                return None
+            ledger = self.manager.production_ledgers.get(
+                ledger_id
+            ) or self.manager.non_production_ledgers.get(ledger_id)
+            return (ledger_id, ledger, ledger_id != "test_non_prod_1")
+
+        with mock.patch.object(self.manager, "_get_ledger_by_did", get_ledger_by_did):
+            start = asyncio.get_event_loop().time()
+            (
+                ledger_id,
+                ledger_inst,
+            ) = await self.manager.lookup_did_in_configured_ledgers(
+                "Av63wJYM7xYR4AiygYq4c3", cache_did=True
+            )
+            elapsed = asyncio.get_event_loop().time() - start
+        # the first production ledger wins; the slow ledger is not waited for
+        assert ledger_id == "test_prod_1"
+        assert ledger_inst.pool.name == "test_prod_1"
+        assert elapsed < 1
+        await asyncio.sleep(0)
+        assert cancelled == ["test_non_prod_2"]
+
+    async def test_lookup_did_in_configured_ledgers_short_circuit(self):
+        calls = []
+
+        async def get_ledger_by_did(ledger_id, did):
+            calls.append(ledger_id)
+            if ledger_id == "test_prod_1":
+                return (ledger_id, self.manager.production_ledgers[ledger_id], True)
+            await asyncio.sleep(5)
+
+        with mock.patch.object(self.manager, "_get_ledger_by_did", get_ledger_by_did):
+            (ledger_id, _) = await asyncio.wait_for(
+                self.manager.lookup_did_in_configured_ledgers(
+                    "Av63wJYM7xYR4AiygYq4c3", cache_did=False
+                ),
+                1,
+            )
+        assert ledger_id == "test_prod_1"
+        assert len(calls) == 4
+
+    async def test_lookup_did_in_configured_ledgers_not_found_cached(self):
+        get_ledger_by_did = mock.CoroutineMock(return_value=None)
+        with mock.patch.object(self.manager, "_get_ledger_by_did", get_ledger_by_did):
+            for _ in range(2):
+                with self.assertRaises(MultipleLedgerManagerError) as cm:
+                    await self.manager.lookup_did_in_configured_ledgers(
+                        "Av63wJYM7xYR4AiygYq4c3", cache_did=True
+                    )
+                assert "not found in any of the ledgers total: (production: " in str(
+                    cm.exception
+                )
+        assert get_ledger_by_did.call_count == 4
+        cache = self.profile.inject(BaseCache)
+        assert (
+            await cache.get("did_ledger_id_resolver::Av63wJYM7xYR4AiygYq4c3")
+            == MultiIndyVDRLedgerManager.DID_NOT_FOUND
+        )
@@ -0,0 +1,109 @@
+"""Persistent cache for immutable ledger objects."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+from pathlib import Path
+from typing import Optional
+
+LOGGER = logging.getLogger(__name__)
+
+
+class LedgerObjectCache:
+    """Cache immutable ledger objects, such as schemas, on disk.
+
+    Objects are stored one per file, named by the hash of the object kind and
+    identifier. Each cache directory belongs to a single ledger, identified by
+    the hash of its genesis transactions, so that entries are never shared
+    between ledgers which happen to use the same pool name. Entries do not
+    expire, and are loaded into memory when the cache is warmed.
+    """
+
+    def __init__(self, path: Path):
+        """Initialize a `LedgerObjectCache` instance.
+
+        Args:
+            path: The directory in which to store cached objects
+        """
+        self.path = path
+        self._entries = {}
+        self._warmed = False
+
+    @staticmethod
+    def _file_name(kind: str, object_id: str) -> str:
+        """Get the content address of a cached object."""
+        digest = hashlib.sha256(f"{kind}::{object_id}".encode("utf-8")).hexdigest()
+        return f"{digest}.json"
+
+    def warm(self) -> int:
+        """Load all cached objects into memory.
+
+        Returns:
+            The number of objects loaded
+
+        """
+        if self._warmed:
+            return len(self._entries)
+        self._warmed = True
+        try:
+            paths = list(self.path.glob("*.json"))
+        except OSError:
+            return 0
+        for path in paths:
+            try:
+                entry = json.loads(path.read_text())
+                if path.name != self._file_name(entry["kind"], entry["id"]):
+                    raise ValueError("Entry does not match its file name")
+            except (OSError, KeyError, TypeError, ValueError):
+                LOGGER.warning("Ignoring invalid ledger cache entry: %s", path)
+                continue
+            self._entries[(entry["kind"], entry["id"])] = entry["value"]
+        LOGGER.debug("Loaded %d ledger objects from %s", len(self._entries), self.path)
+        return len(self._entries)
+
+    def get(self, kind: str, object_id: str) -> Optional[dict]:
+        """Get a cached object.
+
+        Args:
+            kind: The kind of object, such as "schema"
+            object_id: The ledger identifier of the object
+
+        """
+        key = (kind, object_id)
+        if key not in self._entries and not self._warmed:
+            try:
+                entry = json.loads(
+                    self.path.joinpath(self._file_name(kind, object_id)).read_text()
+                )
+            except (OSError, ValueError):
+                return None
+            self._entries[key] = entry["value"]
+        return self._entries.get(key)
+
+    def set(self, kind: str, object_id: str, value: dict):
+        """Add an object to the cache.
+
+        Args:
+            kind: The kind of object, such as "schema"
+            object_id: The ledger identifier of the object
+            value: The object, which must not change once written to the ledger
+
+        """
+        if self._entries.get((kind, object_id)) == value:
+            return
+        self._entries[(kind, object_id)] = value
+        entry = json.dumps({"kind": kind, "id": object_id, "value": value})
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=self.path, delete=False) as tmp:
+                tmp.write(entry.encode("utf-8"))
+            os.replace(tmp.name, self.path.joinpath(self._file_name(kind, object_id)))
+        except OSError:
+            LOGGER.exception("Error writing ledger cache entry")
+
+    def __len__(self) -> int:
+        """Get the number of objects loaded in memory."""
+        return len(self._entries)
@@ -5,6 +5,7 @@ import pytest
 from aries_cloudagent.tests import mock
 
 
+from ...cache.in_memory import InMemoryCache
 from ...core.in_memory import InMemoryProfile
 from ...indy.issuer import IndyIssuer
 from ...wallet.base import BaseWallet
@@ -419,6 +420,64 @@ class TestIndyVdrLedger:
             result = await ledger.get_schema("55GkHamhTU1ZbTbV2ab9DE:2:schema_name:9.1")
             assert result is None
 
+    @pytest.mark.asyncio
+    async def test_get_schema_persistent_cache(
+        self,
+        ledger: IndyVdrLedger,
+        tmp_path,
+    ):
+        ledger.pool.persistent_cache = True
+        ledger.pool.cfg_path_cache = tmp_path
+        ledger.pool.genesis_hash_cache = "hash"
+        async with ledger:
+            ledger.pool_handle.submit_request.return_value = {
+                "seqNo": 99,
+                "dest": "55GkHamhTU1ZbTbV2ab9DE",
+                "data": {
+                    "name": "schema_name",
+                    "version": "9.1",
+                    "attr_names": ["a", "b"],
+                },
+            }
+
+            result = await ledger.get_schema("55GkHamhTU1ZbTbV2ab9DE:2:schema_name:9.1")
+            assert await ledger.get_schema("99") == result
+            assert ledger.pool_handle.submit_request.call_count == 1
+
+        # a restarted agent reads the schema from disk
+        pool = IndyVdrLedgerPool("test-ledger", persistent_cache=True)
+        pool.cfg_path_cache = tmp_path
+        pool.genesis_hash_cache = "hash"
+        assert pool.object_cache.warm() == 2
+        assert pool.object_cache.get("schema", "99") == result
+
+    @pytest.mark.asyncio
+    async def test_get_schemas(
+        self,
+        ledger: IndyVdrLedger,
+    ):
+        ledger.pool.cache = InMemoryCache()
+        schema_ids = [
+            f"55GkHamhTU1ZbTbV2ab9DE:2:schema_name:{version}" for version in range(4)
+        ]
+        await ledger.pool.cache.set(f"schema::{schema_ids[0]}", {"id": schema_ids[0]})
+
+        def get_schema_reply(request):
+            operation = json.loads(request.body)["operation"]
+            return {
+                "seqNo": 99,
+                "dest": operation["dest"],
+                "data": {**operation["data"], "attr_names": ["a", "b"]},
+            }
+
+        async with ledger:
+            ledger.pool_handle.submit_request.side_effect = get_schema_reply
+            result = await ledger.get_schemas(schema_ids + schema_ids[2:])
+            assert list(result) == schema_ids
+            assert [schema["id"] for schema in result.values()] == schema_ids
+            # the cached schema and the repeated ids are not requested again
+            assert ledger.pool_handle.submit_request.await_count == 3
+
     @pytest.mark.asyncio
     async def test_send_credential_definition(
         self,
@@ -536,6 +595,30 @@ class TestIndyVdrLedger:
                 "value": {"cred": "def"},
             }
 
+    @pytest.mark.asyncio
+    async def test_get_credential_definition_persistent_cache(
+        self,
+        ledger: IndyVdrLedger,
+        tmp_path,
+    ):
+        ledger.pool.persistent_cache = True
+        ledger.pool.cfg_path_cache = tmp_path
+        ledger.pool.genesis_hash_cache = "hash"
+        async with ledger:
+            ledger.pool_handle.submit_request.return_value = {
+                "seqNo": 99,
+                "ref": "schema-id",
+                "signature_type": "CL",
+                "tag": "tag",
+                "origin": "origin-did",
+                "data": {"cred": "def"},
+            }
+
+            cred_def_id = "55GkHamhTU1ZbTbV2ab9DE:3:CL:99:tag"
+            result = await ledger.get_credential_definition(cred_def_id)
+            assert await ledger.get_credential_definition(cred_def_id) == result
+            assert ledger.pool_handle.submit_request.call_count == 1
+
     @pytest.mark.asyncio
     async def test_get_credential_definition_not_found(
         self,
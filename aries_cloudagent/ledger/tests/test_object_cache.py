@@ -0,0 +1,43 @@
+from ..object_cache import LedgerObjectCache
+
+SCHEMA = {"id": "55GkHamhTU1ZbTbV2ab9DE:2:schema_name:9.1", "seqNo": 99}
+
+
+def test_set_get(tmp_path):
+    cache = LedgerObjectCache(tmp_path.joinpath("objects"))
+    assert cache.get("schema", SCHEMA["id"]) is None
+    cache.set("schema", SCHEMA["id"], SCHEMA)
+    assert cache.get("schema", SCHEMA["id"]) == SCHEMA
+    assert cache.get("credential_definition", SCHEMA["id"]) is None
+    assert len(cache) == 1
+
+
+def test_persisted(tmp_path):
+    LedgerObjectCache(tmp_path).set("schema", SCHEMA["id"], SCHEMA)
+
+    cache = LedgerObjectCache(tmp_path)
+    assert cache.get("schema", SCHEMA["id"]) == SCHEMA
+
+    cache = LedgerObjectCache(tmp_path)
+    assert cache.warm() == 1
+    assert cache.warm() == 1
+    assert cache.get("schema", SCHEMA["id"]) == SCHEMA
+
+
+def test_warm_skips_invalid(tmp_path):
+    cache = LedgerObjectCache(tmp_path)
+    cache.set("schema", SCHEMA["id"], SCHEMA)
+    entry = tmp_path.joinpath(cache._file_name("schema", SCHEMA["id"])).read_text()
+    tmp_path.joinpath("corrupt.json").write_text("{")
+    # an entry must be stored under its own content address
+    tmp_path.joinpath("moved.json").write_text(entry)
+
+    cache = LedgerObjectCache(tmp_path)
+    assert cache.warm() == 1
+    assert cache.get("schema", SCHEMA["id"]) == SCHEMA
+
+
+def test_missing_dir(tmp_path):
+    cache = LedgerObjectCache(tmp_path.joinpath("missing"))
+    assert cache.warm() == 0
+    assert cache.get("schema", SCHEMA["id"]) is None
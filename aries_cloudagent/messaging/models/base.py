@@ -1,22 +1,46 @@
 """Base classes for Models and Schemas."""
 
+import copy
 import logging
-import json
 
 from abc import ABC
-from collections import namedtuple
-from typing import Mapping, Optional, Type, TypeVar, Union, cast, overload
+from collections import defaultdict, namedtuple
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    Dict,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 from typing_extensions import Literal
 
-from marshmallow import Schema, post_dump, pre_load, post_load, ValidationError, EXCLUDE
+from marshmallow import (
+    Schema,
+    fields,
+    post_dump,
+    pre_load,
+    post_load,
+    ValidationError,
+    EXCLUDE,
+)
+from marshmallow.decorators import VALIDATES, VALIDATES_SCHEMA
 
 from ...core.error import BaseError
+from ...utils import json_codec
 from ...utils.classloader import ClassLoader
 
 LOGGER = logging.getLogger(__name__)
 
 SerDe = namedtuple("SerDe", "ser de")
 
+TRUSTED_DATA = ContextVar("TRUSTED_DATA", default=False)
+
 
 def resolve_class(the_cls, relative_cls: Optional[type] = None) -> type:
     """Resolve a class.
@@ -72,6 +96,60 @@ def resolve_meta_property(obj, prop_name: str, defval=None):
     return found
 
 
+@contextmanager
+def trusted_data():
+    """Deserialize models without running validators within this context.
+
+    For use when loading data which was validated before it was stored, such as
+    the messages held by a record. Required fields are still checked.
+    """
+    token = TRUSTED_DATA.set(True)
+    try:
+        yield
+    finally:
+        TRUSTED_DATA.reset(token)
+
+
+def _trusted_field(field: fields.Field, seen: frozenset) -> fields.Field:
+    """Copy a field, and any fields or schemas it wraps, without validators.
+
+    Fields and nested schema instances may be shared with the module-level
+    schemas used for untrusted input, so they are copied rather than changed.
+    """
+    field = copy.copy(field)
+    field.validators = []
+    if isinstance(field, fields.Nested):
+        field._schema = _trusted_schema(field.schema, seen)
+    for name in ("inner", "key_field", "value_field"):
+        inner_field = getattr(field, name, None)
+        if isinstance(inner_field, fields.Field):
+            setattr(field, name, _trusted_field(inner_field, seen))
+    if getattr(field, "tuple_fields", None):
+        field.tuple_fields = [
+            _trusted_field(inner_field, seen) for inner_field in field.tuple_fields
+        ]
+    return field
+
+
+def _trusted_schema(schema: Schema, seen: frozenset = frozenset()) -> Schema:
+    """Copy a schema instance without its field and schema validators."""
+    if schema.__class__ in seen:
+        # a schema nesting itself keeps its validators below the first level
+        return schema
+    seen = seen | {schema.__class__}
+    schema = copy.copy(schema)
+    skipped = (VALIDATES, (VALIDATES_SCHEMA, False), (VALIDATES_SCHEMA, True))
+    schema._hooks = defaultdict(
+        list, {tag: names for tag, names in schema._hooks.items() if tag not in skipped}
+    )
+    schema.fields = {
+        name: _trusted_field(field, seen) for name, field in schema.fields.items()
+    }
+    schema.load_fields = {name: schema.fields[name] for name in schema.load_fields}
+    schema.dump_fields = {name: schema.fields[name] for name in schema.dump_fields}
+    return schema
+
+
 class BaseModelError(BaseError):
     """Base exception class for base model errors."""
 
@@ -87,6 +165,8 @@ class BaseModel(ABC):
 
         schema_class = None
 
+    _schemas: Dict[Tuple[type, Optional[str], bool], "BaseModelSchema"] = {}
+
     def __init__(self):
         """Initialize BaseModel.
 
@@ -117,6 +197,36 @@ class BaseModel(ABC):
             f"Resolved class is not a subclass of BaseModelSchema: {resolved}"
         )
 
+    @staticmethod
+    def _get_schema(
+        schema_cls: Type["BaseModelSchema"],
+        unknown: Optional[str] = None,
+        trusted: bool = False,
+    ) -> "BaseModelSchema":
+        """Get a schema instance, shared between calls with the same options.
+
+        Schema hooks must not keep state from one `load` or `dump` to the next.
+
+        Args:
+            schema_cls: The schema class
+            unknown: Behaviour for unknown attributes
+            trusted: Whether to skip the validators of the schema and its fields
+
+        Returns:
+            The schema instance
+
+        """
+        key = (schema_cls, unknown, trusted)
+        schema = BaseModel._schemas.get(key)
+        if schema is None:
+            schema = schema_cls(
+                unknown=unknown or resolve_meta_property(schema_cls, "unknown", EXCLUDE)
+            )
+            if trusted:
+                schema = _trusted_schema(schema)
+            BaseModel._schemas[key] = schema
+        return schema
+
     @property
     def Schema(self) -> Type["BaseModelSchema"]:
         """Accessor for the model's schema class.
@@ -189,9 +299,8 @@ class BaseModel(ABC):
         if obj is None and none2none:
             return None
 
-        schema_cls = cls._get_schema_class()
-        schema = schema_cls(
-            unknown=unknown or resolve_meta_property(schema_cls, "unknown", EXCLUDE)
+        schema = cls._get_schema(
+            cls._get_schema_class(), unknown, TRUSTED_DATA.get()
         )
 
         try:
@@ -235,10 +344,7 @@ class BaseModel(ABC):
             A dict representation of this model, or a JSON string if as_string is True
 
         """
-        schema_cls = self._get_schema_class()
-        schema = schema_cls(
-            unknown=unknown or resolve_meta_property(schema_cls, "unknown", EXCLUDE)
-        )
+        schema = self._get_schema(self._get_schema_class(), unknown)
         try:
             return (
                 schema.dumps(self, separators=(",", ":"))
@@ -286,7 +392,7 @@ class BaseModel(ABC):
 
         """
         try:
-            parsed = json.loads(json_repr)
+            parsed = json_codec.loads(json_repr)
         except ValueError as e:
             LOGGER.exception(f"{cls.__name__} message parse error:")
             raise BaseModelError(f"{cls.__name__} JSON parsing failed") from e
@@ -299,7 +405,7 @@ class BaseModel(ABC):
             A JSON representation of this message
 
         """
-        return json.dumps(self.serialize(unknown=unknown))
+        return json_codec.dumps(self.serialize(unknown=unknown))
 
     def __repr__(self) -> str:
         """Return a human readable representation of this class.
@@ -1,25 +1,50 @@
 """Classes for BaseStorage-based record management."""
 
+import asyncio
 import json
 import logging
 import sys
 import uuid
 from datetime import datetime
-from typing import Any, Mapping, Optional, Sequence, Type, TypeVar, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from marshmallow import fields
 
 from ...cache.base import BaseCache
 from ...config.settings import BaseSettings
-from ...core.profile import ProfileSession
-from ...storage.base import BaseStorage, StorageDuplicateError, StorageNotFoundError
+from ...core.profile import Profile, ProfileSession
+from ...storage.base import (
+    DEFAULT_PAGE_SIZE,
+    BaseStorage,
+    BaseStorageSearch,
+    StorageDuplicateError,
+    StorageNotFoundError,
+)
 from ...storage.record import StorageRecord
+from ...utils import json_codec
+from ...utils.stats import Collector
 from ..util import datetime_to_str, time_now
 from ..valid import INDY_ISO8601_DATETIME_EXAMPLE, INDY_ISO8601_DATETIME_VALIDATE
-from .base import BaseModel, BaseModelError, BaseModelSchema
+from .base import BaseModel, BaseModelError, BaseModelSchema, trusted_data
 
 LOGGER = logging.getLogger(__name__)
 
+RECORD_TYPE_PROMOTED_TAGS = "promoted_tags"
+
+# back-fill tasks running in the background, by profile and record type
+_BACKFILL_TASKS: Dict[Tuple[str, str], asyncio.Task] = {}
 
 RecordType = TypeVar("RecordType", bound="BaseRecord")
 
@@ -77,6 +102,9 @@ class BaseRecord(BaseModel):
     EVENT_NAMESPACE: str = "acapy::record"
     LOG_STATE_FLAG = None
     TAG_NAMES = {"state"}
+    # Record value fields also stored as tags, so that query post-filters on them
+    # can be applied by storage once existing records have been back-filled
+    PROMOTED_TAG_NAMES = set()
     STATE_DELETED = "deleted"
 
     def __init__(
@@ -115,20 +143,32 @@ class BaseRecord(BaseModel):
             raise ValueError(f"Duplicate {record_id_name} inputs; {record}")
         params = dict(**record)
         params[record_id_name] = record_id
-        return cls(**params)
+        # models held by the record were validated before they were stored
+        with trusted_data():
+            return cls(**params)
 
     @classmethod
     def get_tag_map(cls) -> Mapping[str, str]:
         """Accessor for the set of defined tags."""
 
-        return {tag.lstrip("~"): tag for tag in cls.TAG_NAMES or ()}
+        return {
+            tag.lstrip("~"): tag
+            for tags in (cls.TAG_NAMES, cls.PROMOTED_TAG_NAMES)
+            for tag in tags or ()
+        }
+
+    @classmethod
+    def get_promoted_tag_map(cls) -> Mapping[str, str]:
+        """Accessor for the set of tags promoted from record value fields."""
+
+        return {tag.lstrip("~"): tag for tag in cls.PROMOTED_TAG_NAMES or ()}
 
     @property
     def storage_record(self) -> StorageRecord:
         """Accessor for a `StorageRecord` representing this record."""
 
         return StorageRecord(
-            self.RECORD_TYPE, json.dumps(self.value), self.tags, self._id
+            self.RECORD_TYPE, json_codec.dumps(self.value), self.tags, self._id
         )
 
     @property
@@ -150,11 +190,14 @@ class BaseRecord(BaseModel):
     def record_tags(self) -> dict:
         """Accessor to define implementation-specific tags."""
 
-        return {
-            tag: getattr(self, prop)
-            for (prop, tag) in self.get_tag_map().items()
-            if getattr(self, prop) is not None
-        }
+        promoted = self.get_promoted_tag_map()
+        tags = {}
+        for prop, tag in self.get_tag_map().items():
+            value = getattr(self, prop)
+            # only string values of promoted fields can be matched as tags
+            if value is not None and (prop not in promoted or isinstance(value, str)):
+                tags[tag] = value
+        return tags
 
     @property
     def tags(self) -> dict:
@@ -230,7 +273,7 @@ class BaseRecord(BaseModel):
         result = await storage.get_record(
             cls.RECORD_TYPE, record_id, {"forUpdate": for_update, "retrieveTags": False}
         )
-        vals = json.loads(result.value)
+        vals = json_codec.loads(result.value)
         return cls.from_storage(record_id, vals)
 
     @classmethod
@@ -259,7 +302,7 @@ class BaseRecord(BaseModel):
         )
         found = None
         for record in rows:
-            vals = json.loads(record.value)
+            vals = json_codec.loads(record.value)
             if match_post_filter(vals, post_filter, alt=False):
                 if found:
                     raise StorageDuplicateError(
@@ -278,27 +321,163 @@ class BaseRecord(BaseModel):
             )
         return found
 
+    @staticmethod
+    def _profile_key(profile: Profile) -> str:
+        """Identify a profile, including sub-wallets sharing a store."""
+
+        profile_id = getattr(profile, "profile_id", None)
+        return f"{profile.name}:{profile_id}" if profile_id else profile.name
+
+    @classmethod
+    def _promoted_tags_cache_key(cls, profile: Profile) -> str:
+        """Get the cache key for the back-filled promoted tags of a profile."""
+
+        return (
+            f"{RECORD_TYPE_PROMOTED_TAGS}::{cls._profile_key(profile)}::"
+            f"{cls.RECORD_TYPE}"
+        )
+
+    @classmethod
+    async def get_indexed_fields(cls, session: ProfileSession) -> Set[str]:
+        """Get the record value fields which can be matched by a tag query.
+
+        Promoted tags are only included once existing records have been
+        back-filled by `backfill_promoted_tags`.
+
+        Args:
+            session: The profile session to use
+        """
+
+        indexed = {tag.lstrip("~") for tag in cls.TAG_NAMES or ()}
+        promoted = cls.get_promoted_tag_map()
+        if not promoted:
+            return indexed
+
+        cache_key = cls._promoted_tags_cache_key(session.profile)
+        backfilled = await cls.get_cached_key(session, cache_key)
+        if backfilled is None:
+            storage = session.inject(BaseStorage)
+            try:
+                record = await storage.get_record(
+                    RECORD_TYPE_PROMOTED_TAGS, cls.RECORD_TYPE
+                )
+                backfilled = json_codec.loads(record.value)
+            except StorageNotFoundError:
+                backfilled = []
+            await cls.set_cached_key(session, cache_key, backfilled)
+        return indexed | (set(promoted) & set(backfilled))
+
+    @classmethod
+    def plan_query(
+        cls,
+        indexed: Set[str],
+        tag_filter: dict = None,
+        post_filter_positive: dict = None,
+        alt: bool = False,
+    ) -> Tuple[dict, dict]:
+        """Split positive post-filter clauses between storage and python matching.
+
+        Clauses on indexed fields whose values are strings (or, with `alt`,
+        lists of strings) are added to the tag filter. Negative post-filters
+        always match in python, as records without a tag cannot be told apart
+        from records with an empty value.
+
+        Args:
+            indexed: The record value fields which can be matched by tag query
+            tag_filter: The dictionary of tag filter clauses
+            post_filter_positive: Value filters to apply matching positively
+            alt: set to match any value in each post-filter clause
+
+        Returns:
+            A tuple of the tag filter and the remaining positive post-filter
+
+        """
+
+        tag_filter = dict(tag_filter or {})
+        remaining = {}
+        for key, value in (post_filter_positive or {}).items():
+            if key in indexed and key not in tag_filter:
+                if not alt and isinstance(value, str):
+                    tag_filter[key] = value
+                    continue
+                if (
+                    alt
+                    and isinstance(value, (list, tuple, set))
+                    and all(isinstance(option, str) for option in value)
+                ):
+                    # empty values never match alternatives in python
+                    tag_filter[key] = {"$in": [option for option in value if option]}
+                    continue
+            remaining[key] = value
+        return tag_filter, remaining
+
+    @classmethod
+    def log_query_stats(cls, session: ProfileSession, scanned: int, returned: int):
+        """Report the number of rows read from storage by a query.
+
+        Args:
+            session: The profile session used for the query
+            scanned: The number of rows read from storage
+            returned: The number of records returned
+        """
+
+        LOGGER.debug(
+            "%s query scanned %d rows, returned %d", cls.__name__, scanned, returned
+        )
+        collector = session.inject_or(Collector)
+        if collector:
+            collector.log(f"{cls.__name__}.query:scanned", scanned)
+            collector.log(f"{cls.__name__}.query:returned", returned)
+
     @classmethod
     async def query(
         cls: Type[RecordType],
         session: ProfileSession,
         tag_filter: dict = None,
         *,
+        limit: int = None,
+        offset: int = None,
         post_filter_positive: dict = None,
         post_filter_negative: dict = None,
         alt: bool = False,
     ) -> Sequence[RecordType]:
         """Query stored records.
 
+        Positive post-filter clauses on tagged fields are applied by storage.
+
         Args:
             session: The profile session to use
             tag_filter: An optional dictionary of tag filter clauses
+            limit: The maximum number of records to return
+            offset: The number of matching records to skip
             post_filter_positive: Additional value filters to apply matching positively
             post_filter_negative: Additional value filters to apply matching negatively
             alt: set to match any (positive=True) value or miss all (positive=False)
                 values in post_filter
         """
 
+        if limit is not None or offset:
+            return [
+                record
+                async for record in cls.iter_query(
+                    session,
+                    tag_filter,
+                    limit=limit,
+                    offset=offset,
+                    post_filter_positive=post_filter_positive,
+                    post_filter_negative=post_filter_negative,
+                    alt=alt,
+                )
+            ]
+
+        if post_filter_positive:
+            tag_filter, post_filter_positive = cls.plan_query(
+                await cls.get_indexed_fields(session),
+                tag_filter,
+                post_filter_positive,
+                alt,
+            )
+
         storage = session.inject(BaseStorage)
         rows = await storage.find_all_records(
             cls.RECORD_TYPE,
@@ -307,7 +486,7 @@ class BaseRecord(BaseModel):
         )
         result = []
         for record in rows:
-            vals = json.loads(record.value)
+            vals = json_codec.loads(record.value)
             if match_post_filter(
                 vals,
                 post_filter_positive,
@@ -323,8 +502,220 @@ class BaseRecord(BaseModel):
                     result.append(cls.from_storage(record.id, vals))
                 except BaseModelError as err:
                     raise BaseModelError(f"{err}, for record id {record.id}")
+        cls.log_query_stats(session, len(rows), len(result))
         return result
 
+    @classmethod
+    async def iter_query(
+        cls: Type[RecordType],
+        session: ProfileSession,
+        tag_filter: dict = None,
+        *,
+        limit: int = None,
+        offset: int = None,
+        post_filter_positive: dict = None,
+        post_filter_negative: dict = None,
+        alt: bool = False,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[RecordType]:
+        """Iterate over stored records, fetching them from storage a page at a time.
+
+        Without post-filters left to match in python, the limit and offset are
+        applied by the storage backend. Otherwise pages are fetched until enough
+        records match.
+
+        Args:
+            session: The profile session to use
+            tag_filter: An optional dictionary of tag filter clauses
+            limit: The maximum number of records to return
+            offset: The number of matching records to skip
+            post_filter_positive: Additional value filters to apply matching positively
+            post_filter_negative: Additional value filters to apply matching negatively
+            alt: set to match any (positive=True) value or miss all (positive=False)
+                values in post_filter
+            page_size: The number of records to fetch from storage at a time
+        """
+
+        if post_filter_positive:
+            tag_filter, post_filter_positive = cls.plan_query(
+                await cls.get_indexed_fields(session),
+                tag_filter,
+                post_filter_positive,
+                alt,
+            )
+
+        storage = session.inject(BaseStorage)
+        post_filtered = bool(post_filter_positive or post_filter_negative)
+        skip = (offset or 0) if post_filtered else 0
+        fetch_offset = 0 if post_filtered else (offset or 0)
+        remaining = limit
+        scanned = returned = 0
+        try:
+            while remaining is None or remaining > 0:
+                fetch_count = page_size
+                if remaining is not None and not post_filtered:
+                    fetch_count = min(page_size, remaining)
+                rows = await storage.find_paginated_records(
+                    cls.RECORD_TYPE,
+                    cls.prefix_tag_filter(tag_filter),
+                    limit=fetch_count,
+                    offset=fetch_offset,
+                    options={"retrieveTags": False},
+                )
+                fetch_offset += len(rows)
+                for record in rows:
+                    scanned += 1
+                    vals = json_codec.loads(record.value)
+                    if post_filtered:
+                        if not (
+                            match_post_filter(
+                                vals, post_filter_positive, positive=True, alt=alt
+                            )
+                            and match_post_filter(
+                                vals, post_filter_negative, positive=False, alt=alt
+                            )
+                        ):
+                            continue
+                        if skip:
+                            skip -= 1
+                            continue
+                    try:
+                        found = cls.from_storage(record.id, vals)
+                    except BaseModelError as err:
+                        raise BaseModelError(f"{err}, for record id {record.id}")
+                    returned += 1
+                    yield found
+                    if remaining is not None:
+                        remaining -= 1
+                        if not remaining:
+                            return
+                if len(rows) < fetch_count:
+                    return
+        finally:
+            cls.log_query_stats(session, scanned, returned)
+
+    @classmethod
+    async def backfill_promoted_tags(
+        cls, profile: Profile, *, batch_size: int = DEFAULT_PAGE_SIZE
+    ) -> int:
+        """Add promoted tags to stored records which were saved without them.
+
+        Records are updated a batch at a time while the agent is running. Once
+        all records have been visited, the promoted tags are recorded as
+        back-filled and queries begin to match on them in storage. Records are
+        not visited again while the recorded tags cover the promoted tags.
+
+        Args:
+            profile: The profile whose records to update
+            batch_size: The number of records to update in each transaction
+
+        Returns:
+            The number of records updated
+
+        """
+
+        promoted = cls.get_promoted_tag_map()
+        if not promoted:
+            return 0
+
+        async with profile.session() as session:
+            if set(promoted) <= await cls.get_indexed_fields(session):
+                return 0
+
+        updated = 0
+        search = profile.inject(BaseStorageSearch).search_records(
+            cls.RECORD_TYPE, page_size=batch_size
+        )
+        try:
+            while True:
+                rows = await search.fetch(batch_size)
+                if not rows:
+                    break
+                stale = [
+                    row.id
+                    for row in rows
+                    if any(tag not in (row.tags or {}) for tag in promoted.values())
+                ]
+                if not stale:
+                    continue
+                async with profile.transaction() as txn:
+                    storage = txn.inject(BaseStorage)
+                    for record_id in stale:
+                        # re-read the record, in case it was updated since the scan
+                        try:
+                            row = await storage.get_record(
+                                cls.RECORD_TYPE, record_id, {"forUpdate": True}
+                            )
+                        except StorageNotFoundError:
+                            continue
+                        vals = json_codec.loads(row.value)
+                        tags = dict(row.tags or {})
+                        for prop, tag in promoted.items():
+                            if tag not in tags and isinstance(vals.get(prop), str):
+                                tags[tag] = vals[prop]
+                        if tags != (row.tags or {}):
+                            await storage.update_record(row, row.value, tags)
+                            updated += 1
+                    await txn.commit()
+        finally:
+            await search.close()
+
+        async with profile.session() as session:
+            storage = session.inject(BaseStorage)
+            value = json.dumps(sorted(promoted))
+            try:
+                record = await storage.get_record(
+                    RECORD_TYPE_PROMOTED_TAGS, cls.RECORD_TYPE
+                )
+                await storage.update_record(record, value, {})
+            except StorageNotFoundError:
+                await storage.add_record(
+                    StorageRecord(RECORD_TYPE_PROMOTED_TAGS, value, {}, cls.RECORD_TYPE)
+                )
+            await cls.clear_cached_key(session, cls._promoted_tags_cache_key(profile))
+        LOGGER.info(
+            "Back-filled promoted tags %s on %d %s records",
+            ", ".join(sorted(promoted)),
+            updated,
+            cls.__name__,
+        )
+        return updated
+
+    @classmethod
+    def schedule_backfill_promoted_tags(cls, profile: Profile) -> asyncio.Task:
+        """Run `backfill_promoted_tags` for a profile in the background.
+
+        A back-fill already running for the profile is returned instead of
+        starting another.
+
+        Args:
+            profile: The profile whose records to update
+
+        Returns:
+            The back-fill task
+
+        """
+
+        key = (cls._profile_key(profile), cls.RECORD_TYPE)
+        task = _BACKFILL_TASKS.get(key)
+        if task and not task.done():
+            return task
+
+        def done(task: asyncio.Task):
+            if _BACKFILL_TASKS.get(key) is task:
+                del _BACKFILL_TASKS[key]
+            if not task.cancelled() and task.exception():
+                LOGGER.error(
+                    "Error back-filling promoted tags on %s records",
+                    cls.__name__,
+                    exc_info=task.exception(),
+                )
+
+        task = asyncio.get_event_loop().create_task(cls.backfill_promoted_tags(profile))
+        task.add_done_callback(done)
+        _BACKFILL_TASKS[key] = task
+        return task
+
     async def save(
         self,
         session: ProfileSession,
@@ -0,0 +1,84 @@
+"""Support for paginated and streamed record list requests in the Admin API."""
+
+import json
+from typing import AsyncIterable, Optional, Tuple
+
+from aiohttp import web
+from marshmallow import fields, validate
+
+from .openapi import OpenAPISchema
+
+NDJSON_MIME_TYPE = "application/x-ndjson"
+MAX_PAGE_LIMIT = 10000
+
+
+class PaginatedQuerySchema(OpenAPISchema):
+    """Parameters for paginated list request query strings."""
+
+    limit = fields.Int(
+        required=False,
+        validate=validate.Range(min=1, max=MAX_PAGE_LIMIT),
+        metadata={
+            "description": "Maximum number of records to return",
+            "example": 100,
+        },
+    )
+    offset = fields.Int(
+        required=False,
+        validate=validate.Range(min=0),
+        metadata={
+            "description": "Number of matching records to skip",
+            "example": 0,
+        },
+    )
+
+
+def get_limit_offset(request: web.BaseRequest) -> Tuple[Optional[int], Optional[int]]:
+    """Read the pagination parameters of a list request.
+
+    Args:
+        request: aiohttp request object
+
+    Returns:
+        A tuple of the limit and offset, either of which may be `None`
+
+    """
+    try:
+        limit = int(request.query["limit"]) if request.query.get("limit") else None
+        offset = int(request.query["offset"]) if request.query.get("offset") else None
+    except ValueError as err:
+        raise web.HTTPBadRequest(reason="Invalid limit or offset") from err
+    if (limit is not None and not 1 <= limit <= MAX_PAGE_LIMIT) or (
+        offset is not None and offset < 0
+    ):
+        raise web.HTTPBadRequest(reason="Limit or offset out of range")
+    return limit, offset
+
+
+def accepts_ndjson(request: web.BaseRequest) -> bool:
+    """Determine whether the client asked for a newline-delimited JSON stream."""
+    return NDJSON_MIME_TYPE in request.headers.get("Accept", "")
+
+
+async def ndjson_response(
+    request: web.BaseRequest, results: AsyncIterable[dict]
+) -> web.StreamResponse:
+    """Stream results to the client as newline-delimited JSON.
+
+    Each result is written as soon as it is produced, so that memory use does
+    not grow with the size of the result set.
+
+    Args:
+        request: aiohttp request object
+        results: the serialized results to send
+
+    Returns:
+        The completed stream response
+
+    """
+    response = web.StreamResponse(headers={"Content-Type": NDJSON_MIME_TYPE})
+    await response.prepare(request)
+    async for result in results:
+        await response.write(json.dumps(result).encode() + b"\n")
+    await response.write_eof()
+    return response
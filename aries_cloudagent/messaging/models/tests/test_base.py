@@ -1,9 +1,17 @@
 from unittest import mock
 from unittest import IsolatedAsyncioTestCase
 
-from marshmallow import EXCLUDE, INCLUDE, fields, validates_schema, ValidationError
+from marshmallow import (
+    EXCLUDE,
+    INCLUDE,
+    Schema,
+    fields,
+    validates_schema,
+    ValidationError,
+)
+from marshmallow.validate import OneOf, Range
 
-from ..base import BaseModel, BaseModelError, BaseModelSchema
+from ..base import BaseModel, BaseModelError, BaseModelSchema, trusted_data
 
 
 class ModelImpl(BaseModel):
@@ -69,6 +77,46 @@ class SchemaImplWithoutUnknown(BaseModelSchema):
             raise ValidationError("")
 
 
+class ModelImplNested(BaseModel):
+    class Meta:
+        schema_class = "SchemaImplNested"
+
+    def __init__(self, *, inner=None, kind=None):
+        self.inner = inner
+        self.kind = kind
+
+
+class SchemaImplNested(BaseModelSchema):
+    class Meta:
+        model_class = ModelImplNested
+
+    inner = fields.List(fields.Nested(SchemaImpl))
+    kind = fields.String(validate=OneOf(["known"]))
+
+
+class ModelImplNestedInstance(BaseModel):
+    class Meta:
+        schema_class = "SchemaImplNestedInstance"
+
+    def __init__(self, *, inner=None, counts=None):
+        self.inner = inner
+        self.counts = counts
+
+
+class SchemaImplCount(Schema):
+    count = fields.Integer(validate=Range(min=0))
+
+
+class SchemaImplNestedInstance(BaseModelSchema):
+    class Meta:
+        model_class = ModelImplNestedInstance
+
+    inner = fields.Nested(SchemaImplCount())
+    counts = fields.Dict(
+        keys=fields.Str(), values=fields.List(fields.Nested(SchemaImplCount()))
+    )
+
+
 class TestBase(IsolatedAsyncioTestCase):
     def test_model_validate_fails(self):
         model = ModelImpl(attr="string")
@@ -118,3 +166,43 @@ class TestBase(IsolatedAsyncioTestCase):
         assert ModelImplWithoutUnknown.deserialize(
             {"attr": "succeeds", "another": "value"}
         )
+
+    def test_schema_instance_reused(self):
+        schema = ModelImpl._get_schema(SchemaImpl)
+        assert ModelImpl._get_schema(SchemaImpl) is schema
+        assert ModelImpl._get_schema(SchemaImpl, INCLUDE) is not schema
+        assert ModelImpl._get_schema(SchemaImpl, trusted=True) is not schema
+
+        with mock.patch.object(SchemaImpl, "__init__") as mock_init:
+            ModelImpl.deserialize({"attr": "succeeds"})
+            ModelImpl(attr="succeeds").serialize()
+            mock_init.assert_not_called()
+
+    def test_trusted_data(self):
+        data = {"inner": [{"attr": "unchecked"}], "kind": "unchecked"}
+        with self.assertRaises(BaseModelError):
+            ModelImplNested.deserialize(data)
+
+        with trusted_data():
+            model = ModelImplNested.deserialize(data)
+            with self.assertRaises(BaseModelError):
+                # required fields are still checked
+                ModelImpl.deserialize({})
+        assert model.inner[0].attr == "unchecked"
+        assert model.kind == "unchecked"
+
+        with self.assertRaises(BaseModelError):
+            ModelImplNested.deserialize(data)
+
+    def test_trusted_data_nested_instance(self):
+        for data in (
+            {"inner": {"count": -5}},
+            {"counts": {"key": [{"count": -5}]}},
+        ):
+            with self.assertRaises(BaseModelError):
+                ModelImplNestedInstance.deserialize(data)
+            with trusted_data():
+                ModelImplNestedInstance.deserialize(data)
+            # schema instances shared with untrusted input keep their validators
+            with self.assertRaises(BaseModelError):
+                ModelImplNestedInstance.deserialize(data)
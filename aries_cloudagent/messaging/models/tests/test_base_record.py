@@ -5,6 +5,7 @@ from unittest import IsolatedAsyncioTestCase
 from marshmallow import EXCLUDE, fields
 
 from ....cache.base import BaseCache
+from ....cache.in_memory import InMemoryCache
 from ....core.event_bus import EventBus, MockEventBus, Event
 from ....core.in_memory import InMemoryProfile
 from ....storage.base import (
@@ -12,7 +13,7 @@ from ....storage.base import (
     StorageDuplicateError,
     StorageRecord,
 )
-from ....messaging.models.base import BaseModelError
+from ....messaging.models.base import TRUSTED_DATA, BaseModelError
 
 from ...util import time_now
 
@@ -62,6 +63,10 @@ class ARecordImplSchema(BaseRecordSchema):
     code = fields.Str()
 
 
+class PromotedRecordImpl(ARecordImpl):
+    PROMOTED_TAG_NAMES = {"a"}
+
+
 class UnencTestImpl(BaseRecord):
     TAG_NAMES = {"~a", "~b", "c"}
 
@@ -83,6 +88,16 @@ class TestBaseRecord(IsolatedAsyncioTestCase):
         with self.assertRaises(ValueError):
             BaseRecordImpl.from_storage(record_id, stored)
 
+    def test_from_storage_trusted(self):
+        trusted = []
+        with mock.patch.object(BaseRecordImpl, "__init__") as mock_init:
+            mock_init.side_effect = lambda *args, **kwargs: trusted.append(
+                TRUSTED_DATA.get()
+            )
+            BaseRecordImpl.from_storage("record_id", {})
+        assert trusted == [True]
+        assert not TRUSTED_DATA.get()
+
     async def test_post_save_new(self):
         session = InMemoryProfile.test_session()
         mock_storage = mock.MagicMock()
@@ -254,6 +269,142 @@ class TestBaseRecord(IsolatedAsyncioTestCase):
         )
         assert not result
 
+    async def test_query_paginated(self):
+        session = InMemoryProfile.test_session()
+        for i in range(7):
+            await ARecordImpl(
+                a="even" if i % 2 == 0 else "odd", b=str(i), code="red"
+            ).save(session)
+
+        result = await ARecordImpl.query(session, {"code": "red"}, limit=3, offset=2)
+        assert [rec.b for rec in result] == ["2", "3", "4"]
+
+        result = await ARecordImpl.query(session, offset=5)
+        assert [rec.b for rec in result] == ["5", "6"]
+
+        result = await ARecordImpl.query(
+            session, limit=2, offset=1, post_filter_positive={"a": "even"}
+        )
+        assert [rec.b for rec in result] == ["2", "4"]
+
+        result = await ARecordImpl.query(
+            session, offset=1, post_filter_negative={"a": "even"}
+        )
+        assert [rec.b for rec in result] == ["3", "5"]
+
+    async def test_iter_query_pages(self):
+        session = InMemoryProfile.test_session()
+        for i in range(5):
+            await ARecordImpl(a="one", b=str(i)).save(session)
+        storage = session.inject(BaseStorage)
+
+        with mock.patch.object(
+            storage,
+            "find_paginated_records",
+            wraps=storage.find_paginated_records,
+        ) as mock_find:
+            result = [
+                rec.b
+                async for rec in ARecordImpl.iter_query(
+                    session, post_filter_positive={"a": "one"}, page_size=2
+                )
+            ]
+        assert result == ["0", "1", "2", "3", "4"]
+        assert [c.kwargs["offset"] for c in mock_find.call_args_list] == [0, 2, 4]
+
+    def test_plan_query(self):
+        indexed = {"code", "a"}
+        assert ARecordImpl.plan_query(
+            indexed, {"code": "red"}, {"a": "one", "b": "two"}
+        ) == ({"code": "red", "a": "one"}, {"b": "two"})
+        assert ARecordImpl.plan_query(
+            indexed, None, {"a": ["one", ""], "code": "red"}, alt=True
+        ) == ({"a": {"$in": ["one"]}}, {"code": "red"})
+        assert ARecordImpl.plan_query(
+            indexed, {"a": "one"}, {"a": "two", "code": None}
+        ) == ({"a": "one"}, {"a": "two", "code": None})
+
+    async def test_promoted_tags(self):
+        session = InMemoryProfile.test_session()
+        for a in ("one", "two", "one"):
+            await ARecordImpl(a=a, b="b").save(session)
+        record = PromotedRecordImpl(a="two", b="b", code="red")
+        assert record.tags == {"a": "two", "code": "red"}
+        await record.save(session)
+        assert PromotedRecordImpl(a=None, b="b").tags == {}
+
+        # not pushed down to storage before the back-fill
+        assert await PromotedRecordImpl.get_indexed_fields(session) == {"code"}
+        with mock.patch.object(
+            PromotedRecordImpl, "log_query_stats"
+        ) as mock_stats:
+            result = await PromotedRecordImpl.query(
+                session, post_filter_positive={"a": "two"}
+            )
+            assert len(result) == 2
+            mock_stats.assert_called_once_with(session, 4, 2)
+
+        profile = session.profile
+        assert await PromotedRecordImpl.backfill_promoted_tags(profile) == 3
+        assert await PromotedRecordImpl.backfill_promoted_tags(profile) == 0
+        assert await PromotedRecordImpl.get_indexed_fields(session) == {"code", "a"}
+        with mock.patch.object(
+            PromotedRecordImpl, "log_query_stats"
+        ) as mock_stats:
+            result = await PromotedRecordImpl.query(
+                session, post_filter_positive={"a": "two"}
+            )
+            assert len(result) == 2
+            mock_stats.assert_called_once_with(session, 2, 2)
+
+            mock_stats.reset_mock()
+            result = [
+                rec
+                async for rec in PromotedRecordImpl.iter_query(
+                    session, post_filter_positive={"a": ["one"]}, alt=True
+                )
+            ]
+            assert [rec.a for rec in result] == ["one", "one"]
+            mock_stats.assert_called_once_with(session, 2, 2)
+
+    async def test_promoted_tags_cached(self):
+        profile = InMemoryProfile.test_profile(bind={BaseCache: InMemoryCache()})
+        async with profile.session() as session:
+            assert await PromotedRecordImpl.get_indexed_fields(session) == {"code"}
+        await PromotedRecordImpl.backfill_promoted_tags(profile)
+        async with profile.session() as session:
+            assert await PromotedRecordImpl.get_indexed_fields(session) == {"code", "a"}
+        assert await ARecordImpl.backfill_promoted_tags(profile) == 0
+
+    async def test_promoted_tags_backfilled(self):
+        profile = InMemoryProfile.test_profile()
+        async with profile.session() as session:
+            await ARecordImpl(a="one", b="b").save(session)
+        assert await PromotedRecordImpl.backfill_promoted_tags(profile) == 1
+
+        # not visited again once the promoted tags are recorded
+        async with profile.session() as session:
+            await ARecordImpl(a="two", b="b").save(session)
+        assert await PromotedRecordImpl.backfill_promoted_tags(profile) == 0
+
+    async def test_schedule_backfill_promoted_tags(self):
+        profile = InMemoryProfile.test_profile()
+        async with profile.session() as session:
+            await ARecordImpl(a="one", b="b").save(session)
+
+        task = PromotedRecordImpl.schedule_backfill_promoted_tags(profile)
+        assert PromotedRecordImpl.schedule_backfill_promoted_tags(profile) is task
+        assert await task == 1
+        other = PromotedRecordImpl.schedule_backfill_promoted_tags(profile)
+        assert other is not task
+        assert await other == 0
+
+        sub_wallet = InMemoryProfile.test_profile()
+        sub_wallet.profile_id = "sub"
+        assert PromotedRecordImpl._profile_key(sub_wallet) != (
+            PromotedRecordImpl._profile_key(profile)
+        )
+
     @mock.patch("builtins.print")
     def test_log_state(self, mock_print):
         test_param = "test.log"
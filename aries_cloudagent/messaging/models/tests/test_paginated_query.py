@@ -0,0 +1,71 @@
+import json
+
+from unittest import IsolatedAsyncioTestCase
+
+from aiohttp import web
+from aiohttp.test_utils import make_mocked_request
+from marshmallow import ValidationError
+
+from aries_cloudagent.tests import mock
+
+from .. import paginated_query as test_module
+
+
+class TestPaginatedQuery(IsolatedAsyncioTestCase):
+    def test_schema(self):
+        schema = test_module.PaginatedQuerySchema()
+        assert schema.load({"limit": "10", "offset": "0"}) == {
+            "limit": 10,
+            "offset": 0,
+        }
+        with self.assertRaises(ValidationError):
+            schema.load({"limit": 0})
+        with self.assertRaises(ValidationError):
+            schema.load({"offset": -1})
+
+    def test_get_limit_offset(self):
+        request = mock.MagicMock(query={})
+        assert test_module.get_limit_offset(request) == (None, None)
+
+        request.query = {"limit": "5", "offset": "20"}
+        assert test_module.get_limit_offset(request) == (5, 20)
+
+        for query in (
+            {"limit": "five"},
+            {"limit": "0"},
+            {"limit": str(test_module.MAX_PAGE_LIMIT + 1)},
+            {"offset": "-1"},
+        ):
+            request.query = query
+            with self.assertRaises(web.HTTPBadRequest):
+                test_module.get_limit_offset(request)
+
+    def test_accepts_ndjson(self):
+        request = mock.MagicMock(headers={})
+        assert not test_module.accepts_ndjson(request)
+        request.headers = {"Accept": "application/x-ndjson, application/json"}
+        assert test_module.accepts_ndjson(request)
+
+    async def test_ndjson_response(self):
+        request = make_mocked_request("GET", "/connections")
+        written = []
+
+        async def results():
+            yield {"id": "1"}
+            yield {"id": "2"}
+
+        with mock.patch.object(
+            web.StreamResponse, "prepare", mock.CoroutineMock()
+        ), mock.patch.object(
+            web.StreamResponse,
+            "write",
+            mock.CoroutineMock(side_effect=lambda data: written.append(data)),
+        ), mock.patch.object(
+            web.StreamResponse, "write_eof", mock.CoroutineMock()
+        ) as mock_eof:
+            response = await test_module.ndjson_response(request, results())
+
+        assert response.content_type == test_module.NDJSON_MIME_TYPE
+        assert [json.loads(line) for line in written] == [{"id": "1"}, {"id": "2"}]
+        assert all(line.endswith(b"\n") for line in written)
+        mock_eof.assert_awaited_once()
@@ -4,7 +4,6 @@ The responder is provided to message handlers to enable them to send a new messa
 in response to the message being handled.
 """
 import asyncio
-import json
 from abc import ABC, abstractmethod
 from typing import List, Optional, Sequence, Tuple, Union
 
@@ -15,6 +14,7 @@ from ..core.error import BaseError
 from ..core.profile import Profile
 from ..transport.outbound.message import OutboundMessage
 from ..transport.outbound.status import OutboundSendStatus
+from ..utils import json_codec
 from .base_message import BaseMessage
 
 SKIP_ACTIVE_CONN_CHECK_MSG_TYPES = [
@@ -65,7 +65,7 @@ class BaseResponder(ABC):
             # TODO DIDComm version selection
             serialized = message.serialize()
             # TODO serialized format selection?
-            payload = json.dumps(serialized)
+            payload = json_codec.dumps(serialized)
             enc_payload = None
             if not reply_thread_id:
                 reply_thread_id = message._thread_id
@@ -94,7 +94,7 @@ class BaseResponder(ABC):
             msg_type = message._message_type
             msg_id = message._id
         else:
-            msg_dict = json.loads(message)
+            msg_dict = json_codec.loads(message)
             msg_type = msg_dict.get("@type")
             msg_id = msg_dict.get("@id")
         return await self.send_outbound(
@@ -134,7 +134,7 @@ class BaseResponder(ABC):
             msg_type = message._message_type
             msg_id = message._id
         else:
-            msg_dict = json.loads(message)
+            msg_dict = json_codec.loads(message)
             msg_type = msg_dict.get("@type")
             msg_id = msg_dict.get("@id")
         return await self.send_outbound(
@@ -267,3 +267,24 @@ class TestAgentMessageSchema(IsolatedAsyncioTestCase):
         }
         result = SignedAgentMessage.deserialize(serial)
         result.serialize()
+
+    def test_deserialize_decorators_not_shared(self):
+        serial = {
+            "@type": "signed-agent-message",
+            "value~sig": {
+                "@type": DIDCommPrefix.qualify_current(
+                    "signature/1.0/ed25519Sha512_single"
+                ),
+                "signature": (
+                    "-OKdiRRQu-xbVGICg1J6KV_6nXLLzYRXr8BZSXzoXimytBl"
+                    "O8ULY7Nl1lQPqahc-XQPHiBSVraLM8XN_sCzdCg=="
+                ),
+                "sig_data": "AAAAAF8bIV4iVGVzdCB2YWx1ZSI=",
+                "signer": "7VA3CaF9jaTuRN2SGmekANoja6Js4U51kfRSbpZAfdhy",
+            },
+        }
+        first = SignedAgentMessage.deserialize({**serial, "~thread": {"thid": "1"}})
+        second = SignedAgentMessage.deserialize({**serial, "~thread": {"thid": "2"}})
+        assert first._decorators is not second._decorators
+        assert first._thread_id == "1"
+        assert second._thread_id == "2"
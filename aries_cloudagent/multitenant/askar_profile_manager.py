@@ -1,9 +1,10 @@
 """Manager for askar profile multitenancy mode."""
 
-from typing import Iterable, Optional, cast
+from typing import Iterable, Optional, Set, cast
 from ..core.profile import (
     Profile,
 )
+from ..core.util import PROFILE_OPENED_EVENT_TOPIC
 from ..config.wallet import wallet_config
 from ..config.injection_context import InjectionContext
 from ..wallet.models.wallet_record import WalletRecord
@@ -24,6 +25,7 @@ class AskarProfileMultitenantManager(BaseMultitenantManager):
         """
         super().__init__(profile)
         self._multitenant_profile: Optional[AskarProfile] = multitenant_profile
+        self._opened_wallet_ids: Set[str] = set()
 
     @property
     def open_profiles(self) -> Iterable[Profile]:
@@ -101,11 +103,17 @@ class AskarProfileMultitenantManager(BaseMultitenantManager):
 
         assert self._multitenant_profile.opened
 
-        return AskarProfile(
+        profile = AskarProfile(
             self._multitenant_profile.opened,
             profile_context,
             profile_id=wallet_record.wallet_id,
         )
+        if wallet_record.wallet_id not in self._opened_wallet_ids:
+            self._opened_wallet_ids.add(wallet_record.wallet_id)
+            await profile.notify(
+                PROFILE_OPENED_EVENT_TOPIC, {"wallet_id": wallet_record.wallet_id}
+            )
+        return profile
 
     async def remove_wallet_profile(self, profile: Profile):
         """Remove the wallet profile instance.
@@ -114,4 +122,5 @@ class AskarProfileMultitenantManager(BaseMultitenantManager):
             profile: The wallet profile instance
 
         """
+        self._opened_wallet_ids.discard(getattr(profile, "profile_id", None))
         await profile.remove()
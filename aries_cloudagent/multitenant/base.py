@@ -3,28 +3,37 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
 import logging
-from typing import Iterable, List, Optional, cast, Tuple
+import re
+from typing import Iterable, List, Mapping, Optional, Sequence, cast, Tuple
 
 import jwt
 
 from ..config.injection_context import InjectionContext
 from ..core.error import BaseError
+from ..core.event_bus import Event, EventBus
 from ..core.profile import Profile, ProfileSession
 from ..protocols.coordinate_mediation.v1_0.manager import (
     MediationManager,
     MediationRecord,
 )
 from ..protocols.coordinate_mediation.v1_0.route_manager import RouteManager
-from ..protocols.routing.v1_0.manager import RouteNotFoundError, RoutingManager
+from ..protocols.routing.v1_0.manager import (
+    ROUTE_EVENT_PREFIX,
+    RouteNotFoundError,
+    RoutingManager,
+)
 from ..protocols.routing.v1_0.models.route_record import RouteRecord
 from ..storage.base import BaseStorage
 from ..transport.wire_format import BaseWireFormat
 from ..wallet.base import BaseWallet
 from ..wallet.models.wallet_record import WalletRecord
+from .cache import WalletKeyCache
 from .error import WalletKeyMissingError
 
 LOGGER = logging.getLogger(__name__)
 
+ROUTE_EVENT_PATTERN = re.compile(f"^{ROUTE_EVENT_PREFIX}.*$")
+
 
 class MultitenantManagerError(BaseError):
     """Generic multitenant error."""
@@ -43,6 +52,20 @@ class BaseMultitenantManager(ABC):
         if not profile:
             raise MultitenantManagerError("Missing profile")
 
+        # index of recipient keys to wallet records, kept in sync with routes
+        self._wallet_keys = WalletKeyCache(
+            profile.settings.get_int("multitenant.key_cache_size") or 10000
+        )
+        event_bus = profile.inject_or(EventBus)
+        if event_bus:
+            event_bus.subscribe(ROUTE_EVENT_PATTERN, self._on_route_event)
+
+    async def _on_route_event(self, profile: Profile, event: Event):
+        """Invalidate the cached wallet for a recipient key when its route changes."""
+        recipient_key = event.payload and event.payload.get("recipient_key")
+        if recipient_key:
+            self._wallet_keys.remove_key(recipient_key)
+
     @property
     @abstractmethod
     def open_profiles(self) -> Iterable[Profile]:
@@ -227,6 +250,7 @@ class BaseMultitenantManager(ABC):
             wallet_record = await WalletRecord.retrieve_by_id(session, wallet_id)
             wallet_record.update_settings(new_settings)
             await wallet_record.save(session)
+        self._wallet_keys.remove_wallet(wallet_id)
 
         return wallet_record
 
@@ -269,6 +293,7 @@ class BaseMultitenantManager(ABC):
             )
 
             await wallet.delete_record(session)
+        self._wallet_keys.remove_wallet(wallet.wallet_id)
 
     @abstractmethod
     async def remove_wallet_profile(self, profile: Profile):
@@ -389,6 +414,11 @@ class BaseMultitenantManager(ABC):
         Returns:
             Wallet record associated with the recipient key
         """
+        wallet = self._wallet_keys.get(recipient_key)
+        if wallet:
+            return wallet
+
+        generation = self._wallet_keys.generation
         routing_mgr = RoutingManager(self._profile)
 
         try:
@@ -398,10 +428,56 @@ class BaseMultitenantManager(ABC):
                     session, routing_record.wallet_id
                 )
 
+            self._wallet_keys.put(recipient_key, wallet, generation)
             return wallet
         except RouteNotFoundError:
             pass
 
+    async def _get_wallets_by_keys(
+        self, recipient_keys: Sequence[str]
+    ) -> Mapping[str, WalletRecord]:
+        """Get the wallet records associated with several recipient keys at once.
+
+        Routes for keys which are not cached are fetched in a single query.
+        Keys without a unique route to a wallet are omitted from the result.
+
+        Args:
+            recipient_keys: The recipient keys
+        Returns:
+            A mapping of recipient keys to the associated wallet records
+        """
+        found = {}
+        missing = []
+        for key in recipient_keys:
+            wallet = self._wallet_keys.get(key)
+            if wallet:
+                found[key] = wallet
+            elif key not in missing:
+                missing.append(key)
+        if not missing:
+            return found
+
+        generation = self._wallet_keys.generation
+        async with self._profile.session() as session:
+            routes = await RouteRecord.query(
+                session, {"recipient_key": {"$in": missing}}
+            )
+            key_routes = {}
+            for route in routes:
+                key_routes.setdefault(route.recipient_key, []).append(route)
+            wallets = {}
+            for key, (route, *duplicates) in key_routes.items():
+                if duplicates or not route.wallet_id:
+                    continue
+                if route.wallet_id not in wallets:
+                    wallets[route.wallet_id] = await WalletRecord.retrieve_by_id(
+                        session, route.wallet_id
+                    )
+                found[key] = wallets[route.wallet_id]
+                self._wallet_keys.put(key, found[key], generation)
+
+        return found
+
     async def get_profile_for_key(
         self, context: InjectionContext, recipient_key: str
     ) -> Optional[Profile]:
@@ -431,10 +507,12 @@ class BaseMultitenantManager(ABC):
         wire_format = wire_format or self._profile.inject(BaseWireFormat)
 
         recipient_keys = wire_format.get_recipient_keys(message_body)
+        found = await self._get_wallets_by_keys(recipient_keys)
         wallets = []
 
         for key in recipient_keys:
-            wallet = await self._get_wallet_by_key(key)
+            # keys without a route yet are retried, as the route may be in flight
+            wallet = found.get(key) or await self._get_wallet_by_key(key)
 
             if wallet:
                 wallets.append(wallet)
@@ -1,4 +1,4 @@
-"""Cache for multitenancy profiles."""
+"""Caches for multitenancy profiles and routing."""
 
 import logging
 from collections import OrderedDict
@@ -6,6 +6,7 @@ from typing import Optional
 from weakref import WeakValueDictionary
 
 from ..core.profile import Profile
+from ..wallet.models.wallet_record import WalletRecord
 
 LOGGER = logging.getLogger(__name__)
 
@@ -111,3 +112,88 @@ class ProfileCache:
         """
         del self.profiles[key]
         del self._cache[key]
+
+
+class WalletKeyCache:
+    """Index of recipient keys to wallet records, evicting on LRU strategy.
+
+    Every invalidation increments `generation`. A lookup started before an
+    invalidation passes the generation it observed to `put`, so that it cannot
+    restore an entry which was invalidated while the lookup was in progress.
+    """
+
+    def __init__(self, capacity: int):
+        """Initialize WalletKeyCache.
+
+        Args:
+            capacity: The maximum number of recipient keys to retain
+        """
+
+        self._cache: OrderedDict[str, WalletRecord] = OrderedDict()
+        self.capacity = capacity
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, recipient_key: str) -> Optional[WalletRecord]:
+        """Get the wallet record for a recipient key, if cached.
+
+        Args:
+            recipient_key (str): the recipient key to look up
+
+        Returns:
+            Optional[WalletRecord]: The wallet record if found in cache.
+
+        """
+        wallet = self._cache.get(recipient_key)
+        if wallet:
+            self._cache.move_to_end(recipient_key)
+            self.hits += 1
+        else:
+            self.misses += 1
+        return wallet
+
+    def put(self, recipient_key: str, wallet: WalletRecord, generation: int = None):
+        """Add the wallet record for a recipient key to the cache.
+
+        Args:
+            recipient_key (str): the recipient key
+            wallet (WalletRecord): the wallet record the key routes to
+            generation (int): the generation observed when the lookup started
+        """
+        if generation is not None and generation != self.generation:
+            return
+        self._cache[recipient_key] = wallet
+        self._cache.move_to_end(recipient_key)
+        while len(self._cache) > self.capacity:
+            self._cache.popitem(last=False)
+
+    def remove_key(self, recipient_key: str):
+        """Remove a recipient key from the cache.
+
+        Args:
+            recipient_key (str): the recipient key to remove
+        """
+        self.generation += 1
+        self._cache.pop(recipient_key, None)
+
+    def remove_wallet(self, wallet_id: str):
+        """Remove all recipient keys routed to a wallet from the cache.
+
+        Args:
+            wallet_id (str): the id of the wallet record
+        """
+        self.generation += 1
+        for key in [
+            key for key, wallet in self._cache.items() if wallet.wallet_id == wallet_id
+        ]:
+            del self._cache[key]
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        self.generation += 1
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        """Get the number of cached recipient keys."""
+        return len(self._cache)
@@ -6,6 +6,7 @@ from typing import Iterable
 from ..config.injection_context import InjectionContext
 from ..config.wallet import wallet_config
 from ..core.profile import Profile
+from ..core.util import PROFILE_OPENED_EVENT_TOPIC
 from ..multitenant.base import BaseMultitenantManager
 from ..wallet.models.wallet_record import WalletRecord
 from .cache import ProfileCache
@@ -82,6 +83,7 @@ class MultitenantManager(BaseMultitenantManager):
             # MTODO: add ledger config
             profile, _ = await wallet_config(context, provision=provision)
             self._profiles.put(wallet_id, profile)
+            await profile.notify(PROFILE_OPENED_EVENT_TOPIC, {"wallet_id": wallet_id})
 
         return profile
 
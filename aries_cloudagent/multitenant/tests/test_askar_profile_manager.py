@@ -5,6 +5,7 @@ from aries_cloudagent.tests import mock
 
 from ...config.injection_context import InjectionContext
 from ...core.in_memory import InMemoryProfile
+from ...core.util import PROFILE_OPENED_EVENT_TOPIC
 from ...messaging.responder import BaseResponder
 from ...wallet.models.wallet_record import WalletRecord
 from ..askar_profile_manager import AskarProfileMultitenantManager
@@ -49,6 +50,7 @@ class TestAskarProfileMultitenantManager(IsolatedAsyncioTestCase):
             sub_wallet_profile_context = InjectionContext()
             sub_wallet_profile = AskarProfile(None, None)
             sub_wallet_profile.context.copy.return_value = sub_wallet_profile_context
+            sub_wallet_profile.notify = mock.CoroutineMock()
 
             def side_effect(context, provision):
                 sub_wallet_profile.name = askar_profile_mock_name
@@ -110,6 +112,7 @@ class TestAskarProfileMultitenantManager(IsolatedAsyncioTestCase):
             sub_wallet_profile = AskarProfile(None, None)
             sub_wallet_profile.context.copy.return_value = InjectionContext()
             sub_wallet_profile.store.create_profile.return_value = create_profile_stub
+            sub_wallet_profile.notify = mock.CoroutineMock()
             self.manager._multitenant_profile = sub_wallet_profile
 
             await self.manager.get_wallet_profile(
@@ -120,6 +123,29 @@ class TestAskarProfileMultitenantManager(IsolatedAsyncioTestCase):
                 wallet_record.wallet_id
             )
 
+    async def test_get_wallet_profile_notify_opened(self):
+        wallet_record = WalletRecord(wallet_id="test", settings={})
+
+        with mock.patch(
+            "aries_cloudagent.multitenant.askar_profile_manager.AskarProfile"
+        ) as AskarProfile:
+            sub_wallet_profile = AskarProfile(None, None)
+            sub_wallet_profile.context.copy.return_value = InjectionContext()
+            sub_wallet_profile.notify = mock.CoroutineMock()
+            self.manager._multitenant_profile = sub_wallet_profile
+
+            await self.manager.get_wallet_profile(self.profile.context, wallet_record)
+            await self.manager.get_wallet_profile(self.profile.context, wallet_record)
+            sub_wallet_profile.notify.assert_awaited_once_with(
+                PROFILE_OPENED_EVENT_TOPIC, {"wallet_id": "test"}
+            )
+
+            sub_wallet_profile.profile_id = "test"
+            sub_wallet_profile.remove = mock.CoroutineMock()
+            await self.manager.remove_wallet_profile(sub_wallet_profile)
+            await self.manager.get_wallet_profile(self.profile.context, wallet_record)
+            assert sub_wallet_profile.notify.await_count == 2
+
     async def test_get_wallet_profile_should_use_custom_subwallet_name(self):
         wallet_record = WalletRecord(wallet_id="test", settings={})
         multitenant_sub_wallet_name = "custom_wallet_name"
@@ -135,6 +161,7 @@ class TestAskarProfileMultitenantManager(IsolatedAsyncioTestCase):
             ) as AskarProfile:
                 sub_wallet_profile = AskarProfile(None, None)
                 sub_wallet_profile.context.copy.return_value = InjectionContext()
+                sub_wallet_profile.notify = mock.CoroutineMock()
 
                 def side_effect(context, provision):
                     return sub_wallet_profile, None
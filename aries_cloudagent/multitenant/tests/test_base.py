@@ -6,6 +6,7 @@ import jwt
 
 from .. import base as test_module
 from ...config.base import InjectionError
+from ...core.event_bus import Event
 from ...core.in_memory import InMemoryProfile
 from ...messaging.responder import BaseResponder
 from ...protocols.coordinate_mediation.v1_0.manager import (
@@ -13,6 +14,7 @@ from ...protocols.coordinate_mediation.v1_0.manager import (
     MediationRecord,
 )
 from ...protocols.coordinate_mediation.v1_0.route_manager import RouteManager
+from ...protocols.routing.v1_0.manager import ROUTE_DELETED_EVENT, RoutingManager
 from ...protocols.routing.v1_0.models.route_record import RouteRecord
 from ...storage.error import StorageNotFoundError
 from ...storage.in_memory import InMemoryStorage
@@ -177,6 +179,74 @@ class TestBaseMultitenantManager(IsolatedAsyncioTestCase):
 
         assert isinstance(wallet, WalletRecord)
 
+    async def test_get_wallet_by_key_cached(self):
+        recipient_key = "test-recipient-key"
+
+        wallet_record = WalletRecord(settings={})
+        async with self.profile.session() as session:
+            await wallet_record.save(session)
+            route_record = RouteRecord(
+                wallet_id=wallet_record.wallet_id, recipient_key=recipient_key
+            )
+            await route_record.save(session)
+
+        wallet = await self.manager._get_wallet_by_key(recipient_key)
+        with mock.patch.object(RoutingManager, "get_recipient") as get_recipient:
+            assert await self.manager._get_wallet_by_key(recipient_key) is wallet
+            get_recipient.assert_not_called()
+
+        await self.manager._on_route_event(
+            self.profile,
+            Event(ROUTE_DELETED_EVENT, {"recipient_key": recipient_key}),
+        )
+        assert self.manager._wallet_keys.get(recipient_key) is None
+
+    async def test_get_wallets_by_keys(self):
+        wallets = [WalletRecord(settings={}), WalletRecord(settings={})]
+        async with self.profile.session() as session:
+            for wallet in wallets:
+                await wallet.save(session)
+            for key, wallet in (("k1", wallets[0]), ("k2", wallets[0])):
+                await RouteRecord(wallet_id=wallet.wallet_id, recipient_key=key).save(
+                    session
+                )
+            await RouteRecord(connection_id="conn", recipient_key="k3").save(session)
+            for _ in range(2):
+                await RouteRecord(
+                    wallet_id=wallets[1].wallet_id, recipient_key="dup"
+                ).save(session)
+
+        queries = []
+        query = RouteRecord.query
+
+        async def count_query(session, tag_filter):
+            queries.append(tag_filter)
+            return await query(session, tag_filter)
+
+        with mock.patch.object(RouteRecord, "query", count_query):
+            found = await self.manager._get_wallets_by_keys(
+                ["k1", "k2", "k3", "dup", "unknown", "k1"]
+            )
+            assert queries == [
+                {"recipient_key": {"$in": ["k1", "k2", "k3", "dup", "unknown"]}}
+            ]
+            assert set(found) == {"k1", "k2"}
+            assert found["k1"].wallet_id == wallets[0].wallet_id
+
+            # served from the index without another query
+            assert await self.manager._get_wallets_by_keys(["k1", "k2"]) == found
+            assert len(queries) == 1
+
+        with mock.patch.object(
+            WalletRecord, "delete_record", mock.CoroutineMock()
+        ), mock.patch.object(
+            self.manager, "get_wallet_profile", mock.CoroutineMock()
+        ), mock.patch.object(
+            self.manager, "remove_wallet_profile", mock.CoroutineMock()
+        ):
+            await self.manager.remove_wallet(wallets[0].wallet_id, "key")
+        assert self.manager._wallet_keys.get("k1") is None
+
     async def test_create_wallet_removes_key_only_unmanaged_mode(self):
         with mock.patch.object(
             self.manager, "get_wallet_profile"
@@ -1,6 +1,7 @@
 from ...core.profile import Profile
 
-from ..cache import ProfileCache
+from ...wallet.models.wallet_record import WalletRecord
+from ..cache import ProfileCache, WalletKeyCache
 
 
 class MockProfile(Profile):
@@ -105,3 +106,39 @@ def test_rescue_open_profile():
     assert cache.get("2") is None
     assert cache.get("3")
     assert cache.get("4")
+
+
+def test_wallet_key_cache_lru():
+    cache = WalletKeyCache(2)
+    wallet = WalletRecord(wallet_id="w1", settings={})
+    cache.put("k1", wallet)
+    cache.put("k2", wallet)
+    assert cache.get("k1") is wallet
+    cache.put("k3", wallet)
+
+    assert len(cache) == 2
+    assert cache.get("k2") is None
+    assert cache.get("k1") is wallet
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_wallet_key_cache_invalidate():
+    cache = WalletKeyCache(10)
+    first = WalletRecord(wallet_id="w1", settings={})
+    second = WalletRecord(wallet_id="w2", settings={})
+    cache.put("k1", first)
+    cache.put("k2", first)
+    cache.put("k3", second)
+
+    cache.remove_key("k3")
+    assert cache.get("k3") is None
+    cache.remove_wallet("w1")
+    assert len(cache) == 0
+
+    # a lookup started before an invalidation is not cached
+    generation = cache.generation
+    cache.clear()
+    cache.put("k1", first, generation)
+    assert cache.get("k1") is None
+    cache.put("k1", first, cache.generation)
+    assert cache.get("k1") is first
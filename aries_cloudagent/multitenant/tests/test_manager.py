@@ -2,6 +2,7 @@ from unittest import IsolatedAsyncioTestCase
 from aries_cloudagent.tests import mock
 
 from ...core.in_memory import InMemoryProfile
+from ...core.util import PROFILE_OPENED_EVENT_TOPIC
 from ...messaging.responder import BaseResponder
 from ...wallet.models.wallet_record import WalletRecord
 from ..manager import MultitenantManager
@@ -46,6 +47,24 @@ class TestMultitenantManager(IsolatedAsyncioTestCase):
             assert profile is self.manager._profiles.get("test")
             wallet_config.assert_not_called()
 
+    async def test_get_wallet_profile_notify_opened(self):
+        wallet_record = WalletRecord(wallet_id="test", settings={})
+
+        def side_effect(context, provision):
+            return (InMemoryProfile(context=context), None)
+
+        with mock.patch(
+            "aries_cloudagent.multitenant.manager.wallet_config"
+        ) as wallet_config, mock.patch.object(
+            InMemoryProfile, "notify", mock.CoroutineMock()
+        ) as mock_notify:
+            wallet_config.side_effect = side_effect
+            await self.manager.get_wallet_profile(self.profile.context, wallet_record)
+            await self.manager.get_wallet_profile(self.profile.context, wallet_record)
+            mock_notify.assert_awaited_once_with(
+                PROFILE_OPENED_EVENT_TOPIC, {"wallet_id": "test"}
+            )
+
     async def test_get_wallet_profile_settings(self):
         extra_settings = {"extra_settings": "extra_settings"}
         all_wallet_record_settings = [
@@ -19,6 +19,12 @@ from ....cache.base import BaseCache
 from ....connections.models.conn_record import ConnRecord, StoredConnRecordSchema
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    accepts_ndjson,
+    get_limit_offset,
+    ndjson_response,
+)
 from ....messaging.valid import (
     ENDPOINT_EXAMPLE,
     ENDPOINT_VALIDATE,
@@ -236,7 +242,7 @@ class ConnectionStaticResultSchema(OpenAPISchema):
     record = fields.Nested(StoredConnRecordSchema(), required=True)
 
 
-class ConnectionsListQueryStringSchema(OpenAPISchema):
+class ConnectionsListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for connections list request query string."""
 
     alias = fields.Str(
@@ -469,11 +475,34 @@ async def connections_list(request: web.BaseRequest):
     if request.query.get("connection_protocol"):
         post_filter["connection_protocol"] = request.query["connection_protocol"]
 
+    limit, offset = get_limit_offset(request)
     profile = context.profile
+
+    if accepts_ndjson(request):
+
+        async def stream_results():
+            async with profile.session() as session:
+                async for record in ConnRecord.iter_query(
+                    session,
+                    tag_filter,
+                    limit=limit,
+                    offset=offset,
+                    post_filter_positive=post_filter,
+                    alt=True,
+                ):
+                    yield record.serialize()
+
+        return await ndjson_response(request, stream_results())
+
     try:
         async with profile.session() as session:
             records = await ConnRecord.query(
-                session, tag_filter, post_filter_positive=post_filter, alt=True
+                session,
+                tag_filter,
+                limit=limit,
+                offset=offset,
+                post_filter_positive=post_filter,
+                alt=True,
             )
         results = [record.serialize() for record in records]
         results.sort(key=connection_sort_key)
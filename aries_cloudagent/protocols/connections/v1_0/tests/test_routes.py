@@ -97,6 +97,8 @@ class TestConnectionRoutes(IsolatedAsyncioTestCase):
                         "their_public_did": "a_public_did",
                         "invitation_msg_id": "dummy_msg",
                     },
+                    limit=None,
+                    offset=None,
                     post_filter_positive={
                         "their_role": list(ConnRecord.Role.REQUESTER.value),
                         "connection_protocol": ConnRecord.Protocol.RFC_0160.aries_protocol,
@@ -139,6 +141,54 @@ class TestConnectionRoutes(IsolatedAsyncioTestCase):
             with self.assertRaises(test_module.web.HTTPBadRequest):
                 await test_module.connections_list(self.request)
 
+    async def test_connections_list_paginated(self):
+        self.request.query = {"limit": "2", "offset": "4"}
+        with mock.patch.object(
+            test_module.ConnRecord, "query", mock.CoroutineMock(return_value=[])
+        ) as mock_query, mock.patch.object(
+            test_module.web, "json_response"
+        ) as mock_response:
+            await test_module.connections_list(self.request)
+            mock_query.assert_called_once_with(
+                ANY, {}, limit=2, offset=4, post_filter_positive={}, alt=True
+            )
+            mock_response.assert_called_once_with({"results": []})
+
+    async def test_connections_list_paginated_x(self):
+        self.request.query = {"limit": "0"}
+        with self.assertRaises(test_module.web.HTTPBadRequest):
+            await test_module.connections_list(self.request)
+
+        self.request.query = {"offset": "first"}
+        with self.assertRaises(test_module.web.HTTPBadRequest):
+            await test_module.connections_list(self.request)
+
+    async def test_connections_list_ndjson(self):
+        self.request.query = {"limit": "2"}
+        self.request.headers = {"Accept": "application/x-ndjson"}
+        records = [
+            mock.MagicMock(serialize=mock.MagicMock(return_value={"id": str(i)}))
+            for i in range(2)
+        ]
+
+        async def iter_query(*args, **kwargs):
+            for record in records:
+                yield record
+
+        with mock.patch.object(
+            test_module.ConnRecord, "iter_query", mock.MagicMock(side_effect=iter_query)
+        ) as mock_iter_query, mock.patch.object(
+            test_module, "ndjson_response", mock.CoroutineMock()
+        ) as mock_response:
+            await test_module.connections_list(self.request)
+            assert mock_iter_query.call_count == 0
+            request, results = mock_response.call_args[0]
+            assert request is self.request
+            assert [result async for result in results] == [{"id": "0"}, {"id": "1"}]
+            mock_iter_query.assert_called_once_with(
+                ANY, {}, limit=2, offset=None, post_filter_positive={}, alt=True
+            )
+
     async def test_connections_retrieve(self):
         self.request.match_info = {"conn_id": "dummy"}
         mock_conn_rec = mock.MagicMock()
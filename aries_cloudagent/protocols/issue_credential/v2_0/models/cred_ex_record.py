@@ -33,6 +33,7 @@ class V20CredExRecord(BaseExchangeRecord):
     RECORD_ID_NAME = "cred_ex_id"
     RECORD_TOPIC = "issue_credential_v2_0"
     TAG_NAMES = {"~thread_id"} if UNENCRYPTED_TAGS else {"thread_id"}
+    PROMOTED_TAG_NAMES = {"connection_id", "role", "state"}
 
     INITIATOR_SELF = "self"
     INITIATOR_EXTERNAL = "external"
@@ -18,13 +18,21 @@ from ....admin.request_context import AdminRequestContext
 from ....anoncreds.holder import AnonCredsHolderError
 from ....anoncreds.issuer import AnonCredsIssuerError
 from ....connections.models.conn_record import ConnRecord
+from ....core.event_bus import Event, EventBus
 from ....core.profile import Profile
+from ....core.util import PROFILE_OPENED_EVENT_PATTERN, STARTUP_EVENT_PATTERN
 from ....indy.holder import IndyHolderError
 from ....indy.issuer import IndyIssuerError
 from ....ledger.error import LedgerError
 from ....messaging.decorators.attach_decorator import AttachDecorator
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    accepts_ndjson,
+    get_limit_offset,
+    ndjson_response,
+)
 from ....messaging.valid import (
     INDY_CRED_DEF_ID_EXAMPLE,
     INDY_CRED_DEF_ID_VALIDATE,
@@ -62,7 +70,7 @@ class V20IssueCredentialModuleResponseSchema(OpenAPISchema):
     """Response schema for v2.0 Issue Credential Module."""
 
 
-class V20CredExRecordListQueryStringSchema(OpenAPISchema):
+class V20CredExRecordListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for credential exchange record list query."""
 
     connection_id = fields.Str(
@@ -516,11 +524,31 @@ async def credential_exchange_list(request: web.BaseRequest):
         if request.query.get(k, "") != ""
     }
 
+    limit, offset = get_limit_offset(request)
+
+    if accepts_ndjson(request):
+
+        async def stream_results():
+            async with profile.session() as session:
+                async for cxr in V20CredExRecord.iter_query(
+                    session,
+                    tag_filter,
+                    limit=limit,
+                    offset=offset,
+                    post_filter_positive=post_filter,
+                ):
+                    details = await _get_attached_credentials(profile, cxr)
+                    yield _format_result_with_details(cxr, details)
+
+        return await ndjson_response(request, stream_results())
+
     try:
         async with profile.session() as session:
             cred_ex_records = await V20CredExRecord.query(
                 session=session,
                 tag_filter=tag_filter,
+                limit=limit,
+                offset=offset,
                 post_filter_positive=post_filter,
             )
 
@@ -1657,6 +1685,17 @@ async def credential_exchange_problem_report(request: web.BaseRequest):
     return web.json_response({})
 
 
+def register_events(event_bus: EventBus):
+    """Subscribe to any events we need to support."""
+    event_bus.subscribe(STARTUP_EVENT_PATTERN, on_profile_opened)
+    event_bus.subscribe(PROFILE_OPENED_EVENT_PATTERN, on_profile_opened)
+
+
+async def on_profile_opened(profile: Profile, event: Event):
+    """Tag the credential exchange records of a profile with their promoted fields."""
+    V20CredExRecord.schedule_backfill_promoted_tags(profile)
+
+
 async def register(app: web.Application):
     """Register routes."""
 
@@ -1735,6 +1735,19 @@ class TestV20CredRoutes(IsolatedAsyncioTestCase):
         await test_module.register(mock_app)
         mock_app.add_routes.assert_called_once()
 
+    async def test_register_events(self):
+        mock_event_bus = mock.MagicMock(subscribe=mock.MagicMock())
+        test_module.register_events(mock_event_bus)
+        assert mock_event_bus.subscribe.call_count == 2
+
+    async def test_on_profile_opened(self):
+        with mock.patch.object(
+            test_module.V20CredExRecord, "schedule_backfill_promoted_tags"
+        ) as mock_backfill:
+            profile = self.context.profile
+            await test_module.on_profile_opened(profile, mock.MagicMock())
+            mock_backfill.assert_called_once_with(profile)
+
     async def test_post_process_routes(self):
         mock_app = mock.MagicMock(_state={"swagger_dict": {}})
         test_module.post_process_routes(mock_app)
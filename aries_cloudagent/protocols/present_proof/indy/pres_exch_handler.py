@@ -220,64 +220,66 @@ class IndyPresExchHandler:
         identifiers: list,
     ) -> Tuple[dict, dict, dict, dict]:
         """Return schemas, cred_defs, rev_reg_defs, rev_reg_entries."""
-        schema_ids = []
-        cred_def_ids = []
-
         schemas = {}
         cred_defs = {}
         rev_reg_defs = {}
         rev_reg_entries = {}
 
+        multitenant_mgr = self._profile.inject_or(BaseMultitenantManager)
+        if multitenant_mgr:
+            ledger_exec_inst = IndyLedgerRequestsExecutor(self._profile)
+        else:
+            ledger_exec_inst = self._profile.inject(IndyLedgerRequestsExecutor)
+
+        # group the identifiers by ledger, to fetch each ledger's objects in batches
+        ledgers = {}
+        ledger_idents = {}
         for identifier in identifiers:
-            schema_ids.append(identifier["schema_id"])
-            cred_def_ids.append(identifier["cred_def_id"])
-            multitenant_mgr = self._profile.inject_or(BaseMultitenantManager)
-            if multitenant_mgr:
-                ledger_exec_inst = IndyLedgerRequestsExecutor(self._profile)
-            else:
-                ledger_exec_inst = self._profile.inject(IndyLedgerRequestsExecutor)
-            ledger = (
-                await ledger_exec_inst.get_ledger_for_identifier(
-                    identifier["schema_id"],
-                    txn_record_type=GET_SCHEMA,
-                )
-            )[1]
+            schema_id = identifier["schema_id"]
+            if schema_id not in ledgers:
+                ledgers[schema_id] = (
+                    await ledger_exec_inst.get_ledger_for_identifier(
+                        schema_id,
+                        txn_record_type=GET_SCHEMA,
+                    )
+                )[1]
+            ledger_idents.setdefault(ledgers[schema_id], []).append(identifier)
+
+        for ledger, idents in ledger_idents.items():
             async with ledger:
                 # Build schemas for anoncreds
-                if identifier["schema_id"] not in schemas:
-                    schemas[identifier["schema_id"]] = await ledger.get_schema(
-                        identifier["schema_id"]
+                schemas.update(
+                    await ledger.get_schemas(
+                        ident["schema_id"]
+                        for ident in idents
+                        if ident["schema_id"] not in schemas
                     )
-
-                if identifier["cred_def_id"] not in cred_defs:
-                    cred_defs[
-                        identifier["cred_def_id"]
-                    ] = await ledger.get_credential_definition(
-                        identifier["cred_def_id"]
+                )
+                cred_defs.update(
+                    await ledger.get_credential_definitions(
+                        ident["cred_def_id"]
+                        for ident in idents
+                        if ident["cred_def_id"] not in cred_defs
                     )
-
-                if identifier.get("rev_reg_id"):
-                    if identifier["rev_reg_id"] not in rev_reg_defs:
-                        rev_reg_defs[
-                            identifier["rev_reg_id"]
-                        ] = await ledger.get_revoc_reg_def(identifier["rev_reg_id"])
-
-                    if identifier.get("timestamp"):
-                        rev_reg_entries.setdefault(identifier["rev_reg_id"], {})
-
-                        if (
-                            identifier["timestamp"]
-                            not in rev_reg_entries[identifier["rev_reg_id"]]
-                        ):
-                            (
-                                found_rev_reg_entry,
-                                _found_timestamp,
-                            ) = await ledger.get_revoc_reg_entry(
-                                identifier["rev_reg_id"], identifier["timestamp"]
-                            )
-                            rev_reg_entries[identifier["rev_reg_id"]][
-                                identifier["timestamp"]
-                            ] = found_rev_reg_entry
+                )
+                rev_reg_defs.update(
+                    await ledger.get_revoc_reg_defs(
+                        ident["rev_reg_id"]
+                        for ident in idents
+                        if ident.get("rev_reg_id")
+                        and ident["rev_reg_id"] not in rev_reg_defs
+                    )
+                )
+                entries = await ledger.get_revoc_reg_entries(
+                    (ident["rev_reg_id"], ident["timestamp"])
+                    for ident in idents
+                    if ident.get("rev_reg_id")
+                    and ident.get("timestamp")
+                    and ident["timestamp"]
+                    not in rev_reg_entries.get(ident["rev_reg_id"], {})
+                )
+                for (rev_reg_id, timestamp), (found_entry, _) in entries.items():
+                    rev_reg_entries.setdefault(rev_reg_id, {})[timestamp] = found_entry
         return (
             schemas,
             cred_defs,
@@ -259,6 +259,22 @@ class TestPresentationManager(IsolatedAsyncioTestCase):
                 NOW,
             )
         )
+        # batched reads return the results of the single reads
+        for batch_read, read in (
+            ("get_schemas", self.ledger.get_schema),
+            ("get_credential_definitions", self.ledger.get_credential_definition),
+            ("get_revoc_reg_defs", self.ledger.get_revoc_reg_def),
+            ("get_revoc_reg_entries", self.ledger.get_revoc_reg_entry),
+        ):
+            setattr(
+                self.ledger,
+                batch_read,
+                mock.CoroutineMock(
+                    side_effect=lambda keys, read=read: {
+                        key: read.return_value for key in keys
+                    }
+                ),
+            )
         injector.bind_instance(BaseLedger, self.ledger)
         injector.bind_instance(
             IndyLedgerRequestsExecutor,
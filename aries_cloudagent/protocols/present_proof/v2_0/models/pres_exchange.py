@@ -31,6 +31,7 @@ class V20PresExRecord(BaseExchangeRecord):
     RECORD_ID_NAME = "pres_ex_id"
     RECORD_TOPIC = "present_proof_v2_0"
     TAG_NAMES = {"~thread_id"} if UNENCRYPTED_TAGS else {"thread_id"}
+    PROMOTED_TAG_NAMES = {"connection_id", "role", "state"}
 
     INITIATOR_SELF = "self"
     INITIATOR_EXTERNAL = "external"
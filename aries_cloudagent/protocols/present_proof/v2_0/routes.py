@@ -16,6 +16,9 @@ from marshmallow import ValidationError, fields, validate, validates_schema
 
 from ....admin.request_context import AdminRequestContext
 from ....connections.models.conn_record import ConnRecord
+from ....core.event_bus import Event, EventBus
+from ....core.profile import Profile
+from ....core.util import PROFILE_OPENED_EVENT_PATTERN, STARTUP_EVENT_PATTERN
 from ....anoncreds.holder import AnonCredsHolder, AnonCredsHolderError
 from ....indy.holder import IndyHolder, IndyHolderError
 from ....indy.models.cred_precis import IndyCredPrecisSchema
@@ -26,6 +29,12 @@ from ....ledger.error import LedgerError
 from ....messaging.decorators.attach_decorator import AttachDecorator
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    accepts_ndjson,
+    get_limit_offset,
+    ndjson_response,
+)
 from ....messaging.valid import (
     INDY_EXTRA_WQL_EXAMPLE,
     INDY_EXTRA_WQL_VALIDATE,
@@ -70,7 +79,7 @@ class V20PresentProofModuleResponseSchema(OpenAPISchema):
     """Response schema for Present Proof Module."""
 
 
-class V20PresExRecordListQueryStringSchema(OpenAPISchema):
+class V20PresExRecordListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for presentation exchange list query."""
 
     connection_id = fields.Str(
@@ -447,11 +456,30 @@ async def present_proof_list(request: web.BaseRequest):
         if request.query.get(k, "") != ""
     }
 
+    limit, offset = get_limit_offset(request)
+
+    if accepts_ndjson(request):
+
+        async def stream_results():
+            async with profile.session() as session:
+                async for record in V20PresExRecord.iter_query(
+                    session,
+                    tag_filter,
+                    limit=limit,
+                    offset=offset,
+                    post_filter_positive=post_filter,
+                ):
+                    yield record.serialize()
+
+        return await ndjson_response(request, stream_results())
+
     try:
         async with profile.session() as session:
             records = await V20PresExRecord.query(
                 session=session,
                 tag_filter=tag_filter,
+                limit=limit,
+                offset=offset,
                 post_filter_positive=post_filter,
             )
         results = [record.serialize() for record in records]
@@ -1384,6 +1412,17 @@ async def present_proof_remove(request: web.BaseRequest):
     return web.json_response({})
 
 
+def register_events(event_bus: EventBus):
+    """Subscribe to any events we need to support."""
+    event_bus.subscribe(STARTUP_EVENT_PATTERN, on_profile_opened)
+    event_bus.subscribe(PROFILE_OPENED_EVENT_PATTERN, on_profile_opened)
+
+
+async def on_profile_opened(profile: Profile, event: Event):
+    """Tag the presentation exchange records of a profile with their promoted fields."""
+    V20PresExRecord.schedule_backfill_promoted_tags(profile)
+
+
 async def register(app: web.Application):
     """Register routes."""
 
@@ -19,6 +19,10 @@ LOGGER = logging.getLogger(__name__)
 RECIP_ROUTE_PAUSE = 0.1
 RECIP_ROUTE_RETRY = 10
 
+ROUTE_EVENT_PREFIX = "acapy::routing::route::"
+ROUTE_CREATED_EVENT = ROUTE_EVENT_PREFIX + "created"
+ROUTE_DELETED_EVENT = ROUTE_EVENT_PREFIX + "deleted"
+
 
 class RoutingManagerError(BaseError):
     """Generic routing error."""
@@ -121,6 +125,7 @@ class RoutingManager:
         """Remove an existing route record."""
         async with self._profile.session() as session:
             await route.delete_record(session)
+        await self._profile.notify(ROUTE_DELETED_EVENT, self._route_event(route))
 
     async def create_route_record(
         self,
@@ -154,4 +159,14 @@ class RoutingManager:
         async with self._profile.session() as session:
             await route.save(session, reason="Created new route")
         LOGGER.info(">>> CREATED routing record for verkey: " + recipient_key)
+        await self._profile.notify(ROUTE_CREATED_EVENT, self._route_event(route))
         return route
+
+    @staticmethod
+    def _route_event(route: RouteRecord) -> dict:
+        """Build the payload of a route event."""
+        return {
+            "recipient_key": route.recipient_key,
+            "wallet_id": route.wallet_id,
+            "connection_id": route.connection_id,
+        }
@@ -1,4 +1,5 @@
 from unittest import IsolatedAsyncioTestCase
+from unittest.mock import call
 from aries_cloudagent.tests import mock
 
 from marshmallow import ValidationError
@@ -10,7 +11,13 @@ from .....storage.error import (
 )
 from .....transport.inbound.receipt import MessageReceipt
 
-from ..manager import RoutingManager, RoutingManagerError, RouteNotFoundError
+from ..manager import (
+    ROUTE_CREATED_EVENT,
+    ROUTE_DELETED_EVENT,
+    RoutingManager,
+    RoutingManagerError,
+    RouteNotFoundError,
+)
 from ..models.route_record import RouteRecord, RouteRecordSchema
 
 TEST_CONN_ID = "conn-id"
@@ -59,10 +66,24 @@ class TestRoutingManager(IsolatedAsyncioTestCase):
             await self.manager.create_route_record(TEST_CONN_ID, None)
 
     async def test_create_delete(self):
-        record = await self.manager.create_route_record(TEST_CONN_ID, TEST_ROUTE_VERKEY)
-        await self.manager.delete_route_record(record)
+        with mock.patch.object(
+            self.profile, "notify", mock.CoroutineMock()
+        ) as mock_notify:
+            record = await self.manager.create_route_record(
+                TEST_CONN_ID, TEST_ROUTE_VERKEY
+            )
+            await self.manager.delete_route_record(record)
         results = await self.manager.get_routes()
         assert not results
+        payload = {
+            "recipient_key": TEST_ROUTE_VERKEY,
+            "wallet_id": None,
+            "connection_id": TEST_CONN_ID,
+        }
+        assert mock_notify.await_args_list == [
+            call(ROUTE_CREATED_EVENT, payload),
+            call(ROUTE_DELETED_EVENT, payload),
+        ]
 
     async def test_get_recipient_no_verkey(self):
         with self.assertRaises(RoutingManagerError) as context:
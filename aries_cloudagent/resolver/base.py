@@ -1,9 +1,12 @@
 """Base Class for DID Resolvers."""
 
 from abc import ABC, abstractmethod
+import asyncio
 from enum import Enum
+import logging
 import re
-from typing import NamedTuple, Optional, Pattern, Sequence, Text, Union
+import time
+from typing import Dict, Mapping, NamedTuple, Optional, Pattern, Sequence, Text, Union
 import warnings
 
 from pydid import DID
@@ -12,6 +15,9 @@ from ..cache.base import BaseCache
 from ..config.injection_context import InjectionContext
 from ..core.error import BaseError
 from ..core.profile import Profile
+from ..utils.stats import Collector, Histogram
+
+LOGGER = logging.getLogger(__name__)
 
 
 class ResolverError(BaseError):
@@ -68,9 +74,21 @@ class ResolutionResult:
 
 
 class BaseDIDResolver(ABC):
-    """Base Class for DID Resolvers."""
+    """Base Class for DID Resolvers.
+
+    Resolved documents are cached for `DEFAULT_TTL` seconds, or the TTL given
+    for the DID method in `METHOD_TTL`. Once that has passed, the cached
+    document is still returned for up to `STALE_TTL` seconds while it is
+    refreshed in the background. DIDs which are not found are cached for
+    `NOT_FOUND_TTL` seconds. The time taken by resolutions which are not
+    answered from the cache is recorded in `latency`.
+    """
 
     DEFAULT_TTL = 3600
+    METHOD_TTL: Mapping[str, int] = {}
+    STALE_TTL = 3600
+    NOT_FOUND_TTL = 30
+    LATENCY_BUCKETS = (0.01, 0.05, 0.25, 1.0, 5.0)
 
     def __init__(self, type_: Optional[ResolverType] = None):
         """Initialize BaseDIDResolver.
@@ -79,6 +97,8 @@ class BaseDIDResolver(ABC):
             type_ (Type): Type of resolver, native or non-native
         """
         self.type = type_ or ResolverType.NON_NATIVE
+        self.latency = Histogram(self.LATENCY_BUCKETS)
+        self._refreshing: Dict[str, asyncio.Future] = {}
 
     @abstractmethod
     async def setup(self, context: InjectionContext):
@@ -134,6 +154,17 @@ class BaseDIDResolver(ABC):
 
         return bool(supported_did_regex.match(did))
 
+    def supports_hint(self, did: str) -> Optional[bool]:
+        """Return a cheap hint of whether this resolver supports the given DID.
+
+        Resolvers which override `supports` with a check against storage or
+        another service may override this method to answer without awaiting
+        `supports`, for instance to rule out DIDs of other methods. Return
+        False if the DID is not supported, True if it is, or None if `supports`
+        must be consulted.
+        """
+        return None
+
     async def resolve(
         self,
         profile: Profile,
@@ -155,16 +186,88 @@ class BaseDIDResolver(ABC):
 
         cache_key = f"resolver::{type(self).__name__}::{did}"
         cache = profile.inject_or(BaseCache)
-        if cache:
-            async with cache.acquire(cache_key) as entry:
-                if entry.result:
-                    return entry.result
-                else:
-                    result = await self._resolve(profile, did, service_accept)
-                    await entry.set_result(result, ttl=self.DEFAULT_TTL)
-                    return result
-
-        return await self._resolve(profile, did, service_accept)
+        if not cache:
+            return await self._timed_resolve(profile, did, service_accept)
+
+        async with cache.acquire(cache_key) as entry:
+            if entry.result:
+                cached = entry.result
+            else:
+                cached, ttl = await self._fetch_for_cache(profile, did, service_accept)
+                await entry.set_result(cached, ttl)
+
+        if "fresh_until" not in cached:
+            # cached before documents were stored with their expiry
+            return cached
+        if cached.get("not_found"):
+            raise DIDNotFound(f"DID {did} could not be resolved")
+        if cached["fresh_until"] <= time.time():
+            self._refresh_cached(profile, did, service_accept, cache, cache_key)
+        return cached["did_document"]
+
+    def cache_ttl(self, did: str) -> int:
+        """Return the number of seconds a resolved DID document is fresh."""
+        return self.METHOD_TTL.get(did.split(":", 2)[1], self.DEFAULT_TTL)
+
+    async def _fetch_for_cache(
+        self,
+        profile: Profile,
+        did: str,
+        service_accept: Optional[Sequence[Text]] = None,
+    ):
+        """Resolve a DID, returning the cache entry and its TTL."""
+        try:
+            document = await self._timed_resolve(profile, did, service_accept)
+        except DIDNotFound:
+            return (
+                {"not_found": True, "fresh_until": time.time() + self.NOT_FOUND_TTL},
+                self.NOT_FOUND_TTL,
+            )
+        ttl = self.cache_ttl(did)
+        return (
+            {"did_document": document, "fresh_until": time.time() + ttl},
+            ttl + self.STALE_TTL,
+        )
+
+    async def _timed_resolve(
+        self,
+        profile: Profile,
+        did: str,
+        service_accept: Optional[Sequence[Text]] = None,
+    ) -> dict:
+        """Resolve a DID with `_resolve`, recording the time taken in `latency`."""
+        start = time.perf_counter()
+        try:
+            return await self._resolve(profile, did, service_accept)
+        finally:
+            duration = time.perf_counter() - start
+            self.latency.observe(duration)
+            collector = profile.inject_or(Collector)
+            if collector:
+                collector.log(f"DIDResolver.resolve:{type(self).__qualname__}", duration)
+
+    def _refresh_cached(
+        self,
+        profile: Profile,
+        did: str,
+        service_accept: Optional[Sequence[Text]],
+        cache: BaseCache,
+        cache_key: str,
+    ):
+        """Refresh a stale cache entry in the background."""
+        if cache_key in self._refreshing:
+            return
+
+        async def refresh():
+            try:
+                cached, ttl = await self._fetch_for_cache(profile, did, service_accept)
+                await cache.set(cache_key, cached, ttl)
+            except Exception:
+                LOGGER.warning("Error refreshing resolved DID %s", did, exc_info=True)
+
+        task = asyncio.ensure_future(refresh())
+        self._refreshing[cache_key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(cache_key, None))
 
     @abstractmethod
     async def _resolve(
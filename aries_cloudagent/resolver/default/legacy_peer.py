@@ -310,6 +310,10 @@ class LegacyPeerDIDResolver(BaseDIDResolver):
 
         return result
 
+    def supports_hint(self, did: str) -> Optional[bool]:
+        """Rule out DIDs which cannot be found in the wallet without a lookup."""
+        return None if IndyDID.PATTERN.match(did) else False
+
     async def supports(self, profile: Profile, did: str) -> bool:
         """Return whether this resolver supports the given DID.
 
@@ -66,6 +66,11 @@ class TestLegacyPeerDIDResolver:
         """Test supports returns false for DID not matching legacy."""
         assert not await resolver.supports(profile, TEST_DID1)
 
+    def test_supports_hint(self, resolver: LegacyPeerDIDResolver):
+        """Test supports hint rules out DIDs not matching legacy."""
+        assert resolver.supports_hint(TEST_DID0) is None
+        assert resolver.supports_hint(TEST_DID1) is False
+
     @pytest.mark.asyncio
     async def test_supports_x_unknown_did(
         self, resolver: LegacyPeerDIDResolver, profile: Profile
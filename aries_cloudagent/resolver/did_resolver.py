@@ -8,13 +8,26 @@ import asyncio
 from datetime import datetime
 from itertools import chain
 import logging
-from typing import List, Optional, Sequence, Text, Tuple, Union
+import re
+from typing import (
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Sequence,
+    Text,
+    Tuple,
+    Union,
+)
 
 from pydid import DID, DIDError, DIDUrl, Resource, VerificationMethod
 import pydid
 from pydid.doc.doc import BaseDIDDocument, IDNotFoundError
 
 from ..core.profile import Profile
+from ..utils.stats import Histogram
 from .base import (
     BaseDIDResolver,
     DIDMethodNotSupported,
@@ -26,6 +39,34 @@ from .base import (
 
 LOGGER = logging.getLogger(__name__)
 
+# A supported DID regex starting with literal DID methods, as in "^did:key:"
+# or "^did:(?:sov|indy):"
+METHOD_PREFIX = re.compile(
+    r"^\^did:(?:(?P<method>[a-z0-9]+)|\(\?:(?P<methods>[a-z0-9]+(?:\|[a-z0-9]+)*)\)):"
+)
+
+
+class DispatchEntry(NamedTuple):
+    """A resolver with the regex matching the DIDs it supports.
+
+    The pattern is None for resolvers whose `supports` method must be awaited.
+    """
+
+    resolver: BaseDIDResolver
+    pattern: Optional[Pattern]
+
+
+def _literal_methods(pattern: Pattern) -> Optional[FrozenSet[str]]:
+    """Get the only DID methods a supported DID regex can match, if known."""
+    found = METHOD_PREFIX.match(pattern.pattern)
+    if (
+        not found
+        or pattern.flags & re.IGNORECASE
+        or "|" in pattern.pattern[found.end() :]
+    ):
+        return None
+    return frozenset((found.group("method") or found.group("methods")).split("|"))
+
 
 class DIDResolver:
     """did resolver singleton."""
@@ -35,10 +76,63 @@ class DIDResolver:
     def __init__(self, resolvers: Optional[List[BaseDIDResolver]] = None):
         """Create DID Resolver."""
         self.resolvers = resolvers or []
+        self._indexed: List[BaseDIDResolver] = None
+        self._by_method: Dict[str, Tuple[DispatchEntry, ...]] = {}
+        self._any_method: Tuple[DispatchEntry, ...] = ()
+        self._all: Tuple[DispatchEntry, ...] = ()
 
     def register_resolver(self, resolver: BaseDIDResolver):
         """Register a new resolver."""
         self.resolvers.append(resolver)
+        self._indexed = None
+
+    def _build_index(self):
+        """Build the index of candidate resolvers by DID method.
+
+        Resolvers relying on the default `supports` method are matched against
+        their supported DID regex, and are only listed under the DID methods
+        that regex can match when these are spelled out at its start. Other
+        resolvers are candidates for every DID. Native resolvers are listed
+        first, in registered order followed by non-native resolvers in
+        registered order.
+        """
+        entries = []
+        for resolver in chain(
+            (resolver for resolver in self.resolvers if resolver.native),
+            (resolver for resolver in self.resolvers if not resolver.native),
+        ):
+            pattern = methods = None
+            if getattr(resolver.supports, "__func__", None) is BaseDIDResolver.supports:
+                try:
+                    pattern = resolver.supported_did_regex
+                except (NotImplementedError, ResolverError):
+                    # deprecated supported_methods, or not yet set up
+                    pass
+                else:
+                    methods = _literal_methods(pattern)
+            entries.append((DispatchEntry(resolver, pattern), methods))
+
+        known = set(chain.from_iterable(methods or () for _, methods in entries))
+        self._by_method = {
+            method: tuple(
+                entry
+                for entry, methods in entries
+                if methods is None or method in methods
+            )
+            for method in known
+        }
+        self._any_method = tuple(entry for entry, methods in entries if methods is None)
+        self._all = tuple(entry for entry, _ in entries)
+        self._indexed = list(self.resolvers)
+
+    def _candidates(self, did: str) -> Tuple[DispatchEntry, ...]:
+        """Get the resolvers which may support a DID, in order of preference."""
+        if self._indexed != self.resolvers:
+            self._build_index()
+        parts = did.split(":", 2)
+        if len(parts) == 3 and parts[0] == "did":
+            return self._by_method.get(parts[1], self._any_method)
+        return self._all
 
     async def _resolve(
         self,
@@ -75,6 +169,19 @@ class DIDResolver:
 
         raise DIDNotFound(f"DID {did} could not be resolved")
 
+    def latency_stats(self) -> Dict[str, dict]:
+        """Summarize the resolution latency histograms, by resolver class.
+
+        Only resolutions not answered from the cache are included.
+        """
+        latency: Dict[str, Histogram] = {}
+        for resolver in self.resolvers:
+            name = type(resolver).__qualname__
+            if name not in latency:
+                latency[name] = Histogram(resolver.latency.bounds)
+            latency[name].merge(resolver.latency)
+        return {name: histogram.serialize() for name, histogram in latency.items()}
+
     async def resolve(
         self,
         profile: Profile,
@@ -111,17 +218,17 @@ class DIDResolver:
         Native resolvers are yielded first, in registered order followed by
         non-native resolvers in registered order.
         """
-        valid_resolvers = [
-            resolver
-            for resolver in self.resolvers
-            if await resolver.supports(profile, did)
-        ]
-        LOGGER.debug("Valid resolvers for DID %s: %s", did, valid_resolvers)
-        native_resolvers = filter(lambda resolver: resolver.native, valid_resolvers)
-        non_native_resolvers = filter(
-            lambda resolver: not resolver.native, valid_resolvers
-        )
-        resolvers = list(chain(native_resolvers, non_native_resolvers))
+        resolvers = []
+        for resolver, pattern in self._candidates(did):
+            if pattern is not None:
+                supported = bool(pattern.match(did))
+            else:
+                supported = resolver.supports_hint(did)
+                if supported is None:
+                    supported = await resolver.supports(profile, did)
+            if supported:
+                resolvers.append(resolver)
+        LOGGER.debug("Valid resolvers for DID %s: %s", did, resolvers)
         if not resolvers:
             raise DIDMethodNotSupported(f'No resolver supporting DID "{did}" loaded')
         return resolvers
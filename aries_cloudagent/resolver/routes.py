@@ -21,6 +21,36 @@ class ResolutionResultSchema(OpenAPISchema):
     )
 
 
+class ResolverLatencySchema(OpenAPISchema):
+    """Result schema for the resolution latency query."""
+
+    latency = fields.Dict(
+        required=True,
+        keys=fields.Str(metadata={"description": "Resolver class"}),
+        values=fields.Dict(),
+        metadata={
+            "description": (
+                "Histogram of the times taken by resolutions not answered from "
+                "the cache, in seconds, by resolver class"
+            ),
+            "example": {
+                "IndyDIDResolver": {
+                    "buckets": {
+                        "le_0.01": 0,
+                        "le_0.05": 3,
+                        "le_0.25": 1,
+                        "le_1": 0,
+                        "le_5": 0,
+                        "inf": 0,
+                    },
+                    "count": 4,
+                    "total": 0.31,
+                }
+            },
+        },
+    )
+
+
 class W3cDID(validate.Regexp):
     """Validate value against w3c DID."""
 
@@ -69,6 +99,16 @@ async def resolve_did(request: web.Request):
     return web.json_response(result.serialize())
 
 
+@docs(tags=["resolver"], summary="Fetch the DID resolution latency by resolver")
+@response_schema(ResolverLatencySchema(), 200)
+async def resolver_latency(request: web.Request):
+    """Retrieve the resolution latency histograms."""
+    context: AdminRequestContext = request["context"]
+
+    resolver = context.inject(DIDResolver)
+    return web.json_response({"latency": resolver.latency_stats()})
+
+
 async def register(app: web.Application):
     """Register routes."""
 
@@ -79,6 +119,11 @@ async def register(app: web.Application):
                 resolve_did,
                 allow_head=False,
             ),
+            web.get(
+                "/resolver/latency",
+                resolver_latency,
+                allow_head=False,
+            ),
         ]
     )
 
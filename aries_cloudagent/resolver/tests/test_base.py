@@ -1,12 +1,16 @@
 """Test Base DID Resolver methods."""
 
+import asyncio
 import pytest
 import re
 
 from unittest import mock
 from pydid import DIDDocument
 
-from ..base import BaseDIDResolver, DIDMethodNotSupported, ResolverType
+from ...cache.base import BaseCache
+from ...cache.in_memory import InMemoryCache
+from ...core.in_memory import InMemoryProfile
+from ..base import BaseDIDResolver, DIDMethodNotSupported, DIDNotFound, ResolverType
 
 
 class ExampleDIDResolver(BaseDIDResolver):
@@ -81,3 +85,95 @@ async def test_supported_methods():
         assert await TestDIDResolver().supports(
             profile, "did:example:WgWxqztrNooG92RXvxSTWv"
         )
+
+
+class CountingDIDResolver(ExampleDIDResolver):
+    def __init__(self, results):
+        super().__init__()
+        self.results = list(results)
+        self.calls = 0
+
+    async def _resolve(self, profile, did, accept):
+        self.calls += 1
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.fixture
+def cached_profile():
+    profile = InMemoryProfile.test_profile()
+    profile.context.injector.bind_instance(BaseCache, InMemoryCache())
+    yield profile
+
+
+@pytest.mark.asyncio
+async def test_resolve_latency():
+    profile = InMemoryProfile.test_profile()
+    resolver = CountingDIDResolver([{"id": "did:example:123"}, DIDNotFound()])
+    await resolver.resolve(profile, "did:example:123")
+    with pytest.raises(DIDNotFound):
+        await resolver.resolve(profile, "did:example:123")
+    assert resolver.latency.count == 2
+    assert resolver.latency.serialize()["buckets"]["le_0.01"] == 2
+
+
+@pytest.mark.asyncio
+async def test_resolve_cached(cached_profile):
+    resolver = CountingDIDResolver([{"id": "did:example:123"}])
+    for _ in range(2):
+        assert await resolver.resolve(cached_profile, "did:example:123") == {
+            "id": "did:example:123"
+        }
+    assert resolver.calls == 1
+    # cache hits are not recorded as resolutions
+    assert resolver.latency.count == 1
+
+
+@pytest.mark.asyncio
+async def test_resolve_stale_while_revalidate(cached_profile):
+    resolver = CountingDIDResolver([{"version": 1}, {"version": 2}])
+    resolver.METHOD_TTL = {"example": 0}
+    assert await resolver.resolve(cached_profile, "did:example:123") == {"version": 1}
+    # the stale document is returned while it is refreshed
+    assert await resolver.resolve(cached_profile, "did:example:123") == {"version": 1}
+    assert await resolver.resolve(cached_profile, "did:example:123") == {"version": 1}
+    await asyncio.gather(*resolver._refreshing.values())
+    assert resolver.calls == 2
+
+    resolver.METHOD_TTL = {}
+    assert await resolver.resolve(cached_profile, "did:example:123") == {"version": 2}
+    assert resolver.calls == 2
+    assert resolver.latency.count == 2
+
+
+@pytest.mark.asyncio
+async def test_resolve_refresh_x(cached_profile):
+    resolver = CountingDIDResolver([{"version": 1}, ValueError("unavailable")])
+    resolver.METHOD_TTL = {"example": 0}
+    await resolver.resolve(cached_profile, "did:example:123")
+    assert await resolver.resolve(cached_profile, "did:example:123") == {"version": 1}
+    await asyncio.gather(*resolver._refreshing.values())
+    assert resolver.calls == 2
+    assert not resolver._refreshing
+
+
+@pytest.mark.asyncio
+async def test_resolve_not_found_cached(cached_profile):
+    resolver = CountingDIDResolver([DIDNotFound()])
+    for _ in range(2):
+        with pytest.raises(DIDNotFound):
+            await resolver.resolve(cached_profile, "did:example:123")
+    assert resolver.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_resolve_previous_cache_format(cached_profile):
+    resolver = CountingDIDResolver([])
+    await cached_profile.inject(BaseCache).set(
+        "resolver::CountingDIDResolver::did:example:123", {"id": "did:example:123"}
+    )
+    assert await resolver.resolve(cached_profile, "did:example:123") == {
+        "id": "did:example:123"
+    }
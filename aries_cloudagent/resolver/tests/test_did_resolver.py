@@ -209,3 +209,84 @@ async def test_resolve_did_x_not_found(profile):
     resolver = DIDResolver([cowsay_resolver_not_found])
     with pytest.raises(DIDNotFound):
         await resolver.resolve(profile, py_did)
+
+
+class DynamicResolver(MockResolver):
+    def __init__(self, supported_methods, hint=None):
+        super().__init__(supported_methods, native=True)
+        self.hint = hint
+        self.checked = []
+
+    def supports_hint(self, did):
+        return self.hint
+
+    async def supports(self, profile, did):
+        self.checked.append(did)
+        return await super().supports(profile, did)
+
+
+def test_dispatch_index(resolver):
+    key_resolver = resolver.resolvers[TEST_DID_METHODS.index("key")]
+    candidates = resolver._candidates(TEST_DID_5)
+    assert [entry.resolver for entry in candidates] == [key_resolver]
+    assert resolver._candidates("did:cowsay:123") == ()
+    # an unqualified DID is checked against every resolver
+    assert len(resolver._candidates("Kkyqu7CJFuQSvBp468uaDe")) == len(
+        TEST_DID_METHODS
+    )
+
+
+def test_dispatch_index_any_method():
+    resolver = MockResolver(["sov"])
+    resolver._did_regex = re.compile(r"^did:[a-z]+:.*$")
+    registry = DIDResolver([MockResolver(["key"]), resolver])
+    assert [entry.resolver for entry in registry._candidates(TEST_DID0)] == [resolver]
+    assert [entry.resolver for entry in registry._candidates(TEST_DID_5)] == [
+        registry.resolvers[0],
+        resolver,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_match_did_to_resolver_dynamic(profile):
+    dynamic = DynamicResolver(["sov"])
+    registry = DIDResolver([MockResolver(["sov"]), dynamic])
+    assert await registry._match_did_to_resolver(profile, TEST_DID0) == [
+        dynamic,
+        registry.resolvers[0],
+    ]
+    assert dynamic.checked == [TEST_DID0]
+
+    dynamic.hint = False
+    assert await registry._match_did_to_resolver(profile, TEST_DID0) == [
+        registry.resolvers[0]
+    ]
+    dynamic.hint = True
+    assert await registry._match_did_to_resolver(profile, TEST_DID_5) == [dynamic]
+    assert dynamic.checked == [TEST_DID0]
+
+
+@pytest.mark.asyncio
+async def test_match_did_to_resolver_registered_later(profile, resolver):
+    with pytest.raises(DIDMethodNotSupported):
+        await resolver._match_did_to_resolver(profile, "did:cowsay:123")
+    cowsay = MockResolver(["cowsay"])
+    resolver.register_resolver(cowsay)
+    assert await resolver._match_did_to_resolver(profile, "did:cowsay:123") == [
+        cowsay
+    ]
+    resolver.resolvers.remove(cowsay)
+    with pytest.raises(DIDMethodNotSupported):
+        await resolver._match_did_to_resolver(profile, "did:cowsay:123")
+
+
+@pytest.mark.asyncio
+async def test_resolve_latency(resolver, profile):
+    await resolver.resolve(profile, TEST_DID0)
+    with pytest.raises(DIDNotFound):
+        await DIDResolver([MockResolver(["sov"], DIDNotFound())]).resolve(
+            profile, TEST_DID0
+        )
+    stats = resolver.latency_stats()
+    assert stats["MockResolver"]["count"] == 1
+    assert sum(stats["MockResolver"]["buckets"].values()) == 1
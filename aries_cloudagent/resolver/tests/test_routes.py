@@ -7,6 +7,7 @@ from aries_cloudagent.tests import mock
 from pydid import DIDDocument
 
 from ...core.in_memory import InMemoryProfile
+from ...utils.stats import Histogram
 
 from .. import routes as test_module
 from ..base import (
@@ -128,6 +129,22 @@ async def test_resolver_not_found_error(mock_resolver, side_effect, error):
             await test_module.resolve_did(request)
 
 
+@pytest.mark.asyncio
+async def test_resolver_latency(mock_response: mock.MagicMock):
+    profile = InMemoryProfile.test_profile()
+    resolver = DIDResolver()
+    resolver.register_resolver(mock.MagicMock(latency=Histogram([0.01, 0.05])))
+    resolver.resolvers[0].latency.observe(0.02)
+    profile.context.injector.bind_instance(DIDResolver, resolver)
+
+    request_dict = {"context": profile.context}
+    request = mock.MagicMock(__getitem__=lambda _, k: request_dict[k])
+    await test_module.resolver_latency(request)
+    latency = mock_response.call_args[0][0]["latency"]
+    assert latency["MagicMock"]["count"] == 1
+    assert latency["MagicMock"]["buckets"]["le_0.05"] == 1
+
+
 @pytest.mark.asyncio
 async def test_register():
     mock_app = mock.MagicMock()
@@ -0,0 +1,125 @@
+"""Holder store of credential revocation states."""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, NamedTuple, Optional, Set, Tuple
+
+from ..wallet.crypto_pool import CryptoWorkerPool
+
+
+class RevocationStateEntry(NamedTuple):
+    """A revocation state, and the registry state it was created from."""
+
+    timestamp: int
+    state: str
+    source: Any
+
+
+class RevocationStateCache:
+    """LRU store of revocation states by registry, credential and timestamp.
+
+    Creating a revocation state walks the tails file of the registry. A holder
+    that presents the same credential again can instead update a state it
+    created before, which only reads the tails entries of credentials whose
+    status changed in between. States are created and updated on a dedicated
+    worker pool, so that heavy provers do not hold up other executor work.
+    """
+
+    def __init__(self, capacity: int, workers: int = 2, max_pending: int = 100):
+        """Initialize a `RevocationStateCache` instance.
+
+        Args:
+            capacity: The maximum number of revocation states to retain
+            workers: The number of worker threads creating revocation states
+            max_pending: The maximum number of revocation states queued or
+                being created
+        """
+
+        self._entries: "OrderedDict[Tuple[str, str, int], RevocationStateEntry]" = (
+            OrderedDict()
+        )
+        self._by_credential: Dict[Tuple[str, str], Set[int]] = {}
+        self.capacity = capacity
+        self.pool = CryptoWorkerPool(workers, batch_size=1, max_pending=max_pending)
+
+    def get(
+        self, rev_reg_id: str, cred_rev_id: str, timestamp: int
+    ) -> Optional[RevocationStateEntry]:
+        """Get the revocation state of a credential at a timestamp.
+
+        Args:
+            rev_reg_id: The revocation registry identifier
+            cred_rev_id: The credential revocation identifier in the registry
+            timestamp: The time of the registry state
+        """
+
+        key = (rev_reg_id, str(cred_rev_id), timestamp)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def nearest(
+        self, rev_reg_id: str, cred_rev_id: str, timestamp: int
+    ) -> Optional[RevocationStateEntry]:
+        """Get the revocation state of a credential closest to a timestamp.
+
+        Args:
+            rev_reg_id: The revocation registry identifier
+            cred_rev_id: The credential revocation identifier in the registry
+            timestamp: The time of the registry state
+        """
+
+        timestamps = self._by_credential.get((rev_reg_id, str(cred_rev_id)))
+        if not timestamps:
+            return None
+        nearest = min(timestamps, key=lambda known: abs(known - timestamp))
+        return self.get(rev_reg_id, cred_rev_id, nearest)
+
+    def put(self, rev_reg_id: str, cred_rev_id: str, entry: RevocationStateEntry):
+        """Add a revocation state.
+
+        Args:
+            rev_reg_id: The revocation registry identifier
+            cred_rev_id: The credential revocation identifier in the registry
+            entry: The revocation state at its timestamp
+        """
+
+        cred_key = (rev_reg_id, str(cred_rev_id))
+        key = (*cred_key, entry.timestamp)
+        self._entries.pop(key, None)
+        self._entries[key] = entry
+        self._by_credential.setdefault(cred_key, set()).add(entry.timestamp)
+        while len(self._entries) > self.capacity:
+            self._discard(next(iter(self._entries)))
+
+    def clear(self):
+        """Remove all revocation states."""
+
+        self._entries.clear()
+        self._by_credential.clear()
+
+    async def run(self, fn: Callable, *args) -> Any:
+        """Create or update a revocation state on the worker pool.
+
+        Args:
+            fn: The function to run
+            args: Positional arguments for the function
+        """
+
+        return await self.pool.run(fn, *args)
+
+    def _discard(self, key: Tuple[str, str, int]):
+        """Remove a revocation state, if present."""
+
+        if self._entries.pop(key, None) is not None:
+            cred_key = key[:2]
+            timestamps = self._by_credential.get(cred_key)
+            if timestamps is not None:
+                timestamps.discard(key[2])
+                if not timestamps:
+                    del self._by_credential[cred_key]
+
+    def __len__(self) -> int:
+        """Get the number of revocation states in the store."""
+
+        return len(self._entries)
@@ -0,0 +1,68 @@
+import threading
+
+import pytest
+
+from ..state_cache import RevocationStateCache, RevocationStateEntry
+
+REV_REG_ID = "did:sov:LjgpST2rjsoxYegQDRm7EL:4:3:CL:12:default:CL_ACCUM:0"
+
+
+@pytest.fixture()
+def cache():
+    cache = RevocationStateCache(3, workers=1)
+    yield cache
+    cache.pool.shutdown()
+
+
+class TestRevocationStateCache:
+    def test_get_put(self, cache):
+        assert cache.get(REV_REG_ID, "1", 100) is None
+        entry = RevocationStateEntry(100, "state", {"accum": "1"})
+        cache.put(REV_REG_ID, 1, entry)
+        assert cache.get(REV_REG_ID, "1", 100) == entry
+        assert cache.get(REV_REG_ID, 1, 100) == entry
+        assert cache.get(REV_REG_ID, "1", 101) is None
+        assert cache.get(REV_REG_ID, "2", 100) is None
+        assert len(cache) == 1
+
+        replaced = RevocationStateEntry(100, "other", {"accum": "2"})
+        cache.put(REV_REG_ID, "1", replaced)
+        assert cache.get(REV_REG_ID, "1", 100) == replaced
+        assert len(cache) == 1
+
+    def test_nearest(self, cache):
+        assert cache.nearest(REV_REG_ID, "1", 100) is None
+        for timestamp in (100, 200):
+            cache.put(REV_REG_ID, "1", RevocationStateEntry(timestamp, "state", None))
+        cache.put(REV_REG_ID, "2", RevocationStateEntry(400, "state", None))
+
+        assert cache.nearest(REV_REG_ID, "1", 120).timestamp == 100
+        assert cache.nearest(REV_REG_ID, "1", 180).timestamp == 200
+        assert cache.nearest(REV_REG_ID, "1", 1000).timestamp == 200
+        assert cache.nearest(REV_REG_ID, "2", 100).timestamp == 400
+        assert cache.nearest(REV_REG_ID, "3", 100) is None
+
+    def test_eviction(self, cache):
+        for timestamp in (100, 200, 300):
+            cache.put(REV_REG_ID, "1", RevocationStateEntry(timestamp, "state", None))
+        assert cache.get(REV_REG_ID, "1", 100)
+
+        cache.put(REV_REG_ID, "2", RevocationStateEntry(100, "state", None))
+        assert len(cache) == 3
+        assert cache.get(REV_REG_ID, "1", 200) is None
+        assert cache.nearest(REV_REG_ID, "1", 250).timestamp == 300
+
+        cache.put(REV_REG_ID, "2", RevocationStateEntry(200, "state", None))
+        cache.put(REV_REG_ID, "2", RevocationStateEntry(300, "state", None))
+        cache.put(REV_REG_ID, "2", RevocationStateEntry(400, "state", None))
+        assert cache.nearest(REV_REG_ID, "1", 200) is None
+        assert len(cache) == 3
+
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.nearest(REV_REG_ID, "2", 200) is None
+
+    @pytest.mark.asyncio
+    async def test_run(self, cache):
+        assert await cache.run(sum, [1, 2, 3]) == 6
+        assert await cache.run(threading.get_ident) != threading.get_ident()
@@ -191,6 +191,42 @@ class AskarStorage(BaseStorage):
             )
         return results
 
+    async def find_paginated_records(
+        self,
+        type_filter: str,
+        tag_query: Mapping = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+        options: Mapping = None,
+    ) -> Sequence[StorageRecord]:
+        """Retrieve a page of records matching a type filter and tag query.
+
+        The limit and offset are applied by the store, so that only the
+        requested records are loaded. The scan runs outside of this session,
+        so uncommitted changes made in a transaction are not visible to it.
+        """
+        profile: AskarProfile = self._session.profile
+        results = []
+        try:
+            async for row in profile.store.scan(
+                type_filter,
+                tag_query,
+                offset=offset,
+                limit=limit,
+                profile=profile.profile_id,
+            ):
+                results.append(
+                    StorageRecord(
+                        type=row.category,
+                        id=row.name,
+                        value=None if row.value is None else row.value.decode("utf-8"),
+                        tags=row.tags,
+                    )
+                )
+        except AskarError as err:
+            raise StorageSearchError("Error when fetching search results") from err
+        return results
+
     async def delete_all_records(
         self,
         type_filter: str,
@@ -98,6 +98,33 @@ class BaseStorage(ABC):
     ):
         """Retrieve all records matching a particular type filter and tag query."""
 
+    async def find_paginated_records(
+        self,
+        type_filter: str,
+        tag_query: Mapping = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+        options: Mapping = None,
+    ) -> Sequence[StorageRecord]:
+        """Retrieve a page of records matching a type filter and tag query.
+
+        Backends should override this to apply the limit and offset in the
+        store, rather than loading every matching record.
+
+        Args:
+            type_filter: Filter string
+            tag_query: Tags to query
+            limit: The maximum number of records to return
+            offset: The number of matching records to skip
+            options: Dictionary of backend-specific options
+
+        Returns:
+            A list of `StorageRecord` instances
+
+        """
+        results = await self.find_all_records(type_filter, tag_query, options)
+        return results[offset : offset + limit]
+
     @abstractmethod
     async def delete_all_records(
         self,
@@ -1,5 +1,6 @@
 """Basic in-memory storage implementation (non-wallet)."""
 
+from itertools import islice
 from typing import Mapping, Sequence
 
 from ..core.in_memory import InMemoryProfile
@@ -115,6 +116,22 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
                 results.append(record)
         return results
 
+    async def find_paginated_records(
+        self,
+        type_filter: str,
+        tag_query: Mapping = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+        options: Mapping = None,
+    ) -> Sequence[StorageRecord]:
+        """Retrieve a page of records matching a type filter and tag query."""
+        results = (
+            record
+            for record in self.profile.records.values()
+            if record.type == type_filter and tag_query_match(record.tags, tag_query)
+        )
+        return list(islice(results, offset, offset + limit))
+
     async def delete_all_records(
         self,
         type_filter: str,
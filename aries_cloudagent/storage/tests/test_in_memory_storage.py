@@ -133,6 +133,26 @@ class TestInMemoryStorage:
         assert found.value == record.value
         assert found.tags == record.tags
 
+    @pytest.mark.asyncio
+    async def test_find_paginated(self, store, record_factory):
+        records = [record_factory({"tag": "one"}) for _ in range(5)]
+        for record in records:
+            await store.add_record(record)
+        await store.add_record(record_factory({"tag": "two"}))
+
+        first = await store.find_paginated_records(
+            records[0].type, {"tag": "one"}, limit=3
+        )
+        rest = await store.find_paginated_records(
+            records[0].type, {"tag": "one"}, limit=3, offset=3
+        )
+        assert len(first) == 3
+        assert len(rest) == 2
+        assert {row.id for row in first + rest} == {record.id for record in records}
+        assert not await store.find_paginated_records(
+            records[0].type, {"tag": "one"}, offset=5
+        )
+
     @pytest.mark.asyncio
     async def test_delete_all(self, store, record_factory):
         record = record_factory({"tag": "one"})
@@ -36,6 +36,7 @@ class QueuedOutboundMessage:
         self.message = message
         self.payload: Union[str, bytes] = None
         self.retries = None
+        self.failures = 0
         self.retry_at: float = None
         self.state = self.STATE_NEW
         self.target = target
@@ -43,6 +44,8 @@ class QueuedOutboundMessage:
         self.transport_id: str = transport_id
         self.metadata: dict = None
         self.api_key: str = None
+        self.queue_id: str = None
+        self.persisted = False
 
 
 class BaseOutboundTransport(ABC):
@@ -14,11 +14,22 @@ from .base import BaseOutboundTransport, OutboundTransportError
 
 
 class HttpTransport(BaseOutboundTransport):
-    """Http outbound transport class."""
+    """Http outbound transport class.
+
+    Connections are pooled and kept alive between requests. The pool size,
+    the number of connections per host, the DNS cache TTL and the keepalive
+    timeout may be tuned through the `transport.http` settings of the root
+    profile. Requests beyond the per-host limit wait for a free connection.
+    """
 
     schemes = ("http", "https")
     is_external = False
 
+    POOL_LIMIT = 200
+    POOL_LIMIT_PER_HOST = 50
+    DNS_CACHE_TTL = 10
+    KEEPALIVE_TIMEOUT = 15.0
+
     def __init__(self, **kwargs) -> None:
         """Initialize an `HttpTransport` instance."""
         super().__init__(**kwargs)
@@ -26,9 +37,25 @@ class HttpTransport(BaseOutboundTransport):
         self.connector: TCPConnector = None
         self.logger = logging.getLogger(__name__)
 
+    def _connector_args(self) -> dict:
+        """Get the connection pool settings."""
+        settings = self.root_profile.settings if self.root_profile else {}
+        dns_cache_ttl = settings.get("transport.http.dns_cache_ttl", self.DNS_CACHE_TTL)
+        return {
+            "limit": settings.get("transport.http.pool_limit", self.POOL_LIMIT),
+            "limit_per_host": settings.get(
+                "transport.http.pool_limit_per_host", self.POOL_LIMIT_PER_HOST
+            ),
+            "use_dns_cache": dns_cache_ttl != 0,
+            "ttl_dns_cache": dns_cache_ttl or None,
+            "keepalive_timeout": settings.get(
+                "transport.http.keepalive_timeout", self.KEEPALIVE_TIMEOUT
+            ),
+        }
+
     async def start(self):
         """Start the transport."""
-        self.connector = TCPConnector(limit=200, limit_per_host=50)
+        self.connector = TCPConnector(**self._connector_args())
         session_args = {
             "cookie_jar": DummyCookieJar(),
             "connector": self.connector,
@@ -36,7 +63,7 @@ class HttpTransport(BaseOutboundTransport):
         }
         if self.collector:
             session_args["trace_configs"] = [
-                StatsTracer(self.collector, "outbound-http:")
+                StatsTracer(self.collector, "outbound-http:", self.connector)
             ]
         self.client_session = ClientSession(**session_args)
         return self
@@ -1,16 +1,21 @@
 """Outbound transport manager."""
 
 import asyncio
-import json
+import base64
+import heapq
+import itertools
 import logging
-import time
 
-from typing import Callable, Type
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Type
 from urllib.parse import urlparse
+from uuid import uuid4
 
 from ...connections.models.connection_target import ConnectionTarget
 from ...core.profile import Profile
 from ...utils.classloader import ClassLoader, ModuleLoadError, ClassNotFoundError
+from ...utils import json_codec
+from ...utils.env import storage_path
 from ...utils.stats import Collector
 from ...utils.task_queue import CompletedTask, TaskQueue, task_exc_info
 
@@ -25,15 +30,33 @@ from .base import (
     QueuedOutboundMessage,
 )
 from .message import OutboundMessage
+from .retry import CircuitBreaker, RetryBackoff
+from .store.base import BaseOutboundStore
+from .store.log import LogOutboundStore
 
 LOGGER = logging.getLogger(__name__)
 MODULE_BASE_PATH = "aries_cloudagent.transport.outbound"
 
 
 class OutboundTransportManager:
-    """Outbound transport manager class."""
+    """Outbound transport manager class.
+
+    When an outbound store is available, each encoded message is written to
+    the store before delivery starts and removed once it is done, so that
+    undelivered messages are replayed after a restart. With a store, the
+    number of messages held in memory may also be bounded: messages beyond
+    the bound are kept only in the store until there is room to deliver them.
+
+    Failed deliveries are retried with exponential backoff. Messages awaiting
+    a retry are kept in a heap ordered by retry time and released by a single
+    timer, and consecutive failures for an endpoint open a circuit breaker
+    which holds further deliveries to that endpoint for a time.
+    """
 
     MAX_RETRY_COUNT = 4
+    LOAD_BATCH_SIZE = 500
+    STORE_RETRY_DELAY = 5.0
+    MAX_BREAKERS = 10000
 
     def __init__(self, profile: Profile, handle_not_delivered: Callable = None):
         """Initialize a `OutboundTransportManager` instance.
@@ -53,11 +76,32 @@ class OutboundTransportManager:
         self.registered_transports = {}
         self.running_transports = {}
         self.task_queue = TaskQueue(max_active=200)
+        self.outbound_store: BaseOutboundStore = None
+        self.max_buffered = self.root_profile.settings.get(
+            "transport.outbound_queue.max_buffered"
+        )
         self._process_task: asyncio.Task = None
-        if self.root_profile.settings.get("transport.max_outbound_retry"):
-            self.MAX_RETRY_COUNT = self.root_profile.settings[
-                "transport.max_outbound_retry"
-            ]
+        self._store_adds: Dict[str, QueuedOutboundMessage] = {}
+        self._store_removes: List[str] = []
+        self._store_task: asyncio.Task = None
+        self._store_retry: asyncio.TimerHandle = None
+        self._spilled: Deque[str] = deque()
+        self._load_task: asyncio.Task = None
+        self._retry_heap = []
+        self._retry_seq = itertools.count()
+        self._retry_timer: asyncio.TimerHandle = None
+        self._retry_timer_at: float = None
+        self.breakers: "OrderedDict[str, CircuitBreaker]" = OrderedDict()
+        settings = self.root_profile.settings
+        if settings.get("transport.max_outbound_retry"):
+            self.MAX_RETRY_COUNT = settings["transport.max_outbound_retry"]
+        self.retry_backoff = RetryBackoff(
+            base=settings.get("transport.outbound_retry.base", 10.0),
+            max_delay=settings.get("transport.outbound_retry.max_delay", 600.0),
+            jitter=settings.get("transport.outbound_retry.jitter", 0.5),
+        )
+        self.breaker_threshold = settings.get("transport.outbound_breaker.threshold", 5)
+        self.breaker_reset = settings.get("transport.outbound_breaker.reset", 30.0)
 
     async def setup(self):
         """Perform setup operations."""
@@ -67,6 +111,16 @@ class OutboundTransportManager:
         for outbound_transport in outbound_transports:
             self.register(outbound_transport)
 
+        # a store may be provided by a plugin, otherwise use the local log
+        self.outbound_store = self.root_profile.inject_or(BaseOutboundStore)
+        store_path = self.root_profile.settings.get("transport.outbound_queue.path")
+        if not self.outbound_store and store_path:
+            if store_path == "DEFAULT":
+                store_path = storage_path("outbound", self.root_profile.name)
+            self.outbound_store = LogOutboundStore(store_path)
+        if self.outbound_store:
+            await self.outbound_store.open()
+
     def register(self, module_name: str) -> str:
         """Register a new outbound transport by module path.
 
@@ -151,18 +205,50 @@ class OutboundTransportManager:
 
     async def start(self):
         """Start all transports and feed messages from the queue."""
-        for transport_id in self.registered_transports:
+        starting = [
             self.task_queue.run(self.start_transport(transport_id))
+            for transport_id in self.registered_transports
+        ]
+        if self.outbound_store:
+            self.task_queue.run(self.restore_queued(starting))
 
     async def stop(self, wait: bool = True):
         """Stop all running transports."""
         if self._process_task and not self._process_task.done():
             self._process_task.cancel()
+        if self._retry_timer:
+            self._retry_timer.cancel()
+            self._retry_timer = None
+        if self._store_retry:
+            self._store_retry.cancel()
+            self._store_retry = None
+        self._retry_heap = []
         await self.task_queue.complete(None if wait else 0)
+        if self.outbound_store:
+            await self.flush_store()
+            if self._store_retry:
+                self._store_retry.cancel()
+                self._store_retry = None
+            await self.outbound_store.close()
         for transport in self.running_transports.values():
             await transport.stop()
         self.running_transports = {}
 
+    async def restore_queued(self, starting: Sequence[asyncio.Task] = None):
+        """Replay undelivered messages from the outbound store.
+
+        Args:
+            starting: transport start tasks to wait for before delivery
+
+        """
+        if starting:
+            await asyncio.wait(starting)
+        record_ids = await self.outbound_store.list_ids()
+        if record_ids:
+            LOGGER.info("Restoring %d undelivered outbound messages", len(record_ids))
+            self._spilled.extend(record_ids)
+            self.load_spilled()
+
     def get_registered_transport_for_scheme(self, scheme: str) -> str:
         """Find the registered transport ID for a given scheme."""
         try:
@@ -302,7 +388,7 @@ class OutboundTransportManager:
             queued.api_key = api_key
         queued.endpoint = f"{endpoint}/topic/{topic}/"
         queued.metadata = metadata
-        queued.payload = json.dumps(payload)
+        queued.payload = json_codec.dumps(payload)
         queued.state = QueuedOutboundMessage.STATE_PENDING
         queued.retries = 4 if max_attempts is None else max_attempts - 1
         self.outbound_new.append(queued)
@@ -340,7 +426,6 @@ class OutboundTransportManager:
             self.outbound_event.clear()
             loop_time = get_timer()
             upd_buffer = []
-            retry_count = 0
 
             for queued in self.outbound_buffer:
                 if queued.state == QueuedOutboundMessage.STATE_DONE:
@@ -352,20 +437,39 @@ class OutboundTransportManager:
                         )
                         if self.handle_not_delivered and queued.message:
                             self.handle_not_delivered(queued.profile, queued.message)
+                    if self.outbound_store and queued.queue_id:
+                        self.unpersist_queued(queued)
                     continue  # remove from buffer
 
                 deliver = False
 
                 if queued.state == QueuedOutboundMessage.STATE_PENDING:
+                    if self.outbound_store:
+                        if not queued.persisted:
+                            # delivery starts once the message is durable
+                            self.persist_queued(queued)
+                            upd_buffer.append(queued)
+                            continue
+                        if self.max_buffered and len(upd_buffer) >= self.max_buffered:
+                            self._spilled.append(queued.queue_id)
+                            continue  # held in the store until there is room
                     deliver = True
                 elif queued.state == QueuedOutboundMessage.STATE_RETRY:
-                    if queued.retry_at < loop_time:
+                    if queued.retry_at <= loop_time:
                         queued.retry_at = None
                         deliver = True
                     else:
-                        retry_count += 1
+                        self.schedule_retry(queued)
+                        continue  # held in the retry heap
 
                 if deliver:
+                    breaker = self.breakers.get(queued.endpoint)
+                    if breaker and not breaker.allow(loop_time):
+                        queued.state = QueuedOutboundMessage.STATE_RETRY
+                        queued.retry_at = breaker.retry_at(loop_time)
+                        self.schedule_retry(queued)
+                        continue  # held until the endpoint may be retried
+
                     queued.state = QueuedOutboundMessage.STATE_DELIVER
                     p_time = trace_event(
                         self.root_profile.settings,
@@ -414,15 +518,235 @@ class OutboundTransportManager:
                 upd_buffer.append(queued)
 
             self.outbound_buffer = upd_buffer
-            if self.outbound_buffer:
-                if (not new_pending) and (not retry_count):
+            if self._spilled:
+                self.load_spilled()
+            if self.outbound_buffer or self._retry_heap:
+                if not new_pending:
+                    # the retry timer sets the event when retries are due
                     await self.outbound_event.wait()
-                elif retry_count:
-                    # only retries - yield here so we don't hog resources
-                    await asyncio.sleep(0.05)
             else:
                 break
 
+    def schedule_retry(self, queued: QueuedOutboundMessage):
+        """Hold a message in the retry heap until its retry time."""
+        heapq.heappush(
+            self._retry_heap, (queued.retry_at, next(self._retry_seq), queued)
+        )
+        self._schedule_retry_timer()
+
+    def _schedule_retry_timer(self):
+        """Set the retry timer to fire at the earliest retry time, if any."""
+        next_at = self._retry_heap[0][0] if self._retry_heap else None
+        if self._retry_timer:
+            if next_at is not None and self._retry_timer_at <= next_at:
+                return
+            self._retry_timer.cancel()
+            self._retry_timer = None
+        if next_at is not None:
+            self._retry_timer_at = next_at
+            self._retry_timer = self.loop.call_later(
+                max(next_at - get_timer(), 0), self._release_retries
+            )
+
+    def _release_retries(self):
+        """Move messages due for a retry back to the delivery queue."""
+        self._retry_timer = None
+        now = get_timer()
+        while self._retry_heap and self._retry_heap[0][0] <= now:
+            _, _, queued = heapq.heappop(self._retry_heap)
+            self.outbound_new.append(queued)
+        self._schedule_retry_timer()
+        self.process_queued()
+
+    def _breaker_for(self, endpoint: str) -> CircuitBreaker:
+        """Get or create the circuit breaker for an endpoint."""
+        breaker = self.breakers.get(endpoint)
+        if breaker:
+            self.breakers.move_to_end(endpoint)
+        else:
+            breaker = CircuitBreaker(self.breaker_threshold, self.breaker_reset)
+            self.breakers[endpoint] = breaker
+            while len(self.breakers) > self.MAX_BREAKERS:
+                self.breakers.popitem(last=False)
+        return breaker
+
+    def persist_queued(self, queued: QueuedOutboundMessage):
+        """Schedule an encoded message to be written to the outbound store."""
+        if not queued.queue_id:
+            queued.queue_id = str(uuid4())
+            self._store_adds[queued.queue_id] = queued
+            self._schedule_store_flush()
+
+    def unpersist_queued(self, queued: QueuedOutboundMessage):
+        """Schedule a completed message to be removed from the outbound store."""
+        if self._store_adds.pop(queued.queue_id, None) is None:
+            self._store_removes.append(queued.queue_id)
+            self._schedule_store_flush()
+
+    def _schedule_store_flush(self):
+        """Start the process to write pending updates to the store if necessary."""
+        if not self._store_task or self._store_task.done():
+            self._store_task = self.task_queue.run(self.flush_store())
+
+    def _retry_store_flush(self):
+        """Schedule another attempt to write pending updates to the store."""
+        if not self._store_retry:
+            self._store_retry = self.loop.call_later(
+                self.STORE_RETRY_DELAY, self._release_store_retry
+            )
+
+    def _release_store_retry(self):
+        """Retry writing pending updates to the store."""
+        self._store_retry = None
+        self._schedule_store_flush()
+
+    async def flush_store(self):
+        """Write pending additions and removals to the outbound store in batches.
+
+        Updates which fail are kept and retried after a delay. Messages are only
+        marked as persisted, and delivered, once they have been added.
+        """
+        while self._store_adds or self._store_removes:
+            adds, self._store_adds = self._store_adds, {}
+            removes, self._store_removes = self._store_removes, []
+            try:
+                if adds:
+                    await self.outbound_store.add(
+                        {
+                            queue_id: self.queued_to_record(queued)
+                            for queue_id, queued in adds.items()
+                        }
+                    )
+            except Exception:
+                LOGGER.exception("Error adding messages to outbound message store")
+                self._store_adds = {**adds, **self._store_adds}
+                self._store_removes = removes + self._store_removes
+                self._retry_store_flush()
+                return
+            for queued in adds.values():
+                queued.persisted = True
+            try:
+                if removes:
+                    await self.outbound_store.remove(removes)
+            except Exception:
+                LOGGER.exception("Error removing messages from outbound message store")
+                self._store_removes = removes + self._store_removes
+                self._retry_store_flush()
+                self.process_queued()
+                return
+            self.process_queued()
+
+    def _buffer_room(self) -> int:
+        """Determine how many stored messages may be loaded into memory."""
+        if not self.max_buffered:
+            return self.LOAD_BATCH_SIZE
+        return (
+            self.max_buffered
+            - len(self.outbound_buffer)
+            - len(self.outbound_new)
+            - len(self._retry_heap)
+        )
+
+    def load_spilled(self):
+        """Start the process to load stored messages if there is room."""
+        if self._buffer_room() > 0 and (
+            not self._load_task or self._load_task.done()
+        ):
+            self._load_task = self.task_queue.run(self._perform_load())
+
+    async def _perform_load(self):
+        """Load messages held in the outbound store into the delivery queue."""
+        while self._spilled:
+            count = min(self._buffer_room(), self.LOAD_BATCH_SIZE, len(self._spilled))
+            if count <= 0:
+                break
+            batch = [self._spilled.popleft() for _ in range(count)]
+            records = await self.outbound_store.get(batch)
+            for queue_id in batch:
+                record = records.get(queue_id)
+                queued = record and self.record_to_queued(queue_id, record)
+                if queued:
+                    self.outbound_new.append(queued)
+            self.process_queued()
+
+    @staticmethod
+    def queued_to_record(queued: QueuedOutboundMessage) -> dict:
+        """Convert an encoded message into a record for the outbound store.
+
+        Webhook API keys are not stored, only whether the webhook has one.
+        """
+        binary = isinstance(queued.payload, bytes)
+        return {
+            "endpoint": queued.endpoint,
+            "payload": (
+                base64.b64encode(queued.payload).decode("ascii")
+                if binary
+                else queued.payload
+            ),
+            "binary": binary,
+            "transport_id": queued.transport_id,
+            "metadata": queued.metadata,
+            "webhook_auth": bool(queued.api_key),
+            "retries": queued.retries,
+        }
+
+    def _webhook_api_key(self, endpoint: str) -> Optional[str]:
+        """Find the API key of a configured webhook URL for a webhook endpoint."""
+        for webhook_url in self.root_profile.settings.get("admin.webhook_urls") or ():
+            url, _, api_key = webhook_url.partition("#")
+            if api_key and endpoint.startswith(f"{url}/topic/"):
+                return api_key
+        return None
+
+    def _discard_record(self, queue_id: str):
+        """Schedule a stored message which cannot be restored to be removed."""
+        self._store_removes.append(queue_id)
+        self._schedule_store_flush()
+
+    def record_to_queued(self, queue_id: str, record: dict) -> QueuedOutboundMessage:
+        """Restore an encoded message from an outbound store record.
+
+        Restored messages are delivered in the context of the root profile. The
+        API key of a webhook is taken from the webhook URLs of the root profile.
+        """
+        transport_id = record.get("transport_id")
+        if transport_id not in self.running_transports:
+            try:
+                transport_id = self.get_running_transport_for_endpoint(
+                    record["endpoint"]
+                )
+            except OutboundDeliveryError:
+                LOGGER.warning(
+                    "Discarding stored outbound message, no transport for %s",
+                    record["endpoint"],
+                )
+                self._discard_record(queue_id)
+                return None
+        api_key = None
+        if record.get("webhook_auth"):
+            api_key = self._webhook_api_key(record["endpoint"])
+            if not api_key:
+                LOGGER.warning(
+                    "Discarding stored webhook, no API key configured for %s",
+                    record["endpoint"],
+                )
+                self._discard_record(queue_id)
+                return None
+        queued = QueuedOutboundMessage(self.root_profile, None, None, transport_id)
+        queued.endpoint = record["endpoint"]
+        queued.payload = (
+            base64.b64decode(record["payload"])
+            if record.get("binary")
+            else record["payload"]
+        )
+        queued.metadata = record.get("metadata")
+        queued.api_key = api_key
+        queued.retries = record.get("retries")
+        queued.queue_id = queue_id
+        queued.persisted = True
+        queued.state = QueuedOutboundMessage.STATE_PENDING
+        return queued
+
     def encode_queued_message(self, queued: QueuedOutboundMessage) -> asyncio.Task:
         """Kick off encoding of a queued message."""
 
@@ -476,8 +800,10 @@ class OutboundTransportManager:
 
     def finished_deliver(self, queued: QueuedOutboundMessage, completed: CompletedTask):
         """Handle completion of queued message delivery."""
+        now = get_timer()
         if completed.exc_info:
             queued.error = completed.exc_info
+            self._breaker_for(queued.endpoint).record_failure(now)
 
             if queued.retries:
                 if LOGGER.isEnabledFor(logging.DEBUG):
@@ -502,7 +828,8 @@ class OutboundTransportManager:
                     )
                 queued.retries -= 1
                 queued.state = QueuedOutboundMessage.STATE_RETRY
-                queued.retry_at = time.perf_counter() + 10
+                queued.retry_at = now + self.retry_backoff.delay(queued.failures)
+                queued.failures += 1
             else:
                 LOGGER.exception(
                     ">>> Outbound message failed to deliver, NOT Re-queued.",
@@ -512,11 +839,19 @@ class OutboundTransportManager:
         else:
             queued.error = None
             queued.state = QueuedOutboundMessage.STATE_DONE
+            self.breakers.pop(queued.endpoint, None)
         queued.task = None
         self.process_queued()
 
     async def flush(self):
         """Wait for any queued messages to be delivered."""
-        proc_task = self.process_queued()
-        if proc_task:
-            await proc_task
+        while True:
+            proc_task = self.process_queued()
+            pending = [
+                task
+                for task in (proc_task, self._store_task, self._load_task)
+                if task and not task.done()
+            ]
+            if not pending:
+                break
+            await asyncio.wait(pending)
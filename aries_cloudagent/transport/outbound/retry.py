@@ -0,0 +1,134 @@
+"""Retry backoff and circuit breaker helpers for outbound delivery."""
+
+import random
+
+
+class RetryBackoff:
+    """Exponential backoff with jitter for failed deliveries.
+
+    The delay before retry number `attempt` (starting at zero) is
+    `base * factor ** attempt`, capped at `max_delay`. With a `jitter` above
+    zero, the delay is reduced by a random fraction of up to `jitter`, so that
+    messages which failed together are not all retried at the same time.
+    """
+
+    def __init__(
+        self,
+        base: float = 10.0,
+        factor: float = 2.0,
+        max_delay: float = 600.0,
+        jitter: float = 0.5,
+    ):
+        """Initialize a `RetryBackoff` instance.
+
+        Args:
+            base: the delay in seconds before the first retry
+            factor: the multiplier applied to the delay for each further retry
+            max_delay: the maximum delay in seconds
+            jitter: the maximum fraction of the delay removed at random
+
+        """
+        self.base = base
+        self.factor = factor
+        self.max_delay = max_delay
+        self.jitter = min(max(jitter, 0.0), 1.0)
+
+    def delay(self, attempt: int) -> float:
+        """Get the delay in seconds before a retry.
+
+        Args:
+            attempt: the number of retries already made
+
+        """
+        try:
+            delay = min(self.base * self.factor ** max(attempt, 0), self.max_delay)
+        except OverflowError:
+            delay = self.max_delay
+        if self.jitter:
+            delay *= 1.0 - self.jitter * random.random()
+        return delay
+
+
+class CircuitBreaker:
+    """Track delivery failures for a single endpoint.
+
+    After `threshold` consecutive failures the breaker opens, and deliveries
+    to the endpoint are held until `reset_timeout` seconds have passed. A
+    single trial delivery is then allowed, and the breaker opens again for
+    twice as long (up to `max_reset_timeout`) if it fails. The owner discards
+    the breaker once a delivery succeeds.
+    """
+
+    STATE_CLOSED = "closed"
+    STATE_OPEN = "open"
+    STATE_HALF_OPEN = "half-open"
+
+    def __init__(
+        self,
+        threshold: int = 5,
+        reset_timeout: float = 30.0,
+        max_reset_timeout: float = 600.0,
+    ):
+        """Initialize a `CircuitBreaker` instance.
+
+        Args:
+            threshold: the number of consecutive failures which open the breaker
+            reset_timeout: the initial number of seconds the breaker stays open
+            max_reset_timeout: the maximum number of seconds the breaker stays open
+
+        """
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.failures = 0
+        self.opened = 0
+        self.open_until: float = None
+        self.trial = False
+
+    @property
+    def state(self) -> str:
+        """Accessor for the breaker state, not accounting for elapsed time."""
+        if self.open_until is None:
+            return self.STATE_CLOSED
+        return self.STATE_HALF_OPEN if self.trial else self.STATE_OPEN
+
+    def allow(self, now: float) -> bool:
+        """Determine whether a delivery may be attempted.
+
+        Args:
+            now: the current timer value
+
+        """
+        if self.open_until is None:
+            return True
+        if self.trial or now < self.open_until:
+            return False
+        self.trial = True
+        return True
+
+    def retry_at(self, now: float) -> float:
+        """Get the timer value at which a held delivery should be reconsidered.
+
+        Args:
+            now: the current timer value
+
+        """
+        if self.trial or self.open_until is None:
+            return now + self.reset_timeout
+        return max(self.open_until, now)
+
+    def record_failure(self, now: float):
+        """Record a failed delivery.
+
+        Args:
+            now: the current timer value
+
+        """
+        self.failures += 1
+        if self.trial or self.failures >= self.threshold:
+            timeout = min(
+                self.reset_timeout * 2**self.opened, self.max_reset_timeout
+            )
+            self.opened += 1
+            self.open_until = now + timeout
+            self.trial = False
@@ -0,0 +1,62 @@
+"""Abstract store for undelivered outbound messages."""
+
+from abc import ABC, abstractmethod
+from typing import Mapping, Sequence
+
+from ...error import TransportError
+
+
+class OutboundStoreError(TransportError):
+    """Outbound message store error."""
+
+
+class BaseOutboundStore(ABC):
+    """Abstract store holding encoded outbound messages until delivery.
+
+    Records are plain dictionaries keyed by a queue identifier. Records which
+    have not been removed when the agent stops are replayed on the next start.
+    """
+
+    async def open(self):
+        """Open the store."""
+
+    async def close(self):
+        """Close the store."""
+
+    @abstractmethod
+    async def add(self, records: Mapping[str, dict]):
+        """Add a batch of records to the store.
+
+        Args:
+            records: a mapping of queue identifiers to message records
+
+        """
+
+    @abstractmethod
+    async def remove(self, record_ids: Sequence[str]):
+        """Remove a batch of records from the store, ignoring unknown identifiers.
+
+        Args:
+            record_ids: the queue identifiers of the records to remove
+
+        """
+
+    @abstractmethod
+    async def get(self, record_ids: Sequence[str]) -> Mapping[str, dict]:
+        """Fetch a batch of records from the store.
+
+        Args:
+            record_ids: the queue identifiers of the records to fetch
+
+        Returns:
+            A mapping of queue identifiers to the records found
+
+        """
+
+    @abstractmethod
+    async def list_ids(self) -> Sequence[str]:
+        """List the identifiers of all stored records, in the order they were added."""
+
+    def __repr__(self) -> str:
+        """Human readable representation of this instance."""
+        return "<{}>".format(self.__class__.__name__)
@@ -0,0 +1,192 @@
+"""Append-only log file store for undelivered outbound messages."""
+
+import asyncio
+import json
+import logging
+import os
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import BinaryIO, Callable, Mapping, Sequence, Union
+
+from .base import BaseOutboundStore, OutboundStoreError
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _private_opener(path: str, flags: int) -> int:
+    """Open a file, creating it readable and writable by its owner only."""
+    return os.open(path, flags, 0o600)
+
+
+class LogOutboundStore(BaseOutboundStore):
+    """Outbound message store backed by an append-only log file.
+
+    Each batch of added or removed records is appended to the log as JSON
+    lines and synced to disk in a single write. Only an index of file offsets
+    is held in memory. The log is rewritten without removed records when they
+    outnumber the live records, and when the store is opened. The log file is
+    created readable by its owner only, as it holds message payloads.
+    """
+
+    LOG_NAME = "outbound.log"
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        sync: bool = True,
+        compact_min: int = 1000,
+    ):
+        """Initialize a `LogOutboundStore` instance.
+
+        Args:
+            path: the directory in which to keep the log file
+            sync: whether to sync each batch to disk before returning
+            compact_min: the minimum number of removed entries before the log
+                is compacted
+
+        """
+        self._dir = Path(path)
+        self._file: BinaryIO = None
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._dead = 0
+        self._lock = asyncio.Lock()
+        self._sync = sync
+        self._compact_min = compact_min
+
+    @property
+    def log_path(self) -> Path:
+        """Accessor for the path of the log file."""
+        return self._dir.joinpath(self.LOG_NAME)
+
+    async def _run(self, fn: Callable, *args, require_open: bool = True):
+        """Run a blocking file operation in the default executor."""
+        async with self._lock:
+            if require_open and not self._file:
+                raise OutboundStoreError("Outbound store is not open")
+            return await asyncio.get_event_loop().run_in_executor(None, fn, *args)
+
+    async def open(self):
+        """Open the log, recovering the index of undelivered records."""
+        await self._run(self._open_sync, require_open=False)
+
+    async def close(self):
+        """Close the log file."""
+        if self._file:
+            await self._run(self._close_sync)
+
+    async def add(self, records: Mapping[str, dict]):
+        """Append a batch of records to the log."""
+        if records:
+            await self._run(self._add_sync, records)
+
+    async def remove(self, record_ids: Sequence[str]):
+        """Append a removal entry for a batch of records to the log."""
+        if record_ids:
+            await self._run(self._remove_sync, record_ids)
+
+    async def get(self, record_ids: Sequence[str]) -> Mapping[str, dict]:
+        """Read a batch of records from the log."""
+        if not record_ids:
+            return {}
+        return await self._run(self._get_sync, record_ids)
+
+    async def list_ids(self) -> Sequence[str]:
+        """List the identifiers of all stored records, in the order they were added."""
+        return list(self._index)
+
+    def _open_sync(self):
+        """Open the log file and load the record index."""
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.log_path, "a+b", opener=_private_opener)
+        self._file.seek(0)
+        self._index = OrderedDict()
+        self._dead = 0
+        offset = 0
+        for line in self._file:
+            try:
+                if not line.endswith(b"\n"):
+                    raise ValueError("Missing line terminator")
+                entry = json.loads(line)
+            except ValueError:
+                # an incomplete final entry left by an interrupted write
+                LOGGER.warning("Discarding truncated entry in outbound message log")
+                break
+            if entry.get("op") == "add":
+                self._index[entry["id"]] = offset
+            else:
+                for record_id in entry.get("ids", ()):
+                    if self._index.pop(record_id, None) is not None:
+                        self._dead += 1
+                self._dead += 1
+            offset += len(line)
+        if self._dead or offset != self._file.tell():
+            self._compact_sync()
+
+    def _close_sync(self):
+        """Close the log file."""
+        self._file.close()
+        self._file = None
+
+    def _write_sync(self, data: bytes):
+        """Append data to the log file and sync to disk."""
+        self._file.write(data)
+        self._file.flush()
+        if self._sync:
+            os.fsync(self._file.fileno())
+
+    def _add_sync(self, records: Mapping[str, dict]):
+        """Append a batch of records to the log file."""
+        self._file.seek(0, os.SEEK_END)
+        offset = self._file.tell()
+        lines = []
+        for record_id, record in records.items():
+            line = json.dumps({"op": "add", "id": record_id, "record": record})
+            line = line.encode() + b"\n"
+            lines.append(line)
+            self._index[record_id] = offset
+            offset += len(line)
+        self._write_sync(b"".join(lines))
+
+    def _remove_sync(self, record_ids: Sequence[str]):
+        """Append a removal entry to the log file."""
+        found = [rid for rid in record_ids if self._index.pop(rid, None) is not None]
+        if not found:
+            return
+        self._write_sync(json.dumps({"op": "rm", "ids": found}).encode() + b"\n")
+        self._dead += len(found) + 1
+        if self._dead >= self._compact_min and self._dead > len(self._index):
+            self._compact_sync()
+
+    def _get_sync(self, record_ids: Sequence[str]) -> Mapping[str, dict]:
+        """Read a batch of records from the log file."""
+        found = {}
+        for record_id in record_ids:
+            offset = self._index.get(record_id)
+            if offset is None:
+                continue
+            self._file.seek(offset)
+            found[record_id] = json.loads(self._file.readline())["record"]
+        return found
+
+    def _compact_sync(self):
+        """Rewrite the log file, keeping only the live records."""
+        tmp_path = self.log_path.with_suffix(".tmp")
+        index = OrderedDict()
+        with open(tmp_path, "wb", opener=_private_opener) as tmp:
+            for record_id, offset in self._index.items():
+                self._file.seek(offset)
+                index[record_id] = tmp.tell()
+                tmp.write(self._file.readline())
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        self._file.close()
+        os.replace(tmp_path, self.log_path)
+        self._file = open(self.log_path, "a+b", opener=_private_opener)
+        self._index = index
+        self._dead = 0
+
+    def __repr__(self) -> str:
+        """Human readable representation of this instance."""
+        return "<{} path={}>".format(self.__class__.__name__, self.log_path)
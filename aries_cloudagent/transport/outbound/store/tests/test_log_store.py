@@ -0,0 +1,78 @@
+import pytest
+
+from ..base import OutboundStoreError
+from ..log import LogOutboundStore
+
+
+@pytest.fixture()
+async def store(tmp_path):
+    store = LogOutboundStore(tmp_path, sync=False, compact_min=4)
+    await store.open()
+    yield store
+    await store.close()
+
+
+class TestLogOutboundStore:
+    async def test_add_get_remove(self, store):
+        await store.add({"a": {"payload": "1"}, "b": {"payload": "2"}})
+        assert await store.list_ids() == ["a", "b"]
+        assert await store.get(["b", "missing", "a"]) == {
+            "a": {"payload": "1"},
+            "b": {"payload": "2"},
+        }
+        await store.remove(["a", "missing"])
+        assert await store.list_ids() == ["b"]
+        assert await store.get(["a"]) == {}
+        assert await store.get([]) == {}
+
+    async def test_private_file(self, store):
+        await store.add({"a": {"payload": "1"}})
+        assert store.log_path.stat().st_mode & 0o777 == 0o600
+
+    async def test_reopen_recovers(self, store, tmp_path):
+        await store.add({"a": {"payload": "1"}, "b": {"payload": "2"}})
+        await store.remove(["a"])
+        await store.close()
+
+        reopened = LogOutboundStore(tmp_path)
+        await reopened.open()
+        assert await reopened.list_ids() == ["b"]
+        assert await reopened.get(["b"]) == {"b": {"payload": "2"}}
+        # removed entries are compacted away on open
+        assert reopened.log_path.read_bytes().count(b"\n") == 1
+        await reopened.close()
+
+    async def test_truncated_tail(self, store, tmp_path):
+        await store.add({"a": {"payload": "1"}})
+        await store.close()
+        with open(store.log_path, "ab") as log:
+            log.write(b'{"op": "add", "id": "b", "rec')
+
+        reopened = LogOutboundStore(tmp_path)
+        await reopened.open()
+        assert await reopened.list_ids() == ["a"]
+        await reopened.add({"c": {"payload": "3"}})
+        assert await reopened.get(["a", "c"]) == {
+            "a": {"payload": "1"},
+            "c": {"payload": "3"},
+        }
+        await reopened.close()
+
+    async def test_compaction(self, store):
+        await store.add({str(i): {"payload": i} for i in range(6)})
+        await store.remove(["0", "1"])
+        assert store.log_path.read_bytes().count(b"\n") == 7
+        await store.remove(["2", "3"])
+        # 4 removed + 2 removal entries outnumber the 2 live records
+        assert store.log_path.read_bytes().count(b"\n") == 2
+        assert await store.get(["4", "5"]) == {
+            "4": {"payload": 4},
+            "5": {"payload": 5},
+        }
+
+    async def test_not_open(self, tmp_path):
+        store = LogOutboundStore(tmp_path)
+        with pytest.raises(OutboundStoreError):
+            await store.add({"a": {}})
+        await store.close()
+        assert "outbound.log" in repr(store)
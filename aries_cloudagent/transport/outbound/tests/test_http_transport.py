@@ -104,6 +104,7 @@ class TestHttpTransport(AioHTTPTestCase):
         async def send_message(transport, payload, endpoint):
             async with transport:
                 await transport.handle_message(self.profile, payload, endpoint)
+                await transport.handle_message(self.profile, payload, endpoint)
 
         transport = HttpTransport()
         transport.collector = Collector()
@@ -115,8 +116,37 @@ class TestHttpTransport(AioHTTPTestCase):
         assert results["count"] == {
             "outbound-http:dns_resolve": 1,
             "outbound-http:connect": 1,
-            "outbound-http:POST": 1,
+            "outbound-http:connection:created": 1,
+            "outbound-http:connection:reused": 1,
+            "outbound-http:POST": 2,
+            "outbound-http:pool:in_use": 2,
+            "outbound-http:pool:utilization": 2,
         }
+        assert results["max"]["outbound-http:pool:in_use"] == 1
+        assert results["max"]["outbound-http:pool:utilization"] == 1 / 200
+
+    async def test_connector_settings(self):
+        profile = InMemoryProfile.test_profile(
+            {
+                "transport.http.pool_limit": 20,
+                "transport.http.pool_limit_per_host": 5,
+                "transport.http.dns_cache_ttl": 0,
+                "transport.http.keepalive_timeout": 30.0,
+            }
+        )
+        transport = HttpTransport(root_profile=profile)
+        await transport.start()
+        assert transport.connector.limit == 20
+        assert transport.connector.limit_per_host == 5
+        assert not transport.connector.use_dns_cache
+        await transport.stop()
+
+        transport = HttpTransport()
+        await transport.start()
+        assert transport.connector.limit == HttpTransport.POOL_LIMIT
+        assert transport.connector.limit_per_host == HttpTransport.POOL_LIMIT_PER_HOST
+        assert transport.connector.use_dns_cache
+        await transport.stop()
 
     async def test_transport_coverage(self):
         transport = HttpTransport()
@@ -1,10 +1,13 @@
+import asyncio
 import json
+import tempfile
 
 from aries_cloudagent.tests import mock
 from unittest import IsolatedAsyncioTestCase
 
 from ....core.in_memory import InMemoryProfile
 from ....connections.models.connection_target import ConnectionTarget
+from ....utils import json_codec
 from ...wire_format import BaseWireFormat
 
 from .. import manager as test_module
@@ -179,7 +182,7 @@ class TestOutboundTransportManager(IsolatedAsyncioTestCase):
             mgr._process_done(mock_task)
 
     async def test_process_finished_x(self):
-        mock_queued = mock.MagicMock(retries=1)
+        mock_queued = mock.MagicMock(retries=1, failures=0)
         mock_task = mock.MagicMock(
             exc_info=(KeyError, KeyError("nope"), None),
         )
@@ -224,12 +227,17 @@ class TestOutboundTransportManager(IsolatedAsyncioTestCase):
         mgr.outbound_buffer.append(mock_queued)
 
         with mock.patch.object(
-            test_module.asyncio, "sleep", mock.CoroutineMock()
-        ) as mock_sleep_x:
-            mock_sleep_x.side_effect = KeyError()
+            mgr.outbound_event, "wait", mock.CoroutineMock()
+        ) as mock_wait:
+            mock_wait.side_effect = KeyError()
             with self.assertRaises(KeyError):  # cover retry logic and bail
                 await mgr._process_loop()
             assert mock_queued.retry_at is not None
+            # held in the retry heap rather than polled in the buffer
+            assert not mgr.outbound_buffer
+            assert mgr._retry_heap[0][2] is mock_queued
+            assert mgr._retry_timer
+            await mgr.stop()
 
     async def test_process_loop_new(self):
         profile = InMemoryProfile.test_profile()
@@ -293,7 +301,9 @@ class TestOutboundTransportManager(IsolatedAsyncioTestCase):
         await mgr._process_loop()
 
     async def test_finished_deliver_x_log_debug(self):
-        mock_queued = mock.MagicMock(state=QueuedOutboundMessage.STATE_DONE, retries=1)
+        mock_queued = mock.MagicMock(
+            state=QueuedOutboundMessage.STATE_DONE, retries=1, failures=0
+        )
         mock_completed_x = mock.MagicMock(exc_info=KeyError("an error occurred"))
 
         profile = InMemoryProfile.test_profile()
@@ -343,3 +353,211 @@ class TestOutboundTransportManager(IsolatedAsyncioTestCase):
         result = await mgr.encode_outbound_message(profile, outbound, target)
 
         assert result.payload == enc_payload
+
+    def _mock_transport(self, mgr: OutboundTransportManager):
+        transport = mock.MagicMock()
+        transport.handle_message = mock.CoroutineMock()
+        transport.start = mock.CoroutineMock()
+        transport.stop = mock.CoroutineMock()
+        transport.schemes = ["http"]
+        transport.is_external = False
+        transport_cls = mock.MagicMock(schemes=["http"], return_value=transport)
+        mgr.register_class(transport_cls, "transport_cls")
+        return transport
+
+    async def test_persistent_queue_replay(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            profile = InMemoryProfile.test_profile(
+                {"transport.outbound_queue.path": tmp_dir}
+            )
+            mgr = OutboundTransportManager(profile)
+            await mgr.setup()
+            transport = self._mock_transport(mgr)
+            blocked = asyncio.Event()
+
+            async def handle_message(*args):
+                await blocked.wait()
+
+            transport.handle_message.side_effect = handle_message
+            await mgr.start()
+            await mgr.task_queue
+
+            # delivery is interrupted, so the message remains in the store
+            mgr.enqueue_webhook("topic", {"a": 1}, "http://localhost", 1)
+            while not transport.handle_message.await_count:
+                await asyncio.sleep(0.01)
+            record_ids = await mgr.outbound_store.list_ids()
+            assert len(record_ids) == 1
+            assert (await mgr.outbound_store.get(record_ids))[record_ids[0]][
+                "payload"
+            ] == json_codec.dumps({"a": 1})
+
+            queued = QueuedOutboundMessage(profile, None, None, "transport_cls")
+            queued.payload = b"\x00packed"
+            queued.endpoint = "http://localhost"
+            record = mgr.queued_to_record(queued)
+            assert record["binary"]
+            await mgr.outbound_store.add({"packed": record})
+            await mgr.stop(wait=False)
+
+            restarted = OutboundTransportManager(
+                InMemoryProfile.test_profile({"transport.outbound_queue.path": tmp_dir})
+            )
+            await restarted.setup()
+            transport = self._mock_transport(restarted)
+            await restarted.start()
+            await restarted.task_queue
+            await restarted.flush()
+            payloads = [
+                call.args[1] for call in transport.handle_message.await_args_list
+            ]
+            assert payloads == [json_codec.dumps({"a": 1}), b"\x00packed"]
+            assert await restarted.outbound_store.list_ids() == []
+            await restarted.stop()
+
+    async def test_persistent_queue_bounded(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            profile = InMemoryProfile.test_profile(
+                {
+                    "transport.outbound_queue.path": tmp_dir,
+                    "transport.outbound_queue.max_buffered": 2,
+                }
+            )
+            mgr = OutboundTransportManager(profile)
+            await mgr.setup()
+            transport = self._mock_transport(mgr)
+            await mgr.start()
+            await mgr.task_queue
+
+            buffered = []
+
+            async def handle_message(*args):
+                buffered.append(len(mgr.outbound_buffer))
+
+            transport.handle_message.side_effect = handle_message
+            for i in range(6):
+                mgr.enqueue_webhook("topic", {"n": i}, "http://localhost", 1)
+            await mgr.flush()
+            assert sorted(
+                json.loads(call.args[1])["n"]
+                for call in transport.handle_message.await_args_list
+            ) == list(range(6))
+            assert max(buffered) <= 2
+            await mgr.stop()
+
+    async def test_persistent_queue_add_failure(self):
+        mgr = OutboundTransportManager(InMemoryProfile.test_profile())
+        mgr.STORE_RETRY_DELAY = 0.01
+        transport = self._mock_transport(mgr)
+        mgr.outbound_store = mock.MagicMock(
+            add=mock.CoroutineMock(side_effect=[OSError(), None]),
+            remove=mock.CoroutineMock(),
+            list_ids=mock.CoroutineMock(return_value=[]),
+            close=mock.CoroutineMock(),
+        )
+        await mgr.start()
+        await mgr.task_queue
+
+        mgr.enqueue_webhook("topic", {"a": 1}, "http://localhost", 1)
+        while mgr.outbound_store.add.await_count < 1:
+            await asyncio.sleep(0.01)
+        # the message is not delivered, or spilled, until it has been stored
+        queued = mgr.outbound_buffer[0]
+        assert not queued.persisted
+        transport.handle_message.assert_not_called()
+
+        await mgr.flush()
+        assert mgr.outbound_store.add.await_count == 2
+        transport.handle_message.assert_awaited_once()
+        mgr.outbound_store.remove.assert_awaited_once_with([queued.queue_id])
+        await mgr.stop()
+
+    async def test_persistent_webhook_api_key(self):
+        profile = InMemoryProfile.test_profile(
+            {"admin.webhook_urls": ["http://other#other", "http://localhost#secret"]}
+        )
+        mgr = OutboundTransportManager(profile)
+        self._mock_transport(mgr)
+        await mgr.start()
+        await mgr.task_queue
+
+        queued = QueuedOutboundMessage(profile, None, None, "transport_cls")
+        queued.payload = "{}"
+        queued.endpoint = "http://localhost/topic/topic/"
+        queued.api_key = "secret"
+        record = mgr.queued_to_record(queued)
+        assert "secret" not in json.dumps(record)
+        assert mgr.record_to_queued("id", record).api_key == "secret"
+
+        queued.api_key = None
+        assert mgr.record_to_queued("id", mgr.queued_to_record(queued)).api_key is None
+
+        # webhooks whose API key is no longer configured are discarded
+        mgr.outbound_store = mock.MagicMock(
+            remove=mock.CoroutineMock(), close=mock.CoroutineMock()
+        )
+        queued.api_key = "secret"
+        queued.endpoint = "http://elsewhere/topic/topic/"
+        assert mgr.record_to_queued("id", mgr.queued_to_record(queued)) is None
+        await mgr.task_queue
+        mgr.outbound_store.remove.assert_awaited_once_with(["id"])
+        await mgr.stop()
+
+    async def test_record_to_queued_no_transport(self):
+        mgr = OutboundTransportManager(InMemoryProfile.test_profile())
+        mgr.outbound_store = mock.MagicMock(remove=mock.CoroutineMock())
+        assert (
+            mgr.record_to_queued("id", {"endpoint": "xmpp://x", "payload": "{}"})
+            is None
+        )
+        await mgr.task_queue
+        mgr.outbound_store.remove.assert_awaited_once_with(["id"])
+
+    async def test_retry_backoff(self):
+        profile = InMemoryProfile.test_profile(
+            {
+                "transport.outbound_retry.base": 0.02,
+                "transport.outbound_retry.jitter": 0,
+            }
+        )
+        mgr = OutboundTransportManager(profile)
+        transport = self._mock_transport(mgr)
+        transport.handle_message.side_effect = [KeyError(), KeyError(), None]
+        await mgr.start()
+        await mgr.task_queue
+
+        mgr.enqueue_webhook("topic", {"a": 1}, "http://localhost", 3)
+        start = test_module.get_timer()
+        await mgr.flush()
+        # retried after 0.02 and then 0.04 seconds
+        assert test_module.get_timer() - start >= 0.06
+        assert transport.handle_message.await_count == 3
+        assert not mgr._retry_heap and not mgr._retry_timer
+        assert not mgr.breakers
+        await mgr.stop()
+
+    async def test_circuit_breaker_holds_delivery(self):
+        profile = InMemoryProfile.test_profile(
+            {
+                "transport.outbound_breaker.threshold": 1,
+                "transport.outbound_breaker.reset": 0.05,
+            }
+        )
+        mgr = OutboundTransportManager(profile)
+        transport = self._mock_transport(mgr)
+        await mgr.start()
+        await mgr.task_queue
+
+        mgr._breaker_for("http://localhost/topic/topic/").record_failure(
+            test_module.get_timer()
+        )
+        mgr.enqueue_webhook("topic", {"a": 1}, "http://localhost", 1)
+        mgr.enqueue_webhook("topic", {"a": 2}, "http://localhost", 1)
+        await asyncio.sleep(0.02)
+        transport.handle_message.assert_not_called()
+        assert len(mgr._retry_heap) == 2
+
+        await mgr.flush()
+        assert transport.handle_message.await_count == 2
+        assert not mgr.breakers
+        await mgr.stop()
@@ -0,0 +1,47 @@
+from unittest import TestCase, mock
+
+from .. import retry as test_module
+from ..retry import CircuitBreaker, RetryBackoff
+
+
+class TestRetryBackoff(TestCase):
+    def test_delay(self):
+        backoff = RetryBackoff(base=1.0, factor=2.0, max_delay=5.0, jitter=0)
+        assert [backoff.delay(attempt) for attempt in range(5)] == [1, 2, 4, 5, 5]
+        assert backoff.delay(10000) == 5.0
+
+    def test_jitter(self):
+        backoff = RetryBackoff(base=4.0, jitter=0.5)
+        with mock.patch.object(test_module.random, "random", return_value=1.0):
+            assert backoff.delay(0) == 2.0
+        with mock.patch.object(test_module.random, "random", return_value=0.0):
+            assert backoff.delay(0) == 4.0
+        assert RetryBackoff(jitter=2.0).jitter == 1.0
+
+
+class TestCircuitBreaker(TestCase):
+    def test_open_after_threshold(self):
+        breaker = CircuitBreaker(threshold=2, reset_timeout=10.0)
+        assert breaker.allow(0.0)
+        breaker.record_failure(0.0)
+        assert breaker.state == CircuitBreaker.STATE_CLOSED
+        breaker.record_failure(1.0)
+        assert breaker.state == CircuitBreaker.STATE_OPEN
+        assert not breaker.allow(5.0)
+        assert breaker.retry_at(5.0) == 11.0
+
+    def test_trial(self):
+        breaker = CircuitBreaker(threshold=1, reset_timeout=10.0, max_reset_timeout=15.0)
+        breaker.record_failure(0.0)
+        assert breaker.allow(10.0)
+        assert breaker.state == CircuitBreaker.STATE_HALF_OPEN
+        # only a single trial delivery is made
+        assert not breaker.allow(10.0)
+        assert breaker.retry_at(10.0) == 20.0
+
+        # a failed trial opens the breaker for longer
+        breaker.record_failure(12.0)
+        assert breaker.state == CircuitBreaker.STATE_OPEN
+        assert breaker.open_until == 27.0
+        assert not breaker.allow(26.0)
+        assert breaker.allow(27.0)
@@ -9,10 +9,11 @@ from ..core.profile import ProfileSession
 from ..protocols.routing.v1_0.messages.forward import Forward
 
 from ..messaging.util import time_now
+from ..utils import json_codec
 from ..utils.task_queue import TaskQueue
 from ..wallet.base import BaseWallet
 from ..wallet.error import WalletError
-from ..wallet.util import b64_to_str
+from ..wallet.util import b64_to_bytes
 
 from .error import WireFormatParseError, WireFormatEncodeError, RecipientKeysError
 from .inbound.receipt import MessageReceipt
@@ -21,6 +22,25 @@ from .wire_format import BaseWireFormat
 LOGGER = logging.getLogger(__name__)
 
 
+def forward_envelope(to: str, packed: bytes) -> bytes:
+    """Wrap a packed message in a serialized forward message.
+
+    The packed message is already JSON, so it is spliced into the forward
+    message as is, rather than parsed and serialized again at every hop.
+
+    Args:
+        to: The recipient key of the packed message
+        packed: The packed message
+
+    Returns:
+        The UTF-8 encoded forward message
+
+    """
+    fwd_msg = Forward(to=to)
+    header = json.dumps({"@type": fwd_msg._type, "@id": fwd_msg._id, "to": to})
+    return b"".join((header[:-1].encode("utf-8"), b', "msg": ', packed, b"}"))
+
+
 class PackWireFormat(BaseWireFormat):
     """Standard DIDComm message parser and serializer."""
 
@@ -60,7 +80,7 @@ class PackWireFormat(BaseWireFormat):
             raise WireFormatParseError("Message body is empty")
 
         try:
-            message_dict = json.loads(message_json)
+            message_dict = json_codec.loads(message_json)
         except ValueError:
             raise WireFormatParseError("Message JSON parsing failed")
         if not isinstance(message_dict, dict):
@@ -78,7 +98,7 @@ class PackWireFormat(BaseWireFormat):
             else:
                 receipt.raw_message = message_json
                 try:
-                    message_dict = json.loads(message_json)
+                    message_dict = json_codec.loads(message_json)
                 except ValueError:
                     raise WireFormatParseError("Message JSON parsing failed")
                 if not isinstance(message_dict, dict):
@@ -182,12 +202,11 @@ class PackWireFormat(BaseWireFormat):
         if routing_keys:
             recip_keys = recipient_keys
             for router_key in routing_keys:
-                message = json.loads(message.decode("utf-8"))
-                fwd_msg = Forward(to=recip_keys[0], msg=message)
+                fwd_msg = forward_envelope(recip_keys[0], message)
                 # Forwards are anon packed
                 recip_keys = [router_key]
                 try:
-                    message = await wallet.pack_message(fwd_msg.to_json(), recip_keys)
+                    message = await wallet.pack_message(fwd_msg, recip_keys)
                 except WalletError as e:
                     raise WireFormatEncodeError("Forward message pack failed") from e
         return message
@@ -207,8 +226,10 @@ class PackWireFormat(BaseWireFormat):
         """
 
         try:
-            message_dict = json.loads(message_body)
-            protected = json.loads(b64_to_str(message_dict["protected"], urlsafe=True))
+            message_dict = json_codec.loads(message_body)
+            protected = json_codec.loads(
+                b64_to_bytes(message_dict["protected"], urlsafe=True)
+            )
             recipients = protected["recipients"]
 
             recipient_keys = [recipient["header"]["kid"] for recipient in recipients]
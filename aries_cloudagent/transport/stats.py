@@ -8,11 +8,21 @@ from ..utils.stats import Collector
 class StatsTracer(aiohttp.TraceConfig):
     """Attach hooks to client session events and report statistics."""
 
-    def __init__(self, collector: Collector, prefix: str):
-        """Initialize the `StatsTracer` instance."""
+    def __init__(
+        self, collector: Collector, prefix: str, connector: aiohttp.BaseConnector = None
+    ):
+        """Initialize the `StatsTracer` instance.
+
+        Args:
+            collector: the collector receiving the statistics
+            prefix: the prefix for the names of the statistics
+            connector: the connection pool to report utilization for, if any
+
+        """
         super().__init__()
         self.collector = collector
         self.prefix = prefix
+        self.connector = connector
         self.on_request_start.append(self.request_start)
         self.on_connection_queued_start.append(self.connection_queued_start)
         self.on_connection_queued_end.append(self.connection_queued_end)
@@ -21,8 +31,8 @@ class StatsTracer(aiohttp.TraceConfig):
         self.on_connection_create_start.append(self.socket_connect_start)
         self.on_dns_cache_hit.append(self.socket_connect_start)  # restart timer
         self.on_dns_cache_miss.append(self.socket_connect_start)  # restart timer
-        self.on_connection_reuseconn.append(self.connection_ready)
-        self.on_connection_create_end.append(self.connection_ready)
+        self.on_connection_reuseconn.append(self.connection_reused)
+        self.on_connection_create_end.append(self.connection_created)
         self.on_request_end.append(self.request_end)
 
     async def request_start(self, session, context, params):
@@ -56,6 +66,33 @@ class StatsTracer(aiohttp.TraceConfig):
         except AttributeError:
             pass
         context.fetch_timer = self.collector.timer(self.prefix + context.method).start()
+        self.log_pool_usage()
+
+    async def connection_reused(self, session, context, params):
+        """Handle the reuse of a kept-alive connection."""
+        self.collector.log(self.prefix + "connection:reused", 0.0)
+        await self.connection_ready(session, context, params)
+
+    async def connection_created(self, session, context, params):
+        """Handle the creation of a new connection."""
+        self.collector.log(self.prefix + "connection:created", 0.0)
+        await self.connection_ready(session, context, params)
+
+    def log_pool_usage(self):
+        """Record a sample of the connection pool utilization.
+
+        The number of connections in use and the fraction of the pool limit
+        they represent are logged in place of a duration, so that the average
+        and maximum values are reported by the collector.
+        """
+        acquired = getattr(self.connector, "_acquired", None)
+        if acquired is None:
+            return
+        self.collector.log(self.prefix + "pool:in_use", len(acquired))
+        if self.connector.limit:
+            self.collector.log(
+                self.prefix + "pool:utilization", len(acquired) / self.connector.limit
+            )
 
     async def request_end(self, session, context, params):
         """Handle the end of request."""
@@ -7,6 +7,7 @@ from aries_cloudagent.tests import mock
 from ...core.in_memory import InMemoryProfile
 from ...protocols.didcomm_prefix import DIDCommPrefix
 from ...protocols.routing.v1_0.message_types import FORWARD
+from ...protocols.routing.v1_0.messages.forward import Forward
 from ...wallet.base import BaseWallet
 from ...wallet.did_method import SOV, DIDMethods
 from ...wallet.error import WalletError
@@ -105,12 +106,8 @@ class TestPackWireFormat(IsolatedAsyncioTestCase):
             )
         )
         session = InMemoryProfile.test_session(bind={BaseWallet: mock_wallet})
-        with mock.patch.object(
-            test_module, "Forward", mock.MagicMock()
-        ) as mock_forward:
-            mock_forward.return_value = mock.MagicMock(to_json=mock.MagicMock())
-            with self.assertRaises(WireFormatEncodeError):
-                await serializer.pack(session, None, ["key"], ["key"], ["key"])
+        with self.assertRaises(WireFormatEncodeError):
+            await serializer.pack(session, None, ["key"], ["key"], ["key"])
 
     async def test_unpacked(self):
         serializer = PackWireFormat()
@@ -197,6 +194,48 @@ class TestPackWireFormat(IsolatedAsyncioTestCase):
         assert delivery.recipient_verkey == router_did.verkey
         assert delivery.sender_verkey is None
 
+    async def test_forward_multi_hop(self):
+        local_did = await self.wallet.create_local_did(
+            method=SOV, key_type=ED25519, seed=self.test_seed
+        )
+        router_dids = [
+            await self.wallet.create_local_did(method=SOV, key_type=ED25519)
+            for _ in range(3)
+        ]
+        serializer = PackWireFormat()
+        message_json = json.dumps(self.test_message)
+
+        packed = await serializer.encode_message(
+            self.session,
+            message_json,
+            [local_did.verkey],
+            [did.verkey for did in router_dids],
+            local_did.verkey,
+        )
+
+        # each mediator finds the next envelope intact inside its forward
+        expected_to = [local_did.verkey] + [did.verkey for did in router_dids[:-1]]
+        for router_did, to in zip(reversed(router_dids), reversed(expected_to)):
+            message_dict, delivery = await serializer.parse_message(
+                self.session, packed
+            )
+            assert delivery.recipient_verkey == router_did.verkey
+            forward = Forward.deserialize(message_dict)
+            assert forward.to == to
+            packed = json.dumps(forward.msg)
+
+        message_dict, delivery = await serializer.parse_message(self.session, packed)
+        assert message_dict == self.test_message
+        assert delivery.sender_verkey == local_did.verkey
+
+    def test_forward_envelope(self):
+        packed = json.dumps({"protected": "abc", "ciphertext": "é"}).encode("utf-8")
+        envelope = test_module.forward_envelope("key", packed)
+        forward = Forward.deserialize(json.loads(envelope))
+        assert forward._type == DIDCommPrefix.qualify_current(FORWARD)
+        assert forward.to == "key"
+        assert forward.msg == json.loads(packed)
+
     async def test_get_recipient_keys(self):
         recip_keys = ["kid1", "kid2", "kid3"]
         enc_message = {
@@ -20,3 +20,17 @@ class TestStatsTracer(IsolatedAsyncioTestCase):
 
     async def test_connection_ready_error_pass(self):
         await self.tracer.connection_ready(None, self.context, None)
+
+    async def test_pool_usage(self):
+        collector = test_module.Collector()
+        connector = mock.MagicMock(_acquired={1, 2}, limit=4)
+        tracer = test_module.StatsTracer(collector, "test:", connector)
+        tracer.log_pool_usage()
+        results = collector.extract()
+        assert results["max"]["test:pool:in_use"] == 2
+        assert results["max"]["test:pool:utilization"] == 0.5
+
+        # no sample without a connector
+        collector.reset()
+        self.tracer.log_pool_usage()
+        assert collector.extract()["count"] == {}
@@ -1,6 +1,5 @@
 """Abstract wire format classes."""
 
-import json
 import logging
 
 from abc import abstractmethod
@@ -8,6 +7,7 @@ from typing import List, Sequence, Tuple, Union
 
 from ..core.profile import ProfileSession
 from ..messaging.util import time_now
+from ..utils import json_codec
 
 from .inbound.receipt import MessageReceipt
 from .error import WireFormatParseError
@@ -119,7 +119,7 @@ class JsonWireFormat(BaseWireFormat):
             raise WireFormatParseError("Message body is empty")
 
         try:
-            message_dict = json.loads(message_json)
+            message_dict = json_codec.loads(message_json)
         except ValueError:
             raise WireFormatParseError("Message JSON parsing failed")
         if not isinstance(message_dict, dict):
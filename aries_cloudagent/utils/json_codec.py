@@ -0,0 +1,112 @@
+"""JSON encoding and decoding for messages, records and webhooks.
+
+The codec uses orjson when it is installed, and the standard library otherwise.
+Values orjson cannot encode, such as integers beyond 64 bits, and input it
+rejects, such as NaN constants, fall back to the standard library. Input with
+runs of digits long enough to hold integers beyond 64 bits also falls back, as
+orjson would decode those integers as floats. Otherwise orjson differs in that
+it encodes NaN and infinite floats as null.
+
+Output is compact, without whitespace between items.
+"""
+
+import json
+import re
+
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+JsonInput = Union[str, bytes, bytearray, memoryview]
+
+# orjson decodes integers exactly from -2**63 to 2**64 - 1; input with longer
+# runs of digits, even in strings or floats, is decoded with the standard library
+LONG_DIGITS = re.compile(r"-\d{19}|\d{20}")
+LONG_DIGITS_BYTES = re.compile(rb"-\d{19}|\d{20}")
+
+
+class JsonCodec:
+    """JSON codec using the standard library."""
+
+    name = "json"
+
+    def loads(self, value: JsonInput) -> Any:
+        """Decode a JSON string or UTF-8 encoded bytes.
+
+        Raises:
+            json.JSONDecodeError: If the value is not valid JSON
+
+        """
+        if isinstance(value, memoryview):
+            value = value.tobytes()
+        return json.loads(value)
+
+    def dumps(self, value: Any) -> str:
+        """Encode a value as a JSON string."""
+        return json.dumps(value, separators=(",", ":"))
+
+    def dumps_bytes(self, value: Any) -> bytes:
+        """Encode a value as UTF-8 encoded JSON."""
+        return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec using orjson, falling back to the standard library."""
+
+    name = "orjson"
+
+    def loads(self, value: JsonInput) -> Any:
+        """Decode a JSON string or UTF-8 encoded bytes.
+
+        Raises:
+            json.JSONDecodeError: If the value is not valid JSON
+
+        """
+        if isinstance(value, memoryview):
+            value = value.tobytes()
+        digits = LONG_DIGITS if isinstance(value, str) else LONG_DIGITS_BYTES
+        if digits.search(value):
+            return JsonCodec.loads(self, value)
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            return JsonCodec.loads(self, value)
+
+    def dumps(self, value: Any) -> str:
+        """Encode a value as a JSON string."""
+        return self.dumps_bytes(value).decode("utf-8")
+
+    def dumps_bytes(self, value: Any) -> bytes:
+        """Encode a value as UTF-8 encoded JSON."""
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return JsonCodec.dumps_bytes(self, value)
+
+
+codec: JsonCodec = OrjsonCodec() if orjson else JsonCodec()
+
+
+def set_codec(new_codec: JsonCodec):
+    """Replace the codec used by `loads`, `dumps` and `dumps_bytes`."""
+    global codec
+    codec = new_codec
+
+
+def loads(value: JsonInput) -> Any:
+    """Decode a JSON string or UTF-8 encoded bytes with the current codec."""
+    return codec.loads(value)
+
+
+def dumps(value: Any) -> str:
+    """Encode a value as a JSON string with the current codec."""
+    return codec.dumps(value)
+
+
+def dumps_bytes(value: Any) -> bytes:
+    """Encode a value as UTF-8 encoded JSON with the current codec."""
+    return codec.dumps_bytes(value)
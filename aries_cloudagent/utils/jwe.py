@@ -8,6 +8,7 @@ from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
 from marshmallow import Schema, ValidationError, fields
 
 from ..wallet.util import b64_to_bytes, bytes_to_b64
+from . import json_codec
 
 IDENT_ENC_KEY = "encrypted_key"
 IDENT_HEADER = "header"
@@ -121,7 +122,7 @@ class JweEnvelope:
     def from_json(cls, message: Union[bytes, str]) -> "JweEnvelope":
         """Decode a JWE envelope from a JSON string or bytes value."""
         try:
-            return cls._deserialize(JweSchema().loads(message))
+            return cls._deserialize(JweSchema().load(json_codec.loads(message)))
         except json.JSONDecodeError:
             raise ValidationError("Invalid JWE: not JSON")
 
@@ -134,7 +135,7 @@ class JweEnvelope:
     def _deserialize(cls, parsed: Mapping[str, Any]) -> "JweEnvelope":
         protected_b64 = parsed[IDENT_PROTECTED]
         try:
-            protected: dict = json.loads(from_b64url(protected_b64))
+            protected: dict = json_codec.loads(from_b64url(protected_b64))
         except json.JSONDecodeError:
             raise ValidationError(
                 "Invalid JWE: invalid JSON for protected headers"
@@ -230,7 +231,7 @@ class JweEnvelope:
 
     def to_json(self) -> str:
         """Serialize the JWE envelope to a JSON string."""
-        return json.dumps(self.serialize())
+        return json_codec.dumps(self.serialize())
 
     def add_recipient(self, recip: JweRecipient):
         """Add a recipient to the JWE envelope."""
@@ -3,6 +3,7 @@
 import functools
 import inspect
 import time
+from bisect import bisect_left
 from typing import Sequence, TextIO, Union
 
 
@@ -58,6 +59,43 @@ class Stats:
         }
 
 
+class Histogram:
+    """Counts of observed values falling within a set of bucket bounds."""
+
+    def __init__(self, bounds: Sequence[float]):
+        """Initialize the Histogram instance.
+
+        Args:
+            bounds: The upper bounds of the buckets, in increasing order
+        """
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float):
+        """Add a value to the histogram."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def merge(self, other: "Histogram"):
+        """Add the values observed by a histogram with the same bounds."""
+        if other.bounds != self.bounds:
+            raise ValueError("Cannot merge histograms with different bounds")
+        self.counts = [count + more for count, more in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total += other.total
+
+    def serialize(self) -> dict:
+        """Summarize the histogram in a dictionary."""
+        buckets = {
+            f"le_{bound:g}": count for bound, count in zip(self.bounds, self.counts)
+        }
+        buckets["inf"] = self.counts[-1]
+        return {"buckets": buckets, "count": self.count, "total": self.total}
+
+
 class Timer:
     """Timer instance for a running task."""
 
@@ -3,7 +3,19 @@
 import asyncio
 import logging
 import time
-from typing import Callable, Coroutine, Tuple
+from collections import deque
+from itertools import chain
+from typing import (
+    Awaitable,
+    Callable,
+    Coroutine,
+    Deque,
+    Dict,
+    Hashable,
+    Iterable,
+    Mapping,
+    Tuple,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -34,6 +46,38 @@ def task_exc_info(task: asyncio.Task):
         return type(exc_val), exc_val, exc_val.__traceback__
 
 
+async def gather_keyed(
+    fetch: Callable[[Hashable], Awaitable], keys: Iterable[Hashable], limit: int = 0
+) -> dict:
+    """Run a fetch for each distinct key concurrently and collect the results.
+
+    Args:
+        fetch: The coroutine function to call with each key
+        keys: The keys to fetch, which may contain duplicates
+        limit: The maximum number of fetches in progress at once, if any
+
+    Returns:
+        A dict of the results by key, in the order the keys were given
+
+    """
+    keys = list(dict.fromkeys(keys))
+    slots = asyncio.Semaphore(limit) if limit else None
+
+    async def run(key):
+        if not slots:
+            return await fetch(key)
+        async with slots:
+            return await fetch(key)
+
+    tasks = [asyncio.ensure_future(run(key)) for key in keys]
+    try:
+        return dict(zip(keys, await asyncio.gather(*tasks)))
+    finally:
+        # on failure, do not leave the remaining fetches running
+        for task in tasks:
+            task.cancel()
+
+
 class CompletedTask:
     """Represent the result of a queued task."""
 
@@ -43,10 +87,12 @@ class CompletedTask:
         exc_info: Tuple,
         ident: str = None,
         timing: dict = None,
+        lane: str = None,
     ):
         """Initialize the completed task."""
         self.exc_info = exc_info
         self.ident = ident
+        self.lane = lane
         self.task = task
         self.timing = timing
 
@@ -65,6 +111,9 @@ class PendingTask:
         ident: str = None,
         task_future: asyncio.Future = None,
         queued_time: float = None,
+        *,
+        lane: str = None,
+        groups: Mapping[str, str] = None,
     ):
         """Initialize the pending task.
 
@@ -74,6 +123,8 @@ class PendingTask:
             ident: A string identifier for the task
             task_future: A future to be resolved to the asyncio Task
             queued_time: When the pending task was added to the queue
+            lane: The name of the priority lane for the task
+            groups: The concurrency groups of the task, by group kind
         """
         if not asyncio.iscoroutine(coro):
             raise ValueError(f"Expected coroutine, got {coro}")
@@ -83,6 +134,8 @@ class PendingTask:
         self.queued_time: float = queued_time
         self.unqueued_time: float = None
         self.ident = ident or coro_ident(coro)
+        self.lane = lane or TaskQueue.DEFAULT_LANE
+        self.groups = groups
         self.task_future = task_future or asyncio.get_event_loop().create_future()
 
     def cancel(self):
@@ -121,10 +174,24 @@ class PendingTask:
 
 
 class TaskQueue:
-    """A class for managing a set of asyncio tasks."""
+    """A class for managing a set of asyncio tasks.
+
+    Pending tasks are held in named lanes. When there is room to start a task,
+    lanes are served in proportion to their weights, so that a busy lane does
+    not starve the others. Tasks may also belong to concurrency groups, such as
+    a connection or tenant, limiting the number of active tasks per group.
+    """
+
+    DEFAULT_LANE = "default"
 
     def __init__(
-        self, max_active: int = 0, timed: bool = False, trace_fn: Callable = None
+        self,
+        max_active: int = 0,
+        timed: bool = False,
+        trace_fn: Callable = None,
+        *,
+        lane_weights: Mapping[str, int] = None,
+        group_limits: Mapping[str, int] = None,
     ):
         """Initialize the task queue.
 
@@ -132,10 +199,13 @@ class TaskQueue:
             max_active: The maximum number of tasks to automatically run
             timed: A flag indicating that timing should be collected for tasks
             trace_fn: A callback for all completed tasks
+            lane_weights: The relative weights of the pending task lanes,
+                lanes not listed have a weight of 1
+            group_limits: The maximum number of active tasks in a single
+                concurrency group, by group kind
         """
         self.loop = asyncio.get_event_loop()
         self.active_tasks = []
-        self.pending_tasks = []
         self.timed = timed
         self.total_done = 0
         self.total_failed = 0
@@ -145,6 +215,15 @@ class TaskQueue:
         self._drain_evt = asyncio.Event()
         self._drain_task: asyncio.Task = None
         self._max_active = max_active
+        self._lane_weights = dict(lane_weights or {})
+        self._lanes: Dict[str, Deque[PendingTask]] = {}
+        self._lane_pass: Dict[str, float] = {}
+        self._virtual_time = 0.0
+        self._pending_count = 0
+        self._group_limits = {
+            kind: limit for kind, limit in (group_limits or {}).items() if limit
+        }
+        self._group_active: Dict[Tuple[str, str], int] = {}
 
     @property
     def cancelled(self) -> bool:
@@ -173,12 +252,76 @@ class TaskQueue:
     @property
     def current_pending(self) -> int:
         """Accessor for the current number of pending tasks in the queue."""
-        return len(self.pending_tasks)
+        return self._pending_count
 
     @property
     def current_size(self) -> int:
         """Accessor for the total number of tasks in the queue."""
-        return len(self.active_tasks) + len(self.pending_tasks)
+        return len(self.active_tasks) + self._pending_count
+
+    @property
+    def pending_tasks(self) -> list:
+        """Accessor for the pending tasks in the queue, in lane order."""
+        return list(chain.from_iterable(self._lanes.values()))
+
+    @property
+    def pending_by_lane(self) -> Dict[str, int]:
+        """Accessor for the number of pending tasks in each lane."""
+        return {lane: len(tasks) for lane, tasks in self._lanes.items()}
+
+    def lane_depth(self, lane: str = None) -> int:
+        """Fetch the number of pending tasks in a lane."""
+        tasks = self._lanes.get(lane or self.DEFAULT_LANE)
+        return len(tasks) if tasks else 0
+
+    def _group_available(self, groups: Mapping[str, str]) -> bool:
+        """Check whether another task may be started in the given groups."""
+        if not groups or not self._group_limits:
+            return True
+        for kind, key in groups.items():
+            limit = self._group_limits.get(kind)
+            if limit and key and self._group_active.get((kind, key), 0) >= limit:
+                return False
+        return True
+
+    def _update_groups(self, groups: Mapping[str, str], delta: int):
+        """Adjust the active task counts for the given groups."""
+        if not groups or not self._group_limits:
+            return
+        for kind, key in groups.items():
+            if key and kind in self._group_limits:
+                count = self._group_active.get((kind, key), 0) + delta
+                if count > 0:
+                    self._group_active[(kind, key)] = count
+                else:
+                    self._group_active.pop((kind, key), None)
+
+    def _next_pending(self) -> PendingTask:
+        """Remove and return the next pending task which may be started.
+
+        The lane with the lowest pass value holding a startable task is chosen,
+        and its pass value is then advanced by the inverse of the lane weight.
+        """
+        found = None
+        for lane, tasks in self._lanes.items():
+            if not tasks or (
+                found and self._lane_pass[lane] >= self._lane_pass[found[0]]
+            ):
+                continue
+            for idx, pending in enumerate(tasks):
+                if self._group_available(pending.groups):
+                    found = (lane, idx)
+                    break
+        if not found:
+            return None
+        lane, idx = found
+        tasks = self._lanes[lane]
+        pending = tasks[idx]
+        del tasks[idx]
+        self._pending_count -= 1
+        self._virtual_time = self._lane_pass[lane]
+        self._lane_pass[lane] += 1 / self._lane_weights.get(lane, 1)
+        return pending
 
     def __bool__(self) -> bool:
         """Support for the bool() builtin.
@@ -215,10 +358,13 @@ class TaskQueue:
         # waiting for the drain event, to avoid yielding to other queue methods
         while True:
             self._drain_evt.clear()
-            while self.pending_tasks and (
+            while self._pending_count and (
                 not self._max_active or len(self.active_tasks) < self._max_active
             ):
-                pending: PendingTask = self.pending_tasks.pop(0)
+                pending = self._next_pending()
+                if not pending:
+                    # remaining tasks are held back by their group limits
+                    break
                 if pending.queued_time:
                     pending.unqueued_time = time.perf_counter()
                     timing = {
@@ -228,13 +374,18 @@ class TaskQueue:
                 else:
                     timing = None
                 task = self.run(
-                    pending.coro, pending.complete_hook, pending.ident, timing
+                    pending.coro,
+                    pending.complete_hook,
+                    pending.ident,
+                    timing,
+                    lane=pending.lane,
+                    groups=pending.groups,
                 )
                 try:
                     pending.task = task
                 except ValueError:
                     LOGGER.warning("Pending task future already fulfilled")
-            if self.pending_tasks:
+            if self._pending_count:
                 await self._drain_evt.wait()
             else:
                 break
@@ -247,7 +398,16 @@ class TaskQueue:
         """
         if self.timed and not pending.queued_time:
             pending.queued_time = time.perf_counter()
-        self.pending_tasks.append(pending)
+        tasks = self._lanes.get(pending.lane)
+        if tasks is None:
+            tasks = self._lanes[pending.lane] = deque()
+        if not tasks:
+            # an idle lane resumes at the current pass, without saved-up credit
+            self._lane_pass[pending.lane] = max(
+                self._lane_pass.get(pending.lane, 0.0), self._virtual_time
+            )
+        tasks.append(pending)
+        self._pending_count += 1
         self.drain()
 
     def add_active(
@@ -256,6 +416,9 @@ class TaskQueue:
         task_complete: Callable = None,
         ident: str = None,
         timing: dict = None,
+        *,
+        lane: str = None,
+        groups: Mapping[str, str] = None,
     ) -> asyncio.Task:
         """Register an active async task with an optional completion callback.
 
@@ -264,10 +427,15 @@ class TaskQueue:
             task_complete: An optional callback to run on completion
             ident: A string identifer for the task
             timing: An optional dictionary of timing information
+            lane: The name of the priority lane for the task
+            groups: The concurrency groups of the task, by group kind
         """
         self.active_tasks.append(task)
+        self._update_groups(groups, 1)
         task.add_done_callback(
-            lambda fut: self.completed_task(task, task_complete, ident, timing)
+            lambda fut: self.completed_task(
+                task, task_complete, ident, timing, lane=lane, groups=groups
+            )
         )
         self.total_started += 1
         return task
@@ -278,6 +446,9 @@ class TaskQueue:
         task_complete: Callable = None,
         ident: str = None,
         timing: dict = None,
+        *,
+        lane: str = None,
+        groups: Mapping[str, str] = None,
     ) -> asyncio.Task:
         """Start executing a coroutine as an async task, bypassing the pending queue.
 
@@ -286,6 +457,8 @@ class TaskQueue:
             task_complete: An optional callback to run on completion
             ident: A string identifier for the task
             timing: An optional dictionary of timing information
+            lane: The name of the priority lane for the task
+            groups: The concurrency groups of the task, by group kind
 
         Returns: the new asyncio task instance
 
@@ -301,10 +474,18 @@ class TaskQueue:
                 timing = {}
             coro = coro_timed(coro, timing)
         task = self.loop.create_task(coro)
-        return self.add_active(task, task_complete, ident, timing)
+        return self.add_active(
+            task, task_complete, ident, timing, lane=lane, groups=groups
+        )
 
     def put(
-        self, coro: Coroutine, task_complete: Callable = None, ident: str = None
+        self,
+        coro: Coroutine,
+        task_complete: Callable = None,
+        ident: str = None,
+        *,
+        lane: str = None,
+        groups: Mapping[str, str] = None,
     ) -> PendingTask:
         """Add a new task to the queue, delaying execution if busy.
 
@@ -312,15 +493,20 @@ class TaskQueue:
             coro: The coroutine to run
             task_complete: A callback to run on completion
             ident: A string identifier for the task
+            lane: The name of the priority lane for the task
+            groups: The concurrency groups of the task, by group kind,
+                such as `{"connection": connection_id}`
 
         Returns: a future resolving to the asyncio task instance once queued
 
         """
-        pending = PendingTask(coro, task_complete, ident)
+        pending = PendingTask(coro, task_complete, ident, lane=lane, groups=groups)
         if self._cancelled:
             pending.cancel()
-        elif self.ready:
-            pending.task = self.run(coro, task_complete, pending.ident)
+        elif self.ready and self._group_available(groups):
+            pending.task = self.run(
+                coro, task_complete, pending.ident, lane=pending.lane, groups=groups
+            )
         else:
             self.add_pending(pending)
         return pending
@@ -331,8 +517,12 @@ class TaskQueue:
         task_complete: Callable,
         ident: str,
         timing: dict = None,
+        *,
+        lane: str = None,
+        groups: Mapping[str, str] = None,
     ):
         """Clean up after a task has completed and run callbacks."""
+        self._update_groups(groups, -1)
         exc_info = task_exc_info(task)
         if exc_info:
             self.total_failed += 1
@@ -343,7 +533,7 @@ class TaskQueue:
         else:
             self.total_done += 1
         if task_complete or self._trace_fn:
-            completed = CompletedTask(task, exc_info, ident, timing)
+            completed = CompletedTask(task, exc_info, ident, timing, lane)
             try:
                 if task_complete:
                     task_complete(completed)
@@ -364,7 +554,8 @@ class TaskQueue:
             self._drain_task = None
         for pending in self.pending_tasks:
             pending.cancel()
-        self.pending_tasks = []
+        self._lanes = {}
+        self._pending_count = 0
 
     def cancel(self):
         """Cancel any pending or active tasks in the queue."""
@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+from .. import json_codec
+from ..json_codec import JsonCodec, OrjsonCodec
+
+CODECS = [JsonCodec()]
+if json_codec.orjson:
+    CODECS.append(OrjsonCodec())
+
+VALUE = {"@type": "message", "content": "café", "items": [1, 2.5, None, True]}
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+def test_round_trip(codec: JsonCodec):
+    encoded = codec.dumps(VALUE)
+    assert isinstance(encoded, str)
+    assert json.loads(encoded) == VALUE
+    assert codec.dumps_bytes(VALUE) == encoded.encode("utf-8")
+    for value in (encoded, encoded.encode("utf-8"), memoryview(encoded.encode())):
+        assert codec.loads(value) == VALUE
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+def test_standard_library_values(codec: JsonCodec):
+    assert codec.loads(codec.dumps({1: 2**70})) == {"1": 2**70}
+    for value in (2**64 - 1, 2**64 + 1, -(2**63) - 1, 10**30 + 1):
+        for encoded in (codec.dumps([value]), codec.dumps_bytes([value])):
+            decoded = codec.loads(encoded)[0]
+            assert isinstance(decoded, int) and decoded == value
+    assert codec.loads(b'["12345678901234567890123", 1.5]') == [
+        "12345678901234567890123",
+        1.5,
+    ]
+    assert codec.loads("[NaN]")[0] != codec.loads("[NaN]")[0]
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+def test_invalid(codec: JsonCodec):
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads(b"{")
+    with pytest.raises(TypeError):
+        codec.dumps(object())
+
+
+def test_set_codec():
+    default = json_codec.codec
+    try:
+        json_codec.set_codec(JsonCodec())
+        assert json_codec.dumps({"a": [1]}) == '{"a":[1]}'
+        assert json_codec.dumps_bytes({"a": [1]}) == b'{"a":[1]}'
+        assert json_codec.loads('{"a":[1]}') == {"a": [1]}
+    finally:
+        json_codec.set_codec(default)
+    assert json_codec.codec is default
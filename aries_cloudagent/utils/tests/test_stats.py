@@ -2,7 +2,7 @@ from tempfile import NamedTemporaryFile
 
 from unittest import IsolatedAsyncioTestCase
 
-from ..stats import Collector
+from ..stats import Collector, Histogram
 
 
 class TestStats(IsolatedAsyncioTestCase):
@@ -97,3 +97,21 @@ class TestStats(IsolatedAsyncioTestCase):
 
         stats.reset()
         assert not stats.results["avg"]
+
+    def test_histogram(self):
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+        assert histogram.serialize() == {
+            "buckets": {"le_0.1": 2, "le_1": 1, "inf": 1},
+            "count": 4,
+            "total": 2.65,
+        }
+
+        other = Histogram((0.1, 1.0))
+        other.observe(0.5)
+        histogram.merge(other)
+        assert histogram.serialize()["buckets"] == {"le_0.1": 2, "le_1": 2, "inf": 1}
+        assert histogram.count == 5
+        with self.assertRaises(ValueError):
+            histogram.merge(Histogram((1.0,)))
@@ -3,7 +3,13 @@ import asyncio
 from aries_cloudagent.tests import mock
 from unittest import IsolatedAsyncioTestCase
 
-from ..task_queue import CompletedTask, PendingTask, TaskQueue, task_exc_info
+from ..task_queue import (
+    CompletedTask,
+    PendingTask,
+    TaskQueue,
+    gather_keyed,
+    task_exc_info,
+)
 
 
 async def retval(val, *, delay=0):
@@ -227,3 +233,130 @@ class TestTaskQueue(IsolatedAsyncioTestCase):
         assert len(completed) == 2
         assert "queued" not in completed[0][1]
         assert "queued" in completed[1][1]
+
+    async def test_lanes_weighted(self):
+        started = []
+        release = asyncio.Event()
+
+        async def blocker():
+            await release.wait()
+
+        async def record(name):
+            started.append(name)
+
+        queue = TaskQueue(1, lane_weights={"priority": 2})
+        queue.run(blocker())
+        for i in range(4):
+            queue.put(record(f"bulk{i}"), lane="bulk")
+        for i in range(4):
+            queue.put(record(f"priority{i}"), lane="priority")
+        assert queue.pending_by_lane == {"bulk": 4, "priority": 4}
+        assert queue.lane_depth("priority") == 4
+        assert queue.lane_depth() == 0
+        assert queue.current_pending == 8
+
+        release.set()
+        await queue.flush()
+        assert started == [
+            "bulk0",
+            "priority0",
+            "priority1",
+            "bulk1",
+            "priority2",
+            "priority3",
+            "bulk2",
+            "bulk3",
+        ]
+
+    async def test_lane_idle_no_credit(self):
+        queue = TaskQueue(1)
+        release = asyncio.Event()
+        started = []
+
+        async def blocker():
+            await release.wait()
+
+        async def record(name):
+            started.append(name)
+
+        queue.run(blocker())
+        for i in range(3):
+            queue.put(record(f"a{i}"), lane="a")
+        release.set()
+        await queue.flush()
+
+        release.clear()
+        queue.run(blocker())
+        for i in range(2):
+            queue.put(record(f"a{i + 3}"), lane="a")
+        for i in range(2):
+            queue.put(record(f"b{i}"), lane="b")
+        release.set()
+        await queue.flush()
+        # lane "b" joins at the current pass instead of running all its tasks first
+        assert started[3:] == ["b0", "a3", "b1", "a4"]
+
+    async def test_group_limits(self):
+        active = {}
+        peak = {}
+
+        async def work(conn):
+            active[conn] = active.get(conn, 0) + 1
+            peak[conn] = max(peak.get(conn, 0), active[conn])
+            await asyncio.sleep(0.01)
+            active[conn] -= 1
+            return conn
+
+        queue = TaskQueue(4, group_limits={"connection": 1, "tenant": 0})
+        pending = [
+            queue.put(work(conn), groups={"connection": conn, "tenant": "t"})
+            for conn in ("a", "a", "a", "b")
+        ]
+        assert queue.current_active == 2
+        assert queue.current_pending == 2
+        await queue.flush()
+        assert peak == {"a": 1, "b": 1}
+        assert [p.task.result() for p in pending] == ["a", "a", "a", "b"]
+        assert not queue._group_active
+
+    async def test_cancel_pending_lanes(self):
+        queue = TaskQueue(1)
+        sleep = queue.run(retval(1, delay=1))
+        pend = queue.put(retval(2), lane="priority")
+        queue.cancel_pending()
+        assert pend.cancelled
+        assert queue.current_pending == 0
+        assert not queue.pending_tasks
+        sleep.cancel()
+        await queue.flush()
+
+    async def test_gather_keyed(self):
+        active = []
+        peak = []
+
+        async def fetch(key):
+            active.append(key)
+            peak.append(len(active))
+            await asyncio.sleep(0.01)
+            active.remove(key)
+            return key * 2
+
+        result = await gather_keyed(fetch, [3, 1, 2, 3, 1], limit=2)
+        assert result == {3: 6, 1: 2, 2: 4}
+        assert list(result) == [3, 1, 2]
+        assert max(peak) == 2
+
+        assert await gather_keyed(fetch, []) == {}
+
+    async def test_gather_keyed_x(self):
+        started = []
+
+        async def fetch(key):
+            started.append(key)
+            if key == "bad":
+                raise ValueError(key)
+            await asyncio.sleep(5)
+
+        with self.assertRaises(ValueError):
+            await asyncio.wait_for(gather_keyed(fetch, ["slow", "bad"]), 1)
+        assert started == ["slow", "bad"]
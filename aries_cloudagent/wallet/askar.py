@@ -1,10 +1,9 @@
 """Aries-Askar implementation of BaseWallet interface."""
 
-import asyncio
 import json
 import logging
 
-from typing import List, Sequence, Tuple, Union
+from typing import List, Optional, Sequence, Tuple, Union
 
 from aries_askar import (
     AskarError,
@@ -17,6 +16,7 @@ from aries_askar import (
 
 from .did_parameters_validation import DIDParametersValidation
 from ..askar.didcomm.v1 import pack_message, unpack_message
+from ..askar.key_cache import AskarKeyCache
 from ..askar.profile import AskarProfileSession
 from ..ledger.base import BaseLedger
 from ..ledger.endpoint_type import EndpointType
@@ -30,6 +30,7 @@ from .crypto import (
     validate_seed,
     verify_signed_message,
 )
+from .crypto_pool import CryptoWorkerPool, run_crypto
 from .did_method import SOV, DIDMethod, DIDMethods
 from .error import WalletError, WalletDuplicateError, WalletNotFoundError
 from .key_type import BLS12381G2, ED25519, KeyType, KeyTypes
@@ -539,6 +540,7 @@ class AskarWallet(BaseWallet):
             if not next_verkey:
                 raise WalletError("Cannot rotate DID key: no next key established")
             del metadata["next_verkey"]
+            prev_verkey = entry_val["verkey"]
             entry_val["verkey"] = next_verkey
             item.tags["verkey"] = next_verkey
             await self._session.handle.replace(
@@ -547,6 +549,10 @@ class AskarWallet(BaseWallet):
         except AskarError as err:
             raise WalletError("Error updating DID metadata") from err
 
+        key_cache = self._session.inject_or(AskarKeyCache)
+        if key_cache is not None:
+            key_cache.remove(key_cache.scope_for(self._session.profile), prev_verkey)
+
     async def sign_message(
         self, message: Union[List[bytes], bytes], from_verkey: str
     ) -> bytes:
@@ -570,10 +576,9 @@ class AskarWallet(BaseWallet):
         if not from_verkey:
             raise WalletError("Verkey not provided")
         try:
-            keypair = await self._session.handle.fetch_key(from_verkey)
-            if not keypair:
+            key = await self._fetch_key(from_verkey)
+            if not key:
                 raise WalletNotFoundError("Missing key for sign operation")
-            key = keypair.key
             if key.algorithm == KeyAlg.BLS12_381_G2:
                 # for now - must extract the key and use sign_message
                 return sign_message(
@@ -637,12 +642,15 @@ class AskarWallet(BaseWallet):
         )
 
     async def pack_message(
-        self, message: str, to_verkeys: Sequence[str], from_verkey: str = None
+        self,
+        message: Union[str, bytes],
+        to_verkeys: Sequence[str],
+        from_verkey: str = None,
     ) -> bytes:
         """Pack a message for one or more recipients.
 
         Args:
-            message: The message to pack
+            message: The message to pack, as text or UTF-8 encoded bytes
             to_verkeys: List of verkeys for which to pack
             from_verkey: Sender verkey from which to pack
 
@@ -658,14 +666,17 @@ class AskarWallet(BaseWallet):
             raise WalletError("Message not provided")
         try:
             if from_verkey:
-                from_key_entry = await self._session.handle.fetch_key(from_verkey)
-                if not from_key_entry:
+                from_key = await self._fetch_key(from_verkey)
+                if not from_key:
                     raise WalletNotFoundError("Missing key for pack operation")
-                from_key = from_key_entry.key
             else:
                 from_key = None
-            return await asyncio.get_event_loop().run_in_executor(
-                None, pack_message, to_verkeys, from_key, message
+            return await run_crypto(
+                self._session.inject_or(CryptoWorkerPool),
+                pack_message,
+                to_verkeys,
+                from_key,
+                message,
             )
         except AskarError as err:
             raise WalletError("Exception when packing message") from err
@@ -691,11 +702,24 @@ class AskarWallet(BaseWallet):
                 unpacked_json,
                 recipient,
                 sender,
-            ) = await unpack_message(self._session.handle, enc_message)
+            ) = await unpack_message(
+                self._session.handle,
+                enc_message,
+                self._session.inject_or(CryptoWorkerPool),
+                self._fetch_key,
+            )
         except AskarError as err:
             raise WalletError("Exception when unpacking message") from err
         return unpacked_json.decode("utf-8"), sender, recipient
 
+    async def _fetch_key(self, verkey: str) -> Optional[Key]:
+        """Fetch a local key handle, using the key cache if enabled."""
+        key_cache = self._session.inject_or(AskarKeyCache)
+        if key_cache is not None:
+            return await key_cache.fetch(self._session, verkey)
+        entry = await self._session.handle.fetch_key(verkey)
+        return entry and entry.key
+
     def _load_did_entry(self, entry: Entry) -> DIDInfo:
         """Convert a DID record into the expected DIDInfo format."""
         did_info = entry.value_json
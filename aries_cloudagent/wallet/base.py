@@ -275,12 +275,15 @@ class BaseWallet(ABC):
 
     @abstractmethod
     async def pack_message(
-        self, message: str, to_verkeys: Sequence[str], from_verkey: str = None
+        self,
+        message: Union[str, bytes],
+        to_verkeys: Sequence[str],
+        from_verkey: str = None,
     ) -> bytes:
         """Pack a message for one or more recipients.
 
         Args:
-            message: The message to pack
+            message: The message to pack, as text or UTF-8 encoded bytes
             to_verkeys: The verkeys to pack the message for
             from_verkey: The sender verkey
 
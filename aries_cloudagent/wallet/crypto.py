@@ -290,12 +290,12 @@ def ed25519_pk_to_curve25519(public_key: bytes) -> bytes:
 
 
 def encrypt_plaintext(
-    message: str, add_data: bytes, key: bytes
+    message: Union[str, bytes], add_data: bytes, key: bytes
 ) -> Tuple[bytes, bytes, bytes]:
     """Encrypt the payload of a packed message.
 
     Args:
-        message: Message to encrypt
+        message: Message to encrypt, as text or UTF-8 encoded bytes
         add_data:
         key: Key used for encryption
 
@@ -304,11 +304,11 @@ def encrypt_plaintext(
 
     """
     nonce = nacl.utils.random(nacl.bindings.crypto_aead_chacha20poly1305_ietf_NPUBBYTES)
-    message_bin = message.encode("utf-8")
+    message_bin = message.encode("utf-8") if isinstance(message, str) else message
     output = nacl.bindings.crypto_aead_chacha20poly1305_ietf_encrypt(
         message_bin, add_data, nonce, key
     )
-    mlen = len(message)
+    mlen = len(message_bin)
     ciphertext = output[:mlen]
     tag = output[mlen:]
     return ciphertext, nonce, tag
@@ -336,12 +336,12 @@ def decrypt_plaintext(
 
 
 def encode_pack_message(
-    message: str, to_verkeys: Sequence[bytes], from_secret: bytes = None
+    message: Union[str, bytes], to_verkeys: Sequence[bytes], from_secret: bytes = None
 ) -> bytes:
     """Assemble a packed message for a set of recipients, optionally including the sender.
 
     Args:
-        message: The message to pack
+        message: The message to pack, as text or UTF-8 encoded bytes
         to_verkeys: The verkeys to pack the message for
         from_secret: The sender secret
 
@@ -0,0 +1,172 @@
+"""Worker pool for CPU-bound DIDComm envelope operations."""
+
+import asyncio
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Optional, Sequence, Tuple
+
+from ..utils.stats import Collector
+
+
+def _run_batch(jobs: Sequence[Tuple[Callable, tuple]]) -> Sequence[Tuple[bool, Any]]:
+    """Run a batch of jobs in a worker thread, capturing each result or error."""
+    results = []
+    for fn, args in jobs:
+        try:
+            results.append((True, fn(*args)))
+        except Exception as err:
+            results.append((False, err))
+    return results
+
+
+class CryptoWorkerPool:
+    """Run CPU-bound envelope work on a pool of worker threads.
+
+    Jobs submitted while every worker is busy are queued, and handed to the
+    next free worker in batches of up to `batch_size`, so that a burst of
+    messages costs fewer thread hand-offs. Once `max_pending` jobs are queued
+    or running, further callers wait for the backlog to drain.
+
+    Threads are used rather than processes: the Askar and nacl bindings
+    release the GIL in native crypto calls, and wallet key handles cannot be
+    passed to another process.
+    """
+
+    def __init__(
+        self,
+        workers: int = None,
+        *,
+        batch_size: int = 8,
+        max_pending: int = 1000,
+        collector: Collector = None,
+    ):
+        """Initialize a `CryptoWorkerPool` instance.
+
+        Args:
+            workers: the number of worker threads, by default up to four
+            batch_size: the maximum number of jobs handed to a worker at once
+            max_pending: the maximum number of jobs queued or running
+            collector: an optional stats collector for pool utilization
+
+        """
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.batch_size = max(batch_size, 1)
+        self.max_pending = max(max_pending, 1)
+        self.collector = collector
+        self._executor: ThreadPoolExecutor = None
+        self._pending: Deque[Tuple[Callable, tuple, asyncio.Future]] = deque()
+        self._active = 0
+        self._slots: asyncio.Semaphore = None
+
+    @property
+    def active(self) -> int:
+        """Accessor for the number of workers running a batch."""
+        return self._active
+
+    @property
+    def pending(self) -> int:
+        """Accessor for the number of jobs waiting for a worker."""
+        return len(self._pending)
+
+    @property
+    def utilization(self) -> float:
+        """Accessor for the fraction of workers running a batch."""
+        return self._active / self.workers
+
+    async def run(self, fn: Callable, *args) -> Any:
+        """Run a function on a worker thread and return its result.
+
+        Args:
+            fn: the function to run, which must not touch the event loop
+            args: positional arguments for the function
+
+        """
+        if not self._slots:
+            self._slots = asyncio.Semaphore(self.max_pending)
+        async with self._slots:
+            future = asyncio.get_event_loop().create_future()
+            self._pending.append((fn, args, future))
+            self._dispatch()
+            return await future
+
+    def _dispatch(self):
+        """Hand queued jobs to idle workers."""
+        loop = asyncio.get_event_loop()
+        if not self._executor:
+            self._executor = ThreadPoolExecutor(
+                self.workers, thread_name_prefix="acapy-crypto"
+            )
+        while self._pending and self._active < self.workers:
+            # spread the backlog across the idle workers
+            idle = self.workers - self._active
+            count = min(self.batch_size, -(-len(self._pending) // idle))
+            batch = []
+            while self._pending and len(batch) < count:
+                job = self._pending.popleft()
+                # skip jobs whose callers have given up
+                if not job[2].done():
+                    batch.append(job)
+            if not batch:
+                break
+            self._active += 1
+            handoff = loop.run_in_executor(
+                self._executor, _run_batch, [(fn, args) for fn, args, _ in batch]
+            )
+            handoff.add_done_callback(
+                lambda done, batch=batch: self._batch_done(batch, done)
+            )
+        self.log_usage()
+
+    def _batch_done(self, batch: Sequence[tuple], done: asyncio.Future):
+        """Deliver the results of a batch and dispatch further jobs."""
+        self._active -= 1
+        if done.cancelled():
+            results = [(False, asyncio.CancelledError())] * len(batch)
+        elif done.exception():
+            results = [(False, done.exception())] * len(batch)
+        else:
+            results = done.result()
+        for (_, _, future), (ok, value) in zip(batch, results):
+            if future.done():
+                continue
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+        if self._pending:
+            self._dispatch()
+        else:
+            self.log_usage()
+
+    def log_usage(self):
+        """Report pool utilization and queue depth to the stats collector."""
+        if self.collector:
+            self.collector.log("CryptoWorkerPool:utilization", self.utilization)
+            self.collector.log("CryptoWorkerPool:queued", len(self._pending))
+
+    def shutdown(self):
+        """Stop the worker threads once running batches complete."""
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def __repr__(self) -> str:
+        """Human readable representation of this instance."""
+        return "<{} workers={} active={} pending={}>".format(
+            self.__class__.__name__, self.workers, self._active, len(self._pending)
+        )
+
+
+async def run_crypto(pool: Optional[CryptoWorkerPool], fn: Callable, *args) -> Any:
+    """Run envelope work on the worker pool, or the default executor without one.
+
+    Args:
+        pool: the worker pool, if configured
+        fn: the function to run
+        args: positional arguments for the function
+
+    """
+    if pool:
+        return await pool.run(fn, *args)
+    return await asyncio.get_event_loop().run_in_executor(None, fn, *args)
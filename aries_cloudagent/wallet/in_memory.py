@@ -1,6 +1,5 @@
 """In-memory implementation of BaseWallet interface."""
 
-import asyncio
 from typing import List, Sequence, Tuple, Union
 
 from .did_parameters_validation import DIDParametersValidation
@@ -15,6 +14,7 @@ from .crypto import (
     encode_pack_message,
     decode_pack_message,
 )
+from .crypto_pool import CryptoWorkerPool, run_crypto
 from .did_info import KeyInfo, DIDInfo
 from .did_posture import DIDPosture
 from .did_method import DIDMethod, DIDMethods
@@ -449,12 +449,15 @@ class InMemoryWallet(BaseWallet):
         return verified
 
     async def pack_message(
-        self, message: str, to_verkeys: Sequence[str], from_verkey: str = None
+        self,
+        message: Union[str, bytes],
+        to_verkeys: Sequence[str],
+        from_verkey: str = None,
     ) -> bytes:
         """Pack a message for one or more recipients.
 
         Args:
-            message: The message to pack
+            message: The message to pack, as text or UTF-8 encoded bytes
             to_verkeys: List of verkeys for which to pack
             from_verkey: Sender verkey from which to pack
 
@@ -470,8 +473,12 @@ class InMemoryWallet(BaseWallet):
 
         keys_bin = [b58_to_bytes(key) for key in to_verkeys]
         secret = self._get_private_key(from_verkey) if from_verkey else None
-        result = await asyncio.get_event_loop().run_in_executor(
-            None, encode_pack_message, message, keys_bin, secret
+        result = await run_crypto(
+            self.profile.inject_or(CryptoWorkerPool),
+            encode_pack_message,
+            message,
+            keys_bin,
+            secret,
         )
         return result
 
@@ -496,8 +503,11 @@ class InMemoryWallet(BaseWallet):
                 message,
                 from_verkey,
                 to_verkey,
-            ) = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: decode_pack_message(enc_message, self._get_private_key)
+            ) = await run_crypto(
+                self.profile.inject_or(CryptoWorkerPool),
+                decode_pack_message,
+                enc_message,
+                self._get_private_key,
             )
         except ValueError as e:
             raise WalletError("Message could not be unpacked: {}".format(str(e)))
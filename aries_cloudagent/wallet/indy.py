@@ -850,12 +850,15 @@ class IndySdkWallet(BaseWallet):
             )
 
     async def pack_message(
-        self, message: str, to_verkeys: Sequence[str], from_verkey: str = None
+        self,
+        message: Union[str, bytes],
+        to_verkeys: Sequence[str],
+        from_verkey: str = None,
     ) -> bytes:
         """Pack a message for one or more recipients.
 
         Args:
-            message: The message to pack
+            message: The message to pack, as text or UTF-8 encoded bytes
             to_verkeys: List of verkeys for which to pack
             from_verkey: Sender verkey from which to pack
 
@@ -869,6 +872,9 @@ class IndySdkWallet(BaseWallet):
         """
         if message is None:
             raise WalletError("Message not provided")
+        if isinstance(message, bytes):
+            # libindy encodes the message text itself
+            message = message.decode("utf-8")
         try:
             result = await indy.crypto.pack_message(
                 self.opened.handle, message, to_verkeys, from_verkey
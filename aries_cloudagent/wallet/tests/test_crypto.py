@@ -176,3 +176,13 @@ class TestCrypto(TestCase):
                 [b"message1", b"message2"], b"signature", b"verkey", BLS12381G1
             )
         assert "Unsupported key type: bls12381g1" in str(context.exception)
+
+    def test_encrypt_plaintext(self):
+        key = test_module.nacl.bindings.crypto_secretstream_xchacha20poly1305_keygen()
+        for message in ("Grüße", "Grüße".encode("utf-8")):
+            ciphertext, nonce, tag = test_module.encrypt_plaintext(message, b"aad", key)
+            assert len(tag) == 16
+            assert (
+                test_module.decrypt_plaintext(ciphertext + tag, b"aad", nonce, key)
+                == "Grüße"
+            )
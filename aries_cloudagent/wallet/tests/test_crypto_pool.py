@@ -0,0 +1,116 @@
+import asyncio
+import threading
+
+import pytest
+
+from unittest import mock
+
+from ...utils.stats import Collector
+from .. import crypto_pool as test_module
+from ..crypto_pool import CryptoWorkerPool, run_crypto
+
+
+@pytest.fixture()
+def pool():
+    pool = CryptoWorkerPool(2, batch_size=4, max_pending=16)
+    yield pool
+    pool.shutdown()
+
+
+class TestCryptoWorkerPool:
+    @pytest.mark.asyncio
+    async def test_run(self, pool):
+        assert await pool.run(sum, [1, 2, 3]) == 6
+        assert pool.active == 0 and pool.pending == 0
+        assert "workers=2" in repr(pool)
+
+    @pytest.mark.asyncio
+    async def test_run_off_loop(self, pool):
+        main = threading.get_ident()
+        assert await pool.run(threading.get_ident) != main
+
+    @pytest.mark.asyncio
+    async def test_error(self, pool):
+        def fail():
+            raise ValueError("bad envelope")
+
+        results = await asyncio.gather(
+            pool.run(fail), pool.run(str, 1), return_exceptions=True
+        )
+        assert isinstance(results[0], ValueError)
+        assert results[1] == "1"
+
+    @pytest.mark.asyncio
+    async def test_batching(self, pool):
+        release = threading.Event()
+        blockers = [asyncio.ensure_future(pool.run(release.wait, 5)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        assert pool.utilization == 1.0
+
+        jobs = [asyncio.ensure_future(pool.run(int, i)) for i in range(8)]
+        await asyncio.sleep(0.01)
+        assert pool.pending == 8
+
+        with mock.patch.object(
+            test_module, "_run_batch", wraps=test_module._run_batch
+        ) as run:
+            release.set()
+            assert await asyncio.gather(*jobs) == list(range(8))
+        await asyncio.gather(*blockers)
+        # each worker picked up the queued jobs in a single hand-off
+        assert run.call_count == 2
+        assert [len(c.args[0]) for c in run.call_args_list] == [4, 4]
+
+    @pytest.mark.asyncio
+    async def test_back_pressure(self):
+        pool = CryptoWorkerPool(1, max_pending=2)
+        release = threading.Event()
+        try:
+            running = [
+                asyncio.ensure_future(pool.run(release.wait, 5)) for _ in range(2)
+            ]
+            waiting = asyncio.ensure_future(pool.run(str, 1))
+            await asyncio.sleep(0.01)
+            # the third job is held before it is queued
+            assert pool.pending == 1
+            assert not waiting.done()
+            release.set()
+            await asyncio.gather(*running)
+            assert await waiting == "1"
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_job_skipped(self):
+        pool = CryptoWorkerPool(1)
+        release = threading.Event()
+        calls = []
+        try:
+            running = asyncio.ensure_future(pool.run(release.wait, 5))
+            cancelled = asyncio.ensure_future(pool.run(calls.append, 1))
+            await asyncio.sleep(0.01)
+            cancelled.cancel()
+            await asyncio.sleep(0)
+            release.set()
+            await running
+            assert await pool.run(calls.append, 2) is None
+            assert calls == [2]
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_collector(self):
+        collector = Collector()
+        pool = CryptoWorkerPool(2, collector=collector)
+        try:
+            await pool.run(str, 1)
+        finally:
+            pool.shutdown()
+        results = collector.results["avg"]
+        assert "CryptoWorkerPool:utilization" in results
+        assert "CryptoWorkerPool:queued" in results
+
+    @pytest.mark.asyncio
+    async def test_run_crypto(self, pool):
+        assert await run_crypto(pool, str, 1) == "1"
+        assert await run_crypto(None, str, 2) == "2"
@@ -17,6 +17,7 @@ from ...indy.sdk.profile import IndySdkProfile, IndySdkProfileManager
 from ...indy.sdk.wallet_setup import IndyWalletConfig
 from ...ledger.endpoint_type import EndpointType
 from ...ledger.indy import IndySdkLedgerPool
+from ...transport.pack_format import PackWireFormat
 from ...wallet.did_method import SOV, DIDMethods
 from ...wallet.key_type import ED25519
 from .. import indy as test_module
@@ -264,6 +265,7 @@ class TestIndySdkWallet(test_in_memory_wallet.TestInMemoryWallet):
                     ],
                 )
             assert "outlier" in str(excinfo.value)
+            assert mock_pack.call_args[0][1] == "hello world"
 
 
 @pytest.mark.indy
@@ -296,6 +298,32 @@ class TestWalletCompat:
         unpacked, from_vk, to_vk = await wallet.unpack_message(py_packed)
         assert self.test_message == unpacked
 
+    @pytest.mark.asyncio
+    async def test_pack_routed_message(self, in_memory_wallet, wallet: IndySdkWallet):
+        """Ensure that messages sent through mediators are packed by indy-sdk."""
+        sender = await wallet.create_local_did(SOV, ED25519, self.test_seed)
+        recipient = await in_memory_wallet.create_signing_key(ED25519)
+        router = await in_memory_wallet.create_signing_key(ED25519)
+        session = mock.MagicMock(inject_or=mock.MagicMock(return_value=wallet))
+
+        packed = await PackWireFormat().pack(
+            session,
+            self.test_message,
+            [recipient.verkey],
+            [router.verkey],
+            sender.verkey,
+        )
+
+        forward, _, to_vk = await in_memory_wallet.unpack_message(packed)
+        assert to_vk == router.verkey
+        forward = json.loads(forward)
+        assert forward["to"] == recipient.verkey
+        unpacked, from_vk, to_vk = await in_memory_wallet.unpack_message(
+            json.dumps(forward["msg"]).encode("utf-8")
+        )
+        assert unpacked == self.test_message
+        assert (from_vk, to_vk) == (sender.verkey, recipient.verkey)
+
     @pytest.mark.asyncio
     async def test_mock_coverage(self):
         """
@@ -0,0 +1,136 @@
+"""Benchmark selecting resolvers for DIDs with the default resolvers loaded.
+
+Compares the previous selection, which awaited `supports` on every registered
+resolver, with the dispatch index built when resolvers are registered. Also
+times complete resolutions of a did:key, including the resolver cache.
+
+Run from the repository root:
+
+    python scripts/benchmarks/did_resolution.py [--rounds N]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from itertools import chain
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from did_peer_2 import KeySpec, generate  # noqa: E402
+
+from aries_cloudagent.cache.base import BaseCache  # noqa: E402
+from aries_cloudagent.cache.in_memory import InMemoryCache  # noqa: E402
+from aries_cloudagent.core.in_memory import InMemoryProfile  # noqa: E402
+from aries_cloudagent.protocols.coordinate_mediation.v1_0.route_manager import (  # noqa: E402
+    RouteManager,
+)
+from aries_cloudagent.protocols.coordinate_mediation.v1_0.route_manager_provider import (  # noqa: E402
+    RouteManagerProvider,
+)
+from aries_cloudagent.resolver.default.jwk import JwkDIDResolver  # noqa: E402
+from aries_cloudagent.resolver.default.key import KeyDIDResolver  # noqa: E402
+from aries_cloudagent.resolver.default.legacy_peer import (  # noqa: E402
+    LegacyPeerDIDResolver,
+)
+from aries_cloudagent.resolver.default.peer1 import PeerDID1Resolver  # noqa: E402
+from aries_cloudagent.resolver.default.peer2 import PeerDID2Resolver  # noqa: E402
+from aries_cloudagent.resolver.default.peer3 import PeerDID3Resolver  # noqa: E402
+from aries_cloudagent.resolver.default.web import WebDIDResolver  # noqa: E402
+from aries_cloudagent.resolver.base import DIDMethodNotSupported  # noqa: E402
+from aries_cloudagent.resolver.did_resolver import DIDResolver  # noqa: E402
+from aries_cloudagent.wallet.util import bytes_to_b58  # noqa: E402
+
+RESOLVERS = (
+    LegacyPeerDIDResolver,
+    KeyDIDResolver,
+    JwkDIDResolver,
+    WebDIDResolver,
+    PeerDID1Resolver,
+    PeerDID2Resolver,
+    PeerDID3Resolver,
+)
+
+
+class ScanningDIDResolver(DIDResolver):
+    """DID resolver selecting resolvers the way it did before."""
+
+    async def _match_did_to_resolver(self, profile, did):
+        valid_resolvers = [
+            resolver
+            for resolver in self.resolvers
+            if await resolver.supports(profile, did)
+        ]
+        return list(
+            chain(
+                filter(lambda resolver: resolver.native, valid_resolvers),
+                filter(lambda resolver: not resolver.native, valid_resolvers),
+            )
+        )
+
+
+async def select(registry: DIDResolver, profile, did: str):
+    """Select resolvers for a DID, allowing for DIDs no resolver supports."""
+    try:
+        return await registry._match_did_to_resolver(profile, did)
+    except DIDMethodNotSupported:
+        return []
+
+
+async def timed(rounds: int, fn, *args) -> float:
+    """Time an awaitable function call in microseconds."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await fn(*args)
+    return (time.perf_counter() - start) * 1e6 / rounds
+
+
+async def run(rounds: int):
+    """Run the benchmark."""
+    profile = InMemoryProfile.test_profile()
+    profile.context.injector.bind_instance(BaseCache, InMemoryCache())
+    profile.context.injector.bind_provider(
+        RouteManager, RouteManagerProvider(profile)
+    )
+    dids = {
+        "did:key": "did:key:z6MkpTHR8VNsBxYAAWHut2Geadd9jSwuBV8xRoAnwWsdvktH",
+        "did:peer:2": generate(
+            [KeySpec.verification(f"z{bytes_to_b58(b'0' * 34)}")], []
+        ),
+        "did:sov": "did:sov:WgWxqztrNooG92RXvxSTWv",
+        "did:web": "did:web:example.com",
+    }
+
+    registries = (ScanningDIDResolver(), DIDResolver())
+    for registry in registries:
+        for resolver_cls in RESOLVERS:
+            registry.register_resolver(resolver_cls())
+
+    print(f"{rounds} rounds, {len(RESOLVERS)} resolvers registered")
+    print(f"{'selection':<12} {'scan (us)':>10} {'index (us)':>11} {'speedup':>8}")
+    for name, did in dids.items():
+        timings = [
+            await timed(rounds, select, registry, profile, did)
+            for registry in registries
+        ]
+        print(
+            f"{name:<12} {timings[0]:>10.1f} {timings[1]:>11.1f} "
+            f"{timings[0] / timings[1]:>7.2f}x"
+        )
+
+    timings = [
+        await timed(rounds, registry.resolve, profile, dids["did:key"])
+        for registry in registries
+    ]
+    print(
+        f"{'resolve key':<12} {timings[0]:>10.1f} {timings[1]:>11.1f} "
+        f"{timings[0] / timings[1]:>7.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(run(args.rounds))
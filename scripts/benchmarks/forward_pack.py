@@ -0,0 +1,84 @@
+"""Benchmark packing a message for delivery through 1-3 mediators.
+
+Compares the previous forward wrapping, which parsed and re-serialized each
+inner envelope, with splicing the inner envelope into the forward message.
+
+Run from the repository root:
+
+    python scripts/benchmarks/forward_pack.py [--size KB] [--rounds N]
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from aries_cloudagent.core.in_memory import InMemoryProfile  # noqa: E402
+from aries_cloudagent.protocols.routing.v1_0.messages.forward import (  # noqa: E402
+    Forward,
+)
+from aries_cloudagent.transport.pack_format import PackWireFormat  # noqa: E402
+from aries_cloudagent.wallet.base import BaseWallet  # noqa: E402
+from aries_cloudagent.wallet.key_type import ED25519  # noqa: E402
+
+
+class ParsingPackWireFormat(PackWireFormat):
+    """Pack format wrapping forwards the way it did before."""
+
+    async def pack(self, session, message_json, recipient_keys, routing_keys, sender):
+        """Pack a message, parsing each envelope to wrap it in a forward."""
+        wallet = session.inject(BaseWallet)
+        message = await wallet.pack_message(message_json, recipient_keys, sender)
+        recip_keys = recipient_keys
+        for router_key in routing_keys:
+            message = json.loads(message.decode("utf-8"))
+            fwd_msg = Forward(to=recip_keys[0], msg=message)
+            recip_keys = [router_key]
+            message = await wallet.pack_message(fwd_msg.to_json(), recip_keys)
+        return message
+
+
+async def run(size: int, rounds: int):
+    """Run the benchmark."""
+    profile = InMemoryProfile.test_profile()
+    async with profile.session() as session:
+        wallet = session.inject(BaseWallet)
+        sender = await wallet.create_signing_key(ED25519)
+        recip = await wallet.create_signing_key(ED25519)
+        routers = [(await wallet.create_signing_key(ED25519)).verkey for _ in range(3)]
+        message = json.dumps(
+            {
+                "@type": "https://didcomm.org/basicmessage/1.0/message",
+                "@id": "benchmark",
+                "content": base64.b64encode(os.urandom(size * 1024)).decode(),
+            }
+        )
+
+        print(f"payload {len(message) // 1024} KiB, {rounds} rounds")
+        print(f"{'hops':>4} {'parsed (ms)':>12} {'spliced (ms)':>13} {'speedup':>8}")
+        for hops in (1, 2, 3):
+            timings = []
+            for fmt in (ParsingPackWireFormat(), PackWireFormat()):
+                start = time.perf_counter()
+                for _ in range(rounds):
+                    await fmt.pack(
+                        session, message, [recip.verkey], routers[:hops], sender.verkey
+                    )
+                timings.append((time.perf_counter() - start) * 1000 / rounds)
+            print(
+                f"{hops:>4} {timings[0]:>12.2f} {timings[1]:>13.2f} "
+                f"{timings[0] / timings[1]:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=512, help="attachment size (KB)")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.size, args.rounds))
@@ -0,0 +1,165 @@
+"""Benchmark loading the default plugins at startup, eagerly and lazily.
+
+Each round builds the default context in a new interpreter, so that every
+module is imported as it would be at startup. The time to import and register
+each plugin, and to set up its protocols, is reported for eager loading and
+for lazy loading (--lazy-load-plugins), followed by the time to register
+protocol events, to build the whole context, and to register admin routes.
+
+Run from the repository root:
+
+    python scripts/benchmarks/plugin_startup.py [--rounds N]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from aiohttp import web  # noqa: E402
+
+from aries_cloudagent.config import default_context  # noqa: E402
+from aries_cloudagent.core.plugin_registry import PluginRegistry  # noqa: E402
+
+PREFIX = "aries_cloudagent."
+
+
+class TimedPluginRegistry(PluginRegistry):
+    """Plugin registry recording the time taken to load each plugin."""
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the registry and its timings."""
+        super().__init__(*args, **kwargs)
+        self.timings = defaultdict(dict)
+        self.modules = {}
+
+    def register_plugin(self, module_name: str):
+        """Register a plugin module, recording its import time."""
+        count = len(sys.modules)
+        start = time.perf_counter()
+        mod = super().register_plugin(module_name)
+        name = module_name.replace(PREFIX, "")
+        self.timings[name]["import"] = time.perf_counter() - start
+        self.modules[name] = len(sys.modules) - count
+        return mod
+
+    async def init_context(self, context):
+        """Set up each plugin as `PluginRegistry` does, recording setup times."""
+        for name, plugin in self._plugins.items():
+            start = time.perf_counter()
+            if hasattr(plugin, "setup"):
+                await plugin.setup(context)
+            else:
+                await self.load_protocols(context, plugin)
+            self.timings[name.replace(PREFIX, "")]["setup"] = (
+                time.perf_counter() - start
+            )
+        start = time.perf_counter()
+        self.register_protocol_events(context)
+        self.events = time.perf_counter() - start
+
+
+async def measure(lazy: bool) -> dict:
+    """Build the default context and time loading its plugins."""
+    default_context.PluginRegistry = TimedPluginRegistry
+    builder = default_context.DefaultContextBuilder(
+        settings={"lazy_load_plugins": lazy, "wallet.type": "askar"}
+    )
+    count = len(sys.modules)
+    start = time.perf_counter()
+    context = await builder.build_context()
+    build = time.perf_counter() - start
+    registry = context.inject(TimedPluginRegistry)
+    build_modules = len(sys.modules) - count
+
+    start = time.perf_counter()
+    await registry.register_admin_routes(web.Application())
+    admin = time.perf_counter() - start
+
+    return {
+        "plugins": registry.timings,
+        "modules": registry.modules,
+        "events": registry.events,
+        "build": build,
+        "build_modules": build_modules,
+        "admin": admin,
+        "admin_modules": len(sys.modules) - count - build_modules,
+    }
+
+
+def measure_in_subprocess(lazy: bool) -> dict:
+    """Time loading plugins in a new interpreter."""
+    output = subprocess.run(
+        [sys.executable, __file__, "--measure", "lazy" if lazy else "eager"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def mean(results: list, *keys) -> float:
+    """Average a timing over rounds, in milliseconds."""
+    total = 0.0
+    for result in results:
+        value = result
+        for key in keys:
+            value = value.get(key, 0.0)
+        total += value
+    return total * 1000 / len(results)
+
+
+def run(rounds: int):
+    """Run the benchmark."""
+    eager = []
+    lazy = []
+    for _ in range(rounds):
+        eager.append(measure_in_subprocess(False))
+        lazy.append(measure_in_subprocess(True))
+
+    print(f"{rounds} rounds, times in ms, modules imported in the first round")
+    print(
+        f"{'plugin':<42} {'import':>7} {'lazy':>7} {'setup':>7} {'lazy':>7} "
+        f"{'modules':>8} {'lazy':>5}"
+    )
+    for name in eager[0]["plugins"]:
+        print(
+            f"{name:<42} {mean(eager, 'plugins', name, 'import'):>7.1f} "
+            f"{mean(lazy, 'plugins', name, 'import'):>7.1f} "
+            f"{mean(eager, 'plugins', name, 'setup'):>7.1f} "
+            f"{mean(lazy, 'plugins', name, 'setup'):>7.1f} "
+            f"{eager[0]['modules'][name]:>8} {lazy[0]['modules'][name]:>5}"
+        )
+    print()
+    print(f"{'step':<22} {'eager':>8} {'lazy':>8} {'modules':>8} {'lazy':>5}")
+    print(
+        f"{'register events':<22} {mean(eager, 'events'):>8.1f} "
+        f"{mean(lazy, 'events'):>8.1f}"
+    )
+    print(
+        f"{'build context':<22} {mean(eager, 'build'):>8.1f} "
+        f"{mean(lazy, 'build'):>8.1f} {eager[0]['build_modules']:>8} "
+        f"{lazy[0]['build_modules']:>5}"
+    )
+    print(
+        f"{'register admin routes':<22} {mean(eager, 'admin'):>8.1f} "
+        f"{mean(lazy, 'admin'):>8.1f} {eager[0]['admin_modules']:>8} "
+        f"{lazy[0]['admin_modules']:>5}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--measure", choices=("eager", "lazy"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.measure:
+        print(json.dumps(asyncio.run(measure(args.measure == "lazy"))))
+    else:
+        run(args.rounds)
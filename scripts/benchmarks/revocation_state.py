@@ -0,0 +1,112 @@
+"""Benchmark holder revocation states, created anew and updated from a cache.
+
+Each round revokes one more credential in an indy-credx revocation registry
+and creates the revocation state of the holder's credential at the new
+registry state, once without the revocation state cache, which walks the
+tails file, and once with it, which updates the state kept from the previous
+round.
+
+Run from the repository root:
+
+    python scripts/benchmarks/revocation_state.py [--rounds N] [--max-creds N]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+from indy_credx import (
+    CredentialDefinition,
+    RevocationRegistryDefinition,
+    Schema,
+)
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from aries_cloudagent.core.in_memory import InMemoryProfile  # noqa: E402
+from aries_cloudagent.indy.credx.holder import IndyCredxHolder  # noqa: E402
+from aries_cloudagent.revocation.state_cache import RevocationStateCache  # noqa: E402
+
+DID = "55GkHamhTU1ZbTbV2ab9DE"
+
+
+def create_registry(max_creds: int, tails_dir: str):
+    """Create a revocation registry issuing credentials by default."""
+    schema = Schema.create(DID, "resident", "1.0", ["name"]).to_dict()
+    schema["seqNo"] = 15
+    cred_def, cred_def_private, _ = CredentialDefinition.create(
+        DID, Schema.load(schema), "CL", "default", support_revocation=True
+    )
+    rev_reg_def, rev_reg_def_private, rev_reg, _ = RevocationRegistryDefinition.create(
+        DID,
+        cred_def,
+        "0",
+        "CL_ACCUM",
+        max_creds,
+        issuance_type="ISSUANCE_BY_DEFAULT",
+        tails_dir_path=tails_dir,
+    )
+    return cred_def, rev_reg_def, rev_reg_def_private, rev_reg
+
+
+async def measure(holder: IndyCredxHolder, *args) -> float:
+    """Time creating a revocation state, in milliseconds."""
+    start = time.perf_counter()
+    await holder.create_revocation_state(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+async def run(rounds: int, max_creds: int):
+    """Run the benchmark."""
+    with tempfile.TemporaryDirectory() as tails_dir:
+        cred_def, rev_reg_def, rev_reg_def_private, rev_reg = create_registry(
+            max_creds, tails_dir
+        )
+        reg_def = rev_reg_def.to_dict()
+        tails_path = rev_reg_def.tails_location
+
+        cache = RevocationStateCache(rounds + 1, workers=1)
+        uncached = IndyCredxHolder(InMemoryProfile.test_profile())
+        profile = InMemoryProfile.test_profile()
+        profile.context.injector.bind_instance(RevocationStateCache, cache)
+        cached = IndyCredxHolder(profile)
+
+        revoked = []
+        delta = {"ver": "1.0", "value": {"accum": rev_reg.to_dict()["value"]["accum"]}}
+        await cached.create_revocation_state("1", reg_def, delta, 0, tails_path)
+
+        create = []
+        update = []
+        for timestamp in range(1, rounds + 1):
+            revoked.append(timestamp + 1)
+            rev_reg.update(cred_def, rev_reg_def, rev_reg_def_private, [], revoked[-1:])
+            delta = {
+                "ver": "1.0",
+                "value": {
+                    "accum": rev_reg.to_dict()["value"]["accum"],
+                    "revoked": list(revoked),
+                },
+            }
+            args = ("1", reg_def, delta, timestamp, tails_path)
+            create.append(await measure(uncached, *args))
+            update.append(await measure(cached, *args))
+        cache.pool.shutdown()
+
+    print(f"{rounds} rounds, {max_creds} credentials in the registry, times in ms")
+    print(f"{'':<8} {'mean':>8} {'min':>8} {'max':>8}")
+    for label, times in (("create", create), ("update", update)):
+        print(
+            f"{label:<8} {sum(times) / len(times):>8.2f} {min(times):>8.2f} "
+            f"{max(times):>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--max-creds", type=int, default=32768)
+    args = parser.parse_args()
+    asyncio.run(run(args.rounds, args.max_creds))
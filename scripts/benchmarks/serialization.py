@@ -0,0 +1,158 @@
+"""Benchmark serializing and deserializing messages and records.
+
+Compares the previous serialization, which built a new schema on every call,
+with the schema instances cached per model class. Deserialization is also
+timed with validation skipped, as for the messages held by records loaded from
+storage.
+
+Run from the repository root:
+
+    python scripts/benchmarks/serialization.py [--rounds N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from aries_cloudagent.connections.models.conn_record import ConnRecord  # noqa: E402
+from aries_cloudagent.messaging.decorators.attach_decorator import (  # noqa: E402
+    AttachDecorator,
+)
+from aries_cloudagent.messaging.models.base import (  # noqa: E402
+    BaseModel,
+    trusted_data,
+)
+from aries_cloudagent.messaging.models.base_record import BaseRecord  # noqa: E402
+from aries_cloudagent.protocols.issue_credential.v2_0.messages.cred_format import (  # noqa: E402
+    V20CredFormat,
+)
+from aries_cloudagent.protocols.issue_credential.v2_0.messages.cred_offer import (  # noqa: E402
+    V20CredOffer,
+)
+from aries_cloudagent.protocols.issue_credential.v2_0.messages.inner.cred_preview import (  # noqa: E402
+    V20CredAttrSpec,
+    V20CredPreview,
+)
+from aries_cloudagent.protocols.issue_credential.v2_0.models.cred_ex_record import (  # noqa: E402
+    V20CredExRecord,
+)
+from aries_cloudagent.protocols.trustping.v1_0.messages.ping import (  # noqa: E402
+    Ping,
+)
+
+
+def uncached(fn):
+    """Call a function the way it was done before, building each schema used."""
+    BaseModel._schemas.clear()
+    return fn()
+
+
+def build_models() -> dict:
+    """Build a sample of message and record models."""
+    cred_offer = V20CredOffer(
+        credential_preview=V20CredPreview(
+            attributes=[
+                V20CredAttrSpec(name=f"attr_{i}", value=str(i)) for i in range(10)
+            ]
+        ),
+        formats=[V20CredFormat(attach_id="indy", format_="hlindy/cred-abstract@v2.0")],
+        offers_attach=[
+            AttachDecorator.data_base64(
+                {
+                    "schema_id": "WgWxqztrNooG92RXvxSTWv:2:schema_name:1.0",
+                    "cred_def_id": "WgWxqztrNooG92RXvxSTWv:3:CL:20:tag",
+                    "nonce": "1234567890",
+                    "key_correctness_proof": {
+                        "c": "123",
+                        "xz_cap": "456",
+                        "xr_cap": [["master_secret", "789"]],
+                    },
+                },
+                ident="indy",
+            )
+        ],
+    )
+    return {
+        "ping": Ping(comment="benchmark"),
+        "cred offer": cred_offer,
+        "conn record": ConnRecord(
+            my_did="55GkHamhTU1ZbTbV2ab9DE",
+            their_did="GbuDUYXaUZRfHD2jeDuQuP",
+            state=ConnRecord.State.COMPLETED,
+        ),
+        "cred ex record": V20CredExRecord(
+            connection_id="connection-id",
+            cred_offer=cred_offer,
+            state=V20CredExRecord.STATE_OFFER_SENT,
+        ),
+    }
+
+
+def timed(rounds: int, fn) -> float:
+    """Time a function call in microseconds."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) * 1e6 / rounds
+
+
+def loaders(model) -> tuple:
+    """Get functions loading a model, with and without validation."""
+    model_cls = type(model)
+    if isinstance(model, BaseRecord):
+        # records are loaded from their stored value
+        stored = model.value
+
+        def load():
+            return model_cls(**dict(stored, **{model_cls.RECORD_ID_NAME: "id"}))
+
+        def load_trusted():
+            return model_cls.from_storage("id", stored)
+
+    else:
+        data = model.serialize()
+
+        def load():
+            return model_cls.deserialize(data)
+
+        def load_trusted():
+            with trusted_data():
+                return model_cls.deserialize(data)
+
+    return load, load_trusted
+
+
+def run(rounds: int):
+    """Run the benchmark."""
+    print(f"{rounds} rounds")
+    print(
+        f"{'model':<15} {'op':<5} {'before (us)':>12} {'cached (us)':>12} "
+        f"{'trusted (us)':>13} {'cached':>7} {'trusted':>8}"
+    )
+    for name, model in build_models().items():
+        load, load_trusted = loaders(model)
+        for op, fn, trusted_fn in (
+            ("load", load, load_trusted),
+            ("dump", model.serialize, None),
+        ):
+            before = timed(rounds, lambda: uncached(fn))
+            cached = timed(rounds, fn)
+            line = f"{name:<15} {op:<5} {before:>12.1f} {cached:>12.1f} "
+            if trusted_fn:
+                trusted = timed(rounds, trusted_fn)
+                print(
+                    f"{line}{trusted:>13.1f} {before / cached:>6.2f}x "
+                    f"{before / trusted:>7.2f}x"
+                )
+            else:
+                print(f"{line}{'-':>13} {before / cached:>6.2f}x {'-':>8}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=1000)
+    args = parser.parse_args()
+    run(args.rounds)
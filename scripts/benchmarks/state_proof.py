@@ -0,0 +1,115 @@
+"""Benchmark state proof verification over recorded ledger replies.
+
+Compares the previous verification, which rebuilt a trie from the proof nodes
+and decoded every node twice, with the single pass over the decoded nodes,
+both with the proof cache cleared before each round ("cold") and with proofs
+repeated as in a multi-ledger lookup ("warm").
+
+Run from the repository root:
+
+    python scripts/benchmarks/state_proof.py [--rounds N]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+from rlp import DecodingError, decode as rlp_decode
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from aries_cloudagent.ledger.merkel_validation.constants import (  # noqa: E402
+    NODE_TYPE_BRANCH,
+    NODE_TYPE_LEAF,
+)
+from aries_cloudagent.ledger.merkel_validation.domain_txn_handler import (  # noqa: E402
+    get_proof_nodes,
+    prepare_for_state_read,
+)
+from aries_cloudagent.ledger.merkel_validation.tests.test_data import (  # noqa: E402
+    GET_ATTRIB_REPLY,
+    GET_CLAIM_DEF_REPLY_A,
+    GET_NYM_REPLY,
+    GET_REVOC_REG_DEF_REPLY_A,
+    GET_REVOC_REG_REPLY_A,
+    GET_SCHEMA_REPLY_A,
+)
+from aries_cloudagent.ledger.merkel_validation.trie import SubTrie  # noqa: E402
+
+REPLIES = {
+    "GET_NYM": GET_NYM_REPLY,
+    "GET_ATTR": GET_ATTRIB_REPLY,
+    "GET_SCHEMA": GET_SCHEMA_REPLY_A,
+    "GET_CLAIM_DEF": GET_CLAIM_DEF_REPLY_A,
+    "GET_REVOC_REG_DEF": GET_REVOC_REG_DEF_REPLY_A,
+    "GET_REVOC_REG": GET_REVOC_REG_REPLY_A,
+}
+
+
+async def rebuilding_verify(expected_value, proof_nodes):
+    """Verify a state proof the way it was done before."""
+    try:
+        proof_nodes = rlp_decode(proof_nodes)
+        new_trie = await SubTrie.get_new_trie_with_proof_nodes(proof_nodes)
+        expected_value = json.loads(expected_value)
+        for encoded_node in list(new_trie._subtrie.values()):
+            try:
+                decoded_node = rlp_decode(encoded_node)
+                if SubTrie._get_node_type(decoded_node) == NODE_TYPE_BRANCH:
+                    value = rlp_decode(decoded_node[-1])[0]
+                    if json.loads(value.decode("utf-8")) == expected_value:
+                        return True
+                if SubTrie._get_node_type(decoded_node) == NODE_TYPE_LEAF:
+                    value = rlp_decode(decoded_node[1])[0]
+                    if json.loads(value.decode("utf-8")) == expected_value:
+                        return True
+            except DecodingError:
+                continue
+        return False
+    except Exception:
+        return False
+
+
+async def cold_verify(expected_value, proof_nodes):
+    """Verify a state proof which has not been seen before."""
+    SubTrie._serialized_proof_values.cache_clear()
+    return await SubTrie.verify_spv_proof(expected_value, proof_nodes)
+
+
+async def warm_verify(expected_value, proof_nodes):
+    """Verify a state proof which may have been seen before."""
+    return await SubTrie.verify_spv_proof(expected_value, proof_nodes)
+
+
+async def run(rounds: int):
+    """Run the benchmark."""
+    print(f"{rounds} rounds")
+    print(
+        f"{'reply':<18} {'nodes':>5} {'before (us)':>12} {'cold (us)':>10} "
+        f"{'warm (us)':>10} {'cold':>7} {'warm':>7}"
+    )
+    for name, reply in REPLIES.items():
+        expected_value = prepare_for_state_read(reply)
+        proof_nodes = get_proof_nodes(reply)
+        timings = []
+        for verify in (rebuilding_verify, cold_verify, warm_verify):
+            assert await verify(expected_value, proof_nodes)
+            start = time.perf_counter()
+            for _ in range(rounds):
+                await verify(expected_value, proof_nodes)
+            timings.append((time.perf_counter() - start) * 1e6 / rounds)
+        print(
+            f"{name:<18} {len(rlp_decode(proof_nodes)):>5} {timings[0]:>12.1f} "
+            f"{timings[1]:>10.1f} {timings[2]:>10.1f} "
+            f"{timings[0] / timings[1]:>6.2f}x {timings[0] / timings[2]:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(run(args.rounds))